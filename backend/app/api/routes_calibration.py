@@ -3,11 +3,13 @@
 from __future__ import annotations
 
 import logging
+from typing import cast
 
-from fastapi import APIRouter, Query, status
+from fastapi import APIRouter, Query, Request, status
 from fastapi.responses import JSONResponse
 
 from backend.app.api.schemas import (
+    ExtractionCacheStatsResponse,
     ExtractionRunPersistResponse,
     ExtractionRunsAggregateSummaryResponse,
     ExtractionRunsListResponse,
@@ -21,6 +23,7 @@ from backend.app.application.extraction_observability import (
     summarize_extraction_runs,
 )
 from backend.app.config import extraction_observability_enabled
+from backend.app.ports.file_storage import FileStorage
 
 from .routes_common import error_response, extraction_observability_disabled_response
 
@@ -143,3 +146,25 @@ def get_debug_extraction_run_summary(
         )
 
     return ExtractionRunsAggregateSummaryResponse(**summary)
+
+
+@router.get(
+    "/debug/extraction-cache",
+    response_model=ExtractionCacheStatsResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Get raw-text extraction cache counters",
+    description="Return hit/miss counters of this process and the on-disk cache occupancy.",
+)
+def get_debug_extraction_cache(request: Request) -> ExtractionCacheStatsResponse | JSONResponse:
+    if not extraction_observability_enabled():
+        return extraction_observability_disabled_response()
+
+    stats = cast(FileStorage, request.app.state.file_storage).extraction_cache_stats()
+    return ExtractionCacheStatsResponse(
+        hits=stats.hits,
+        misses=stats.misses,
+        hit_rate=stats.hit_rate,
+        entries=stats.entries,
+        size_bytes=stats.size_bytes,
+        max_bytes=stats.max_bytes,
+    )
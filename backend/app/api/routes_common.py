@@ -7,7 +7,7 @@ import logging
 from datetime import UTC, datetime
 from typing import Any
 
-from fastapi import Request, status
+from fastapi import Request, Response, status
 from fastapi.responses import JSONResponse
 
 logger = logging.getLogger(__name__)
@@ -32,6 +32,35 @@ def extraction_observability_disabled_response() -> JSONResponse:
     )
 
 
+def request_entity_tags(request: Request) -> frozenset[str]:
+    """Return the entity tags of an If-None-Match header (weak validators compare equal)."""
+
+    header = request.headers.get("if-none-match")
+    if not header:
+        return frozenset()
+    tags: set[str] = set()
+    for item in header.split(","):
+        tag = item.strip()
+        if tag.startswith("W/"):
+            tag = tag[2:]
+        tag = tag.strip('"')
+        if tag:
+            tags.add(tag)
+    return frozenset(tags)
+
+
+def apply_etag_headers(response: Response, version_tag: str) -> None:
+    # no-cache keeps clients revalidating, so a stale representation is never reused.
+    response.headers["ETag"] = f'"{version_tag}"'
+    response.headers["Cache-Control"] = "private, no-cache"
+
+
+def not_modified_response(version_tag: str) -> Response:
+    response = Response(status_code=status.HTTP_304_NOT_MODIFIED)
+    apply_etag_headers(response, version_tag)
+    return response
+
+
 def log_event(
     *,
     event_type: str,
@@ -41,6 +70,7 @@ def log_event(
     failure_reason: str | None = None,
     access_type: str | None = None,
     count_returned: int | None = None,
+    job_id: str | None = None,
 ) -> None:
     payload: dict[str, Any] = {
         "event_type": event_type,
@@ -57,6 +87,8 @@ def log_event(
         payload["access_type"] = access_type
     if count_returned is not None:
         payload["count_returned"] = count_returned
+    if job_id:
+        payload["job_id"] = job_id
     logger.info(json.dumps(payload))
 
 
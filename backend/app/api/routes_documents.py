@@ -1,5 +1,6 @@
 """Document-related API routes."""
 
+import asyncio
 from pathlib import Path
 from typing import Annotated, Any, cast
 from urllib.parse import quote
@@ -20,20 +21,36 @@ from backend.app.api.schemas import (
     ProcessingStepResponse,
 )
 from backend.app.application.document_service import (
+    DocumentUploadResult,
     get_document_original_location,
     get_document_status_details,
     get_processing_history,
     list_documents,
     register_document_upload,
 )
-from backend.app.application.processing import enqueue_processing_run
-from backend.app.config import processing_enabled, rate_limit_download, rate_limit_upload
+from backend.app.application.processing import (
+    enqueue_processing_run,
+    reuse_completed_run_for_duplicate,
+)
+from backend.app.config import (
+    processing_enabled,
+    rate_limit_download,
+    rate_limit_upload,
+    upload_dedup_enabled,
+)
 from backend.app.domain.models import ProcessingStatus
 from backend.app.infra.rate_limiter import limiter
 from backend.app.ports.document_repository import DocumentRepository
-from backend.app.ports.file_storage import FileStorage
-
-from .routes_common import _request_content_length, error_response, log_event
+from backend.app.ports.file_storage import FileStorage, StagedUpload, UploadTooLargeError
+
+from .routes_common import (
+    _request_content_length,
+    apply_etag_headers,
+    error_response,
+    log_event,
+    not_modified_response,
+    request_entity_tags,
+)
 
 router = APIRouter(tags=["Documents"])
 
@@ -142,12 +159,18 @@ def list_documents_route(
     response_model=DocumentResponse,
     status_code=status.HTTP_200_OK,
     summary="Get document processing status",
-    description="Return document metadata and its current processing state.",
-    responses={404: {"description": "Document not found (NOT_FOUND)."}},
+    description=(
+        "Return document metadata and its current processing state. Responses carry an "
+        "ETag; send it back in If-None-Match to get 304 Not Modified when unchanged."
+    ),
+    responses={
+        304: {"description": "Document unchanged since the given ETag."},
+        404: {"description": "Document not found (NOT_FOUND)."},
+    },
 )
 def get_document_status(
-    request: Request, document_id: DocumentIdPath
-) -> DocumentResponse | JSONResponse:
+    request: Request, response: Response, document_id: DocumentIdPath
+) -> DocumentResponse | JSONResponse | Response:
     """Return the document processing status for a given document id."""
 
     repository = cast(DocumentRepository, request.app.state.document_repository)
@@ -162,6 +185,12 @@ def get_document_status(
             message="Document not found.",
         )
 
+    version_tag = details.version_tag
+    entity_tags = request_entity_tags(request)
+    if version_tag in entity_tags or "*" in entity_tags:
+        return not_modified_response(version_tag)
+    apply_etag_headers(response, version_tag)
+
     latest_run = None
     if details.latest_run is not None:
         latest_run = LatestRunResponse(
@@ -337,7 +366,9 @@ def get_document_original(
     summary="Register a document upload",
     description=(
         "Validate an uploaded file and register its metadata. "
-        "Release 1 stores the original PDF in filesystem storage."
+        "Release 1 stores the original PDF in filesystem storage. "
+        "A byte-identical re-upload reuses the latest completed run of the earlier "
+        "document instead of being reprocessed."
     ),
     responses={
         400: {"model": ErrorResponse, "description": "Invalid request (INVALID_REQUEST)."},
@@ -381,30 +412,32 @@ async def upload_document(
             message="Document exceeds the maximum allowed size of 20 MB.",
         )
 
+    storage = cast(FileStorage, request.app.state.file_storage)
     max_chunk_size = 64 * 1024
-    total_size = 0
-    content_chunks: list[bytes] = []
-    while True:
-        chunk = await file.read(max_chunk_size)
-        if not chunk:
-            break
-        total_size += len(chunk)
-        if total_size > MAX_UPLOAD_SIZE:
-            log_event(
-                event_type="DOCUMENT_UPLOADED",
-                document_id=None,
-                error_code="FILE_TOO_LARGE",
-                failure_reason="Document exceeds the maximum allowed size.",
-            )
-            return error_response(
-                status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
-                error_code="FILE_TOO_LARGE",
-                message="Document exceeds the maximum allowed size of 20 MB.",
-            )
-        content_chunks.append(chunk)
+    writer = await asyncio.to_thread(storage.open_upload, max_size=MAX_UPLOAD_SIZE)
+    try:
+        while chunk := await file.read(max_chunk_size):
+            await asyncio.to_thread(writer.write, chunk)
+        staged = await asyncio.to_thread(writer.finish)
+    except UploadTooLargeError:
+        writer.abort()
+        log_event(
+            event_type="DOCUMENT_UPLOADED",
+            document_id=None,
+            error_code="FILE_TOO_LARGE",
+            failure_reason="Document exceeds the maximum allowed size.",
+        )
+        return error_response(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            error_code="FILE_TOO_LARGE",
+            message="Document exceeds the maximum allowed size of 20 MB.",
+        )
+    except BaseException:
+        writer.abort()
+        raise
 
-    contents = b"".join(content_chunks)
-    if len(contents) == 0:
+    if staged.file_size == 0:
+        storage.discard_upload(staged=staged)
         log_event(
             event_type="DOCUMENT_UPLOADED",
             document_id=None,
@@ -418,20 +451,15 @@ async def upload_document(
         )
 
     repository = cast(DocumentRepository, request.app.state.document_repository)
-    storage = cast(FileStorage, request.app.state.file_storage)
     try:
-        result = register_document_upload(
+        result, reused = await asyncio.to_thread(
+            _register_and_schedule_upload,
             filename=Path(file.filename).name,
             content_type=file.content_type or "",
-            content=contents,
+            upload=staged,
             repository=repository,
             storage=storage,
         )
-        if processing_enabled():
-            enqueue_processing_run(
-                document_id=result.document_id,
-                repository=repository,
-            )
     except Exception as exc:  # pragma: no cover - defensive
         log_event(
             event_type="DOCUMENT_UPLOADED",
@@ -449,11 +477,12 @@ async def upload_document(
         event_type="DOCUMENT_UPLOADED",
         document_id=result.document_id,
     )
-    status_value = (
-        ProcessingStatus.PROCESSING.value
-        if processing_enabled()
-        else ProcessingStatus.UPLOADED.value
-    )
+    if reused:
+        status_value = ProcessingStatus.COMPLETED.value
+    elif processing_enabled():
+        status_value = ProcessingStatus.PROCESSING.value
+    else:
+        status_value = ProcessingStatus.UPLOADED.value
     return DocumentUploadResponse(
         document_id=result.document_id,
         status=status_value,
@@ -461,6 +490,38 @@ async def upload_document(
     )
 
 
+def _register_and_schedule_upload(
+    *,
+    filename: str,
+    content_type: str,
+    upload: StagedUpload,
+    repository: DocumentRepository,
+    storage: FileStorage,
+) -> tuple[DocumentUploadResult, bool]:
+    """Register a staged upload and start (or reuse) its processing; blocking I/O."""
+
+    result = register_document_upload(
+        filename=filename,
+        content_type=content_type,
+        upload=upload,
+        repository=repository,
+        storage=storage,
+    )
+    if not processing_enabled():
+        return result, False
+    if upload_dedup_enabled():
+        reused_run = reuse_completed_run_for_duplicate(
+            document_id=result.document_id,
+            content_sha256=result.content_sha256,
+            repository=repository,
+            storage=storage,
+        )
+        if reused_run is not None:
+            return result, True
+    enqueue_processing_run(document_id=result.document_id, repository=repository)
+    return result, False
+
+
 def _validate_upload(file: UploadFile) -> dict[str, Any] | None:
     if file.content_type not in ALLOWED_CONTENT_TYPES:
         return {
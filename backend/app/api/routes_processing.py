@@ -4,17 +4,33 @@ from __future__ import annotations
 
 from typing import cast
 
-from fastapi import APIRouter, Request, status
+from fastapi import APIRouter, Query, Request, status
 from fastapi.responses import JSONResponse
 
 from backend.app.api.schemas import (
     ProcessingRunResponse,
     RawTextArtifactResponse,
+    ReinterpretationJobFailureResponse,
+    ReinterpretationJobRequest,
+    ReinterpretationJobResponse,
 )
 from backend.app.application.document_service import get_document
-from backend.app.application.processing import enqueue_processing_run
-from backend.app.config import processing_enabled
-from backend.app.domain.models import ProcessingRunState
+from backend.app.application.processing import (
+    ReinterpretationJobRunner,
+    claim_reinterpretation_job,
+    create_reinterpretation_job,
+    created_at_filter_bound,
+    enqueue_processing_run,
+    resolve_interpretation_source_run,
+)
+from backend.app.config import processing_enabled, processing_process_workers
+from backend.app.domain.models import (
+    ProcessingRunState,
+    ReinterpretationJob,
+    ReinterpretationJobFilters,
+    ReinterpretationJobState,
+    ReviewStatus,
+)
 from backend.app.ports.document_repository import DocumentRepository
 from backend.app.ports.file_storage import FileStorage
 
@@ -28,12 +44,29 @@ router = APIRouter(tags=["Processing"])
     response_model=ProcessingRunResponse,
     status_code=status.HTTP_201_CREATED,
     summary="Create a new processing run",
-    description="Create a new processing run for the document (append-only).",
-    responses={404: {"description": "Document not found (NOT_FOUND)."}},
+    description=(
+        "Create a new processing run for the document (append-only). With "
+        "`interpretation_only=true` the run skips extraction and rebuilds the "
+        "interpretation from the stored raw text of `source_run_id` (default: the "
+        "latest finished run that has raw text)."
+    ),
+    responses={
+        400: {"description": "source_run_id without interpretation_only (INVALID_REQUEST)."},
+        404: {"description": "Document not found (NOT_FOUND)."},
+        409: {"description": "Processing disabled or source raw text unavailable (CONFLICT)."},
+    },
 )
 def reprocess_document(
     request: Request,
     document_id: str,
+    interpretation_only: bool = Query(
+        False,
+        description="Rebuild only the interpretation from a previous run's stored raw text.",
+    ),
+    source_run_id: str | None = Query(
+        None,
+        description="Run whose raw text is reused; requires interpretation_only.",
+    ),
 ) -> ProcessingRunResponse | JSONResponse:
     """Create a new queued processing run for an existing document."""
 
@@ -45,6 +78,13 @@ def reprocess_document(
             message="Document not found.",
         )
 
+    if source_run_id is not None and not interpretation_only:
+        return error_response(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            error_code="INVALID_REQUEST",
+            message="source_run_id requires interpretation_only.",
+        )
+
     if not processing_enabled():
         return error_response(
             status_code=status.HTTP_409_CONFLICT,
@@ -52,7 +92,26 @@ def reprocess_document(
             message="Processing is disabled.",
         )
 
-    run = enqueue_processing_run(document_id=document_id, repository=repository)
+    if interpretation_only:
+        source_run_id = resolve_interpretation_source_run(
+            document_id=document_id,
+            source_run_id=source_run_id,
+            repository=repository,
+            storage=cast(FileStorage, request.app.state.file_storage),
+        )
+        if source_run_id is None:
+            return error_response(
+                status_code=status.HTTP_409_CONFLICT,
+                error_code="CONFLICT",
+                message="No stored raw text is available to reinterpret.",
+                details={"reason": "SOURCE_RAW_TEXT_NOT_AVAILABLE"},
+            )
+
+    run = enqueue_processing_run(
+        document_id=document_id,
+        repository=repository,
+        source_run_id=source_run_id,
+    )
     log_event(
         event_type="REPROCESS_REQUESTED",
         document_id=document_id,
@@ -62,6 +121,7 @@ def reprocess_document(
         run_id=run.run_id,
         state=run.state.value,
         created_at=run.created_at,
+        source_run_id=source_run_id,
     )
 
 
@@ -70,9 +130,12 @@ def reprocess_document(
     response_model=RawTextArtifactResponse,
     status_code=status.HTTP_200_OK,
     summary="Retrieve raw extracted text",
-    description="Return raw extracted text for a processing run.",
+    description=(
+        "Return raw extracted text for a processing run, or a single page of it when "
+        "`page` is given."
+    ),
     responses={
-        404: {"description": "Run not found (NOT_FOUND)."},
+        404: {"description": "Run or page not found (NOT_FOUND)."},
         409: {"description": "Raw text not ready or not available (CONFLICT)."},
         410: {"description": "Raw text artifact missing (ARTIFACT_MISSING)."},
     },
@@ -80,6 +143,9 @@ def reprocess_document(
 def get_raw_text_artifact(
     request: Request,
     run_id: str,
+    page: int | None = Query(
+        None, ge=1, description="Return only this 1-based page instead of the whole text."
+    ),
 ) -> RawTextArtifactResponse | JSONResponse:
     """Return extracted raw text for a processing run."""
 
@@ -117,9 +183,15 @@ def get_raw_text_artifact(
         )
 
     try:
-        text = storage.resolve_raw_text(document_id=run.document_id, run_id=run.run_id).read_text(
-            encoding="utf-8"
-        )
+        index = storage.read_raw_text_index(document_id=run.document_id, run_id=run.run_id)
+        if page is None:
+            text: str | None = storage.resolve_raw_text(
+                document_id=run.document_id, run_id=run.run_id
+            ).read_text(encoding="utf-8")
+        else:
+            text = storage.read_raw_text_page(
+                document_id=run.document_id, run_id=run.run_id, page=page
+            )
     except Exception as exc:  # pragma: no cover - defensive
         log_event(
             event_type="RAW_TEXT_ACCESS_FAILED",
@@ -133,6 +205,14 @@ def get_raw_text_artifact(
             message="Unexpected error while accessing raw text.",
         )
 
+    if text is None or index is None:
+        return error_response(
+            status_code=status.HTTP_404_NOT_FOUND,
+            error_code="NOT_FOUND",
+            message="Raw text page not found.",
+            details={"page": page, "page_count": index.page_count if index else 0},
+        )
+
     log_event(
         event_type="RAW_TEXT_ACCESSED",
         document_id=run.document_id,
@@ -144,4 +224,176 @@ def get_raw_text_artifact(
         artifact_type="RAW_TEXT",
         content_type="text/plain",
         text=text,
+        page=page,
+        page_count=index.page_count,
+    )
+
+
+@router.post(
+    "/reinterpretation-jobs",
+    response_model=ReinterpretationJobResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+    summary="Start a bulk re-interpretation job",
+    description=(
+        "Reinterpret every document matching the filters from its latest stored raw "
+        "text, fanning out across a process pool. Progress is checkpointed per batch; "
+        "poll the job for throughput and failures."
+    ),
+    responses={409: {"description": "Processing disabled (CONFLICT)."}},
+)
+async def start_reinterpretation_job(
+    request: Request,
+    payload: ReinterpretationJobRequest,
+) -> ReinterpretationJobResponse | JSONResponse:
+    """Create a bulk re-interpretation job and run it in the background."""
+
+    if not processing_enabled():
+        return error_response(
+            status_code=status.HTTP_409_CONFLICT,
+            error_code="CONFLICT",
+            message="Processing is disabled.",
+        )
+
+    repository = cast(DocumentRepository, request.app.state.document_repository)
+    job = create_reinterpretation_job(
+        filters=ReinterpretationJobFilters(
+            review_status=ReviewStatus(payload.review_status) if payload.review_status else None,
+            created_after=created_at_filter_bound(payload.created_after),
+            created_before=created_at_filter_bound(payload.created_before),
+            max_documents=payload.max_documents,
+        ),
+        repository=repository,
+    )
+    _reinterpretation_runner(request).start(
+        job_id=job.job_id,
+        repository=repository,
+        storage=cast(FileStorage, request.app.state.file_storage),
+        workers=payload.workers or processing_process_workers(),
+    )
+    log_event(event_type="REINTERPRETATION_JOB_STARTED", document_id=None, job_id=job.job_id)
+    return _reinterpretation_job_response(job)
+
+
+@router.get(
+    "/reinterpretation-jobs/{job_id}",
+    response_model=ReinterpretationJobResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Get bulk re-interpretation job progress",
+    description="Return state, counters, throughput and recorded failures of a bulk job.",
+    responses={404: {"description": "Job not found (NOT_FOUND)."}},
+)
+def get_reinterpretation_job(
+    request: Request,
+    job_id: str,
+) -> ReinterpretationJobResponse | JSONResponse:
+    """Return the persisted progress of a bulk re-interpretation job."""
+
+    repository = cast(DocumentRepository, request.app.state.document_repository)
+    job = repository.get_reinterpretation_job(job_id)
+    if job is None:
+        return error_response(
+            status_code=status.HTTP_404_NOT_FOUND,
+            error_code="NOT_FOUND",
+            message="Reinterpretation job not found.",
+        )
+    return _reinterpretation_job_response(job)
+
+
+@router.post(
+    "/reinterpretation-jobs/{job_id}/resume",
+    response_model=ReinterpretationJobResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+    summary="Resume a bulk re-interpretation job",
+    description="Continue an interrupted job from its last checkpoint.",
+    responses={
+        404: {"description": "Job not found (NOT_FOUND)."},
+        409: {"description": "Processing disabled, job running or completed (CONFLICT)."},
+    },
+)
+async def resume_reinterpretation_job(
+    request: Request,
+    job_id: str,
+    workers: int | None = Query(
+        None,
+        ge=1,
+        le=64,
+        description="Process-pool size (default: VET_RECORDS_PROCESSING_WORKERS).",
+    ),
+) -> ReinterpretationJobResponse | JSONResponse:
+    """Resume a bulk re-interpretation job that no live runner holds, in the background."""
+
+    repository = cast(DocumentRepository, request.app.state.document_repository)
+    job = repository.get_reinterpretation_job(job_id)
+    if job is None:
+        return error_response(
+            status_code=status.HTTP_404_NOT_FOUND,
+            error_code="NOT_FOUND",
+            message="Reinterpretation job not found.",
+        )
+    if not processing_enabled():
+        return error_response(
+            status_code=status.HTTP_409_CONFLICT,
+            error_code="CONFLICT",
+            message="Processing is disabled.",
+        )
+    runner = _reinterpretation_runner(request)
+    # The job may be running in another API or CLI process; only a job whose
+    # lease is free or expired (its runner died) is taken over.
+    lease = (
+        None
+        if runner.is_running(job_id)
+        else claim_reinterpretation_job(job_id=job_id, repository=repository)
+    )
+    if lease is None:
+        current = repository.get_reinterpretation_job(job_id) or job
+        reason = (
+            "JOB_COMPLETED"
+            if current.state == ReinterpretationJobState.COMPLETED
+            else "JOB_RUNNING"
+        )
+        return error_response(
+            status_code=status.HTTP_409_CONFLICT,
+            error_code="CONFLICT",
+            message="Reinterpretation job cannot be resumed.",
+            details={"reason": reason},
+        )
+
+    runner.start(
+        job_id=job_id,
+        repository=repository,
+        storage=cast(FileStorage, request.app.state.file_storage),
+        workers=workers or processing_process_workers(),
+        lease=lease,
+    )
+    log_event(event_type="REINTERPRETATION_JOB_RESUMED", document_id=None, job_id=job_id)
+    return _reinterpretation_job_response(repository.get_reinterpretation_job(job_id) or job)
+
+
+def _reinterpretation_runner(request: Request) -> ReinterpretationJobRunner:
+    return cast(ReinterpretationJobRunner, request.app.state.reinterpretation_jobs)
+
+
+def _reinterpretation_job_response(job: ReinterpretationJob) -> ReinterpretationJobResponse:
+    filters = job.filters
+    return ReinterpretationJobResponse(
+        job_id=job.job_id,
+        state=job.state.value,
+        filters={
+            "review_status": filters.review_status.value if filters.review_status else None,
+            "created_after": filters.created_after,
+            "created_before": filters.created_before,
+            "max_documents": filters.max_documents,
+        },
+        total_documents=job.total_documents,
+        processed_documents=job.processed_documents,
+        succeeded_documents=job.succeeded_documents,
+        failed_documents=job.failed_documents,
+        docs_per_second=job.docs_per_second,
+        elapsed_seconds=job.elapsed_seconds,
+        checkpoint_document_id=job.checkpoint_document_id,
+        failures=[ReinterpretationJobFailureResponse(**failure) for failure in job.failures],
+        created_at=job.created_at,
+        updated_at=job.updated_at,
+        started_at=job.started_at,
+        completed_at=job.completed_at,
     )
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from typing import Annotated, cast
 
-from fastapi import APIRouter, Path, Request, status
+from fastapi import APIRouter, Path, Request, Response, status
 from fastapi.responses import HTMLResponse, JSONResponse
 
 from backend.app.api.schemas import (
@@ -33,7 +33,13 @@ from .review_debug import (
     build_visit_scoping_metrics,
     render_visit_debug_html,
 )
-from .routes_common import error_response, log_event
+from .routes_common import (
+    apply_etag_headers,
+    error_response,
+    log_event,
+    not_modified_response,
+    request_entity_tags,
+)
 
 router = APIRouter(tags=["Review"])
 UUID_PATH_PATTERN = r"^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$"
@@ -83,15 +89,19 @@ def _resolve_review_context(
     response_model=DocumentReviewResponse,
     status_code=status.HTTP_200_OK,
     summary="Get review context for a document",
-    description="Return latest completed run and its active interpretation.",
+    description=(
+        "Return latest completed run and its active interpretation. Responses carry an "
+        "ETag; send it back in If-None-Match to get 304 Not Modified when unchanged."
+    ),
     responses={
+        304: {"description": "Review context unchanged since the given ETag."},
         404: {"description": "Document not found (NOT_FOUND)."},
         409: {"description": "No completed run available for review (CONFLICT)."},
     },
 )
 def get_document_review_context(
-    request: Request, document_id: DocumentIdPath
-) -> DocumentReviewResponse | JSONResponse:
+    request: Request, response: Response, document_id: DocumentIdPath
+) -> DocumentReviewResponse | JSONResponse | Response:
     """Return review context based on the latest completed run."""
 
     repository = cast(DocumentRepository, request.app.state.document_repository)
@@ -107,7 +117,10 @@ def get_document_review_context(
         document_id=document_id,
         repository=repository,
         storage=storage,
+        known_version_tags=request_entity_tags(request),
     )
+    if review is not None and review.not_modified and review.version_tag is not None:
+        return not_modified_response(review.version_tag)
     if review is None:
         return error_response(
             status_code=status.HTTP_409_CONFLICT,
@@ -134,6 +147,8 @@ def get_document_review_context(
         document_id=document_id,
         run_id=review.review.latest_completed_run.run_id,
     )
+    if review.version_tag is not None:
+        apply_etag_headers(response, review.version_tag)
 
     return DocumentReviewResponse(
         document_id=review.review.document_id,
@@ -305,11 +320,13 @@ def edit_run_interpretation(
     payload: InterpretationEditRequest,
 ) -> InterpretationEditResponse | JSONResponse:
     repository = cast(DocumentRepository, request.app.state.document_repository)
+    storage = cast(FileStorage, request.app.state.file_storage)
     outcome = apply_interpretation_edits(
         run_id=run_id,
         base_version_number=payload.base_version_number,
         changes=[change.model_dump() for change in payload.changes],
         repository=repository,
+        storage=storage,
     )
     if outcome is None:
         return error_response(
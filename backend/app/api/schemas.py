@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from datetime import datetime
 from typing import Literal
 
 from pydantic import BaseModel, Field
@@ -27,6 +28,10 @@ class ProcessingRunResponse(BaseModel):
     run_id: str = Field(..., description="Unique identifier of the processing run.")
     state: str = Field(..., description="Current processing run state.")
     created_at: str = Field(..., description="UTC ISO timestamp when the run was created.")
+    source_run_id: str | None = Field(
+        None,
+        description="Run whose stored raw text an interpretation-only run reuses.",
+    )
 
 
 class LatestRunResponse(BaseModel):
@@ -124,6 +129,62 @@ class RawTextArtifactResponse(BaseModel):
     artifact_type: str = Field(..., description="Artifact type identifier.")
     content_type: str = Field(..., description="Content type for the raw text artifact.")
     text: str = Field(..., description="Extracted raw text content.")
+    page: int | None = Field(
+        None, description="1-based page the text belongs to, when a single page was requested."
+    )
+    page_count: int = Field(..., description="Number of pages in the raw text.")
+
+
+class ReinterpretationJobRequest(BaseModel):
+    review_status: Literal["IN_REVIEW", "REVIEWED"] | None = Field(
+        None, description="Only reinterpret documents with this review status."
+    )
+    created_after: datetime | None = Field(
+        None,
+        description="Only documents registered at or after this ISO timestamp (UTC if naive).",
+    )
+    created_before: datetime | None = Field(
+        None,
+        description="Only documents registered before this ISO timestamp (UTC if naive; "
+        "default: job creation time).",
+    )
+    max_documents: int | None = Field(
+        None, ge=1, description="Upper bound on the number of documents reinterpreted."
+    )
+    workers: int | None = Field(
+        None,
+        ge=1,
+        le=64,
+        description="Process-pool size (default: VET_RECORDS_PROCESSING_WORKERS).",
+    )
+
+
+class ReinterpretationJobFailureResponse(BaseModel):
+    document_id: str = Field(..., description="Document that could not be reinterpreted.")
+    reason: str = Field(..., description="Failure reason or failure type of the run.")
+    run_id: str | None = Field(None, description="Run created for the document, if any.")
+
+
+class ReinterpretationJobResponse(BaseModel):
+    job_id: str = Field(..., description="Unique identifier of the bulk job.")
+    state: str = Field(..., description="QUEUED, RUNNING, COMPLETED or INTERRUPTED.")
+    filters: dict[str, object] = Field(..., description="Document selection of the job.")
+    total_documents: int = Field(..., description="Documents selected when the job was created.")
+    processed_documents: int = Field(..., description="Documents processed up to the checkpoint.")
+    succeeded_documents: int = Field(..., description="Documents reinterpreted successfully.")
+    failed_documents: int = Field(..., description="Documents that failed or were skipped.")
+    docs_per_second: float | None = Field(None, description="Throughput of processed batches.")
+    elapsed_seconds: float = Field(..., description="Time spent processing batches.")
+    checkpoint_document_id: str | None = Field(
+        None, description="Last document of the last checkpointed batch."
+    )
+    failures: list[ReinterpretationJobFailureResponse] = Field(
+        ..., description="First recorded failures (capped)."
+    )
+    created_at: str = Field(..., description="UTC ISO timestamp when the job was created.")
+    updated_at: str = Field(..., description="UTC ISO timestamp of the last progress update.")
+    started_at: str | None = Field(None, description="UTC ISO timestamp of the first start.")
+    completed_at: str | None = Field(None, description="UTC ISO timestamp of completion.")
 
 
 class LatestCompletedRunReviewResponse(BaseModel):
@@ -312,6 +373,15 @@ class ExtractionTriageItemResponse(BaseModel):
     sourceHint: str | None = None
 
 
+class ExtractionCacheStatsResponse(BaseModel):
+    hits: int = Field(..., description="Cache hits since this process started.")
+    misses: int = Field(..., description="Cache misses since this process started.")
+    hit_rate: float | None = Field(None, description="hits / (hits + misses), if any lookup.")
+    entries: int = Field(..., description="Cached extractions on disk.")
+    size_bytes: int = Field(..., description="Bytes used by cached extractions.")
+    max_bytes: int = Field(..., description="LRU size budget (0 when the cache is disabled).")
+
+
 class ExtractionRunTriageResponse(BaseModel):
     documentId: str
     runId: str
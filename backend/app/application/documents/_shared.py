@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import hashlib
+import json
 import re
 from datetime import datetime
 
@@ -356,3 +358,10 @@ def _extract_evidence_snippet(field: dict[str, object]) -> str | None:
         return None
     snippet = evidence.get("snippet")
     return snippet if isinstance(snippet, str) else None
+
+
+def _version_tag(*parts: object) -> str:
+    """Return a stable digest of the values a response representation is derived from."""
+
+    encoded = json.dumps(parts, separators=(",", ":"), default=str).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()[:32]
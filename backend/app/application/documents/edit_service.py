@@ -30,6 +30,7 @@ from backend.app.application.global_schema import (
 from backend.app.config import human_edit_neutral_candidate_confidence
 from backend.app.domain.models import ProcessingRunState
 from backend.app.ports.document_repository import DocumentRepository
+from backend.app.ports.file_storage import FileStorage
 
 
 @dataclass(frozen=True, slots=True)
@@ -71,8 +72,13 @@ def apply_interpretation_edits(
     changes: list[dict[str, object]],
     repository: DocumentRepository,
     now_provider: Callable[[], str] = _default_now_iso,
+    storage: FileStorage | None = None,
 ) -> InterpretationEditOutcome | None:
-    """Apply veterinarian edits and append a new active interpretation version."""
+    """Apply veterinarian edits and append a new active interpretation version.
+
+    When ``storage`` is given the review projection of the new version is
+    materialized right away, so the next review read does not recompute it.
+    """
 
     run = repository.get_run(run_id)
     if run is None:
@@ -203,8 +209,19 @@ def apply_interpretation_edits(
 
     from backend.app.application.documents.review_payload_projector import (
         _normalize_review_interpretation_data,
+        materialize_review_projection,
+        read_run_raw_text,
     )
 
+    if storage is not None:
+        materialize_review_projection(
+            repository=repository,
+            run_id=run_id,
+            interpretation_payload=new_payload,
+            raw_text=read_run_raw_text(storage=storage, document_id=run.document_id, run_id=run_id),
+            created_at=now_iso,
+        )
+
     return InterpretationEditOutcome(
         result=InterpretationEditResult(
             run_id=run_id,
@@ -1,8 +1,9 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass
 from pathlib import Path
 
+from backend.app.application.documents._shared import _version_tag
 from backend.app.domain.models import (
     Document,
     DocumentWithLatestRun,
@@ -37,6 +38,12 @@ class DocumentStatusDetails:
     latest_run: ProcessingRunSummary | None
     status_view: DocumentStatusView
 
+    @property
+    def version_tag(self) -> str:
+        """Digest of everything the document status representation is built from."""
+
+        return _version_tag(asdict(self))
+
 
 @dataclass(frozen=True, slots=True)
 class DocumentOriginalLocation:
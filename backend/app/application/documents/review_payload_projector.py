@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import logging
+
 from backend.app.application.documents._shared import (
     _MEDICAL_RECORD_CANONICAL_FIELD_SLOTS,
     _MEDICAL_RECORD_CANONICAL_SECTIONS,
@@ -11,6 +13,93 @@ from backend.app.application.documents.age_normalizer import _normalize_age_from
 from backend.app.application.documents.edit_service import _sanitize_confidence_breakdown
 from backend.app.application.documents.visit_scoping import normalize_canonical_review_scoping
 from backend.app.application.field_normalizers import normalize_microchip_digits_only
+from backend.app.ports.document_repository import DocumentRepository
+from backend.app.ports.file_storage import FileStorage
+
+logger = logging.getLogger(__name__)
+
+REVIEW_PROJECTION_ARTIFACT_TYPE = "REVIEW_PROJECTION"
+# Bump whenever projection output changes (this module, visit scoping/population,
+# age normalization) so materialized projections are recomputed on next read.
+REVIEW_PROJECTOR_VERSION = "1"
+
+
+def build_review_projection_artifact(
+    interpretation_payload: dict[str, object], *, raw_text: str | None
+) -> dict[str, object]:
+    """Project an interpretation version into the payload stored as REVIEW_PROJECTION."""
+
+    data = interpretation_payload.get("data")
+    version_number = interpretation_payload.get("version_number", 1)
+    return {
+        "interpretation_id": str(interpretation_payload.get("interpretation_id", "")),
+        "version_number": version_number if isinstance(version_number, int) else 1,
+        "projector_version": REVIEW_PROJECTOR_VERSION,
+        "data": _normalize_review_interpretation_data(
+            data if isinstance(data, dict) else {}, raw_text=raw_text
+        ),
+    }
+
+
+def load_materialized_review_projection(
+    *,
+    repository: DocumentRepository,
+    run_id: str,
+    interpretation_id: str,
+    version_number: int,
+) -> dict[str, object] | None:
+    """Return the stored projection if it matches the interpretation and projector versions."""
+
+    payload = repository.get_latest_artifact_payload(
+        run_id=run_id,
+        artifact_type=REVIEW_PROJECTION_ARTIFACT_TYPE,
+    )
+    if not isinstance(payload, dict):
+        return None
+    if (
+        payload.get("projector_version") != REVIEW_PROJECTOR_VERSION
+        or payload.get("interpretation_id") != interpretation_id
+        or payload.get("version_number") != version_number
+    ):
+        return None
+    data = payload.get("data")
+    return data if isinstance(data, dict) else None
+
+
+def materialize_review_projection(
+    *,
+    repository: DocumentRepository,
+    run_id: str,
+    interpretation_payload: dict[str, object],
+    raw_text: str | None,
+    created_at: str,
+) -> dict[str, object]:
+    """Compute and persist the review projection; persistence failures are non-fatal."""
+
+    artifact = build_review_projection_artifact(interpretation_payload, raw_text=raw_text)
+    try:
+        repository.append_artifact(
+            run_id=run_id,
+            artifact_type=REVIEW_PROJECTION_ARTIFACT_TYPE,
+            payload=artifact,
+            created_at=created_at,
+        )
+    except Exception:
+        logger.exception("Failed to persist review projection run_id=%s", run_id)
+    data = artifact["data"]
+    assert isinstance(data, dict)
+    return data
+
+
+def read_run_raw_text(*, storage: FileStorage, document_id: str, run_id: str) -> str | None:
+    raw_text_path = storage.resolve_raw_text(document_id=document_id, run_id=run_id)
+    if not raw_text_path.exists():
+        return None
+    try:
+        return raw_text_path.read_text(encoding="utf-8")
+    except OSError:
+        logger.warning("Failed to read raw_text file path=%s", raw_text_path)
+        return None
 
 
 def _normalize_review_interpretation_data(
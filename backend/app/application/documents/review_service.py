@@ -7,10 +7,11 @@ Visit scoping and segment parsing responsibilities have been extracted to
 from __future__ import annotations
 
 import logging
-from collections.abc import Callable
+from collections.abc import Callable, Collection
 from dataclasses import dataclass
 
 from backend.app.application.documents import review_payload_projector
+from backend.app.application.documents._shared import _version_tag
 from backend.app.application.documents.calibration import (
     _apply_reviewed_document_calibration,
     _revert_reviewed_document_calibration,
@@ -59,6 +60,8 @@ class DocumentReview:
 class DocumentReviewLookupResult:
     review: DocumentReview | None
     unavailable_reason: str | None
+    version_tag: str | None = None
+    not_modified: bool = False
 
 
 def get_document_review(
@@ -66,7 +69,16 @@ def get_document_review(
     document_id: str,
     repository: DocumentRepository,
     storage: FileStorage,
+    known_version_tags: Collection[str] = (),
 ) -> DocumentReviewLookupResult | None:
+    """Return the review context of the latest completed run.
+
+    The result carries a ``version_tag`` derived from the run, interpretation
+    version, review status and projector version. When it is one of
+    ``known_version_tags`` (``"*"`` matches any) the lookup stops before the
+    projection is loaded and returns ``not_modified=True``.
+    """
+
     logger.info("get_document_review called document_id=%s", document_id)
     document = repository.get(document_id)
     if document is None:
@@ -93,26 +105,50 @@ def get_document_review(
     version_number_raw = interpretation_payload.get("version_number", 1)
     version_number = version_number_raw if isinstance(version_number_raw, int) else 1
 
-    structured_data = interpretation_payload.get("data")
-    if not isinstance(structured_data, dict):
-        structured_data = {}
-
-    raw_text: str | None = None
-    raw_text_path = storage.resolve_raw_text(
+    raw_text_available = storage.exists_raw_text(
         document_id=latest_completed_run.document_id,
         run_id=latest_completed_run.run_id,
     )
-    if raw_text_path.exists():
-        try:
-            raw_text = raw_text_path.read_text(encoding="utf-8")
-        except OSError:
-            logger.warning("Failed to read raw_text file path=%s", raw_text_path)
-            raw_text = None
-
-    structured_data = review_payload_projector._normalize_review_interpretation_data(
-        structured_data,
-        raw_text=raw_text,
+    version_tag = _version_tag(
+        document.review_status.value,
+        document.reviewed_at,
+        document.reviewed_by,
+        latest_completed_run.run_id,
+        latest_completed_run.state.value,
+        latest_completed_run.completed_at,
+        latest_completed_run.failure_type,
+        interpretation_id,
+        version_number,
+        raw_text_available,
+        review_payload_projector.REVIEW_PROJECTOR_VERSION,
     )
+    if version_tag in known_version_tags or "*" in known_version_tags:
+        return DocumentReviewLookupResult(
+            review=None,
+            unavailable_reason=None,
+            version_tag=version_tag,
+            not_modified=True,
+        )
+
+    structured_data = review_payload_projector.load_materialized_review_projection(
+        repository=repository,
+        run_id=latest_completed_run.run_id,
+        interpretation_id=interpretation_id,
+        version_number=version_number,
+    )
+    if structured_data is None:
+        # Missing or produced by an older projector version: recompute once and store.
+        structured_data = review_payload_projector.materialize_review_projection(
+            repository=repository,
+            run_id=latest_completed_run.run_id,
+            interpretation_payload=interpretation_payload,
+            raw_text=review_payload_projector.read_run_raw_text(
+                storage=storage,
+                document_id=latest_completed_run.document_id,
+                run_id=latest_completed_run.run_id,
+            ),
+            created_at=_default_now_iso(),
+        )
 
     return DocumentReviewLookupResult(
         review=DocumentReview(
@@ -130,16 +166,14 @@ def get_document_review(
             ),
             raw_text_artifact=RawTextArtifactAvailability(
                 run_id=latest_completed_run.run_id,
-                available=storage.exists_raw_text(
-                    document_id=latest_completed_run.document_id,
-                    run_id=latest_completed_run.run_id,
-                ),
+                available=raw_text_available,
             ),
             review_status=document.review_status.value,
             reviewed_at=document.reviewed_at,
             reviewed_by=document.reviewed_by,
         ),
         unavailable_reason=None,
+        version_tag=version_tag,
     )
 
 
@@ -7,7 +7,7 @@ from uuid import uuid4
 
 from backend.app.domain.models import Document, ProcessingStatus, ReviewStatus
 from backend.app.ports.document_repository import DocumentRepository
-from backend.app.ports.file_storage import FileStorage
+from backend.app.ports.file_storage import FileStorage, StagedUpload
 
 
 def _default_now_iso() -> str:
@@ -31,13 +31,14 @@ class DocumentUploadResult:
     document_id: str
     status: str
     created_at: str
+    content_sha256: str
 
 
 def register_document_upload(
     *,
     filename: str,
     content_type: str,
-    content: bytes,
+    upload: StagedUpload,
     repository: DocumentRepository,
     storage: FileStorage,
     id_provider: Callable[[], str] = _default_id,
@@ -48,7 +49,9 @@ def register_document_upload(
     Args:
         filename: Sanitized basename of the uploaded file.
         content_type: MIME type provided at upload time.
+        upload: Upload already streamed into storage; committed under the new id.
         repository: Persistence port used to store document metadata.
+        storage: Storage port holding the staged upload.
         id_provider: Provider for generating new document ids.
         now_provider: Provider for generating the creation timestamp (UTC ISO).
 
@@ -58,7 +61,11 @@ def register_document_upload(
 
     document_id = id_provider()
     created_at = now_provider()
-    stored_file = storage.save(document_id=document_id, content=content)
+    try:
+        stored_file = storage.commit_upload(staged=upload, document_id=document_id)
+    except Exception:
+        storage.discard_upload(staged=upload)
+        raise
 
     document = Document(
         document_id=document_id,
@@ -69,6 +76,7 @@ def register_document_upload(
         created_at=created_at,
         updated_at=created_at,
         review_status=ReviewStatus.IN_REVIEW,
+        content_sha256=upload.content_sha256,
     )
 
     try:
@@ -81,4 +89,5 @@ def register_document_upload(
         document_id=document_id,
         status=ProcessingStatus.UPLOADED.value,
         created_at=created_at,
+        content_sha256=upload.content_sha256,
     )
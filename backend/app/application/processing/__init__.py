@@ -1,11 +1,31 @@
 """Processing package public entry points."""
 
+from .deduplication import reuse_completed_run_for_duplicate
 from .orchestrator import InterpretationBuildError, ProcessingError
+from .pdf_extraction import shutdown_fitz_page_pool
+from .reinterpretation import (
+    ReinterpretationJobRunner,
+    claim_reinterpretation_job,
+    create_reinterpretation_job,
+    created_at_filter_bound,
+    execute_reinterpretation_job,
+    resolve_interpretation_source_run,
+    run_reinterpretation_job,
+)
 from .scheduler import enqueue_processing_run, processing_scheduler
 
 __all__ = [
+    "claim_reinterpretation_job",
+    "create_reinterpretation_job",
+    "created_at_filter_bound",
     "enqueue_processing_run",
+    "execute_reinterpretation_job",
     "processing_scheduler",
+    "resolve_interpretation_source_run",
+    "reuse_completed_run_for_duplicate",
+    "run_reinterpretation_job",
+    "shutdown_fitz_page_pool",
+    "ReinterpretationJobRunner",
     "ProcessingError",
     "InterpretationBuildError",
 ]
@@ -5,6 +5,8 @@ from __future__ import annotations
 import logging
 from collections.abc import Mapping
 
+from backend.app.domain.raw_text_index import RawTextIndex
+
 from . import candidate_ranking
 from .constants import COVERAGE_CONFIDENCE_FALLBACK
 from .date_parsing import (
@@ -27,9 +29,11 @@ from .extractors import (
 logger = logging.getLogger(__name__)
 
 
-def _mine_interpretation_candidates(raw_text: str) -> dict[str, list[dict[str, object]]]:
+def _mine_interpretation_candidates(
+    raw_text: str, raw_text_index: RawTextIndex | None = None
+) -> dict[str, list[dict[str, object]]]:
     logger.debug("_mine_interpretation_candidates start chars=%d", len(raw_text))
-    context = MiningContext.from_raw_text(raw_text)
+    context = MiningContext.from_raw_text(raw_text, raw_text_index)
     collector = CandidateCollector(context)
     _collect_external_candidates(context, collector)
     extract_identifier_candidates(context, collector)
@@ -72,7 +76,6 @@ def _collect_external_candidates(context: MiningContext, collector: CandidateCol
             value=str(date_candidate["value"]),
             confidence=float(date_candidate["confidence"]),
             snippet=str(date_candidate["snippet"]),
-            page=1,
             anchor=(str(date_candidate["anchor"]) if date_candidate.get("anchor") else None),
             anchor_priority=int(date_candidate["anchor_priority"]),
             target_reason=str(date_candidate["target_reason"]),
@@ -52,6 +52,11 @@ def _build_structured_fields_from_global_schema(
     repository: DocumentRepository | None,
 ) -> list[dict[str, object]]:
     fields: list[dict[str, object]] = []
+    calibration_counts = _load_calibration_counts(
+        repository=repository,
+        context_key=context_key,
+        policy_version=policy_version,
+    )
     candidate_suggestions_by_key = {
         key: _build_field_candidate_suggestions(key=key, candidate_bundle=candidate_bundle)
         for key in GLOBAL_SCHEMA_KEYS
@@ -91,7 +96,7 @@ def _build_structured_fields_from_global_schema(
                             context_key=context_key,
                             context_key_aliases=context_key_aliases,
                             policy_version=policy_version,
-                            repository=repository,
+                            calibration_counts=calibration_counts,
                             candidate_suggestions=candidate_suggestions,
                         )
                     )
@@ -119,7 +124,7 @@ def _build_structured_fields_from_global_schema(
                     context_key=context_key,
                     context_key_aliases=context_key_aliases,
                     policy_version=policy_version,
-                    repository=repository,
+                    calibration_counts=calibration_counts,
                     candidate_suggestions=candidate_suggestions,
                 )
             )
@@ -205,7 +210,7 @@ class FieldBuildContext:
     context_key: str
     context_key_aliases: tuple[str, ...]
     policy_version: str
-    repository: DocumentRepository | None
+    calibration_counts: Mapping[tuple[str, str | None], tuple[int, int]] | None
     candidate_suggestions: list[dict[str, object]] | None
 
 
@@ -216,12 +221,10 @@ def _build_structured_field(ctx: FieldBuildContext) -> dict[str, object]:
     field_candidate_confidence = _sanitize_field_candidate_confidence(ctx.confidence)
     text_extraction_reliability = _sanitize_text_extraction_reliability(None)
     field_review_history_adjustment = _resolve_review_history_adjustment(
-        repository=ctx.repository,
-        context_key=ctx.context_key,
+        calibration_counts=ctx.calibration_counts,
         context_key_aliases=ctx.context_key_aliases,
         field_key=ctx.key,
         mapping_id=ctx.mapping_id,
-        policy_version=ctx.policy_version,
     )
     field_mapping_confidence = _compose_field_mapping_confidence(
         candidate_confidence=field_candidate_confidence,
@@ -299,25 +302,34 @@ def _derive_mapping_id(*, key: str, candidate: dict[str, object] | None) -> str
     return None
 
 
-def _resolve_review_history_adjustment(
+def _load_calibration_counts(
     *,
     repository: DocumentRepository | None,
     context_key: str,
+    policy_version: str,
+) -> Mapping[tuple[str, str | None], tuple[int, int]] | None:
+    """Fetch every calibration count of the context once instead of once per field."""
+
+    if repository is None:
+        return None
+    return repository.get_calibration_counts_for_context(
+        context_key=context_key,
+        policy_version=policy_version,
+    )
+
+
+def _resolve_review_history_adjustment(
+    *,
+    calibration_counts: Mapping[tuple[str, str | None], tuple[int, int]] | None,
     context_key_aliases: tuple[str, ...],
     field_key: str,
     mapping_id: str | None,
-    policy_version: str,
 ) -> float:
     _ = context_key_aliases
-    if repository is None:
+    if not calibration_counts:
         return 0.0
 
-    counts = repository.get_calibration_counts(
-        context_key=context_key,
-        field_key=field_key,
-        mapping_id=mapping_id,
-        policy_version=policy_version,
-    )
+    counts = calibration_counts.get((field_key, mapping_id))
     if counts is None:
         return 0.0
 
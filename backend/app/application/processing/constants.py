@@ -7,8 +7,20 @@ import re
 _NAME_TOKEN_PATTERN = re.compile(r"^[A-Za-zÁÉÍÓÚÜÑáéíóúüñ][A-Za-zÁÉÍÓÚÜÑáéíóúüñ'\.-]*$")
 
 PROCESSING_TICK_SECONDS = 0.5
+PROCESSING_IDLE_POLL_MAX_SECONDS = 10.0
+RUN_LEASE_SECONDS = 60.0
+MAX_RUN_CLAIMS = 3
 PROCESSING_TIMEOUT_SECONDS = 120.0
 MAX_RUNS_PER_TICK = 10
+# Bulk re-interpretation checkpoints after each batch; a resumed job repeats at most one batch.
+REINTERPRETATION_BATCH_SIZE = 50
+MAX_RECORDED_REINTERPRETATION_FAILURES = 100
+# Runs in flight per pool worker, so the pool stays busy while other runs do I/O.
+REINTERPRETATION_RUNS_PER_WORKER = 2
+# STEP_STATUS details key recording the run whose raw text (and interpretation) was reused.
+REUSED_FROM_DETAILS_KEY = "reused_from"
+# EXTRACTION details key recording the extractor build and limits that produced the raw text.
+EXTRACTOR_IDENTITY_DETAILS_KEY = "extractor_identity"
 # Legacy compatibility exports (tests/import shims); runtime reads are centralized in settings.py.
 PDF_EXTRACTOR_FORCE_ENV = "PDF_EXTRACTOR_FORCE"
 INTERPRETATION_DEBUG_INCLUDE_CANDIDATES_ENV = "VET_RECORDS_INCLUDE_INTERPRETATION_CANDIDATES"
@@ -0,0 +1,190 @@
+"""Reuse of completed processing results for byte-identical uploads."""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Callable
+from datetime import UTC, datetime
+from uuid import uuid4
+
+from backend.app.config import confidence_policy_version_or_none
+from backend.app.domain.models import ProcessingRunState, StepName, StepStatus
+from backend.app.ports.document_repository import DocumentRepository
+from backend.app.ports.file_storage import FileStorage
+
+from . import pdf_extraction
+from .constants import EXTRACTOR_IDENTITY_DETAILS_KEY, REUSED_FROM_DETAILS_KEY
+from .orchestrator import _append_step_status, _extractor_identity_details
+from .scheduler import EnqueuedRun
+
+logger = logging.getLogger(__name__)
+
+
+def _default_now_iso() -> str:
+    return datetime.now(UTC).isoformat()
+
+
+def _default_id() -> str:
+    return str(uuid4())
+
+
+def reuse_completed_run_for_duplicate(
+    *,
+    document_id: str,
+    content_sha256: str,
+    repository: DocumentRepository,
+    storage: FileStorage,
+    id_provider: Callable[[], str] = _default_id,
+    now_provider: Callable[[], str] = _default_now_iso,
+) -> EnqueuedRun | None:
+    """Complete a run for ``document_id`` from a prior run of identical content.
+
+    The new run links the source run's raw text and copies its machine-built
+    (first) STRUCTURED_INTERPRETATION, so reviewer edits made on the source
+    document are not carried over. STEP_STATUS details record the source run.
+    A source built under another confidence policy version or extractor
+    identity than the current ones is not reused.
+
+    Returns:
+        The completed run, or None when no reusable run exists or linking fails;
+        callers then enqueue a regular processing run.
+    """
+
+    source_run = repository.get_latest_completed_run_by_content_hash(
+        content_sha256=content_sha256,
+        exclude_document_id=document_id,
+    )
+    if source_run is None:
+        return None
+    if not storage.exists_raw_text(document_id=source_run.document_id, run_id=source_run.run_id):
+        return None
+    source_interpretation = repository.get_first_artifact_payload(
+        run_id=source_run.run_id,
+        artifact_type="STRUCTURED_INTERPRETATION",
+    )
+    if source_interpretation is None:
+        return None
+    source_data = source_interpretation.get("data")
+    if not isinstance(source_data, dict):
+        return None
+    if _policy_version(source_data) != confidence_policy_version_or_none():
+        return None
+    extractor_identity = _source_extractor_identity(run_id=source_run.run_id, repository=repository)
+    current_identity = pdf_extraction._pdf_extractor_identity()
+    if current_identity is None:
+        return None
+    if extractor_identity != _extractor_identity_details(current_identity):
+        return None
+
+    run_id = id_provider()
+    created_at = now_provider()
+    repository.create_processing_run(
+        run_id=run_id,
+        document_id=document_id,
+        state=ProcessingRunState.RUNNING,
+        created_at=created_at,
+        started_at=created_at,
+    )
+    lineage: dict[str, object] = {
+        REUSED_FROM_DETAILS_KEY: {
+            "document_id": source_run.document_id,
+            "run_id": source_run.run_id,
+            "content_sha256": content_sha256,
+        }
+    }
+    try:
+        storage.link_raw_text(
+            source_document_id=source_run.document_id,
+            source_run_id=source_run.run_id,
+            document_id=document_id,
+            run_id=run_id,
+        )
+        with repository.run_unit_of_work() as unit_of_work:
+            # The extractor identity is carried over so this run can be reused in turn.
+            for step_name, details in (
+                (
+                    StepName.EXTRACTION,
+                    {**lineage, EXTRACTOR_IDENTITY_DETAILS_KEY: extractor_identity},
+                ),
+                (StepName.INTERPRETATION, lineage),
+            ):
+                _append_step_status(
+                    repository=unit_of_work,
+                    run_id=run_id,
+                    step_name=step_name,
+                    step_status=StepStatus.SUCCEEDED,
+                    attempt=1,
+                    started_at=created_at,
+                    ended_at=now_provider(),
+                    error_code=None,
+                    details=details,
+                )
+            unit_of_work.append_artifact(
+                run_id=run_id,
+                artifact_type="STRUCTURED_INTERPRETATION",
+                payload=_rebind_interpretation(
+                    source_interpretation,
+                    data=source_data,
+                    document_id=document_id,
+                    run_id=run_id,
+                    created_at=created_at,
+                ),
+                created_at=now_provider(),
+            )
+            unit_of_work.complete_run(
+                run_id=run_id,
+                state=ProcessingRunState.COMPLETED,
+                completed_at=now_provider(),
+                failure_type=None,
+            )
+    except Exception:
+        logger.exception(
+            "Failed to reuse processing results for duplicate upload",
+            extra={"document_id": document_id, "source_run_id": source_run.run_id},
+        )
+        repository.complete_run(
+            run_id=run_id,
+            state=ProcessingRunState.FAILED,
+            completed_at=now_provider(),
+            failure_type="REUSE_FAILED",
+        )
+        return None
+
+    return EnqueuedRun(run_id=run_id, created_at=created_at, state=ProcessingRunState.COMPLETED)
+
+
+def _policy_version(data: dict[str, object]) -> str | None:
+    policy = data.get("confidence_policy")
+    if not isinstance(policy, dict):
+        return None
+    version = policy.get("policy_version")
+    return version if isinstance(version, str) else None
+
+
+def _source_extractor_identity(*, run_id: str, repository: DocumentRepository) -> object:
+    """Return the extractor identity recorded by a run's successful EXTRACTION step."""
+
+    for step in reversed(repository.list_step_artifacts(run_id=run_id)):
+        if step.step_name == StepName.EXTRACTION and step.step_status == StepStatus.SUCCEEDED:
+            return (step.details or {}).get(EXTRACTOR_IDENTITY_DETAILS_KEY)
+    return None
+
+
+def _rebind_interpretation(
+    payload: dict[str, object],
+    *,
+    data: dict[str, object],
+    document_id: str,
+    run_id: str,
+    created_at: str,
+) -> dict[str, object]:
+    data = dict(data)
+    data["document_id"] = document_id
+    data["processing_run_id"] = run_id
+    data["created_at"] = created_at
+    return {
+        **payload,
+        "interpretation_id": str(uuid4()),
+        "version_number": 1,
+        "data": data,
+    }
@@ -0,0 +1,121 @@
+"""Execution backends for CPU-bound processing work (extraction and interpretation)."""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import logging
+import multiprocessing
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Protocol, TypeVar
+
+from backend.app.config import (
+    PROCESSING_EXECUTOR_PROCESS,
+    processing_executor_mode,
+    processing_process_workers,
+)
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+_in_processing_worker = False
+
+
+def mark_processing_worker() -> None:
+    """Pool initializer flagging this process as a processing worker."""
+
+    global _in_processing_worker
+    _in_processing_worker = True
+
+
+def in_processing_worker() -> bool:
+    """Return whether this process was started by a processing pool initializer."""
+
+    return _in_processing_worker
+
+
+class ProcessingExecutor(Protocol):
+    """Runs blocking processing callables without stalling the event loop."""
+
+    async def run(self, fn: Callable[..., T], /, *args: object, **kwargs: object) -> T:
+        """Run ``fn(*args, **kwargs)`` and return its result."""
+
+    def shutdown(self) -> None:
+        """Release executor resources."""
+
+
+class ThreadProcessingExecutor:
+    """Run work in the default thread pool (in-process; used by tests and small deployments)."""
+
+    async def run(self, fn: Callable[..., T], /, *args: object, **kwargs: object) -> T:
+        return await asyncio.to_thread(fn, *args, **kwargs)
+
+    def shutdown(self) -> None:
+        return None
+
+
+class ProcessPoolProcessingExecutor:
+    """Run work in a spawn-based process pool so CPU-bound steps scale across cores.
+
+    Callables must be importable module-level functions and every argument and
+    result must be picklable. The pool is created lazily on first use, and again
+    after a worker died and broke it.
+    """
+
+    def __init__(self, *, max_workers: int) -> None:
+        self._max_workers = max(1, max_workers)
+        self._pool: ProcessPoolExecutor | None = None
+
+    @property
+    def max_workers(self) -> int:
+        return self._max_workers
+
+    def _ensure_pool(self) -> ProcessPoolExecutor:
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(
+                max_workers=self._max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=mark_processing_worker,
+            )
+            logger.info("Started processing process pool max_workers=%s", self._max_workers)
+        return self._pool
+
+    async def run(self, fn: Callable[..., T], /, *args: object, **kwargs: object) -> T:
+        loop = asyncio.get_running_loop()
+        pool = self._ensure_pool()
+        try:
+            return await loop.run_in_executor(pool, functools.partial(fn, *args, **kwargs))
+        except BrokenProcessPool:
+            # A broken pool rejects every later submission; fail this call and
+            # let the next one start a fresh pool.
+            if self._pool is pool:
+                self._pool = None
+                pool.shutdown(wait=False, cancel_futures=True)
+                logger.warning("Processing process pool broke; it will be restarted")
+            raise
+
+    def shutdown(self) -> None:
+        if self._pool is None:
+            return
+        self._pool.shutdown(wait=True, cancel_futures=True)
+        self._pool = None
+
+
+_DEFAULT_EXECUTOR = ThreadProcessingExecutor()
+
+
+def default_processing_executor() -> ProcessingExecutor:
+    """Return the shared in-thread executor used when no backend is injected."""
+
+    return _DEFAULT_EXECUTOR
+
+
+def build_processing_executor() -> ProcessingExecutor:
+    """Build the executor selected by ``VET_RECORDS_PROCESSING_EXECUTOR``."""
+
+    if processing_executor_mode() == PROCESSING_EXECUTOR_PROCESS:
+        return ProcessPoolProcessingExecutor(max_workers=processing_process_workers())
+    return _DEFAULT_EXECUTOR
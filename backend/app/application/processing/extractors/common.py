@@ -7,6 +7,8 @@ from collections import defaultdict
 from collections.abc import Iterable
 from dataclasses import dataclass
 
+from backend.app.domain.raw_text_index import RawTextIndex
+
 from ...field_normalizers import SPECIES_TOKEN_TO_CANONICAL
 from ..constants import (
     _ADDRESS_LIKE_PATTERN,
@@ -37,18 +39,28 @@ class MiningContext:
     raw_text: str
     compact_text: str
     lines: list[str]
+    index: RawTextIndex
 
     @classmethod
-    def from_raw_text(cls, raw_text: str) -> MiningContext:
+    def from_raw_text(cls, raw_text: str, index: RawTextIndex | None = None) -> MiningContext:
         compact_text = _WHITESPACE_PATTERN.sub(" ", raw_text).strip()
         lines = [line.strip() for line in raw_text.splitlines() if line.strip()]
-        return cls(raw_text=raw_text, compact_text=compact_text, lines=lines)
+        return cls(
+            raw_text=raw_text,
+            compact_text=compact_text,
+            lines=lines,
+            index=index or RawTextIndex.build(raw_text),
+        )
 
     @property
     def species_keywords(self) -> dict[str, str]:
         return SPECIES_TOKEN_TO_CANONICAL
 
 
+# Evidence page placeholder: resolve the page from where the snippet occurs.
+PAGE_FROM_OFFSET = 0
+
+
 class CandidateCollector:
     def __init__(self, context: MiningContext) -> None:
         self.context = context
@@ -71,7 +83,7 @@ class CandidateCollector:
         value: str,
         confidence: float,
         snippet: str,
-        page: int | None = 1,
+        page: int | None = PAGE_FROM_OFFSET,
         anchor: str | None = None,
         anchor_priority: int = 0,
         target_reason: str | None = None,
@@ -88,6 +100,8 @@ class CandidateCollector:
         snippet_offset = (
             self.context.raw_text.rfind(normalized_snippet) if normalized_snippet else -1
         )
+        if page == PAGE_FROM_OFFSET:
+            page = self.context.index.page_for_offset(snippet_offset) if snippet_offset >= 0 else 1
         self.candidates[key].append(
             {
                 "value": cleaned_value,
@@ -22,6 +22,7 @@ from backend.app.config import (
     confidence_policy_explicit_config_diagnostics,
     confidence_policy_version_or_none,
 )
+from backend.app.domain.raw_text_index import RawTextIndex
 from backend.app.ports.document_repository import DocumentRepository
 from backend.app.settings import should_include_interpretation_candidates
 
@@ -53,6 +54,7 @@ def _build_interpretation_artifact(
     run_id: str,
     raw_text: str,
     repository: DocumentRepository | None = None,
+    raw_text_index: RawTextIndex | None = None,
 ) -> dict[str, object]:
     compact_text = _WHITESPACE_PATTERN.sub(" ", raw_text).strip()
     warning_codes: list[str] = []
@@ -60,7 +62,7 @@ def _build_interpretation_artifact(
     canonical_evidence: dict[str, list[dict[str, object]]] = {}
 
     if compact_text:
-        candidate_bundle = _mine_interpretation_candidates(raw_text)
+        candidate_bundle = _mine_interpretation_candidates(raw_text, raw_text_index)
         canonical_values, canonical_evidence = _map_candidates_to_global_schema(candidate_bundle)
         canonical_values = normalize_canonical_fields(
             canonical_values,
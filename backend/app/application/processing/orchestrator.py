@@ -3,8 +3,10 @@
 from __future__ import annotations
 
 import asyncio
+import hashlib
 import logging
 from datetime import UTC, datetime
+from pathlib import Path
 
 from backend.app.application.extraction_observability import (
     build_extraction_snapshot_from_interpretation,
@@ -12,6 +14,7 @@ from backend.app.application.extraction_observability import (
 )
 from backend.app.application.extraction_quality import evaluate_extracted_text_quality
 from backend.app.config import (
+    extraction_early_abort_pages,
     extraction_observability_enabled,
 )
 from backend.app.domain.models import (
@@ -20,11 +23,18 @@ from backend.app.domain.models import (
     StepName,
     StepStatus,
 )
+from backend.app.domain.raw_text_index import RawTextIndex
 from backend.app.ports.document_repository import DocumentRepository
-from backend.app.ports.file_storage import FileStorage
+from backend.app.ports.file_storage import ExtractionCacheKey, FileStorage
+from backend.app.ports.run_repository import RunUnitOfWork
 
 from . import pdf_extraction
-from .constants import PROCESSING_TIMEOUT_SECONDS
+from .constants import (
+    EXTRACTOR_IDENTITY_DETAILS_KEY,
+    PROCESSING_TIMEOUT_SECONDS,
+    REUSED_FROM_DETAILS_KEY,
+)
+from .execution import ProcessingExecutor, default_processing_executor
 from .interpretation import _build_interpretation_artifact
 
 logger = logging.getLogger(__name__)
@@ -50,10 +60,34 @@ class InterpretationBuildError(Exception):
         self.error_code = error_code
         self.details = details
 
+    def __reduce__(self) -> tuple[object, ...]:
+        # Keyword-only __init__: rebuild explicitly so the error survives the
+        # trip back from a process-pool worker.
+        return (self.__class__._rebuild, (self.error_code, self.details))
+
+    @classmethod
+    def _rebuild(
+        cls, error_code: str, details: dict[str, object] | None
+    ) -> InterpretationBuildError:
+        return cls(error_code=error_code, details=details)
+
 
 async def _execute_run(
-    *, run: ProcessingRun, repository: DocumentRepository, storage: FileStorage
+    *,
+    run: ProcessingRun,
+    repository: DocumentRepository,
+    storage: FileStorage,
+    executor: ProcessingExecutor | None = None,
+    unit_of_work: RunUnitOfWork | None = None,
 ) -> None:
+    """Execute a started run and record its terminal state.
+
+    When ``unit_of_work`` is given, STEP_STATUS/artifact writes and the run
+    completion are buffered in it and committed at step boundaries instead of
+    one transaction per write.
+    """
+
+    writer = unit_of_work or repository
     try:
         await asyncio.wait_for(
             _process_document(
@@ -61,42 +95,49 @@ async def _execute_run(
                 document_id=run.document_id,
                 repository=repository,
                 storage=storage,
+                executor=executor,
+                unit_of_work=unit_of_work,
+                source_run_id=run.source_run_id,
             ),
             timeout=PROCESSING_TIMEOUT_SECONDS,
         )
     except TimeoutError:
-        repository.complete_run(
+        writer.complete_run(
             run_id=run.run_id,
             state=ProcessingRunState.TIMED_OUT,
             completed_at=_default_now_iso(),
             failure_type=None,
         )
+        _commit_unit_of_work(unit_of_work)
         return
     except ProcessingError as exc:
-        repository.complete_run(
+        writer.complete_run(
             run_id=run.run_id,
             state=ProcessingRunState.FAILED,
             completed_at=_default_now_iso(),
             failure_type=exc.failure_type,
         )
+        _commit_unit_of_work(unit_of_work)
         return
     except Exception as exc:  # pragma: no cover - defensive
         logger.exception("Processing run failed: %s", exc)
-        repository.complete_run(
+        writer.complete_run(
             run_id=run.run_id,
             state=ProcessingRunState.FAILED,
             completed_at=_default_now_iso(),
             failure_type="INTERPRETATION_FAILED",
         )
+        _commit_unit_of_work(unit_of_work)
         return
 
     completed_at = _default_now_iso()
-    repository.complete_run(
+    writer.complete_run(
         run_id=run.run_id,
         state=ProcessingRunState.COMPLETED,
         completed_at=completed_at,
         failure_type=None,
     )
+    _commit_unit_of_work(unit_of_work)
     _persist_observability_snapshot_for_completed_run(
         repository=repository,
         document_id=run.document_id,
@@ -146,10 +187,137 @@ async def _process_document(
     document_id: str,
     repository: DocumentRepository,
     storage: FileStorage,
+    executor: ProcessingExecutor | None = None,
+    unit_of_work: RunUnitOfWork | None = None,
+    source_run_id: str | None = None,
 ) -> None:
+    """Run extraction and interpretation for a started run.
+
+    CPU-bound steps (PDF extraction, quality scoring, interpretation) go through
+    ``executor`` so they never run on the event loop thread; the default is the
+    in-thread executor. Writes go to ``unit_of_work`` when provided; RUNNING
+    transitions are committed immediately so progress stays visible.
+
+    With ``source_run_id`` the run is interpretation-only: extraction is skipped
+    and the interpretation is rebuilt from that run's stored raw text.
+    """
+
+    executor = executor or default_processing_executor()
+    writer = unit_of_work or repository
+    lineage: dict[str, object] | None = None
+    if source_run_id is None:
+        raw_text, raw_text_index = await _run_extraction_step(
+            run_id=run_id,
+            document_id=document_id,
+            repository=repository,
+            storage=storage,
+            executor=executor,
+            writer=writer,
+            unit_of_work=unit_of_work,
+        )
+    else:
+        lineage = {REUSED_FROM_DETAILS_KEY: {"document_id": document_id, "run_id": source_run_id}}
+        raw_text, raw_text_index = await _reuse_source_raw_text(
+            run_id=run_id,
+            document_id=document_id,
+            source_run_id=source_run_id,
+            storage=storage,
+            writer=writer,
+            lineage=lineage,
+        )
+
+    interpretation_started_at = _default_now_iso()
+    _append_step_status(
+        repository=writer,
+        run_id=run_id,
+        step_name=StepName.INTERPRETATION,
+        step_status=StepStatus.RUNNING,
+        attempt=1,
+        started_at=interpretation_started_at,
+        ended_at=None,
+        error_code=None,
+        details=lineage,
+    )
+    _commit_unit_of_work(unit_of_work)
+    try:
+        interpretation_payload = await executor.run(
+            _build_interpretation_artifact,
+            document_id=document_id,
+            run_id=run_id,
+            raw_text=raw_text,
+            repository=repository,
+            raw_text_index=raw_text_index,
+        )
+        writer.append_artifact(
+            run_id=run_id,
+            artifact_type="STRUCTURED_INTERPRETATION",
+            payload=interpretation_payload,
+            created_at=_default_now_iso(),
+        )
+    except InterpretationBuildError as exc:
+        _append_step_status(
+            repository=writer,
+            run_id=run_id,
+            step_name=StepName.INTERPRETATION,
+            step_status=StepStatus.FAILED,
+            attempt=1,
+            started_at=interpretation_started_at,
+            ended_at=_default_now_iso(),
+            error_code=exc.error_code,
+            details=exc.details,
+        )
+        raise ProcessingError("INTERPRETATION_FAILED") from exc
+    except Exception as exc:
+        _append_step_status(
+            repository=writer,
+            run_id=run_id,
+            step_name=StepName.INTERPRETATION,
+            step_status=StepStatus.FAILED,
+            attempt=1,
+            started_at=interpretation_started_at,
+            ended_at=_default_now_iso(),
+            error_code="INTERPRETATION_FAILED",
+            details=lineage,
+        )
+        raise ProcessingError("INTERPRETATION_FAILED") from exc
+
+    await _materialize_review_projection(
+        run_id=run_id,
+        interpretation_payload=interpretation_payload,
+        raw_text=raw_text,
+        writer=writer,
+        executor=executor,
+    )
+
+    await asyncio.sleep(0.05)
+    _append_step_status(
+        repository=writer,
+        run_id=run_id,
+        step_name=StepName.INTERPRETATION,
+        step_status=StepStatus.SUCCEEDED,
+        attempt=1,
+        started_at=interpretation_started_at,
+        ended_at=_default_now_iso(),
+        error_code=None,
+        details=lineage,
+    )
+
+
+async def _run_extraction_step(
+    *,
+    run_id: str,
+    document_id: str,
+    repository: DocumentRepository,
+    storage: FileStorage,
+    executor: ProcessingExecutor,
+    writer: DocumentRepository | RunUnitOfWork,
+    unit_of_work: RunUnitOfWork | None,
+) -> tuple[str, RawTextIndex]:
+    """Extract, quality-gate and store the raw text of the document's PDF and its index."""
+
     extraction_started_at = _default_now_iso()
     _append_step_status(
-        repository=repository,
+        repository=writer,
         run_id=run_id,
         step_name=StepName.EXTRACTION,
         step_status=StepStatus.RUNNING,
@@ -158,11 +326,12 @@ async def _process_document(
         ended_at=None,
         error_code=None,
     )
+    _commit_unit_of_work(unit_of_work)
 
     document = repository.get(document_id)
     if document is None:
         _append_step_status(
-            repository=repository,
+            repository=writer,
             run_id=run_id,
             step_name=StepName.EXTRACTION,
             step_status=StepStatus.FAILED,
@@ -174,7 +343,7 @@ async def _process_document(
         raise ProcessingError("EXTRACTION_FAILED")
     if not storage.exists(storage_path=document.storage_path):
         _append_step_status(
-            repository=repository,
+            repository=writer,
             run_id=run_id,
             step_name=StepName.EXTRACTION,
             step_status=StepStatus.FAILED,
@@ -189,7 +358,7 @@ async def _process_document(
     file_size = await asyncio.to_thread(lambda: file_path.stat().st_size)
     if file_size == 0:
         _append_step_status(
-            repository=repository,
+            repository=writer,
             run_id=run_id,
             step_name=StepName.EXTRACTION,
             step_status=StepStatus.FAILED,
@@ -200,14 +369,44 @@ async def _process_document(
         )
         raise ProcessingError("EXTRACTION_FAILED")
 
-    raw_text, extractor_used = await asyncio.to_thread(
-        pdf_extraction._extract_pdf_text_with_extractor, file_path
+    cache_key = await asyncio.to_thread(
+        _extraction_cache_key, content_sha256=document.content_sha256, file_path=file_path
+    )
+    cached = (
+        await asyncio.to_thread(storage.read_cached_extraction, key=cache_key)
+        if cache_key is not None
+        else None
     )
-    quality_score, quality_pass, quality_reasons = evaluate_extracted_text_quality(raw_text)
+    streamed: pdf_extraction.StreamedPdfText | None = None
+    if cached is not None and cache_key is not None:
+        raw_text, extractor_used = cached.text, cache_key.extractor
+        page_starts, fallback_pages = cached.page_starts, cached.fallback_pages
+    else:
+        # Pages are written to the run's staging file as they are extracted and
+        # the file is only published once the quality gate passes.
+        try:
+            streamed = await executor.run(
+                pdf_extraction._stream_pdf_text_with_extractor,
+                file_path,
+                storage.stage_raw_text(document_id=document_id, run_id=run_id),
+                extraction_early_abort_pages(),
+            )
+        except BaseException:
+            storage.discard_raw_text(document_id=document_id, run_id=run_id)
+            raise
+        raw_text, extractor_used = streamed.text, streamed.extractor
+        page_starts, fallback_pages = streamed.page_starts, streamed.fallback_pages
+    if streamed is not None and streamed.aborted:
+        quality_score, quality_pass, quality_reasons = 0.0, False, ["NOT_HUMAN_READABLE"]
+    else:
+        quality_score, quality_pass, quality_reasons = await executor.run(
+            evaluate_extracted_text_quality, raw_text
+        )
     logger.info(
         (
             "PDF extraction finished run_id=%s document_id=%s extractor=%s chars=%d "
-            "quality_score=%.3f quality_pass=%s quality_reasons=%s"
+            "quality_score=%.3f quality_pass=%s quality_reasons=%s cache_hit=%s "
+            "early_abort_pages=%s fallback_pages=%s"
         ),
         run_id,
         document_id,
@@ -216,10 +415,15 @@ async def _process_document(
         quality_score,
         quality_pass,
         quality_reasons,
+        cached is not None,
+        streamed.pages if streamed is not None and streamed.aborted else None,
+        list(fallback_pages),
     )
     if not quality_pass:
+        if streamed is not None:
+            storage.discard_raw_text(document_id=document_id, run_id=run_id)
         _append_step_status(
-            repository=repository,
+            repository=writer,
             run_id=run_id,
             step_name=StepName.EXTRACTION,
             step_status=StepStatus.FAILED,
@@ -230,11 +434,17 @@ async def _process_document(
         )
         raise ProcessingError("EXTRACTION_LOW_QUALITY")
 
+    raw_text_index = await executor.run(RawTextIndex.build, raw_text, page_starts)
     try:
-        storage.save_raw_text(document_id=document_id, run_id=run_id, text=raw_text)
+        if streamed is not None:
+            storage.commit_raw_text(document_id=document_id, run_id=run_id, index=raw_text_index)
+        else:
+            storage.save_raw_text(
+                document_id=document_id, run_id=run_id, text=raw_text, index=raw_text_index
+            )
     except Exception as exc:
         _append_step_status(
-            repository=repository,
+            repository=writer,
             run_id=run_id,
             step_name=StepName.EXTRACTION,
             step_status=StepStatus.FAILED,
@@ -244,9 +454,22 @@ async def _process_document(
             error_code="EXTRACTION_FAILED",
         )
         raise ProcessingError("EXTRACTION_FAILED") from exc
+    # Only text that passed the quality gate is cached, so a degraded extraction
+    # (e.g. cut short by the parser deadline) is retried rather than pinned.
+    if cached is None and cache_key is not None and extractor_used == cache_key.extractor:
+        try:
+            await asyncio.to_thread(
+                storage.write_cached_extraction,
+                key=cache_key,
+                text=raw_text,
+                page_starts=page_starts,
+                fallback_pages=fallback_pages,
+            )
+        except OSError:
+            logger.warning("Failed to cache extracted text document_id=%s", document_id)
 
     _append_step_status(
-        repository=repository,
+        repository=writer,
         run_id=run_id,
         step_name=StepName.EXTRACTION,
         step_status=StepStatus.SUCCEEDED,
@@ -254,75 +477,155 @@ async def _process_document(
         started_at=extraction_started_at,
         ended_at=_default_now_iso(),
         error_code=None,
+        details=_extraction_details(
+            extractor_used=extractor_used, fallback_pages=fallback_pages, cache_key=cache_key
+        ),
     )
+    return raw_text, raw_text_index
 
-    interpretation_started_at = _default_now_iso()
-    _append_step_status(
-        repository=repository,
-        run_id=run_id,
-        step_name=StepName.INTERPRETATION,
-        step_status=StepStatus.RUNNING,
-        attempt=1,
-        started_at=interpretation_started_at,
-        ended_at=None,
-        error_code=None,
+
+def _extraction_details(
+    *,
+    extractor_used: str,
+    fallback_pages: tuple[int, ...],
+    cache_key: ExtractionCacheKey | None,
+) -> dict[str, object] | None:
+    details: dict[str, object] = {}
+    if fallback_pages:
+        details.update(extractor=extractor_used, fallback_pages=list(fallback_pages))
+    # Recorded only when the identity describes the extractor that actually ran,
+    # so duplicate uploads reuse raw text only from the current extractor build.
+    if cache_key is not None and extractor_used == cache_key.extractor:
+        details[EXTRACTOR_IDENTITY_DETAILS_KEY] = _extractor_identity_details(
+            (cache_key.extractor, cache_key.extractor_version, cache_key.limits)
+        )
+    return details or None
+
+
+def _extractor_identity_details(identity: tuple[str, str, str]) -> dict[str, str]:
+    """Return the STEP_STATUS details form of a `_pdf_extractor_identity` tuple."""
+
+    extractor, extractor_version, limits = identity
+    return {"extractor": extractor, "extractor_version": extractor_version, "limits": limits}
+
+
+def _extraction_cache_key(
+    *, content_sha256: str | None, file_path: Path
+) -> ExtractionCacheKey | None:
+    """Return the extraction cache key of a PDF, or None when extraction cannot run."""
+
+    identity = pdf_extraction._pdf_extractor_identity()
+    if identity is None:
+        return None
+    if content_sha256 is None:
+        digest = hashlib.sha256()
+        with file_path.open("rb") as handle:
+            for chunk in iter(lambda: handle.read(1024 * 1024), b""):
+                digest.update(chunk)
+        content_sha256 = digest.hexdigest()
+    extractor, extractor_version, limits = identity
+    return ExtractionCacheKey(
+        content_sha256=content_sha256,
+        extractor=extractor,
+        extractor_version=extractor_version,
+        limits=limits,
     )
+
+
+async def _reuse_source_raw_text(
+    *,
+    run_id: str,
+    document_id: str,
+    source_run_id: str,
+    storage: FileStorage,
+    writer: DocumentRepository | RunUnitOfWork,
+    lineage: dict[str, object],
+) -> tuple[str, RawTextIndex | None]:
+    """Link the source run's raw text (and its index) into this run instead of extracting again."""
+
+    started_at = _default_now_iso()
     try:
-        interpretation_payload = _build_interpretation_artifact(
+        await asyncio.to_thread(
+            storage.link_raw_text,
+            source_document_id=document_id,
+            source_run_id=source_run_id,
             document_id=document_id,
             run_id=run_id,
-            raw_text=raw_text,
-            repository=repository,
         )
-        repository.append_artifact(
-            run_id=run_id,
-            artifact_type="STRUCTURED_INTERPRETATION",
-            payload=interpretation_payload,
-            created_at=_default_now_iso(),
+        raw_text_path = storage.resolve_raw_text(document_id=document_id, run_id=run_id)
+        raw_text = await asyncio.to_thread(raw_text_path.read_text, encoding="utf-8")
+        raw_text_index = await asyncio.to_thread(
+            storage.read_raw_text_index, document_id=document_id, run_id=run_id
         )
-    except InterpretationBuildError as exc:
-        _append_step_status(
-            repository=repository,
-            run_id=run_id,
-            step_name=StepName.INTERPRETATION,
-            step_status=StepStatus.FAILED,
-            attempt=1,
-            started_at=interpretation_started_at,
-            ended_at=_default_now_iso(),
-            error_code=exc.error_code,
-            details=exc.details,
-        )
-        raise ProcessingError("INTERPRETATION_FAILED") from exc
     except Exception as exc:
         _append_step_status(
-            repository=repository,
+            repository=writer,
             run_id=run_id,
-            step_name=StepName.INTERPRETATION,
+            step_name=StepName.EXTRACTION,
             step_status=StepStatus.FAILED,
             attempt=1,
-            started_at=interpretation_started_at,
+            started_at=started_at,
             ended_at=_default_now_iso(),
-            error_code="INTERPRETATION_FAILED",
-            details=None,
+            error_code="EXTRACTION_FAILED",
+            details=lineage,
         )
-        raise ProcessingError("INTERPRETATION_FAILED") from exc
+        raise ProcessingError("EXTRACTION_FAILED") from exc
 
-    await asyncio.sleep(0.05)
     _append_step_status(
-        repository=repository,
+        repository=writer,
         run_id=run_id,
-        step_name=StepName.INTERPRETATION,
+        step_name=StepName.EXTRACTION,
         step_status=StepStatus.SUCCEEDED,
         attempt=1,
-        started_at=interpretation_started_at,
+        started_at=started_at,
         ended_at=_default_now_iso(),
         error_code=None,
+        details=lineage,
+    )
+    return raw_text, raw_text_index
+
+
+async def _materialize_review_projection(
+    *,
+    run_id: str,
+    interpretation_payload: dict[str, object],
+    raw_text: str,
+    writer: DocumentRepository | RunUnitOfWork,
+    executor: ProcessingExecutor,
+) -> None:
+    """Store the review projection with the run so review reads skip recomputing it.
+
+    Failures are logged only; the review endpoint recomputes a missing projection.
+    """
+
+    from backend.app.application.documents.review_payload_projector import (
+        REVIEW_PROJECTION_ARTIFACT_TYPE,
+        build_review_projection_artifact,
     )
 
+    try:
+        projection = await executor.run(
+            build_review_projection_artifact, interpretation_payload, raw_text=raw_text
+        )
+    except Exception:
+        logger.exception("Failed to build review projection run_id=%s", run_id)
+        return
+    writer.append_artifact(
+        run_id=run_id,
+        artifact_type=REVIEW_PROJECTION_ARTIFACT_TYPE,
+        payload=projection,
+        created_at=_default_now_iso(),
+    )
+
+
+def _commit_unit_of_work(unit_of_work: RunUnitOfWork | None) -> None:
+    if unit_of_work is not None:
+        unit_of_work.commit()
+
 
 def _append_step_status(
     *,
-    repository: DocumentRepository,
+    repository: DocumentRepository | RunUnitOfWork,
     run_id: str,
     step_name: StepName,
     step_status: StepStatus,
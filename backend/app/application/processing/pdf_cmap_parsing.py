@@ -2,7 +2,14 @@
 
 from __future__ import annotations
 
+import hashlib
 import re
+import threading
+from array import array
+from bisect import bisect_left
+from collections import OrderedDict
+from collections.abc import Iterator, Mapping
+from dataclasses import dataclass
 
 from . import pdf_fallback_shared as shared
 from .pdf_page_structure import _extract_object_stream
@@ -17,6 +24,10 @@ _HEX_PAIR_PATTERN = re.compile(rb"<([0-9A-Fa-f]+)>\s*<([0-9A-Fa-f]+)>")
 _BFRANGE_INLINE_PATTERN = re.compile(rb"<([0-9A-Fa-f]+)>\s*<([0-9A-Fa-f]+)>\s*<([0-9A-Fa-f]+)>")
 _BFRANGE_ARRAY_PATTERN = re.compile(rb"<([0-9A-Fa-f]+)>\s*<([0-9A-Fa-f]+)>\s*\[(.*)\]")
 _BFRANGE_ARRAY_ENTRY_PATTERN = re.compile(rb"<([0-9A-Fa-f]+)>")
+# Character codes are at most four bytes long.
+_MAX_CODE = 0xFFFFFFFF
+# Destination values that `_decode_unicode_hex` turns into ``chr(value)``, by hex width.
+_DIRECT_DESTINATIONS = {2: ((0, 0xFF),), 4: ((0, 0xD7FF), (0xE000, 0xFFFF))}
 
 
 def _parse_tounicode_cmap(chunk: bytes) -> shared.PdfCMap | None:
@@ -35,6 +46,8 @@ def _parse_tounicode_cmap(chunk: bytes) -> shared.PdfCMap | None:
         for src_hex, dst_hex in _HEX_PAIR_PATTERN.findall(block):
             mapping[int(src_hex, 16)] = _decode_unicode_hex(dst_hex)
 
+    ranges = _CodeRanges()
+
     for block in _BFRANGE_BLOCK_PATTERN.findall(chunk):
         for line in block.splitlines():
             line = line.strip()
@@ -44,33 +57,105 @@ def _parse_tounicode_cmap(chunk: bytes) -> shared.PdfCMap | None:
             inline_match = _BFRANGE_INLINE_PATTERN.match(line)
             if inline_match:
                 start_hex, end_hex, dst_start_hex = inline_match.groups()
-                start = int(start_hex, 16)
-                end = int(end_hex, 16)
-                dst_start = int(dst_start_hex, 16)
-                for offset, code in enumerate(range(start, end + 1)):
-                    mapping[code] = _decode_unicode_hex(
-                        f"{dst_start + offset:0{len(dst_start_hex)}X}".encode("ascii")
-                    )
+                ranges.add_destination_range(
+                    int(start_hex, 16),
+                    int(end_hex, 16),
+                    int(dst_start_hex, 16),
+                    len(dst_start_hex),
+                )
                 continue
 
             array_match = _BFRANGE_ARRAY_PATTERN.match(line)
             if not array_match:
                 continue
             start_hex, end_hex, destinations = array_match.groups()
+            start = int(start_hex, 16)
             destination_values = _BFRANGE_ARRAY_ENTRY_PATTERN.findall(destinations)
-            for offset, code in enumerate(range(int(start_hex, 16), int(end_hex, 16) + 1)):
-                if offset >= len(destination_values):
-                    break
-                mapping[code] = _decode_unicode_hex(destination_values[offset])
+            values = tuple(
+                _decode_unicode_hex(value)
+                for value in destination_values[: max(0, int(end_hex, 16) - start + 1)]
+            )
+            if values:
+                ranges.add(start, start + len(values) - 1, 0, values)
 
-    if not mapping:
+    if not mapping and not ranges.starts:
         return None
     return shared.PdfCMap(
         codepoints=mapping,
         code_lengths=tuple(sorted(code_lengths, reverse=True)),
+        range_starts=array("I", ranges.starts),
+        range_ends=array("I", ranges.ends),
+        range_bases=array("I", ranges.bases),
+        range_values=tuple(ranges.values),
     )
 
 
+class _CodeRanges:
+    """Sorted, disjoint ``bfrange`` ranges; a later range replaces what it overlaps.
+
+    Destinations that increment a single BMP character (or latin-1 byte) are
+    stored as a base code point; any other destination gets a value table.
+    """
+
+    def __init__(self) -> None:
+        self.starts: list[int] = []
+        self.ends: list[int] = []
+        self.bases: list[int] = []
+        self.values: list[tuple[str, ...] | None] = []
+
+    def add_destination_range(self, start: int, end: int, destination: int, width: int) -> None:
+        """Map ``start..end`` to consecutive destinations, written ``width`` hex digits wide."""
+
+        last = destination + end - start
+        value = destination
+        while value <= last:
+            piece_end, direct = last, False
+            for lower, upper in _DIRECT_DESTINATIONS.get(width, ()):
+                if lower <= value <= upper:
+                    piece_end, direct = min(upper, last), True
+                    break
+                if value < lower:
+                    piece_end = min(piece_end, lower - 1)
+            code = start + value - destination
+            if direct:
+                self.add(code, code + piece_end - value, value, None)
+            else:
+                values = tuple(
+                    _decode_unicode_hex(f"{destination_value:0{width}X}".encode("ascii"))
+                    for destination_value in range(value, piece_end + 1)
+                )
+                self.add(code, code + piece_end - value, 0, values)
+            value = piece_end + 1
+
+    def add(self, start: int, end: int, base: int, values: tuple[str, ...] | None) -> None:
+        if start > _MAX_CODE:
+            return
+        end = min(end, _MAX_CODE)
+        first = bisect_left(self.ends, start)
+        stop = first
+        while stop < len(self.starts) and self.starts[stop] <= end:
+            stop += 1
+        pieces = []
+        if first < stop and self.starts[first] < start:
+            pieces.append(self._piece(first, self.starts[first], start - 1))
+        pieces.append((start, end, base, values))
+        if first < stop and self.ends[stop - 1] > end:
+            pieces.append(self._piece(stop - 1, end + 1, self.ends[stop - 1]))
+        self.starts[first:stop] = [piece[0] for piece in pieces]
+        self.ends[first:stop] = [piece[1] for piece in pieces]
+        self.bases[first:stop] = [piece[2] for piece in pieces]
+        self.values[first:stop] = [piece[3] for piece in pieces]
+
+    def _piece(
+        self, index: int, start: int, end: int
+    ) -> tuple[int, int, int, tuple[str, ...] | None]:
+        offset = start - self.starts[index]
+        values = self.values[index]
+        if values is None:
+            return start, end, self.bases[index] + offset, None
+        return start, end, 0, values[offset : offset + end - start + 1]
+
+
 def _decode_unicode_hex(hex_value: bytes) -> str:
     if len(hex_value) % 2 == 1:
         hex_value = b"0" + hex_value
@@ -83,15 +168,110 @@ def _decode_unicode_hex(hex_value: bytes) -> str:
     return raw.decode("latin-1", errors="ignore")
 
 
-def _extract_cmaps_by_object(objects: dict[int, bytes]) -> dict[int, shared.PdfCMap]:
-    cmaps: dict[int, shared.PdfCMap] = {}
-    for object_id, object_payload in objects.items():
-        if shared.deadline_exceeded():
-            break
+@dataclass(frozen=True, slots=True)
+class CMapCacheStats:
+    """Counters and occupancy of the process-wide parsed CMap cache."""
+
+    hits: int
+    misses: int
+    entries: int
+    max_entries: int
+
+    @property
+    def hit_rate(self) -> float | None:
+        lookups = self.hits + self.misses
+        if lookups == 0:
+            return None
+        return self.hits / lookups
+
+
+class _ParsedCMapCache:
+    """Parsed ToUnicode CMaps keyed by a digest of the inflated stream, LRU-bounded.
+
+    Documents produced by the same software embed byte-identical CMaps, so
+    they are parsed once per process. Streams that are not CMaps are cached
+    too (as None). Cached CMaps are shared between documents and must not be
+    mutated.
+    """
+
+    def __init__(self, *, max_entries: int) -> None:
+        self._max_entries = max_entries
+        self._entries: OrderedDict[bytes, shared.PdfCMap | None] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def get_or_parse(self, stream: bytes) -> shared.PdfCMap | None:
+        key = hashlib.blake2b(stream, digest_size=16).digest()
+        with self._lock:
+            if key in self._entries:
+                self._hits += 1
+                self._entries.move_to_end(key)
+                return self._entries[key]
+            self._misses += 1
+        cmap = _parse_tounicode_cmap(stream)
+        with self._lock:
+            self._entries[key] = cmap
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+        return cmap
+
+    def stats(self) -> CMapCacheStats:
+        with self._lock:
+            return CMapCacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                entries=len(self._entries),
+                max_entries=self._max_entries,
+            )
+
+
+_PARSED_CMAPS = _ParsedCMapCache(max_entries=shared.MAX_CACHED_CMAPS)
+
+
+def cmap_cache_stats() -> CMapCacheStats:
+    """Return this process's parsed CMap cache counters."""
+
+    return _PARSED_CMAPS.stats()
+
+
+def _extract_cmaps_by_object(
+    objects: Mapping[int, shared.PdfBuffer],
+) -> Mapping[int, shared.PdfCMap]:
+    return _LazyCMapsByObject(objects)
+
+
+class _LazyCMapsByObject(Mapping[int, shared.PdfCMap]):
+    """ToUnicode CMaps keyed by object number, parsed on first lookup.
+
+    Pages only look up the CMaps their fonts reference, so image and other
+    streams are never inflated just to find out they are not CMaps.
+    """
+
+    def __init__(self, objects: Mapping[int, shared.PdfBuffer]) -> None:
+        self._objects = objects
+        self._parsed: dict[int, shared.PdfCMap | None] = {}
+
+    def __getitem__(self, object_id: int) -> shared.PdfCMap:
+        if object_id not in self._parsed:
+            self._parsed[object_id] = self._parse(object_id)
+        cmap = self._parsed[object_id]
+        if cmap is None:
+            raise KeyError(object_id)
+        return cmap
+
+    def __iter__(self) -> Iterator[int]:
+        return (object_id for object_id in self._objects if object_id in self)
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def _parse(self, object_id: int) -> shared.PdfCMap | None:
+        object_payload = self._objects.get(object_id)
+        if object_payload is None or shared.deadline_exceeded():
+            return None
         stream = _extract_object_stream(object_payload, max_bytes=shared.MAX_CMAP_STREAM_BYTES)
         if stream is None:
-            continue
-        cmap = _parse_tounicode_cmap(stream)
-        if cmap is not None:
-            cmaps[object_id] = cmap
-    return cmaps
+            return None
+        return _PARSED_CMAPS.get_or_parse(stream)
@@ -2,12 +2,72 @@
 
 from __future__ import annotations
 
+import binascii
 import re
 
 from . import pdf_fallback_shared as shared
 
 _HEX_STRING_PATTERN = re.compile(rb"<([0-9A-Fa-f\s]+)>")
 _WHITESPACE_BYTES_PATTERN = re.compile(rb"\s+")
+_LITERAL_SPECIAL_PATTERN = re.compile(rb"[()\\]")
+_LITERAL_ESCAPES = {110: 10, 114: 13, 116: 9, 98: 8, 102: 12}
+# int() and float() strip surrounding whitespace, which latin-1 words may hold.
+_NUMBER_START_BYTES = frozenset(
+    byte for byte in range(256) if chr(byte) in "+-.0123456789" or chr(byte).isspace()
+)
+# Each match skips the whitespace before one token and names its kind after the
+# token's first byte. Numbers, operators, names, strings without escapes or
+# nesting and plain hex strings are taken from the match itself; other strings,
+# hex strings and arrays are parsed from ``match.end()``. Words that may still be
+# numbers go through `_parse_word`. Delimiters that cannot start a token are
+# skipped. Comments are only recognized outside arrays, and a '%' inside a word
+# is part of it.
+_DELIMITERS = rb" \t\r\n\[\]()<>/\x00"
+_NOT_NUMBER_START = b"".join(re.escape(bytes([byte])) for byte in sorted(_NUMBER_START_BYTES))
+_NUMBER = rb"(?P<number>[+-]?(?:\d+(?:\.\d*)?|\.\d+))(?=[" + _DELIMITERS + rb"]|\Z)"
+_COMMON_TOKENS = (
+    rb"|(?P<text>\([^()\\]*\))"
+    rb"|(?P<string>\()"
+    rb"|(?P<array>\[)"
+    rb"|(?P<hexdigits><(?:[0-9A-Fa-f]{2})+>)"
+    rb"|(?P<hex><(?=[^<]))"
+    rb"|(?P<name>/[^ \t\r\n\[\]()<>\x00]*)"
+)
+_CONTENT_TOKEN_PATTERN = re.compile(
+    rb"[ \t\r\n\x00]*(?:"
+    + _NUMBER
+    + rb"|(?P<operator>[^%"
+    + _NOT_NUMBER_START
+    + _DELIMITERS
+    + rb"][^"
+    + _DELIMITERS
+    + rb"]*)"
+    + _COMMON_TOKENS
+    + rb"|(?P<comment>%[^\r\n]*)"
+    + rb"|(?P<word>[^%"
+    + _DELIMITERS
+    + rb"][^"
+    + _DELIMITERS
+    + rb"]*)"
+    + rb"|(?P<skip>[\])<>]))"
+)
+_ARRAY_TOKEN_PATTERN = re.compile(
+    rb"[ \t\r\n\x00]*(?:"
+    + _NUMBER
+    + rb"|(?P<operator>[^"
+    + _NOT_NUMBER_START
+    + _DELIMITERS
+    + rb"][^"
+    + _DELIMITERS
+    + rb"]*)"
+    + _COMMON_TOKENS
+    + rb"|(?P<close>\])"
+    + rb"|(?P<word>[^"
+    + _DELIMITERS
+    + rb"]+)"
+    + rb"|(?P<skip>[)<>]))"
+)
+_DEADLINE_CHECK_INTERVAL = 64
 
 
 def _decode_hex_string(content: bytes, start: int) -> tuple[bytes | None, int]:
@@ -30,78 +90,98 @@ def _decode_hex_string(content: bytes, start: int) -> tuple[bytes | None, int]:
 
 
 def _tokenize_pdf_content(content: bytes) -> list[object]:
+    """Split a content stream into operators, operands, strings and arrays.
+
+    Tokens are matched in bulk by `_CONTENT_TOKEN_PATTERN`; scanning restarts
+    only after a token that had to be parsed by hand. The deadline is checked
+    every `_DEADLINE_CHECK_INTERVAL` tokens (an array counts as one).
+    """
+
     tokens: list[object] = []
-    index = 0
+    append = tokens.append
     length = len(content)
+    index = 0
+    seen = 0
     while index < length:
-        if shared.deadline_exceeded():
-            return tokens
-        byte = content[index]
-
-        if byte in b" \t\r\n\x00":
-            index += 1
-            continue
-        if byte == 37:
-            while index < length and content[index] not in b"\r\n":
-                index += 1
-            continue
-        if byte == 40:
-            parsed, index = _parse_pdf_literal_string_bytes(content, index + 1)
-            tokens.append(parsed)
-        elif byte == 91:
-            parsed_array, index = _parse_pdf_array(content, index + 1)
-            tokens.append(parsed_array)
-        elif byte == 60 and index + 1 < length and content[index + 1] != 60:
-            decoded, index = _decode_hex_string(content, index + 1)
-            if decoded is None and index >= length:
+        for match in _CONTENT_TOKEN_PATTERN.finditer(content, index):
+            if seen % _DEADLINE_CHECK_INTERVAL == 0 and shared.deadline_exceeded():
+                return tokens
+            seen += 1
+            kind = match.lastgroup
+            if kind == "number":
+                value = match[kind]
+                append(float(value) if b"." in value else int(value))
+            elif kind == "operator" or kind == "name":
+                append(match[kind].decode("latin-1"))
+            elif kind == "word":
+                append(_parse_word(match[kind]))
+            elif kind == "text":
+                append(match[kind][1:-1])
+            elif kind == "hexdigits":
+                append(binascii.unhexlify(match[kind][1:-1]))
+            elif kind == "comment" or kind == "skip":
+                continue
+            else:
+                parsed, index = _parse_token_from(content, kind, match.end())
+                if parsed is None and index >= length:
+                    return tokens
+                if parsed is not None:
+                    append(parsed)
+                if len(tokens) >= shared.MAX_TOKENS_PER_STREAM:
+                    return tokens
                 break
-            if decoded is not None:
-                tokens.append(decoded)
+            if len(tokens) >= shared.MAX_TOKENS_PER_STREAM:
+                return tokens
         else:
-            token, index = _parse_word_or_name(content, index)
-            if token is None:
-                continue
-            tokens.append(token)
-
-        if len(tokens) >= shared.MAX_TOKENS_PER_STREAM:
-            return tokens
+            break
     return tokens
 
 
 def _parse_pdf_array(content: bytes, index: int) -> tuple[list[object], int]:
     values: list[object] = []
     length = len(content)
-    while index < length:
-        if shared.deadline_exceeded() or len(values) >= shared.MAX_ARRAY_ITEMS:
-            return values, length
-        byte = content[index]
-
-        if byte in b" \t\r\n\x00":
-            index += 1
-            continue
-        if byte == 93:
-            return values, index + 1
-        if byte == 40:
-            parsed, index = _parse_pdf_literal_string_bytes(content, index + 1)
-            values.append(parsed)
-            continue
-        if byte == 91:
-            nested, index = _parse_pdf_array(content, index + 1)
-            values.append(nested)
-            continue
-        if byte == 60 and index + 1 < length and content[index + 1] != 60:
-            decoded, index = _decode_hex_string(content, index + 1)
-            if decoded is None and index >= length:
+    seen = 1
+    while len(values) < shared.MAX_ARRAY_ITEMS:
+        for match in _ARRAY_TOKEN_PATTERN.finditer(content, index):
+            if len(values) >= shared.MAX_ARRAY_ITEMS:
                 return values, length
-            if decoded is not None:
-                values.append(decoded)
-            continue
+            if seen % _DEADLINE_CHECK_INTERVAL == 0 and shared.deadline_exceeded():
+                return values, length
+            seen += 1
+            kind = match.lastgroup
+            if kind == "number":
+                value = match[kind]
+                values.append(float(value) if b"." in value else int(value))
+            elif kind == "text":
+                values.append(match[kind][1:-1])
+            elif kind == "close":
+                return values, match.end()
+            elif kind == "operator" or kind == "name":
+                values.append(match[kind].decode("latin-1"))
+            elif kind == "word":
+                values.append(_parse_word(match[kind]))
+            elif kind == "hexdigits":
+                values.append(binascii.unhexlify(match[kind][1:-1]))
+            elif kind != "skip":
+                parsed, index = _parse_token_from(content, kind, match.end())
+                if parsed is None and index >= length:
+                    return values, length
+                if parsed is not None:
+                    values.append(parsed)
+                break
+        else:
+            break
+    return values, length
 
-        token, index = _parse_word_or_name(content, index)
-        if token is not None:
-            values.append(token)
 
-    return values, length
+def _parse_token_from(content: bytes, kind: str | None, index: int) -> tuple[object | None, int]:
+    """Parse a string, array or hex string whose opening delimiter ends at ``index``."""
+
+    if kind == "string":
+        return _parse_pdf_literal_string_bytes(content, index)
+    if kind == "array":
+        return _parse_pdf_array(content, index)
+    return _decode_hex_string(content, index)
 
 
 def _parse_pdf_literal_string(blob: bytes, index: int) -> tuple[str, int]:
@@ -110,62 +190,50 @@ def _parse_pdf_literal_string(blob: bytes, index: int) -> tuple[str, int]:
 
 
 def _parse_pdf_literal_string_bytes(blob: bytes, index: int) -> tuple[bytes, int]:
+    """Parse a literal string starting after the opening '('.
+
+    Runs between parentheses and backslashes are copied in bulk.
+    """
+
     result = bytearray()
     depth = 1
     length = len(blob)
+    seen = 1
 
-    while index < length:
-        if shared.deadline_exceeded():
+    while True:
+        if seen % _DEADLINE_CHECK_INTERVAL == 0 and shared.deadline_exceeded():
+            return bytes(result), length
+        seen += 1
+        match = _LITERAL_SPECIAL_PATTERN.search(blob, index)
+        if match is None:
+            result += blob[index:]
             return bytes(result), length
-        byte = blob[index]
-        index += 1
+        position = match.start()
+        result += blob[index:position]
+        byte = blob[position]
+        index = position + 1
 
         if byte == 92:
             if index >= length:
                 break
             escaped = blob[index]
             index += 1
-            if escaped in (40, 41, 92):
-                result.append(escaped)
-                continue
-            if escaped == 110:
-                result.append(10)
-                continue
-            if escaped == 114:
-                result.append(13)
-                continue
-            if escaped == 116:
-                result.append(9)
-                continue
-            if escaped == 98:
-                result.append(8)
-                continue
-            if escaped == 102:
-                result.append(12)
-                continue
             if 48 <= escaped <= 55:
-                oct_digits = bytearray([escaped])
-                for _ in range(2):
-                    if index < length and 48 <= blob[index] <= 55:
-                        oct_digits.append(blob[index])
-                        index += 1
-                    else:
-                        break
-                result.append(int(oct_digits.decode("ascii"), 8))
+                oct_end = index
+                while oct_end < length and oct_end < index + 2 and 48 <= blob[oct_end] <= 55:
+                    oct_end += 1
+                result.append(int(blob[index - 1 : oct_end], 8))
+                index = oct_end
                 continue
-            result.append(escaped)
+            result.append(_LITERAL_ESCAPES.get(escaped, escaped))
             continue
 
         if byte == 40:
             depth += 1
-            result.append(byte)
-            continue
-        if byte == 41:
+        else:
             depth -= 1
             if depth == 0:
                 break
-            result.append(byte)
-            continue
         result.append(byte)
 
     return bytes(result), index
@@ -196,34 +264,18 @@ def _extract_pdf_text_tokens(chunk: bytes) -> list[tuple[int, bytes]]:
         except ValueError:
             continue
 
-    index = 0
-    length = len(chunk)
-    while index < length:
-        if chunk[index] != 40:
-            index += 1
-            continue
-        start_index = index
-        parsed, index = _parse_pdf_literal_string_bytes(chunk, index + 1)
+    start_index = chunk.find(b"(")
+    while start_index != -1:
+        parsed, index = _parse_pdf_literal_string_bytes(chunk, start_index + 1)
         if parsed:
             tokens.append((start_index, parsed))
+        start_index = chunk.find(b"(", index)
 
     tokens.sort(key=lambda item: item[0])
     return tokens
 
 
-def _parse_word_or_name(content: bytes, index: int) -> tuple[object | None, int]:
-    length = len(content)
-    start = index
-    if content[index] == 47:
-        index += 1
-        while index < length and content[index] not in b" \t\r\n[]()<>\x00":
-            index += 1
-        return content[start:index].decode("latin-1", errors="ignore"), index
-
-    while index < length and content[index] not in b" \t\r\n[]()<>/\x00":
-        index += 1
-    if start == index:
-        return None, index + 1
-    word = content[start:index].decode("latin-1", errors="ignore")
-    numeric = _parse_number_token(word)
-    return numeric if numeric is not None else word, index
+def _parse_word(word: bytes) -> object:
+    text = word.decode("latin-1")
+    numeric = _parse_number_token(text)
+    return numeric if numeric is not None else text
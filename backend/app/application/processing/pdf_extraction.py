@@ -3,8 +3,22 @@
 from __future__ import annotations
 
 import logging
+import multiprocessing
+import os
+import threading
+from collections import deque
+from collections.abc import Generator, Iterator
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
 from pathlib import Path
 
+from backend.app.application.extraction_quality import (
+    evaluate_extracted_text_quality,
+    looks_human_readable_text,
+    normalize_candidate_text,
+)
+from backend.app.config import fitz_page_workers, fitz_parallel_min_pages
 from backend.app.settings import get_pdf_extractor_force
 
 from . import pdf_cmap_parsing as _cmap
@@ -15,12 +29,41 @@ from . import pdf_page_structure as _page
 from . import pdf_text_decoder as _decoder
 from . import pdf_text_quality as _quality
 from .constants import PDF_EXTRACTOR_FORCE_ENV
+from .execution import in_processing_worker, mark_processing_worker
 
 logger = logging.getLogger(__name__)
 
+# Bump whenever the dependency-free parser changes its output: cached extractions
+# are keyed by extractor version.
+FALLBACK_EXTRACTOR_VERSION = "3"
+# Every page shard covers at least this many pages, so worker dispatch and
+# re-opening the document stay small next to the text extraction itself.
+FITZ_MIN_PAGES_PER_SHARD = 8
+
+_fitz_page_pool: ProcessPoolExecutor | None = None
+_fitz_page_pool_workers = 0
+_fitz_page_pool_lock = threading.Lock()
+
+
+@dataclass(frozen=True, slots=True)
+class StreamedPdfText:
+    """Raw text streamed page by page into a staging file."""
+
+    text: str
+    extractor: str
+    pages: int
+    # True when extraction stopped early because no leading page was readable.
+    aborted: bool
+    # 1-based pages whose PyMuPDF text was replaced by the dependency-free parser's.
+    fallback_pages: tuple[int, ...] = ()
+    # Offset in ``text`` where each page starts.
+    page_starts: tuple[int, ...] = (0,)
+
+
 # Explicit compatibility surface for tests and processing_runner consumers.
 PdfCMap = _shared.PdfCMap
 parse_tounicode_cmap = _cmap._parse_tounicode_cmap
+cmap_cache_stats = _cmap.cmap_cache_stats
 extract_pdf_text_tokens = _tokenizer._extract_pdf_text_tokens
 tokenize_pdf_content = _tokenizer._tokenize_pdf_content
 parse_pdf_array = _tokenizer._parse_pdf_array
@@ -38,6 +81,7 @@ collect_page_content_streams = _page._collect_page_content_streams
 parse_pdf_objects = nodeps._parse_pdf_objects
 extract_cmaps_by_object = _cmap._extract_cmaps_by_object
 inflate_pdf_stream = _shared.inflate_pdf_stream
+inflate_failure_counts = _shared.inflate_failure_counts
 
 
 def _extract_pdf_text(file_path: Path) -> str:
@@ -51,7 +95,7 @@ def extract_text_from_pdf(file_path: Path) -> str:
     return _extract_pdf_text(file_path)
 
 
-def _extract_pdf_text_with_extractor(file_path: Path) -> tuple[str, str]:
+def _pdf_extractor_force_mode() -> str:
     forced = get_pdf_extractor_force().lower()
     if forced not in ("", "auto", "fitz", "fallback"):
         logger.warning(
@@ -60,6 +104,47 @@ def _extract_pdf_text_with_extractor(file_path: Path) -> tuple[str, str]:
             forced,
         )
         forced = "auto"
+    return forced
+
+
+def _pdf_extractor_identity() -> tuple[str, str, str] | None:
+    """Return (extractor, version, limits) that `_extract_pdf_text_with_extractor` will use.
+
+    Returns None when the forced extractor is unavailable, i.e. extraction will fail.
+    """
+
+    forced = _pdf_extractor_force_mode()
+    if forced != "fallback":
+        try:
+            import fitz  # PyMuPDF
+        except ImportError:
+            if forced == "fitz":
+                return None
+        else:
+            if forced == "fitz":
+                return "fitz", str(fitz.VersionBind), ""
+            # Garbled pages are re-extracted by the fallback parser (see
+            # `_iter_pages_with_fallback`), so its build and limits are part of the identity.
+            return (
+                "fitz",
+                str(fitz.VersionBind),
+                f"page_fallback={FALLBACK_EXTRACTOR_VERSION};{_fallback_limits()}",
+            )
+    return "fallback", FALLBACK_EXTRACTOR_VERSION, _fallback_limits()
+
+
+def _fallback_limits() -> str:
+    return (
+        f"content={_shared.MAX_CONTENT_STREAM_BYTES};stream={_shared.MAX_SINGLE_STREAM_BYTES};"
+        f"chunks={_shared.MAX_TEXT_CHUNKS};tokens={_shared.MAX_TOKENS_PER_STREAM};"
+        f"arrays={_shared.MAX_ARRAY_ITEMS};cmap={_shared.MAX_CMAP_STREAM_BYTES};"
+        f"objstm={_shared.MAX_OBJECT_STREAM_BYTES};"
+        f"seconds={_shared.MAX_EXTRACTION_SECONDS}"
+    )
+
+
+def _extract_pdf_text_with_extractor(file_path: Path) -> tuple[str, str]:
+    forced = _pdf_extractor_force_mode()
 
     if forced == "fallback":
         return _extract_pdf_text_without_external_dependencies(file_path), "fallback"
@@ -78,28 +163,361 @@ def _extract_pdf_text_with_extractor(file_path: Path) -> tuple[str, str]:
         return _extract_pdf_text_without_external_dependencies(file_path), "fallback"
 
 
+def _stream_pdf_text_with_extractor(
+    file_path: Path, destination: Path, max_unreadable_pages: int
+) -> StreamedPdfText:
+    """Extract page by page into ``destination``, giving up early on unreadable PDFs.
+
+    Pages are appended to ``destination`` as they are produced, joined exactly as
+    `_extract_pdf_text_with_extractor` joins them, and the file is fsynced once
+    complete. When none of the first ``max_unreadable_pages`` pages holds
+    human-readable text (scans, broken encodings) the remaining pages are never
+    extracted and the result is marked aborted; 0 disables the early stop.
+    """
+
+    page_texts, extractor = _iter_pdf_page_texts_with_extractor(file_path)
+    fallback_pages: list[int] = []
+    if extractor == "fitz" and _pdf_extractor_force_mode() != "fitz":
+        page_texts = _iter_pages_with_fallback(file_path, page_texts, fallback_pages)
+    parts: list[str] = []
+    page_starts: list[int] = []
+    text_length = 0
+    readable_seen = False
+    try:
+        with destination.open("w", encoding="utf-8") as handle:
+            for page_text in page_texts:
+                if parts:
+                    handle.write("\n")
+                    text_length += 1
+                page_starts.append(text_length)
+                text_length += len(page_text)
+                handle.write(page_text)
+                handle.flush()
+                parts.append(page_text)
+                readable_seen = readable_seen or looks_human_readable_text(
+                    normalize_candidate_text(page_text)
+                )
+                if not readable_seen and len(parts) == max_unreadable_pages:
+                    return StreamedPdfText(
+                        text="\n".join(parts),
+                        extractor=extractor,
+                        pages=len(parts),
+                        aborted=True,
+                        fallback_pages=tuple(fallback_pages),
+                        page_starts=tuple(page_starts),
+                    )
+            os.fsync(handle.fileno())
+    except Exception as exc:
+        from .orchestrator import ProcessingError
+
+        if isinstance(exc, ProcessingError):
+            raise
+        raise ProcessingError("EXTRACTION_FAILED") from exc
+    finally:
+        page_texts.close()
+
+    return StreamedPdfText(
+        text="\n".join(parts),
+        extractor=extractor,
+        pages=len(parts),
+        aborted=False,
+        fallback_pages=tuple(fallback_pages),
+        page_starts=tuple(page_starts) or (0,),
+    )
+
+
+def _iter_pdf_page_texts_with_extractor(
+    file_path: Path,
+) -> tuple[Generator[str, None, None], str]:
+    """Return a lazy iterator over the PDF's page texts and the extractor producing them.
+
+    The dependency-free parser deduplicates text chunks across the whole
+    document, so it has no page boundaries and yields a single "page".
+    """
+
+    forced = _pdf_extractor_force_mode()
+    if forced != "fallback":
+        try:
+            import fitz  # noqa: F401  # PyMuPDF
+        except ImportError as exc:
+            if forced == "fitz":
+                from .orchestrator import ProcessingError
+
+                raise ProcessingError("EXTRACTION_FAILED") from exc
+        else:
+            return _iter_fitz_page_texts(file_path), "fitz"
+    return _iter_fallback_page_texts(file_path), "fallback"
+
+
+def _iter_fallback_page_texts(file_path: Path) -> Generator[str, None, None]:
+    yield _extract_pdf_text_without_external_dependencies(file_path)
+
+
 def _extract_pdf_text_with_fitz(file_path: Path) -> str:
     try:
-        import fitz  # PyMuPDF
+        import fitz  # noqa: F401  # PyMuPDF
     except ImportError as exc:
         raise ImportError("PyMuPDF is not installed") from exc
 
     try:
-        with fitz.open(file_path) as document:
-            parts = [page.get_text("text") for page in document]
+        page_texts = _iter_fitz_page_texts(file_path)
+        if _pdf_extractor_force_mode() != "fitz":
+            page_texts = _iter_pages_with_fallback(file_path, page_texts, [])
+        return "\n".join(page_texts)
     except Exception as exc:  # pragma: no cover - defensive
         from .orchestrator import ProcessingError
 
         raise ProcessingError("EXTRACTION_FAILED") from exc
 
-    return "\n".join(parts)
+
+def _iter_fitz_page_texts(file_path: Path) -> Generator[str, None, None]:
+    import fitz  # PyMuPDF
+
+    with fitz.open(file_path) as document:
+        shards = _fitz_page_shards(document.page_count)
+        if shards is None:
+            for page in document:
+                yield page.get_text("text")
+            return
+    yield from _iter_fitz_pages_in_parallel(file_path, shards)
+
+
+def _fitz_page_shards(page_count: int) -> list[tuple[int, int]] | None:
+    """Return contiguous page ranges to extract in parallel, or None to stay in-process.
+
+    Extraction that already runs in a worker process (the `process` executor)
+    is never sharded, so documents and pages do not compete for the same cores.
+    """
+
+    if in_processing_worker():
+        return None
+    if page_count < fitz_parallel_min_pages():
+        return None
+    shard_count = min(fitz_page_workers(), page_count // FITZ_MIN_PAGES_PER_SHARD)
+    if shard_count < 2:
+        return None
+    bounds = [page_count * index // shard_count for index in range(shard_count + 1)]
+    return list(zip(bounds, bounds[1:], strict=False))
+
+
+def _extract_fitz_page_range(file_path: Path, start: int, stop: int) -> list[str]:
+    """Extract pages ``start..stop-1`` in a pool worker that opens the PDF on its own."""
+
+    import fitz  # PyMuPDF
+
+    with fitz.open(file_path) as document:
+        return [document[index].get_text("text") for index in range(start, stop)]
+
+
+def _iter_fitz_pages_in_parallel(file_path: Path, shards: list[tuple[int, int]]) -> Iterator[str]:
+    """Yield page texts in page order as the pool finishes each shard.
+
+    Closing the iterator early cancels shards that have not started. If the pool
+    fails, the pages not yet yielded are extracted in this process; a broken pool
+    is discarded so the next document starts a fresh one.
+    """
+
+    futures: list[Future[list[str]]] = []
+    next_page = shards[0][0]
+    pool: ProcessPoolExecutor | None = None
+    try:
+        pool = _get_fitz_page_pool()
+        futures = [
+            pool.submit(_extract_fitz_page_range, file_path, start, stop) for start, stop in shards
+        ]
+        for future, (_, stop) in zip(futures, shards, strict=True):
+            yield from future.result()
+            next_page = stop
+        return
+    except BrokenProcessPool:
+        if pool is not None:
+            _discard_fitz_page_pool(pool)
+        logger.warning("PyMuPDF page pool broke; extracting sequentially", exc_info=True)
+    except Exception:
+        logger.warning(
+            "Page-sharded PyMuPDF extraction failed; extracting sequentially", exc_info=True
+        )
+    finally:
+        for future in futures:
+            future.cancel()
+
+    import fitz  # PyMuPDF
+
+    with fitz.open(file_path) as document:
+        for index in range(next_page, document.page_count):
+            yield document[index].get_text("text")
+
+
+def _iter_pages_with_fallback(
+    file_path: Path, page_texts: Generator[str, None, None], fallback_pages: list[int]
+) -> Generator[str, None, None]:
+    """Yield PyMuPDF page texts, re-extracting garbled pages with the fallback parser.
+
+    Pages failing the quality gate are re-extracted alone by the dependency-free
+    parser, on the page pool, while the following pages keep being read; at most
+    ``fitz_page_workers()`` pages are held back waiting. The fallback text is used
+    when it reads better, and its 1-based page number appended to ``fallback_pages``.
+    """
+
+    pending: deque[tuple[int, str, Future[str | None] | None]] = deque()
+    lookahead = max(2, fitz_page_workers())
+    page_count: int | None = None
+    try:
+        for index, page_text in enumerate(page_texts):
+            future = None
+            if _page_needs_fallback(page_text):
+                if page_count is None:
+                    page_count = _pdf_page_count(file_path)
+                if page_count:
+                    future = _submit_fallback_page(file_path, index, page_count)
+            pending.append((index, page_text, future))
+            while pending:
+                head = pending[0][2]
+                if head is not None and not head.done() and len(pending) < lookahead:
+                    break
+                yield _resolve_fallback_page(*pending.popleft(), fallback_pages)
+        while pending:
+            yield _resolve_fallback_page(*pending.popleft(), fallback_pages)
+    finally:
+        for _, _, future in pending:
+            if future is not None:
+                future.cancel()
+        page_texts.close()
+
+
+def _page_needs_fallback(page_text: str) -> bool:
+    """Return True for pages with text that fails the quality gate.
+
+    Blank and near-blank pages (scans, separators) have nothing to recover.
+    """
+
+    _, quality_pass, reasons = evaluate_extracted_text_quality(page_text)
+    return not quality_pass and reasons != ["TOO_SHORT"]
+
+
+def _page_quality(page_text: str) -> tuple[bool, bool]:
+    """Return (passes the quality gate, looks human-readable).
+
+    Page-sized texts score unevenly, so the score itself is not compared.
+    """
+
+    _, quality_pass, _ = evaluate_extracted_text_quality(page_text)
+    return quality_pass, looks_human_readable_text(normalize_candidate_text(page_text))
+
+
+def _pdf_page_count(file_path: Path) -> int:
+    import fitz  # PyMuPDF
+
+    try:
+        with fitz.open(file_path) as document:
+            return document.page_count
+    except Exception:
+        return 0
+
+
+def _submit_fallback_page(file_path: Path, page_index: int, page_count: int) -> Future[str | None]:
+    """Re-extract one page on the page pool, or right away inside a worker process."""
+
+    if not in_processing_worker() and fitz_page_workers() > 1:
+        try:
+            pool = _get_fitz_page_pool()
+            try:
+                pooled = pool.submit(_extract_fallback_page_text, file_path, page_index, page_count)
+            except BrokenProcessPool:
+                _discard_fitz_page_pool(pool)
+                pool = _get_fitz_page_pool()
+                pooled = pool.submit(_extract_fallback_page_text, file_path, page_index, page_count)
+            pooled.add_done_callback(lambda done: _discard_fitz_page_pool_if_broken(pool, done))
+            return pooled
+        except Exception:
+            logger.warning("Page pool unavailable; re-extracting page in-process", exc_info=True)
+    future: Future[str | None] = Future()
+    try:
+        future.set_result(_extract_fallback_page_text(file_path, page_index, page_count))
+    except Exception as exc:
+        future.set_exception(exc)
+    return future
+
+
+def _extract_fallback_page_text(file_path: Path, page_index: int, page_count: int) -> str | None:
+    return nodeps._extract_pdf_page_text_without_external_dependencies(
+        file_path, page_index=page_index, page_count=page_count
+    )
+
+
+def _resolve_fallback_page(
+    index: int,
+    page_text: str,
+    future: Future[str | None] | None,
+    fallback_pages: list[int],
+) -> str:
+    if future is None:
+        return page_text
+    try:
+        fallback_text = future.result()
+    except Exception:
+        logger.warning("Fallback re-extraction of page %s failed", index + 1, exc_info=True)
+        return page_text
+    if fallback_text is None or _page_quality(fallback_text) <= _page_quality(page_text):
+        return page_text
+    fallback_pages.append(index + 1)
+    return fallback_text
+
+
+def _get_fitz_page_pool() -> ProcessPoolExecutor:
+    global _fitz_page_pool, _fitz_page_pool_workers
+
+    max_workers = fitz_page_workers()
+    with _fitz_page_pool_lock:
+        if _fitz_page_pool is None or _fitz_page_pool_workers != max_workers:
+            if _fitz_page_pool is not None:
+                _fitz_page_pool.shutdown(wait=False)
+            _fitz_page_pool = ProcessPoolExecutor(
+                max_workers=max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=mark_processing_worker,
+            )
+            _fitz_page_pool_workers = max_workers
+            logger.info("Started PyMuPDF page pool max_workers=%s", max_workers)
+        return _fitz_page_pool
+
+
+def _discard_fitz_page_pool(pool: ProcessPoolExecutor) -> None:
+    """Drop ``pool`` if it is still the shared page pool, so the next call starts afresh."""
+
+    global _fitz_page_pool, _fitz_page_pool_workers
+
+    with _fitz_page_pool_lock:
+        if _fitz_page_pool is not pool:
+            return
+        _fitz_page_pool, _fitz_page_pool_workers = None, 0
+    pool.shutdown(wait=False, cancel_futures=True)
+    logger.warning("Discarded broken PyMuPDF page pool")
+
+
+def _discard_fitz_page_pool_if_broken(
+    pool: ProcessPoolExecutor, future: Future[str | None]
+) -> None:
+    if not future.cancelled() and isinstance(future.exception(), BrokenProcessPool):
+        _discard_fitz_page_pool(pool)
+
+
+def shutdown_fitz_page_pool() -> None:
+    """Stop the page-extraction worker processes, if they were started."""
+
+    global _fitz_page_pool, _fitz_page_pool_workers
+
+    with _fitz_page_pool_lock:
+        pool, _fitz_page_pool, _fitz_page_pool_workers = _fitz_page_pool, None, 0
+    if pool is not None:
+        pool.shutdown(wait=True, cancel_futures=True)
 
 
 def _extract_pdf_text_without_external_dependencies(file_path: Path) -> str:
     """Wrapper keeps monkeypatch compatibility for tests targeting this module."""
 
     try:
-        return nodeps._extract_pdf_text_without_external_dependencies(
+        text = nodeps._extract_pdf_text_without_external_dependencies(
             file_path,
             parse_pdf_objects=parse_pdf_objects,
             extract_cmaps_by_object=extract_cmaps_by_object,
@@ -111,6 +529,20 @@ def _extract_pdf_text_without_external_dependencies(file_path: Path) -> str:
         from .orchestrator import ProcessingError
 
         raise ProcessingError("EXTRACTION_FAILED") from exc
+    stats = cmap_cache_stats()
+    logger.debug(
+        "Fallback CMap cache pid=%s hits=%s misses=%s hit_rate=%s entries=%s/%s",
+        os.getpid(),
+        stats.hits,
+        stats.misses,
+        f"{stats.hit_rate:.2f}" if stats.hit_rate is not None else "n/a",
+        stats.entries,
+        stats.max_entries,
+    )
+    logger.debug(
+        "Fallback stream inflation failures pid=%s %s", os.getpid(), inflate_failure_counts()
+    )
+    return text
 
 
 extract_pdf_text = extract_text_from_pdf
@@ -120,6 +552,8 @@ extract_pdf_text_without_external_dependencies = _extract_pdf_text_without_exter
 __all__ = [
     "PDF_EXTRACTOR_FORCE_ENV",
     "PdfCMap",
+    "StreamedPdfText",
+    "cmap_cache_stats",
     "collect_page_content_streams",
     "decode_bytes_with_cmap",
     "decode_tj_array_for_font",
@@ -131,6 +565,7 @@ __all__ = [
     "extract_pdf_text_without_external_dependencies",
     "extract_text_chunks_from_content_stream",
     "extract_text_from_pdf",
+    "inflate_failure_counts",
     "inflate_pdf_stream",
     "looks_textual_bytes",
     "parse_pdf_array",
@@ -2,102 +2,210 @@
 
 from __future__ import annotations
 
+import mmap
 import re
-from collections.abc import Callable
+from collections.abc import Callable, Iterator, Mapping
+from contextlib import contextmanager
 from pathlib import Path
 
 from . import pdf_fallback_shared as shared
+from .pdf_object_index import PdfObjectIndex
 
 _PDF_STREAM_PATTERN = re.compile(rb"stream\r?\n(.*?)\r?\nendstream", re.DOTALL)
-_OBJECT_PATTERN = re.compile(rb"(\d+)\s+(\d+)\s+obj(.*?)endobj", re.DOTALL)
 
 
 def _deadline_exceeded() -> bool:
     return shared.deadline_exceeded()
 
 
-def _inflate_pdf_stream(stream: bytes) -> bytes | None:
+def _inflate_pdf_stream(stream: shared.PdfBuffer) -> bytes | None:
     return shared.inflate_pdf_stream(stream)
 
 
-def _parse_pdf_objects(pdf_bytes: bytes) -> dict[int, bytes]:
-    objects: dict[int, bytes] = {}
-    for match in _OBJECT_PATTERN.finditer(pdf_bytes):
-        objects[int(match.group(1))] = match.group(3)
-    return objects
+def _parse_pdf_objects(pdf_buffer: shared.PdfBuffer) -> Mapping[int, shared.PdfBuffer]:
+    return PdfObjectIndex(pdf_buffer)
+
+
+@contextmanager
+def _map_pdf_file(file_path: Path) -> Iterator[shared.PdfBuffer]:
+    """Yield a read-only memory map of the file, so pages are loaded as they are sliced.
+
+    The mapping is shared with the page cache instead of being copied onto the
+    heap, which keeps concurrent extractions of large uploads from each holding
+    the whole file.
+    """
+
+    with file_path.open("rb") as handle:
+        try:
+            mapped = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # empty files cannot be mapped
+            yield b""
+            return
+    view = memoryview(mapped)
+    try:
+        yield view
+    finally:
+        view.release()
+        try:
+            mapped.close()
+        except BufferError:
+            # Views are still referenced (e.g. by a propagating traceback); the
+            # mapping is released when they are collected.
+            pass
 
 
 def _extract_pdf_text_without_external_dependencies(
     file_path: Path,
     *,
-    parse_pdf_objects: Callable[[bytes], dict[int, bytes]] | None = None,
-    extract_cmaps_by_object: Callable[[dict[int, bytes]], dict[int, shared.PdfCMap]] | None = None,
+    parse_pdf_objects: Callable[[shared.PdfBuffer], Mapping[int, shared.PdfBuffer]] | None = None,
+    extract_cmaps_by_object: Callable[
+        [Mapping[int, shared.PdfBuffer]], Mapping[int, shared.PdfCMap]
+    ]
+    | None = None,
     collect_page_content_streams: Callable[..., list[tuple[bytes, dict[str, shared.PdfCMap]]]]
     | None = None,
-    inflate_pdf_stream: Callable[[bytes], bytes | None] | None = None,
+    inflate_pdf_stream: Callable[[shared.PdfBuffer], bytes | None] | None = None,
     extract_text_chunks_from_content_stream: Callable[..., list[str]] | None = None,
 ) -> str:
     from .pdf_cmap_parsing import _extract_cmaps_by_object
     from .pdf_page_structure import _collect_page_content_streams
     from .pdf_text_decoder import _extract_text_chunks_from_content_stream
-    from .pdf_text_quality import _sanitize_text_chunks, _stitch_text_chunks
 
     _deadline_token = shared.start_extraction_deadline(shared.MAX_EXTRACTION_SECONDS)
+    try:
+        with _map_pdf_file(file_path) as pdf_buffer:
+            return _extract_text_from_pdf_buffer(
+                pdf_buffer,
+                parse_pdf_objects_fn=parse_pdf_objects or _parse_pdf_objects,
+                extract_cmaps_by_object_fn=extract_cmaps_by_object or _extract_cmaps_by_object,
+                collect_page_content_streams_fn=(
+                    collect_page_content_streams or _collect_page_content_streams
+                ),
+                inflate_pdf_stream_fn=inflate_pdf_stream or _inflate_pdf_stream,
+                extract_text_chunks_fn=(
+                    extract_text_chunks_from_content_stream
+                    or _extract_text_chunks_from_content_stream
+                ),
+            )
+    finally:
+        shared.restore_extraction_deadline(_deadline_token)
 
-    parse_pdf_objects_fn = parse_pdf_objects or _parse_pdf_objects
-    extract_cmaps_by_object_fn = extract_cmaps_by_object or _extract_cmaps_by_object
-    collect_page_content_streams_fn = collect_page_content_streams or _collect_page_content_streams
-    inflate_pdf_stream_fn = inflate_pdf_stream or _inflate_pdf_stream
-    extract_text_chunks_fn = (
-        extract_text_chunks_from_content_stream or _extract_text_chunks_from_content_stream
-    )
 
-    try:
-        pdf_bytes = file_path.read_bytes()
-        objects = parse_pdf_objects_fn(pdf_bytes)
-        cmap_by_object = extract_cmaps_by_object_fn(objects)
-        page_streams = collect_page_content_streams_fn(
-            objects=objects,
-            cmap_by_object=cmap_by_object,
-        )
-        text_chunks: list[str] = []
-        total_bytes = 0
+def _extract_text_from_pdf_buffer(
+    pdf_buffer: shared.PdfBuffer,
+    *,
+    parse_pdf_objects_fn: Callable[[shared.PdfBuffer], Mapping[int, shared.PdfBuffer]],
+    extract_cmaps_by_object_fn: Callable[
+        [Mapping[int, shared.PdfBuffer]], Mapping[int, shared.PdfCMap]
+    ],
+    collect_page_content_streams_fn: Callable[..., list[tuple[bytes, dict[str, shared.PdfCMap]]]],
+    inflate_pdf_stream_fn: Callable[[shared.PdfBuffer], bytes | None],
+    extract_text_chunks_fn: Callable[..., list[str]],
+) -> str:
+    """Run the fallback pipeline over ``pdf_buffer``.
+
+    Kept separate so every view of the mapped file is dropped on return, before
+    the mapping is closed.
+    """
+
+    from .pdf_text_quality import _sanitize_text_chunks, _stitch_text_chunks
+
+    objects = parse_pdf_objects_fn(pdf_buffer)
+    cmap_by_object = extract_cmaps_by_object_fn(objects)
+    page_streams = collect_page_content_streams_fn(
+        objects=objects,
+        cmap_by_object=cmap_by_object,
+    )
+    text_chunks = _collect_text_chunks(page_streams, extract_text_chunks_fn=extract_text_chunks_fn)
 
-        for chunk, font_to_cmap in page_streams:
+    if not page_streams:
+        for match in _PDF_STREAM_PATTERN.finditer(pdf_buffer):
             if _deadline_exceeded():
                 break
-            if not chunk or len(chunk) > shared.MAX_SINGLE_STREAM_BYTES:
+            inflated = inflate_pdf_stream_fn(pdf_buffer[match.start(1) : match.end(1)])
+            if inflated is None:
+                continue
+            inflated = bytes(inflated)
+            if b"BT" not in inflated or b"ET" not in inflated:
                 continue
-            total_bytes += len(chunk)
-            if total_bytes > shared.MAX_CONTENT_STREAM_BYTES:
-                break
             text_chunks.extend(
                 extract_text_chunks_fn(
-                    chunk=chunk,
-                    font_to_cmap=font_to_cmap,
-                    fallback_cmaps=list(font_to_cmap.values()),
+                    chunk=inflated,
+                    font_to_cmap={},
+                    fallback_cmaps=[],
                 )
             )
             if len(text_chunks) > shared.MAX_TEXT_CHUNKS:
                 break
 
-        if not page_streams:
-            for match in _PDF_STREAM_PATTERN.finditer(pdf_bytes):
-                if _deadline_exceeded():
-                    break
-                inflated = inflate_pdf_stream_fn(match.group(1))
-                if inflated is None or b"BT" not in inflated or b"ET" not in inflated:
-                    continue
-                text_chunks.extend(
-                    extract_text_chunks_fn(
-                        chunk=inflated,
-                        font_to_cmap={},
-                        fallback_cmaps=[],
-                    )
-                )
-                if len(text_chunks) > shared.MAX_TEXT_CHUNKS:
-                    break
+    return _stitch_text_chunks(_sanitize_text_chunks(text_chunks))
+
+
+def _collect_text_chunks(
+    page_streams: list[tuple[bytes, dict[str, shared.PdfCMap]]],
+    *,
+    extract_text_chunks_fn: Callable[..., list[str]],
+) -> list[str]:
+    text_chunks: list[str] = []
+    total_bytes = 0
+
+    for chunk, font_to_cmap in page_streams:
+        if _deadline_exceeded():
+            break
+        if not chunk or len(chunk) > shared.MAX_SINGLE_STREAM_BYTES:
+            continue
+        total_bytes += len(chunk)
+        if total_bytes > shared.MAX_CONTENT_STREAM_BYTES:
+            break
+        text_chunks.extend(
+            extract_text_chunks_fn(
+                chunk=chunk,
+                font_to_cmap=font_to_cmap,
+                fallback_cmaps=list(font_to_cmap.values()),
+            )
+        )
+        if len(text_chunks) > shared.MAX_TEXT_CHUNKS:
+            break
+    return text_chunks
+
+
+def _extract_pdf_page_text_without_external_dependencies(
+    file_path: Path, *, page_index: int, page_count: int
+) -> str | None:
+    """Return the text of page ``page_index`` (0-based) alone.
+
+    Used to re-extract pages another extractor garbled, so the page tree must
+    hold ``page_count`` pages for page numbers to line up; otherwise None.
+    """
 
-        return _stitch_text_chunks(_sanitize_text_chunks(text_chunks))
+    _deadline_token = shared.start_extraction_deadline(shared.MAX_EXTRACTION_SECONDS)
+    try:
+        with _map_pdf_file(file_path) as pdf_buffer:
+            return _extract_page_text_from_pdf_buffer(
+                pdf_buffer, page_index=page_index, page_count=page_count
+            )
     finally:
         shared.restore_extraction_deadline(_deadline_token)
+
+
+def _extract_page_text_from_pdf_buffer(
+    pdf_buffer: shared.PdfBuffer, *, page_index: int, page_count: int
+) -> str | None:
+    from .pdf_cmap_parsing import _extract_cmaps_by_object
+    from .pdf_page_structure import _iter_page_payloads, _page_content_streams
+    from .pdf_text_decoder import _extract_text_chunks_from_content_stream
+    from .pdf_text_quality import _sanitize_text_chunks, _stitch_text_chunks
+
+    objects = _parse_pdf_objects(pdf_buffer)
+    page_payloads = list(_iter_page_payloads(objects))
+    if len(page_payloads) != page_count or not 0 <= page_index < page_count:
+        return None
+    page_streams = _page_content_streams(
+        page_payloads[page_index],
+        objects=objects,
+        cmap_by_object=_extract_cmaps_by_object(objects),
+    )
+    text_chunks = _collect_text_chunks(
+        page_streams, extract_text_chunks_fn=_extract_text_chunks_from_content_stream
+    )
+    return _stitch_text_chunks(_sanitize_text_chunks(text_chunks))
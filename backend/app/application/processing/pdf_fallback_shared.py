@@ -2,10 +2,14 @@
 
 from __future__ import annotations
 
+import threading
 import time
 import zlib
+from array import array
+from bisect import bisect_right
+from collections import Counter
 from contextvars import ContextVar, Token
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 MAX_CONTENT_STREAM_BYTES = 8 * 1024 * 1024
 MAX_TEXT_CHUNKS = 20000
@@ -14,16 +18,60 @@ MAX_ARRAY_ITEMS = 3000
 MAX_SINGLE_STREAM_BYTES = 1 * 1024 * 1024
 MAX_EXTRACTION_SECONDS = 20.0
 MAX_CMAP_STREAM_BYTES = 256 * 1024
+MAX_OBJECT_STREAM_BYTES = 16 * 1024 * 1024
+MAX_CACHED_CMAPS = 512
+MAX_MEMOIZED_TOKENS = 4096
+MAX_MEMOIZED_TOKEN_BYTES = 256
+
+# Object bodies are zero-copy views of the mapped file; decoded streams are bytes.
+PdfBuffer = bytes | memoryview
+
+# Reasons `inflate_pdf_stream_bounded` gives for returning no data.
+INFLATE_NOT_DEFLATE = "STREAM_NOT_DEFLATE"
+INFLATE_TRUNCATED = "STREAM_TRUNCATED"
+INFLATE_TOO_LARGE = "STREAM_TOO_LARGE"
 
 _ACTIVE_EXTRACTION_DEADLINE: ContextVar[float | None] = ContextVar(
     "_ACTIVE_EXTRACTION_DEADLINE", default=None
 )
 
 
-@dataclass(frozen=True, slots=True)
+@dataclass(frozen=True, slots=True, eq=False)
 class PdfCMap:
+    """ToUnicode mapping, compared and hashed by identity so decodings can be memoized.
+
+    ``codepoints`` holds single-code (``bfchar``) entries. Code ranges are kept
+    as sorted, disjoint arrays of inclusive bounds: range ``i`` maps code ``c``
+    to ``chr(range_bases[i] + c - range_starts[i])``, or to
+    ``range_values[i][c - range_starts[i]]`` when it has a value table. Ranges
+    take precedence over ``codepoints``. Use `get` for lookups.
+    """
+
     codepoints: dict[int, str]
     code_lengths: tuple[int, ...]
+    range_starts: array = field(default_factory=lambda: array("I"), repr=False)
+    range_ends: array = field(default_factory=lambda: array("I"), repr=False)
+    range_bases: array = field(default_factory=lambda: array("I"), repr=False)
+    range_values: tuple[tuple[str, ...] | None, ...] = field(default=(), repr=False)
+    # Single-byte CMaps only: latin-1 character to mapped text, for ``str.translate``.
+    byte_table: tuple[str, ...] | None = field(default=None, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        if self.code_lengths == (1,):
+            table = tuple(
+                mapped if (mapped := self.get(code)) is not None else chr(code)
+                for code in range(256)
+            )
+            object.__setattr__(self, "byte_table", table)
+
+    def get(self, code: int) -> str | None:
+        index = bisect_right(self.range_starts, code) - 1
+        if index >= 0 and code <= self.range_ends[index]:
+            values = self.range_values[index]
+            if values is None:
+                return chr(self.range_bases[index] + code - self.range_starts[index])
+            return values[code - self.range_starts[index]]
+        return self.codepoints.get(code)
 
 
 def deadline_exceeded() -> bool:
@@ -41,8 +89,46 @@ def restore_extraction_deadline(token: Token) -> None:
     _ACTIVE_EXTRACTION_DEADLINE.reset(token)
 
 
-def inflate_pdf_stream(stream: bytes) -> bytes | None:
+@dataclass(frozen=True, slots=True)
+class InflatedStream:
+    """Outcome of a bounded inflation: ``data``, or the ``reason`` there is none."""
+
+    data: bytes | None
+    reason: str | None = None
+
+
+_inflate_failures: Counter[str] = Counter()
+_inflate_failures_lock = threading.Lock()
+
+
+def inflate_pdf_stream_bounded(stream: PdfBuffer, *, max_bytes: int) -> InflatedStream:
+    """Inflate a Flate stream, giving up once it would decode to more than ``max_bytes``.
+
+    Decompression never produces more than ``max_bytes + 1`` bytes, so peak memory
+    follows the limit instead of the stream's compression ratio. Failures are
+    counted per reason, see `inflate_failure_counts`.
+    """
+
+    inflater = zlib.decompressobj()
     try:
-        return zlib.decompress(stream)
+        data = inflater.decompress(stream, max_bytes + 1)
     except zlib.error:
-        return None
+        reason = INFLATE_NOT_DEFLATE
+    else:
+        if len(data) <= max_bytes and inflater.eof:
+            return InflatedStream(data)
+        reason = INFLATE_TOO_LARGE if len(data) > max_bytes else INFLATE_TRUNCATED
+    with _inflate_failures_lock:
+        _inflate_failures[reason] += 1
+    return InflatedStream(None, reason)
+
+
+def inflate_pdf_stream(stream: PdfBuffer, max_bytes: int = MAX_SINGLE_STREAM_BYTES) -> bytes | None:
+    return inflate_pdf_stream_bounded(stream, max_bytes=max_bytes).data
+
+
+def inflate_failure_counts() -> dict[str, int]:
+    """Return how many streams this process failed to inflate, by reason."""
+
+    with _inflate_failures_lock:
+        return dict(_inflate_failures)
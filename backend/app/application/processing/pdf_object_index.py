@@ -0,0 +1,317 @@
+"""Lazy cross-reference object index for fallback PDF extraction."""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Iterator, Mapping
+
+from . import pdf_fallback_shared as shared
+
+_OBJECT_PATTERN = re.compile(rb"(\d+)\s+(\d+)\s+obj(.*?)endobj", re.DOTALL)
+_OBJECT_HEADER_PATTERN = re.compile(rb"\s*(\d+)\s+(\d+)\s+obj")
+_ENDOBJ_PATTERN = re.compile(rb"endobj")
+_STARTXREF_PATTERN = re.compile(rb"startxref\s+(\d+)")
+_XREF_SUBSECTION_PATTERN = re.compile(rb"\s*(\d+)\s+(\d+)[ \t]*\r?\n")
+_XREF_ENTRY_PATTERN = re.compile(rb"\s*(\d{10})\s+(\d{5})\s+([nf])")
+_TRAILER_PATTERN = re.compile(rb"\s*trailer\s*<<(.*?)>>\s*startxref", re.DOTALL)
+_STREAM_KEYWORD_PATTERN = re.compile(rb"stream")
+_STREAM_DATA_PATTERN = re.compile(rb"stream\r?\n(.*?)\r?\nendstream", re.DOTALL)
+_PREV_PATTERN = re.compile(rb"/Prev\s+(\d+)")
+_XREF_STM_PATTERN = re.compile(rb"/XRefStm\s+(\d+)")
+_ROOT_REF_PATTERN = re.compile(rb"/Root\s+(\d+)\s+\d+\s+R")
+_XREF_TYPE_PATTERN = re.compile(rb"/Type\s*/XRef\b")
+_OBJSTM_TYPE_PATTERN = re.compile(rb"/Type\s*/ObjStm\b")
+_W_PATTERN = re.compile(rb"/W\s*\[\s*(\d+)\s+(\d+)\s+(\d+)\s*\]")
+_INDEX_PATTERN = re.compile(rb"/Index\s*\[([\d\s]*)\]")
+_SIZE_PATTERN = re.compile(rb"/Size\s+(\d+)")
+_FIRST_PATTERN = re.compile(rb"/First\s+(\d+)")
+_COUNT_PATTERN = re.compile(rb"/N\s+(\d+)")
+_PREDICTOR_PATTERN = re.compile(rb"/Predictor\s+(\d+)")
+_COLUMNS_PATTERN = re.compile(rb"/Columns\s+(\d+)")
+_STARTXREF_SEARCH_BYTES = 2048
+_MAX_XREF_SECTIONS = 64
+
+
+class PdfObjectIndex(Mapping[int, shared.PdfBuffer]):
+    """Object number to object body over a PDF buffer, sliced on first access.
+
+    Locations come from the cross-reference tables or xref streams reachable
+    from ``startxref`` (following ``/Prev``), so building the index touches no
+    object bodies. Objects packed in object streams are unpacked when one of
+    them is first read. Without usable cross-reference data (missing, damaged
+    or with offsets that do not point at an object header) objects are located
+    with a regex scan instead. Entries whose offset does not point at the
+    object's header (some writers emit bogus in-use entries) are dropped, and
+    the file is scanned once if one of them is requested after all. Bodies
+    match what `_OBJECT_PATTERN` captures: everything between ``obj`` and the
+    next ``endobj``. Bodies of in-file objects are memoryview slices of the
+    buffer, so nothing is copied until a stream is inflated; only objects
+    unpacked from object streams are held as bytes.
+    """
+
+    def __init__(self, pdf_buffer: shared.PdfBuffer) -> None:
+        self._data = memoryview(pdf_buffer)
+        self._object_streams: dict[int, dict[int, bytes]] = {}
+        # In-file objects map to the offset of their body (of their header while
+        # the xref is being read), compressed ones to (object stream, index).
+        self._offsets: dict[int, int] = {}
+        self._compressed: dict[int, tuple[int, int]] = {}
+        self._unresolved: set[int] = set()
+        self._scan_done = False
+        self.root_object_id: int | None = None
+        self.from_xref = self._load_xref()
+        if not self.from_xref:
+            self._offsets.clear()
+            self._compressed.clear()
+            self.root_object_id = None
+            self._scan_objects()
+
+    @property
+    def scanned(self) -> bool:
+        """Whether the whole file had to be scanned for object headers."""
+
+        return self._scan_done
+
+    def __getitem__(self, object_id: int) -> shared.PdfBuffer:
+        if object_id in self._unresolved:
+            self._scan_objects()
+        if object_id in self._offsets:
+            start = self._offsets[object_id]
+            return self._data[start : self._find_endobj(start)]
+        if object_id in self._compressed:
+            stream_id, _ = self._compressed[object_id]
+            body = self._unpack_object_stream(stream_id).get(object_id)
+            if body is not None:
+                return body
+        raise KeyError(object_id)
+
+    def __iter__(self) -> Iterator[int]:
+        if self._unresolved:
+            self._scan_objects()
+        in_file = sorted(self._offsets, key=self._offsets.__getitem__)
+        return iter([*in_file, *self._compressed])
+
+    def __len__(self) -> int:
+        if self._unresolved:
+            self._scan_objects()
+        return len(self._offsets) + len(self._compressed)
+
+    def __contains__(self, object_id: object) -> bool:
+        if object_id in self._unresolved:
+            self._scan_objects()
+        return object_id in self._offsets or object_id in self._compressed
+
+    def _find_endobj(self, start: int) -> int:
+        match = _ENDOBJ_PATTERN.search(self._data, start)
+        return match.start() if match else len(self._data)
+
+    def _scan_objects(self) -> None:
+        """Locate objects by regex; entries already known from the xref win."""
+
+        known = set(self._offsets) | set(self._compressed)
+        for match in _OBJECT_PATTERN.finditer(self._data):
+            object_id = int(match.group(1))
+            if object_id not in known:
+                self._offsets[object_id] = match.start(3)
+        self._unresolved.clear()
+        self._scan_done = True
+
+    def _load_xref(self) -> bool:
+        tail_start = max(0, len(self._data) - _STARTXREF_SEARCH_BYTES)
+        startxref = None
+        for match in _STARTXREF_PATTERN.finditer(self._data, tail_start):
+            startxref = int(match.group(1))
+        if startxref is None:
+            return False
+
+        seen: set[int] = set()
+        pending = [startxref]
+        visited: set[int] = set()
+        while pending:
+            offset = pending.pop(0)
+            if offset in visited or len(visited) >= _MAX_XREF_SECTIONS:
+                continue
+            visited.add(offset)
+            if offset >= len(self._data):
+                return False
+            if self._data[offset : offset + 4] == b"xref":
+                section = self._read_xref_table(offset, seen)
+            else:
+                section = self._read_xref_stream(offset, seen)
+            if section is None:
+                return False
+            trailer, extra_offsets = section
+            if self.root_object_id is None:
+                root_match = _ROOT_REF_PATTERN.search(trailer)
+                if root_match:
+                    self.root_object_id = int(root_match.group(1))
+            pending[:0] = extra_offsets
+        for object_id, header_offset in list(self._offsets.items()):
+            match = _OBJECT_HEADER_PATTERN.match(self._data, header_offset)
+            if match is None or int(match.group(1)) != object_id:
+                del self._offsets[object_id]
+                self._unresolved.add(object_id)
+            else:
+                self._offsets[object_id] = match.end()
+        return bool(self._offsets or self._compressed)
+
+    def _read_xref_table(self, offset: int, seen: set[int]) -> tuple[bytes, list[int]] | None:
+        position = offset + 4
+        while True:
+            subsection = _XREF_SUBSECTION_PATTERN.match(self._data, position)
+            if subsection is None:
+                break
+            first, count = int(subsection.group(1)), int(subsection.group(2))
+            position = subsection.end()
+            for object_id in range(first, first + count):
+                entry = _XREF_ENTRY_PATTERN.match(self._data, position)
+                if entry is None:
+                    return None
+                position = entry.end()
+                if object_id not in seen and entry.group(3) == b"n":
+                    seen.add(object_id)
+                    self._offsets[object_id] = int(entry.group(1))
+        trailer_match = _TRAILER_PATTERN.match(self._data, position)
+        if trailer_match is None:
+            return None
+        trailer = trailer_match.group(1)
+        # A hybrid file's xref stream fills in the entries its table leaves free.
+        extra_offsets = [int(match.group(1)) for match in _XREF_STM_PATTERN.finditer(trailer)]
+        extra_offsets.extend(int(match.group(1)) for match in _PREV_PATTERN.finditer(trailer))
+        return trailer, extra_offsets
+
+    def _read_xref_stream(self, offset: int, seen: set[int]) -> tuple[bytes, list[int]] | None:
+        header = _OBJECT_HEADER_PATTERN.match(self._data, offset)
+        if header is None:
+            return None
+        payload = self._data[header.end() : self._find_endobj(header.end())]
+        dictionary = _stream_dictionary(payload)
+        widths_match = _W_PATTERN.search(dictionary)
+        if not _XREF_TYPE_PATTERN.search(dictionary) or widths_match is None:
+            return None
+        widths = [int(width) for width in widths_match.groups()]
+        entries = _decode_stream(payload, dictionary)
+        if entries is None:
+            return None
+
+        index_match = _INDEX_PATTERN.search(dictionary)
+        if index_match:
+            bounds = [int(value) for value in index_match.group(1).split()]
+        else:
+            size_match = _SIZE_PATTERN.search(dictionary)
+            if size_match is None:
+                return None
+            bounds = [0, int(size_match.group(1))]
+        row_size = sum(widths)
+        if row_size == 0:
+            return None
+        row = 0
+        for first, count in zip(bounds[::2], bounds[1::2], strict=False):
+            for object_id in range(first, first + count):
+                start = row * row_size
+                if start + row_size > len(entries):
+                    return None
+                row += 1
+                fields = []
+                for width in widths:
+                    fields.append(int.from_bytes(entries[start : start + width], "big"))
+                    start += width
+                entry_type = fields[0] if widths[0] else 1
+                if object_id in seen:
+                    continue
+                seen.add(object_id)
+                if entry_type == 1:
+                    self._offsets[object_id] = fields[1]
+                elif entry_type == 2:
+                    self._compressed[object_id] = (fields[1], fields[2])
+        return dictionary, [int(match.group(1)) for match in _PREV_PATTERN.finditer(dictionary)]
+
+    def _unpack_object_stream(self, stream_id: int) -> dict[int, bytes]:
+        unpacked = self._object_streams.get(stream_id)
+        if unpacked is not None:
+            return unpacked
+        unpacked = {}
+        self._object_streams[stream_id] = unpacked
+        payload = self.get(stream_id)
+        if payload is None:
+            return unpacked
+        dictionary = _stream_dictionary(payload)
+        first_match = _FIRST_PATTERN.search(dictionary)
+        count_match = _COUNT_PATTERN.search(dictionary)
+        if not _OBJSTM_TYPE_PATTERN.search(dictionary) or not first_match or not count_match:
+            return unpacked
+        data = _decode_stream(payload, dictionary)
+        if data is None:
+            return unpacked
+        first = int(first_match.group(1))
+        numbers = [int(value) for value in data[:first].split()[: 2 * int(count_match.group(1))]]
+        pairs = list(zip(numbers[::2], numbers[1::2], strict=False))
+        for position, (object_id, relative_offset) in enumerate(pairs):
+            end = pairs[position + 1][1] if position + 1 < len(pairs) else len(data) - first
+            unpacked[object_id] = data[first + relative_offset : first + end]
+        return unpacked
+
+
+def _stream_dictionary(payload: shared.PdfBuffer) -> bytes:
+    """Return the part of a stream object before its ``stream`` keyword."""
+
+    match = _STREAM_KEYWORD_PATTERN.search(payload)
+    return bytes(payload[: match.start()] if match else payload)
+
+
+def _decode_stream(payload: shared.PdfBuffer, dictionary: bytes) -> bytes | None:
+    """Inflate a cross-reference or object stream, undoing PNG row predictors."""
+
+    stream_match = _STREAM_DATA_PATTERN.search(payload)
+    if stream_match is None:
+        return None
+    data = shared.inflate_pdf_stream(
+        payload[stream_match.start(1) : stream_match.end(1)],
+        max_bytes=shared.MAX_OBJECT_STREAM_BYTES,
+    )
+    if data is None:
+        return None
+    predictor_match = _PREDICTOR_PATTERN.search(dictionary)
+    if predictor_match is None or int(predictor_match.group(1)) < 10:
+        return data
+    columns_match = _COLUMNS_PATTERN.search(dictionary)
+    return _undo_png_predictor(data, int(columns_match.group(1)) if columns_match else 1)
+
+
+def _undo_png_predictor(data: bytes, columns: int) -> bytes | None:
+    row_size = columns + 1
+    if columns <= 0 or len(data) % row_size:
+        return None
+    output = bytearray()
+    previous = bytearray(columns)
+    for row_start in range(0, len(data), row_size):
+        kind = data[row_start]
+        row = bytearray(data[row_start + 1 : row_start + row_size])
+        for index in range(columns):
+            left = row[index - 1] if index else 0
+            up = previous[index]
+            if kind == 1:
+                row[index] = (row[index] + left) & 0xFF
+            elif kind == 2:
+                row[index] = (row[index] + up) & 0xFF
+            elif kind == 3:
+                row[index] = (row[index] + (left + up) // 2) & 0xFF
+            elif kind == 4:
+                upper_left = previous[index - 1] if index else 0
+                estimate = left + up - upper_left
+                distances = (
+                    abs(estimate - left),
+                    abs(estimate - up),
+                    abs(estimate - upper_left),
+                )
+                if distances[0] <= distances[1] and distances[0] <= distances[2]:
+                    row[index] = (row[index] + left) & 0xFF
+                elif distances[1] <= distances[2]:
+                    row[index] = (row[index] + up) & 0xFF
+                else:
+                    row[index] = (row[index] + upper_left) & 0xFF
+            elif kind != 0:
+                return None
+        output.extend(row)
+        previous = row
+    return bytes(output)
@@ -3,8 +3,10 @@
 from __future__ import annotations
 
 import re
+from collections.abc import Iterator, Mapping
 
 from . import pdf_fallback_shared as shared
+from .pdf_object_index import PdfObjectIndex
 
 _PAGE_TYPE_PATTERN = re.compile(rb"/Type\s*/Page\b")
 _PAGE_CONTENTS_ARRAY_PATTERN = re.compile(rb"/Contents\s*\[(.*?)\]", re.DOTALL)
@@ -17,34 +19,95 @@ _FONT_DICT_REF_PATTERN = re.compile(rb"/Font\s+(\d+)\s+0\s+R")
 _FONT_ENTRY_PATTERN = re.compile(rb"/([^\s/<>{}\[\]()]+)\s+(\d+)\s+0\s+R")
 _TOUNICODE_REF_PATTERN = re.compile(rb"/ToUnicode\s+(\d+)\s+0\s+R")
 _OBJECT_STREAM_PATTERN = re.compile(rb"stream\r?\n(.*?)\r?\nendstream", re.DOTALL)
+_PAGES_TYPE_PATTERN = re.compile(rb"/Type\s*/Pages\b")
+_CATALOG_PAGES_REF_PATTERN = re.compile(rb"/Pages\s+(\d+)\s+\d+\s+R")
+_PAGE_KIDS_PATTERN = re.compile(rb"/Kids\s*\[(.*?)\]", re.DOTALL)
 
 
 def _collect_page_content_streams(
     *,
-    objects: dict[int, bytes],
-    cmap_by_object: dict[int, shared.PdfCMap],
+    objects: Mapping[int, shared.PdfBuffer],
+    cmap_by_object: Mapping[int, shared.PdfCMap],
 ) -> list[tuple[bytes, dict[str, shared.PdfCMap]]]:
     page_streams: list[tuple[bytes, dict[str, shared.PdfCMap]]] = []
-    for page_payload in objects.values():
-        if not _PAGE_TYPE_PATTERN.search(page_payload):
-            continue
-
-        font_to_cmap = _extract_font_to_cmap_for_page(
-            page_payload=page_payload,
-            objects=objects,
-            cmap_by_object=cmap_by_object,
+    for page_payload in _iter_page_payloads(objects):
+        page_streams.extend(
+            _page_content_streams(page_payload, objects=objects, cmap_by_object=cmap_by_object)
         )
-        for content_object_id in _extract_page_content_object_ids(page_payload):
-            content_payload = objects.get(content_object_id)
-            if content_payload is None:
-                continue
-            stream = _extract_object_stream(content_payload)
-            if stream is not None:
-                page_streams.append((stream, font_to_cmap))
     return page_streams
 
 
-def _extract_page_content_object_ids(page_payload: bytes) -> list[int]:
+def _page_content_streams(
+    page_payload: shared.PdfBuffer,
+    *,
+    objects: Mapping[int, shared.PdfBuffer],
+    cmap_by_object: Mapping[int, shared.PdfCMap],
+) -> list[tuple[bytes, dict[str, shared.PdfCMap]]]:
+    font_to_cmap = _extract_font_to_cmap_for_page(
+        page_payload=page_payload,
+        objects=objects,
+        cmap_by_object=cmap_by_object,
+    )
+    streams: list[tuple[bytes, dict[str, shared.PdfCMap]]] = []
+    for content_object_id in _extract_page_content_object_ids(page_payload):
+        content_payload = objects.get(content_object_id)
+        if content_payload is None:
+            continue
+        stream = _extract_object_stream(content_payload)
+        if stream is not None:
+            streams.append((stream, font_to_cmap))
+    return streams
+
+
+def _iter_page_payloads(
+    objects: Mapping[int, shared.PdfBuffer],
+) -> Iterator[shared.PdfBuffer]:
+    """Yield page objects in document order when the page tree is reachable.
+
+    Only the catalog, page tree nodes and pages are read. Without a catalog
+    (regex-scanned objects) every object is checked for ``/Type /Page``, in
+    file order.
+    """
+
+    page_ids = _page_tree_object_ids(objects) if isinstance(objects, PdfObjectIndex) else None
+    if page_ids:
+        for page_id in page_ids:
+            yield objects[page_id]
+        return
+    for payload in objects.values():
+        if _PAGE_TYPE_PATTERN.search(payload):
+            yield payload
+
+
+def _page_tree_object_ids(objects: PdfObjectIndex) -> list[int] | None:
+    catalog = objects.get(objects.root_object_id) if objects.root_object_id is not None else None
+    pages_ref = _CATALOG_PAGES_REF_PATTERN.search(catalog) if catalog is not None else None
+    if pages_ref is None:
+        return None
+
+    page_ids: list[int] = []
+    visited: set[int] = set()
+    pending = [int(pages_ref.group(1))]
+    while pending:
+        if shared.deadline_exceeded():
+            break
+        object_id = pending.pop()
+        node = objects.get(object_id)
+        if node is None or object_id in visited:
+            continue
+        visited.add(object_id)
+        if _PAGES_TYPE_PATTERN.search(node):
+            kids = _PAGE_KIDS_PATTERN.search(node)
+            if kids is not None:
+                pending.extend(
+                    reversed([int(ref) for ref in _OBJECT_REF_PATTERN.findall(kids.group(1))])
+                )
+        elif _PAGE_TYPE_PATTERN.search(node):
+            page_ids.append(object_id)
+    return page_ids
+
+
+def _extract_page_content_object_ids(page_payload: shared.PdfBuffer) -> list[int]:
     array_match = _PAGE_CONTENTS_ARRAY_PATTERN.search(page_payload)
     if array_match:
         return [int(ref) for ref in _OBJECT_REF_PATTERN.findall(array_match.group(1))]
@@ -57,9 +120,9 @@ def _extract_page_content_object_ids(page_payload: bytes) -> list[int]:
 
 def _extract_font_to_cmap_for_page(
     *,
-    page_payload: bytes,
-    objects: dict[int, bytes],
-    cmap_by_object: dict[int, shared.PdfCMap],
+    page_payload: shared.PdfBuffer,
+    objects: Mapping[int, shared.PdfBuffer],
+    cmap_by_object: Mapping[int, shared.PdfCMap],
 ) -> dict[str, shared.PdfCMap]:
     resource_payload = _resolve_page_resources(page_payload=page_payload, objects=objects)
     if resource_payload is None:
@@ -71,7 +134,9 @@ def _extract_font_to_cmap_for_page(
     )
 
 
-def _resolve_page_resources(*, page_payload: bytes, objects: dict[int, bytes]) -> bytes | None:
+def _resolve_page_resources(
+    *, page_payload: shared.PdfBuffer, objects: Mapping[int, shared.PdfBuffer]
+) -> shared.PdfBuffer | None:
     inline_match = _PAGE_RESOURCES_INLINE_PATTERN.search(page_payload)
     if inline_match:
         return inline_match.group(1)
@@ -84,9 +149,9 @@ def _resolve_page_resources(*, page_payload: bytes, objects: dict[int, bytes]) -
 
 def _build_font_to_cmap_from_page_resources(
     *,
-    resource_payload: bytes,
-    objects: dict[int, bytes],
-    cmap_by_object: dict[int, shared.PdfCMap],
+    resource_payload: shared.PdfBuffer,
+    objects: Mapping[int, shared.PdfBuffer],
+    cmap_by_object: Mapping[int, shared.PdfCMap],
 ) -> dict[str, shared.PdfCMap]:
     mapping: dict[str, shared.PdfCMap] = {}
     for font_name, font_object_id in _extract_font_entries_from_resource_payload(
@@ -107,8 +172,8 @@ def _build_font_to_cmap_from_page_resources(
 
 def _extract_font_entries_from_resource_payload(
     *,
-    resource_payload: bytes,
-    objects: dict[int, bytes],
+    resource_payload: shared.PdfBuffer,
+    objects: Mapping[int, shared.PdfBuffer],
 ) -> dict[str, int]:
     font_name_to_font_object: dict[str, int] = {}
 
@@ -130,24 +195,35 @@ def _extract_font_entries_from_resource_payload(
     return font_name_to_font_object
 
 
-def _extract_object_stream(object_payload: bytes, max_bytes: int | None = None) -> bytes | None:
+def _extract_object_stream(
+    object_payload: shared.PdfBuffer, max_bytes: int = shared.MAX_SINGLE_STREAM_BYTES
+) -> bytes | None:
+    """Return the stream's decoded bytes, at most ``max_bytes`` of them.
+
+    The stream is inflated straight from the object slice and abandoned as soon
+    as it outgrows ``max_bytes``.
+    """
+
     match = _OBJECT_STREAM_PATTERN.search(object_payload)
     if match is None:
         return None
-    raw_stream = match.group(1)
-    if max_bytes is not None and len(raw_stream) > max_bytes:
+    raw_stream = object_payload[match.start(1) : match.end(1)]
+    if len(raw_stream) > max_bytes:
+        return None
+    inflated = shared.inflate_pdf_stream_bounded(raw_stream, max_bytes=max_bytes)
+    if inflated.data is not None:
+        return inflated.data
+    if inflated.reason == shared.INFLATE_TOO_LARGE:
+        return None
+    if not _looks_textual_bytes(raw_stream):
         return None
-    inflated = shared.inflate_pdf_stream(raw_stream)
-    if inflated is not None:
-        if max_bytes is not None and len(inflated) > max_bytes:
-            return None
-        return inflated
-    if _looks_textual_bytes(raw_stream) and b"BT" in raw_stream and b"ET" in raw_stream:
+    raw_stream = bytes(raw_stream)
+    if b"BT" in raw_stream and b"ET" in raw_stream:
         return raw_stream
     return None
 
 
-def _looks_textual_bytes(payload: bytes) -> bool:
+def _looks_textual_bytes(payload: shared.PdfBuffer) -> bool:
     if not payload:
         return False
     printable = sum((32 <= byte <= 126) or byte in (9, 10, 13) for byte in payload)
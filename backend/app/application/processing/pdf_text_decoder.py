@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import struct
+from functools import lru_cache
+
 from . import pdf_fallback_shared as shared
 from .pdf_content_tokenizer import _tokenize_pdf_content
 from .pdf_text_quality import _decoded_text_score, _normalize_candidate_text
@@ -159,6 +162,23 @@ def _decode_tj_array_for_font(
 
 
 def _decode_pdf_text_token(token: bytes, cmaps: list[shared.PdfCMap | None]) -> str:
+    """Return the best-scoring decoding of ``token``: latin-1 or one of ``cmaps``.
+
+    Decodings with at most one CMap are memoized, since headers and labels
+    repeat on every page.
+    """
+
+    if len(cmaps) <= 1 and len(token) <= shared.MAX_MEMOIZED_TOKEN_BYTES:
+        return _decode_token_with_cmap(token, cmaps[0] if cmaps else None)
+    return _select_best_decoding(token, cmaps)
+
+
+@lru_cache(maxsize=shared.MAX_MEMOIZED_TOKENS)
+def _decode_token_with_cmap(token: bytes, cmap: shared.PdfCMap | None) -> str:
+    return _select_best_decoding(token, [cmap])
+
+
+def _select_best_decoding(token: bytes, cmaps: list[shared.PdfCMap | None]) -> str:
     candidates: list[str] = [token.decode("latin-1", errors="ignore")]
     for cmap in cmaps:
         if cmap is None:
@@ -181,6 +201,17 @@ def _decode_pdf_text_token(token: bytes, cmaps: list[shared.PdfCMap | None]) ->
 
 
 def _decode_bytes_with_cmap(token: bytes, cmap: shared.PdfCMap) -> str:
+    """Map ``token`` through ``cmap``, longest code first; unmapped bytes stay latin-1."""
+
+    if cmap.byte_table is not None:
+        return token.decode("latin-1").translate(cmap.byte_table)
+    if cmap.code_lengths == (2,):
+        units = len(token) // 2
+        mapped_units = list(map(cmap.get, struct.unpack(f">{units}H", token[: 2 * units])))
+        if None not in mapped_units:
+            return "".join(mapped_units) + token[2 * units :].decode("latin-1")
+
+    lookup = cmap.get
     chars: list[str] = []
     index = 0
     while index < len(token):
@@ -189,7 +220,7 @@ def _decode_bytes_with_cmap(token: bytes, cmap: shared.PdfCMap) -> str:
             if index + code_length > len(token):
                 continue
             code = int.from_bytes(token[index : index + code_length], byteorder="big")
-            mapped = cmap.codepoints.get(code)
+            mapped = lookup(code)
             if mapped is None:
                 continue
             chars.append(mapped)
@@ -198,6 +229,6 @@ def _decode_bytes_with_cmap(token: bytes, cmap: shared.PdfCMap) -> str:
             break
         if matched:
             continue
-        chars.append(bytes([token[index]]).decode("latin-1", errors="ignore"))
+        chars.append(chr(token[index]))
         index += 1
     return "".join(chars)
@@ -127,13 +127,45 @@ def _max_consonant_run(text: str) -> int:
     return max_run
 
 
+# Bounds the per-process memo: CMaps can map codes onto arbitrary code points.
+MAX_MEMOIZED_CHARACTER_CLASSES = 4096
+
+
+class _CharacterClasses(dict[int, str]):
+    """Code point to class letter for ``str.translate``, classified on first sight.
+
+    ``v`` vowel, ``l`` other letter, ``s`` whitespace, ``d`` other alphanumeric,
+    ``p`` anything else. The memo is emptied once it holds
+    ``MAX_MEMOIZED_CHARACTER_CLASSES`` code points.
+    """
+
+    def __missing__(self, code: int) -> str:
+        if len(self) >= MAX_MEMOIZED_CHARACTER_CLASSES:
+            self.clear()
+        char = chr(code)
+        if char.isalpha():
+            value = "v" if char.lower() in "aeiouáéíóúü" else "l"
+        elif char.isspace():
+            value = "s"
+        elif char.isalnum():
+            value = "d"
+        else:
+            value = "p"
+        self[code] = value
+        return value
+
+
+_CHARACTER_CLASSES = _CharacterClasses()
+
+
 def _decoded_text_score(text: str) -> float:
-    letters = sum(char.isalpha() for char in text)
+    classes = text.translate(_CHARACTER_CLASSES)
+    vowels = classes.count("v")
+    letters = vowels + classes.count("l")
     if letters == 0:
         return -100.0
-    spaces = sum(char.isspace() for char in text)
-    punctuation = sum((not char.isalnum()) and (not char.isspace()) for char in text)
-    vowels = sum(char.lower() in "aeiouáéíóúü" for char in text if char.isalpha())
+    spaces = classes.count("s")
+    punctuation = classes.count("p")
     length = len(text)
     space_ratio = (spaces / length) * 0.5
     punct_ratio = (punctuation / length) * 1.5
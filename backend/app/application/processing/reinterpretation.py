@@ -0,0 +1,420 @@
+"""Interpretation-only reprocessing: source run resolution and bulk jobs."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections.abc import Callable
+from dataclasses import replace
+from datetime import UTC, datetime
+from uuid import uuid4
+
+from backend.app.domain.models import (
+    ProcessingRun,
+    ProcessingRunState,
+    ReinterpretationJob,
+    ReinterpretationJobFilters,
+    ReinterpretationJobState,
+)
+from backend.app.ports.document_repository import DocumentRepository
+from backend.app.ports.file_storage import FileStorage
+
+from .constants import (
+    MAX_RECORDED_REINTERPRETATION_FAILURES,
+    REINTERPRETATION_BATCH_SIZE,
+    REINTERPRETATION_RUNS_PER_WORKER,
+)
+from .execution import ProcessingExecutor, ProcessPoolProcessingExecutor
+from .scheduler import RunLease, _execute_leased_run, _lease_timestamp, default_lease_owner
+
+logger = logging.getLogger(__name__)
+
+_IN_FLIGHT_RUN_STATES = frozenset({ProcessingRunState.QUEUED, ProcessingRunState.RUNNING})
+
+
+def _default_now_iso() -> str:
+    return datetime.now(UTC).isoformat()
+
+
+def _default_id() -> str:
+    return str(uuid4())
+
+
+def resolve_interpretation_source_run(
+    *,
+    document_id: str,
+    source_run_id: str | None,
+    repository: DocumentRepository,
+    storage: FileStorage,
+) -> str | None:
+    """Return the finished run of this document whose raw text can be reinterpreted.
+
+    Without ``source_run_id`` the latest finished run with stored raw text is used.
+    """
+
+    if source_run_id is None:
+        runs = repository.list_processing_runs(document_id=document_id)
+        candidates = [(run.run_id, run.state) for run in reversed(runs)]
+    else:
+        source_run = repository.get_run(source_run_id)
+        if source_run is None or source_run.document_id != document_id:
+            return None
+        candidates = [(source_run.run_id, source_run.state)]
+    for run_id, state in candidates:
+        if state in _IN_FLIGHT_RUN_STATES:
+            continue
+        if storage.exists_raw_text(document_id=document_id, run_id=run_id):
+            return run_id
+    return None
+
+
+def created_at_filter_bound(moment: datetime | None) -> str | None:
+    """Return ``moment`` as `documents.created_at` is stored, so bounds compare as text.
+
+    Naive datetimes are taken as UTC.
+    """
+
+    if moment is None:
+        return None
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=UTC)
+    return moment.astimezone(UTC).isoformat()
+
+
+def create_reinterpretation_job(
+    *,
+    filters: ReinterpretationJobFilters,
+    repository: DocumentRepository,
+    id_provider: Callable[[], str] = _default_id,
+    now_provider: Callable[[], str] = _default_now_iso,
+) -> ReinterpretationJob:
+    """Persist a QUEUED bulk re-interpretation job for the documents matching ``filters``."""
+
+    created_at = now_provider()
+    if filters.created_before is None:
+        filters = replace(filters, created_before=created_at)
+    job = ReinterpretationJob(
+        job_id=id_provider(),
+        state=ReinterpretationJobState.QUEUED,
+        filters=filters,
+        created_at=created_at,
+        updated_at=created_at,
+        started_at=None,
+        completed_at=None,
+        checkpoint_document_id=None,
+        total_documents=repository.count_reinterpretation_candidates(filters=filters),
+    )
+    repository.create_reinterpretation_job(job)
+    return job
+
+
+def claim_reinterpretation_job(*, job_id: str, repository: DocumentRepository) -> RunLease | None:
+    """Take over a job for this runner and return the lease it is now held under.
+
+    Returns None when the job does not exist, is COMPLETED, or is RUNNING under
+    another runner's unexpired lease. A runner that died without releasing its
+    lease loses the job once the lease expires.
+    """
+
+    lease = RunLease(owner=f"reinterpretation:{job_id}:{default_lease_owner()}")
+    claimed = repository.claim_reinterpretation_job(
+        job_id=job_id,
+        lease_owner=lease.owner,
+        lease_expires_at=_lease_timestamp(offset_seconds=lease.seconds),
+        now=_lease_timestamp(),
+    )
+    return lease if claimed else None
+
+
+async def run_reinterpretation_job(
+    *,
+    job_id: str,
+    repository: DocumentRepository,
+    storage: FileStorage,
+    executor: ProcessingExecutor | None,
+    max_in_flight: int,
+    stop_event: asyncio.Event | None = None,
+    batch_size: int = REINTERPRETATION_BATCH_SIZE,
+    lease: RunLease | None = None,
+) -> ReinterpretationJob:
+    """Reinterpret the job's remaining documents, resuming from its checkpoint.
+
+    The job is held under ``lease`` (from `claim_reinterpretation_job`), or
+    claimed here; a job that cannot be claimed is returned unchanged. Each
+    document gets an interpretation-only run from its latest stored raw text,
+    executed under the same lease; up to ``max_in_flight`` runs execute at once
+    with CPU-bound steps on ``executor``. Counters, failures and the checkpoint
+    are persisted, and the job lease renewed, after every batch. Once
+    ``stop_event`` is set the job stops after the current batch and is left
+    INTERRUPTED. If the lease is lost the runner stops without writing again.
+
+    Raises:
+        LookupError: If the job does not exist.
+    """
+
+    if lease is None:
+        lease = claim_reinterpretation_job(job_id=job_id, repository=repository)
+    job = repository.get_reinterpretation_job(job_id)
+    if job is None:
+        raise LookupError(f"Reinterpretation job not found: {job_id}")
+    if lease is None:
+        logger.warning(
+            "Reinterpretation job not claimed job_id=%s state=%s", job_id, job.state.value
+        )
+        return job
+
+    def _persist(progress: ReinterpretationJob) -> bool:
+        return repository.update_reinterpretation_job(
+            progress,
+            lease_owner=lease.owner,
+            lease_expires_at=_lease_timestamp(offset_seconds=lease.seconds),
+        )
+
+    semaphore = asyncio.Semaphore(max(1, max_in_flight))
+
+    async def _reinterpret(document_id: str) -> dict[str, str] | None:
+        async with semaphore:
+            try:
+                return await _reinterpret_document(
+                    document_id=document_id,
+                    repository=repository,
+                    storage=storage,
+                    executor=executor,
+                    lease=lease,
+                )
+            except Exception:
+                logger.exception(
+                    "Bulk reinterpretation failed job_id=%s document_id=%s", job_id, document_id
+                )
+                return {"document_id": document_id, "reason": "REINTERPRETATION_FAILED"}
+
+    elapsed_before = job.elapsed_seconds
+    resumed_at = time.monotonic()
+    heartbeat = asyncio.create_task(
+        _heartbeat_job_lease(job_id=job_id, repository=repository, lease=lease)
+    )
+    try:
+        while stop_event is None or not stop_event.is_set():
+            remaining = job.total_documents - job.processed_documents
+            document_ids = (
+                repository.list_reinterpretation_candidates(
+                    filters=job.filters,
+                    after_document_id=job.checkpoint_document_id,
+                    limit=min(batch_size, remaining),
+                )
+                if remaining > 0
+                else []
+            )
+            if not document_ids:
+                job = replace(
+                    job,
+                    state=ReinterpretationJobState.COMPLETED,
+                    completed_at=_default_now_iso(),
+                    updated_at=_default_now_iso(),
+                )
+                break
+            outcomes = await asyncio.gather(*(_reinterpret(doc_id) for doc_id in document_ids))
+            failures = [outcome for outcome in outcomes if outcome is not None]
+            job = replace(
+                job,
+                checkpoint_document_id=document_ids[-1],
+                processed_documents=job.processed_documents + len(document_ids),
+                succeeded_documents=job.succeeded_documents + len(document_ids) - len(failures),
+                failed_documents=job.failed_documents + len(failures),
+                failures=(*job.failures, *failures)[:MAX_RECORDED_REINTERPRETATION_FAILURES],
+                elapsed_seconds=elapsed_before + time.monotonic() - resumed_at,
+                updated_at=_default_now_iso(),
+            )
+            if not _persist(job):
+                return _lost_job_lease(job_id=job_id, repository=repository, lease=lease)
+            logger.info(
+                "Reinterpretation job progress job_id=%s processed=%s/%s failed=%s "
+                "docs_per_second=%.2f",
+                job_id,
+                job.processed_documents,
+                job.total_documents,
+                job.failed_documents,
+                job.docs_per_second or 0.0,
+            )
+        else:
+            job = replace(
+                job,
+                state=ReinterpretationJobState.INTERRUPTED,
+                updated_at=_default_now_iso(),
+            )
+    except BaseException:
+        # Cancelled or crashed mid-batch: keep the last checkpoint so a resume repeats
+        # at most one batch. Runs still leased by the job are re-queued on lease expiry.
+        _persist(
+            replace(job, state=ReinterpretationJobState.INTERRUPTED, updated_at=_default_now_iso())
+        )
+        raise
+    finally:
+        heartbeat.cancel()
+    if not _persist(job):
+        return _lost_job_lease(job_id=job_id, repository=repository, lease=lease)
+    return job
+
+
+async def _heartbeat_job_lease(
+    *, job_id: str, repository: DocumentRepository, lease: RunLease
+) -> None:
+    """Keep the job lease alive while a batch runs longer than the lease."""
+
+    while True:
+        await asyncio.sleep(lease.heartbeat_seconds)
+        renewed = repository.renew_reinterpretation_job_lease(
+            job_id=job_id,
+            lease_owner=lease.owner,
+            lease_expires_at=_lease_timestamp(offset_seconds=lease.seconds),
+        )
+        if not renewed:
+            return
+
+
+def _lost_job_lease(
+    *, job_id: str, repository: DocumentRepository, lease: RunLease
+) -> ReinterpretationJob:
+    logger.warning(
+        "Reinterpretation job lease lost; stopping job_id=%s owner=%s", job_id, lease.owner
+    )
+    job = repository.get_reinterpretation_job(job_id)
+    if job is None:
+        raise LookupError(f"Reinterpretation job not found: {job_id}")
+    return job
+
+
+async def _reinterpret_document(
+    *,
+    document_id: str,
+    repository: DocumentRepository,
+    storage: FileStorage,
+    executor: ProcessingExecutor | None,
+    lease: RunLease,
+) -> dict[str, str] | None:
+    """Execute one interpretation-only run and return a failure record, if any."""
+
+    latest_run = repository.get_latest_run(document_id)
+    if latest_run is not None and latest_run.state in _IN_FLIGHT_RUN_STATES:
+        return {"document_id": document_id, "reason": "RUN_IN_PROGRESS"}
+    source_run_id = resolve_interpretation_source_run(
+        document_id=document_id,
+        source_run_id=None,
+        repository=repository,
+        storage=storage,
+    )
+    if source_run_id is None:
+        return {"document_id": document_id, "reason": "SOURCE_RAW_TEXT_NOT_AVAILABLE"}
+
+    run = ProcessingRun(
+        run_id=_default_id(),
+        document_id=document_id,
+        state=ProcessingRunState.RUNNING,
+        created_at=_default_now_iso(),
+        source_run_id=source_run_id,
+    )
+    # The run is born RUNNING under the job's lease, so no scheduler can claim it.
+    created = repository.create_started_run(
+        run_id=run.run_id,
+        document_id=document_id,
+        created_at=run.created_at,
+        lease_owner=lease.owner,
+        lease_expires_at=_lease_timestamp(offset_seconds=lease.seconds),
+        source_run_id=source_run_id,
+    )
+    if not created:
+        return {"document_id": document_id, "reason": "RUN_IN_PROGRESS"}
+
+    await _execute_leased_run(
+        run=run, repository=repository, storage=storage, executor=executor, lease=lease
+    )
+    finished = repository.get_run(run.run_id)
+    if finished is not None and finished.state == ProcessingRunState.COMPLETED:
+        return None
+    reason = "RUN_ABANDONED"
+    if finished is not None and finished.state != ProcessingRunState.RUNNING:
+        reason = finished.failure_type or finished.state.value
+    return {"document_id": document_id, "reason": reason, "run_id": run.run_id}
+
+
+async def execute_reinterpretation_job(
+    *,
+    job_id: str,
+    repository: DocumentRepository,
+    storage: FileStorage,
+    workers: int,
+    stop_event: asyncio.Event | None = None,
+    lease: RunLease | None = None,
+) -> ReinterpretationJob:
+    """Run a bulk re-interpretation job on a dedicated pool of ``workers`` processes."""
+
+    executor = ProcessPoolProcessingExecutor(max_workers=workers)
+    try:
+        return await run_reinterpretation_job(
+            job_id=job_id,
+            repository=repository,
+            storage=storage,
+            executor=executor,
+            max_in_flight=workers * REINTERPRETATION_RUNS_PER_WORKER,
+            stop_event=stop_event,
+            lease=lease,
+        )
+    finally:
+        await asyncio.to_thread(executor.shutdown)
+
+
+class ReinterpretationJobRunner:
+    """Run bulk re-interpretation jobs as background tasks of the API process."""
+
+    def __init__(self) -> None:
+        self._tasks: dict[str, asyncio.Task[ReinterpretationJob]] = {}
+
+    def is_running(self, job_id: str) -> bool:
+        task = self._tasks.get(job_id)
+        return task is not None and not task.done()
+
+    def start(
+        self,
+        *,
+        job_id: str,
+        repository: DocumentRepository,
+        storage: FileStorage,
+        workers: int,
+        lease: RunLease | None = None,
+    ) -> bool:
+        """Start ``job_id`` in the background; return False if it is already running here.
+
+        ``lease`` is the job lease taken by `claim_reinterpretation_job`, if any.
+        """
+
+        if self.is_running(job_id):
+            return False
+        task = asyncio.create_task(
+            execute_reinterpretation_job(
+                job_id=job_id,
+                repository=repository,
+                storage=storage,
+                workers=workers,
+                lease=lease,
+            ),
+            name=f"reinterpretation-job-{job_id}",
+        )
+        self._tasks[job_id] = task
+        task.add_done_callback(self._task_done)
+        return True
+
+    def _task_done(self, task: asyncio.Task[ReinterpretationJob]) -> None:
+        for job_id, tracked in list(self._tasks.items()):
+            if tracked is task:
+                del self._tasks[job_id]
+        if not task.cancelled() and task.exception() is not None:
+            logger.error("Bulk reinterpretation job crashed", exc_info=task.exception())
+
+    async def stop(self) -> None:
+        """Cancel running jobs; they are left INTERRUPTED and can be resumed."""
+
+        tasks = tuple(self._tasks.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
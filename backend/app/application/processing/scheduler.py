@@ -4,17 +4,31 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import os
+import socket
+import threading
+import time
+from collections.abc import Callable, Coroutine
 from dataclasses import dataclass
-from datetime import UTC, datetime
+from datetime import UTC, datetime, timedelta
 from uuid import uuid4
 
+from backend.app.config import processing_concurrency
 from backend.app.domain.models import (
+    ProcessingRun,
     ProcessingRunState,
 )
 from backend.app.ports.document_repository import DocumentRepository
 from backend.app.ports.file_storage import FileStorage
 
-from .constants import MAX_RUNS_PER_TICK, PROCESSING_TICK_SECONDS
+from .constants import (
+    MAX_RUN_CLAIMS,
+    MAX_RUNS_PER_TICK,
+    PROCESSING_IDLE_POLL_MAX_SECONDS,
+    PROCESSING_TICK_SECONDS,
+    RUN_LEASE_SECONDS,
+)
+from .execution import ProcessingExecutor, build_processing_executor
 from .orchestrator import _execute_run
 
 logger = logging.getLogger(__name__)
@@ -28,6 +42,53 @@ def _default_id() -> str:
     return str(uuid4())
 
 
+def _lease_timestamp(*, offset_seconds: float = 0.0) -> str:
+    # Fixed precision keeps lease timestamps lexicographically comparable in SQL.
+    moment = datetime.now(UTC) + timedelta(seconds=offset_seconds)
+    return moment.isoformat(timespec="microseconds")
+
+
+def default_lease_owner() -> str:
+    """Return a lease owner id unique to this scheduler instance."""
+
+    return f"{socket.gethostname()}:{os.getpid()}:{uuid4().hex[:8]}"
+
+
+class RunQueueSignal:
+    """Thread-safe in-process notification that new runs are ready to be claimed.
+
+    Running schedulers subscribe an ``asyncio.Event`` bound to their loop; ``notify``
+    may be called from any thread (sync routes run in the threadpool).
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._subscribers: list[tuple[asyncio.AbstractEventLoop, asyncio.Event]] = []
+
+    def subscribe(self) -> asyncio.Event:
+        event = asyncio.Event()
+        with self._lock:
+            self._subscribers.append((asyncio.get_running_loop(), event))
+        return event
+
+    def unsubscribe(self, event: asyncio.Event) -> None:
+        with self._lock:
+            self._subscribers = [item for item in self._subscribers if item[1] is not event]
+
+    def notify(self) -> None:
+        with self._lock:
+            subscribers = list(self._subscribers)
+        for loop, event in subscribers:
+            try:
+                loop.call_soon_threadsafe(event.set)
+            except RuntimeError:
+                # Loop already closed; the scheduler is gone and will unsubscribe.
+                continue
+
+
+run_queue_signal = RunQueueSignal()
+
+
 @dataclass(frozen=True, slots=True)
 class EnqueuedRun:
     run_id: str
@@ -39,10 +100,15 @@ def enqueue_processing_run(
     *,
     document_id: str,
     repository: DocumentRepository,
+    source_run_id: str | None = None,
     id_provider: callable = _default_id,
     now_provider: callable = _default_now_iso,
 ) -> EnqueuedRun:
-    """Create a new queued processing run (append-only)."""
+    """Create a new queued processing run (append-only) and wake the scheduler.
+
+    With ``source_run_id`` the run is interpretation-only and rebuilds the
+    interpretation from that run's stored raw text.
+    """
 
     run_id = id_provider()
     created_at = now_provider()
@@ -51,35 +117,297 @@ def enqueue_processing_run(
         document_id=document_id,
         state=ProcessingRunState.QUEUED,
         created_at=created_at,
+        source_run_id=source_run_id,
     )
+    run_queue_signal.notify()
     return EnqueuedRun(run_id=run_id, created_at=created_at, state=ProcessingRunState.QUEUED)
 
 
+class RunWorkerPool:
+    """Bounded set of in-flight run executions owned by the scheduler loop."""
+
+    def __init__(
+        self,
+        *,
+        max_concurrent_runs: int,
+        on_run_done: Callable[[], None] | None = None,
+    ) -> None:
+        self._max_concurrent_runs = max(1, max_concurrent_runs)
+        self._on_run_done = on_run_done
+        self._tasks: set[asyncio.Task[None]] = set()
+
+    @property
+    def in_flight(self) -> int:
+        return len(self._tasks)
+
+    @property
+    def available_slots(self) -> int:
+        return max(0, self._max_concurrent_runs - len(self._tasks))
+
+    def submit(self, coro: Coroutine[object, object, None], *, name: str | None = None) -> None:
+        task = asyncio.create_task(coro, name=name)
+        self._tasks.add(task)
+        task.add_done_callback(self._task_done)
+
+    def _task_done(self, task: asyncio.Task[None]) -> None:
+        self._tasks.discard(task)
+        if self._on_run_done is not None:
+            self._on_run_done()
+
+    async def drain(self) -> None:
+        """Wait for every in-flight run; cancellation propagates to the runs."""
+
+        if not self._tasks:
+            return
+        logger.info("Draining %s in-flight processing runs", len(self._tasks))
+        await asyncio.gather(*tuple(self._tasks), return_exceptions=True)
+
+
 async def processing_scheduler(
     *,
     repository: DocumentRepository,
     storage: FileStorage,
     stop_event: asyncio.Event,
     tick_seconds: float = PROCESSING_TICK_SECONDS,
+    max_concurrent_runs: int | None = None,
+    executor: ProcessingExecutor | None = None,
+    idle_poll_max_seconds: float = PROCESSING_IDLE_POLL_MAX_SECONDS,
+    lease_owner: str | None = None,
+    lease_seconds: float = RUN_LEASE_SECONDS,
 ) -> None:
-    """Continuously start eligible queued runs and execute them."""
+    """Continuously start eligible queued runs and execute them concurrently.
+
+    Up to ``max_concurrent_runs`` runs execute at the same time (defaults to
+    ``VET_RECORDS_PROCESSING_CONCURRENCY``). CPU-bound steps run on ``executor``
+    (defaults to the backend selected by ``VET_RECORDS_PROCESSING_EXECUTOR``).
+    Once ``stop_event`` is set no new runs are started and in-flight runs are
+    drained before returning.
+
+    The loop wakes immediately when ``enqueue_processing_run`` signals new work
+    or a run finishes. Polling remains only as a safety net (runs enqueued by
+    other processes): ``tick_seconds`` after activity, doubling up to
+    ``idle_poll_max_seconds`` while idle.
 
-    while not stop_event.is_set():
-        await _process_queued_runs(repository=repository, storage=storage)
+    Runs are claimed under a lease owned by ``lease_owner`` and renewed by a
+    heartbeat while they execute, so several schedulers (API processes or
+    standalone workers) can share one database. Runs whose lease expired are
+    re-queued, or failed with PROCESS_TERMINATED after ``MAX_RUN_CLAIMS`` claims.
+    """
+
+    owns_executor = executor is None
+    run_executor = executor or build_processing_executor()
+    wakeup = run_queue_signal.subscribe()
+    worker_pool = RunWorkerPool(
+        max_concurrent_runs=(
+            max_concurrent_runs if max_concurrent_runs is not None else processing_concurrency()
+        ),
+        # A freed slot may unblock queued runs (pool full or same-document exclusivity).
+        on_run_done=wakeup.set,
+    )
+    lease = RunLease(owner=lease_owner or default_lease_owner(), seconds=lease_seconds)
+    poll_seconds = tick_seconds
+    next_reap_at = 0.0
+    try:
+        while not stop_event.is_set():
+            wakeup.clear()
+            if time.monotonic() >= next_reap_at:
+                _requeue_expired_runs(repository=repository)
+                next_reap_at = time.monotonic() + lease.seconds / 2
+            started = _process_queued_runs(
+                repository=repository,
+                storage=storage,
+                worker_pool=worker_pool,
+                executor=run_executor,
+                lease=lease,
+            )
+            poll_seconds = _next_poll_seconds(
+                current=poll_seconds,
+                started=started,
+                tick_seconds=tick_seconds,
+                max_seconds=max(idle_poll_max_seconds, tick_seconds),
+            )
+            await _wait_for_wakeup(stop_event=stop_event, wakeup=wakeup, timeout=poll_seconds)
+    finally:
+        run_queue_signal.unsubscribe(wakeup)
         try:
-            await asyncio.wait_for(stop_event.wait(), timeout=tick_seconds)
-        except TimeoutError:
-            continue
+            await worker_pool.drain()
+        finally:
+            if owns_executor:
+                await asyncio.to_thread(run_executor.shutdown)
+
+
+@dataclass(frozen=True, slots=True)
+class RunLease:
+    """Lease identity and duration used when claiming runs."""
+
+    owner: str
+    seconds: float = RUN_LEASE_SECONDS
+
+    @property
+    def heartbeat_seconds(self) -> float:
+        return self.seconds / 3
+
+
+def _requeue_expired_runs(*, repository: DocumentRepository) -> None:
+    requeued = repository.requeue_expired_runs(now=_lease_timestamp(), max_claims=MAX_RUN_CLAIMS)
+    if requeued:
+        logger.warning("Re-queued %s processing runs with expired leases", requeued)
+
 
+def _next_poll_seconds(
+    *, current: float, started: int, tick_seconds: float, max_seconds: float
+) -> float:
+    """Reset the safety-net poll after activity; back off exponentially while idle."""
 
-async def _process_queued_runs(*, repository: DocumentRepository, storage: FileStorage) -> None:
+    if started:
+        return tick_seconds
+    return min(current * 2, max_seconds)
+
+
+async def _wait_for_wakeup(
+    *, stop_event: asyncio.Event, wakeup: asyncio.Event, timeout: float
+) -> None:
+    if stop_event.is_set() or wakeup.is_set():
+        return
+    waiters = {
+        asyncio.create_task(stop_event.wait()),
+        asyncio.create_task(wakeup.wait()),
+    }
+    try:
+        await asyncio.wait(waiters, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+    finally:
+        for waiter in waiters:
+            waiter.cancel()
+
+
+def _process_queued_runs(
+    *,
+    repository: DocumentRepository,
+    storage: FileStorage,
+    worker_pool: RunWorkerPool,
+    executor: ProcessingExecutor | None = None,
+    lease: RunLease | None = None,
+) -> int:
+    """Claim queued runs into free worker slots and return how many were started."""
+
+    if worker_pool.available_slots == 0:
+        return 0
+    started_count = 0
     queued_runs = repository.list_queued_runs(limit=MAX_RUNS_PER_TICK)
     for run in queued_runs:
+        if worker_pool.available_slots == 0:
+            break
+        # try_start_run refuses a second RUNNING run for the same document, which keeps
+        # per-document exclusivity even when runs execute concurrently.
         started = repository.try_start_run(
             run_id=run.run_id,
             document_id=run.document_id,
             started_at=_default_now_iso(),
+            lease_owner=lease.owner if lease is not None else None,
+            lease_expires_at=(
+                _lease_timestamp(offset_seconds=lease.seconds) if lease is not None else None
+            ),
         )
         if not started:
             continue
-        await _execute_run(run=run, repository=repository, storage=storage)
+        if lease is None:
+            execution = _execute_batched_run(
+                run=run, repository=repository, storage=storage, executor=executor
+            )
+        else:
+            execution = _execute_leased_run(
+                run=run, repository=repository, storage=storage, executor=executor, lease=lease
+            )
+        worker_pool.submit(execution, name=f"processing-run-{run.run_id}")
+        started_count += 1
+    return started_count
+
+
+async def _execute_batched_run(
+    *,
+    run: ProcessingRun,
+    repository: DocumentRepository,
+    storage: FileStorage,
+    executor: ProcessingExecutor | None,
+    lease_owner: str | None = None,
+) -> None:
+    """Execute a run with its writes batched in one unit of work per run.
+
+    Buffered writes are discarded if the execution is cancelled, so an abandoned
+    run never persists partial step history after its lease was lost.
+    """
+
+    with repository.run_unit_of_work(lease_owner=lease_owner) as unit_of_work:
+        await _execute_run(
+            run=run,
+            repository=repository,
+            storage=storage,
+            executor=executor,
+            unit_of_work=unit_of_work,
+        )
+
+
+async def _execute_leased_run(
+    *,
+    run: ProcessingRun,
+    repository: DocumentRepository,
+    storage: FileStorage,
+    executor: ProcessingExecutor | None,
+    lease: RunLease,
+) -> None:
+    """Execute a claimed run while a heartbeat keeps its lease alive.
+
+    If the lease is lost (it expired and another scheduler re-queued the run)
+    the execution is cancelled so two owners never process the same run.
+    """
+
+    execution = asyncio.ensure_future(
+        _execute_batched_run(
+            run=run,
+            repository=repository,
+            storage=storage,
+            executor=executor,
+            lease_owner=lease.owner,
+        )
+    )
+    lease_lost = asyncio.Event()
+    heartbeat = asyncio.create_task(
+        _heartbeat_run_lease(
+            run_id=run.run_id,
+            repository=repository,
+            lease=lease,
+            on_lost=lambda: (lease_lost.set(), execution.cancel()),
+        )
+    )
+    try:
+        await execution
+    except asyncio.CancelledError:
+        if not lease_lost.is_set():
+            raise
+        logger.warning(
+            "Processing run lease lost; abandoning run run_id=%s owner=%s",
+            run.run_id,
+            lease.owner,
+        )
+    finally:
+        heartbeat.cancel()
+
+
+async def _heartbeat_run_lease(
+    *,
+    run_id: str,
+    repository: DocumentRepository,
+    lease: RunLease,
+    on_lost: Callable[[], object],
+) -> None:
+    while True:
+        await asyncio.sleep(lease.heartbeat_seconds)
+        renewed = repository.renew_run_lease(
+            run_id=run_id,
+            lease_owner=lease.owner,
+            lease_expires_at=_lease_timestamp(offset_seconds=lease.seconds),
+            heartbeat_at=_lease_timestamp(),
+        )
+        if not renewed:
+            on_lost()
+            return
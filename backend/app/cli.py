@@ -3,11 +3,40 @@
 from __future__ import annotations
 
 import argparse
+import asyncio
+import contextlib
 import json
+import logging
+import signal
+from datetime import datetime
 
+from backend.app.application.processing import (
+    claim_reinterpretation_job,
+    create_reinterpretation_job,
+    created_at_filter_bound,
+    execute_reinterpretation_job,
+    processing_scheduler,
+)
+from backend.app.application.processing.constants import RUN_LEASE_SECONDS
+from backend.app.application.processing.scheduler import RunLease, default_lease_owner
+from backend.app.config import processing_process_workers
+from backend.app.domain.models import (
+    ReinterpretationJob,
+    ReinterpretationJobFilters,
+    ReinterpretationJobState,
+    ReviewStatus,
+)
 from backend.app.infra import database
+from backend.app.infra.file_storage import LocalFileStorage
+from backend.app.infra.sqlite_document_repository import SqliteDocumentRepository
+from backend.app.logging_config import configure_logging
 from backend.app.settings import get_settings
 
+logger = logging.getLogger(__name__)
+# Standalone workers do not receive in-process enqueue notifications from API
+# processes, so their idle safety-net poll stays short.
+WORKER_IDLE_POLL_MAX_SECONDS = 2.0
+
 
 def _mask_config(key: str, value: object) -> object:
     sensitive_tokens = ("secret", "token", "password", "key")
@@ -45,6 +74,111 @@ def command_config_check() -> int:
     return 0
 
 
+async def _run_worker(*, concurrency: int | None, lease_seconds: float, worker_id: str) -> None:
+    stop_event = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for stop_signal in (signal.SIGINT, signal.SIGTERM):
+        with contextlib.suppress(NotImplementedError):
+            loop.add_signal_handler(stop_signal, stop_event.set)
+    await processing_scheduler(
+        repository=SqliteDocumentRepository(),
+        storage=LocalFileStorage(),
+        stop_event=stop_event,
+        max_concurrent_runs=concurrency,
+        idle_poll_max_seconds=WORKER_IDLE_POLL_MAX_SECONDS,
+        lease_owner=worker_id,
+        lease_seconds=lease_seconds,
+    )
+
+
+def command_worker(*, concurrency: int | None, lease_seconds: float, worker_id: str | None) -> int:
+    configure_logging(get_settings().log_level)
+    database.ensure_schema()
+    owner = worker_id or default_lease_owner()
+    logger.info(
+        "Processing worker starting worker_id=%s concurrency=%s lease_seconds=%.1f",
+        owner,
+        concurrency,
+        lease_seconds,
+    )
+    asyncio.run(_run_worker(concurrency=concurrency, lease_seconds=lease_seconds, worker_id=owner))
+    logger.info("Processing worker stopped worker_id=%s", owner)
+    return 0
+
+
+async def _run_reinterpretation(
+    *, job_id: str, workers: int, lease: RunLease
+) -> ReinterpretationJob:
+    stop_event = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for stop_signal in (signal.SIGINT, signal.SIGTERM):
+        with contextlib.suppress(NotImplementedError):
+            loop.add_signal_handler(stop_signal, stop_event.set)
+    return await execute_reinterpretation_job(
+        job_id=job_id,
+        repository=SqliteDocumentRepository(),
+        storage=LocalFileStorage(),
+        workers=workers,
+        stop_event=stop_event,
+        lease=lease,
+    )
+
+
+def command_reinterpret(
+    *,
+    review_status: str | None,
+    created_after: datetime | None,
+    created_before: datetime | None,
+    max_documents: int | None,
+    workers: int | None,
+    resume_job_id: str | None,
+) -> int:
+    configure_logging(get_settings().log_level)
+    database.ensure_schema()
+    repository = SqliteDocumentRepository()
+    if resume_job_id is None:
+        job = create_reinterpretation_job(
+            filters=ReinterpretationJobFilters(
+                review_status=ReviewStatus(review_status) if review_status else None,
+                created_after=created_at_filter_bound(created_after),
+                created_before=created_at_filter_bound(created_before),
+                max_documents=max_documents,
+            ),
+            repository=repository,
+        )
+    else:
+        resumed = repository.get_reinterpretation_job(resume_job_id)
+        if resumed is None:
+            print(f"Reinterpretation job not found: {resume_job_id}")
+            return 1
+        job = resumed
+    lease = claim_reinterpretation_job(job_id=job.job_id, repository=repository)
+    if lease is None:
+        print(f"Reinterpretation job is completed or running elsewhere: {job.job_id}")
+        return 1
+    pool_size = workers or processing_process_workers()
+    logger.info(
+        "Reinterpretation job starting job_id=%s documents=%s processed=%s workers=%s",
+        job.job_id,
+        job.total_documents,
+        job.processed_documents,
+        pool_size,
+    )
+    job = asyncio.run(_run_reinterpretation(job_id=job.job_id, workers=pool_size, lease=lease))
+    summary = {
+        "job_id": job.job_id,
+        "state": job.state.value,
+        "total_documents": job.total_documents,
+        "processed_documents": job.processed_documents,
+        "succeeded_documents": job.succeeded_documents,
+        "failed_documents": job.failed_documents,
+        "docs_per_second": job.docs_per_second,
+        "failures": list(job.failures),
+    }
+    print(json.dumps(summary, indent=2))
+    return 0 if job.state == ReinterpretationJobState.COMPLETED else 1
+
+
 def build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(description="Backend administrative commands")
     subparsers = parser.add_subparsers(dest="command", required=True)
@@ -52,6 +186,66 @@ def build_parser() -> argparse.ArgumentParser:
     subparsers.add_parser("db-schema", help="Ensure SQLite schema exists")
     subparsers.add_parser("db-check", help="Check database readability and table count")
     subparsers.add_parser("config-check", help="Print resolved runtime configuration")
+    worker_parser = subparsers.add_parser(
+        "worker", help="Run a standalone processing worker that claims runs with leases"
+    )
+    worker_parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=None,
+        help="Concurrent runs (defaults to VET_RECORDS_PROCESSING_CONCURRENCY)",
+    )
+    worker_parser.add_argument(
+        "--lease-seconds",
+        type=float,
+        default=RUN_LEASE_SECONDS,
+        help="Run lease duration; leases are renewed every third of it",
+    )
+    worker_parser.add_argument(
+        "--worker-id",
+        default=None,
+        help="Lease owner id (defaults to host:pid:random)",
+    )
+    reinterpret_parser = subparsers.add_parser(
+        "reinterpret",
+        help="Reinterpret stored raw text of many documents in a resumable bulk job",
+    )
+    reinterpret_parser.add_argument(
+        "--review-status",
+        choices=[status.value for status in ReviewStatus],
+        default=None,
+        help="Only documents with this review status",
+    )
+    reinterpret_parser.add_argument(
+        "--created-after",
+        type=datetime.fromisoformat,
+        default=None,
+        help="Only documents registered at or after this ISO timestamp (UTC if naive)",
+    )
+    reinterpret_parser.add_argument(
+        "--created-before",
+        type=datetime.fromisoformat,
+        default=None,
+        help="Only documents registered before this ISO timestamp (UTC if naive; default: now)",
+    )
+    reinterpret_parser.add_argument(
+        "--max-documents",
+        type=int,
+        default=None,
+        help="Upper bound on the number of documents reinterpreted",
+    )
+    reinterpret_parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Process-pool size (defaults to VET_RECORDS_PROCESSING_WORKERS)",
+    )
+    reinterpret_parser.add_argument(
+        "--resume",
+        dest="resume_job_id",
+        default=None,
+        help="Resume an existing job from its last checkpoint (filters are ignored)",
+    )
 
     return parser
 
@@ -66,6 +260,21 @@ def main() -> int:
         return command_db_check()
     if args.command == "config-check":
         return command_config_check()
+    if args.command == "worker":
+        return command_worker(
+            concurrency=args.concurrency,
+            lease_seconds=args.lease_seconds,
+            worker_id=args.worker_id,
+        )
+    if args.command == "reinterpret":
+        return command_reinterpret(
+            review_status=args.review_status,
+            created_after=args.created_after,
+            created_before=args.created_before,
+            max_documents=args.max_documents,
+            workers=args.workers,
+            resume_job_id=args.resume_job_id,
+        )
 
     parser.error(f"Unsupported command: {args.command}")
     return 2
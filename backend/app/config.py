@@ -19,6 +19,31 @@ RATE_LIMIT_UPLOAD_ENV = "VET_RECORDS_RATE_LIMIT_UPLOAD"
 RATE_LIMIT_DOWNLOAD_ENV = "VET_RECORDS_RATE_LIMIT_DOWNLOAD"
 DEFAULT_RATE_LIMIT_UPLOAD = "10/minute"
 DEFAULT_RATE_LIMIT_DOWNLOAD = "30/minute"
+PROCESSING_CONCURRENCY_ENV = "VET_RECORDS_PROCESSING_CONCURRENCY"
+DEFAULT_PROCESSING_CONCURRENCY = 4
+MAX_PROCESSING_CONCURRENCY = 32
+PROCESSING_EXECUTOR_ENV = "VET_RECORDS_PROCESSING_EXECUTOR"
+PROCESSING_WORKERS_ENV = "VET_RECORDS_PROCESSING_WORKERS"
+PROCESSING_EXECUTOR_THREAD = "thread"
+PROCESSING_EXECUTOR_PROCESS = "process"
+MAX_PROCESSING_WORKERS = 64
+FITZ_PAGE_WORKERS_ENV = "VET_RECORDS_FITZ_PAGE_WORKERS"
+DEFAULT_MAX_FITZ_PAGE_WORKERS = 8
+FITZ_PARALLEL_MIN_PAGES_ENV = "VET_RECORDS_FITZ_PARALLEL_MIN_PAGES"
+DEFAULT_FITZ_PARALLEL_MIN_PAGES = 32
+MAX_FITZ_PARALLEL_MIN_PAGES = 100000
+EXTRACTION_EARLY_ABORT_PAGES_ENV = "VET_RECORDS_EXTRACTION_EARLY_ABORT_PAGES"
+DEFAULT_EXTRACTION_EARLY_ABORT_PAGES = 8
+MAX_EXTRACTION_EARLY_ABORT_PAGES = 100000
+DB_POOL_SIZE_ENV = "VET_RECORDS_DB_POOL_SIZE"
+DEFAULT_DB_POOL_SIZE = 8
+MAX_DB_POOL_SIZE = 64
+DB_STATEMENT_CACHE_SIZE_ENV = "VET_RECORDS_DB_STATEMENT_CACHE_SIZE"
+DEFAULT_DB_STATEMENT_CACHE_SIZE = 256
+MAX_DB_STATEMENT_CACHE_SIZE = 4096
+EXTRACTION_CACHE_MAX_MB_ENV = "VET_RECORDS_EXTRACTION_CACHE_MAX_MB"
+DEFAULT_EXTRACTION_CACHE_MAX_MB = 256
+MAX_EXTRACTION_CACHE_MAX_MB = 102400
 
 
 def _current_settings():
@@ -66,6 +91,25 @@ def _parse_bounded_float_strict(
     )
 
 
+def _parse_bounded_int(
+    raw: str | None,
+    *,
+    default: int,
+    min_value: int,
+    max_value: int,
+) -> int:
+    normalized = _strip_or_none(raw)
+    if normalized is None:
+        return default
+    try:
+        value = int(normalized)
+    except ValueError:
+        return default
+    if not (min_value <= value <= max_value):
+        return default
+    return value
+
+
 def _parse_band_cutoffs(
     *,
     low_raw: str | None,
@@ -115,6 +159,124 @@ def processing_enabled() -> bool:
     return raw.strip().lower() not in {"1", "true", "yes", "on"}
 
 
+def upload_dedup_enabled() -> bool:
+    """Return whether duplicate uploads reuse a prior completed run instead of reprocessing."""
+
+    raw = _current_settings().vet_records_disable_upload_dedup
+    if raw is None:
+        return True
+    return raw.strip().lower() not in {"1", "true", "yes", "on"}
+
+
+def embedded_scheduler_enabled() -> bool:
+    """Return whether the API process runs the scheduler (off when standalone workers do)."""
+
+    raw = _current_settings().vet_records_disable_embedded_scheduler
+    if raw is None:
+        return True
+    return raw.strip().lower() not in {"1", "true", "yes", "on"}
+
+
+def processing_concurrency() -> int:
+    """Return the maximum number of processing runs executed concurrently."""
+
+    return _parse_bounded_int(
+        _current_settings().vet_records_processing_concurrency,
+        default=DEFAULT_PROCESSING_CONCURRENCY,
+        min_value=1,
+        max_value=MAX_PROCESSING_CONCURRENCY,
+    )
+
+
+def processing_executor_mode() -> str:
+    """Return the processing execution backend (`thread` or `process`)."""
+
+    raw = _strip_or_none(_current_settings().vet_records_processing_executor)
+    if raw is not None and raw.lower() == PROCESSING_EXECUTOR_PROCESS:
+        return PROCESSING_EXECUTOR_PROCESS
+    return PROCESSING_EXECUTOR_THREAD
+
+
+def processing_process_workers() -> int:
+    """Return the process-pool size used by the `process` execution backend."""
+
+    default = min(os.cpu_count() or 1, MAX_PROCESSING_WORKERS)
+    return _parse_bounded_int(
+        _current_settings().vet_records_processing_workers,
+        default=default,
+        min_value=1,
+        max_value=MAX_PROCESSING_WORKERS,
+    )
+
+
+def fitz_page_workers() -> int:
+    """Return the process-pool size for page-sharded PyMuPDF extraction (1 disables it)."""
+
+    default = min(os.cpu_count() or 1, DEFAULT_MAX_FITZ_PAGE_WORKERS)
+    return _parse_bounded_int(
+        _current_settings().vet_records_fitz_page_workers,
+        default=default,
+        min_value=1,
+        max_value=MAX_PROCESSING_WORKERS,
+    )
+
+
+def fitz_parallel_min_pages() -> int:
+    """Return the page count from which PyMuPDF extraction is sharded across processes."""
+
+    return _parse_bounded_int(
+        _current_settings().vet_records_fitz_parallel_min_pages,
+        default=DEFAULT_FITZ_PARALLEL_MIN_PAGES,
+        min_value=2,
+        max_value=MAX_FITZ_PARALLEL_MIN_PAGES,
+    )
+
+
+def extraction_early_abort_pages() -> int:
+    """Return after how many unreadable leading pages extraction gives up (0 disables it)."""
+
+    return _parse_bounded_int(
+        _current_settings().vet_records_extraction_early_abort_pages,
+        default=DEFAULT_EXTRACTION_EARLY_ABORT_PAGES,
+        min_value=0,
+        max_value=MAX_EXTRACTION_EARLY_ABORT_PAGES,
+    )
+
+
+def db_pool_size() -> int:
+    """Return how many SQLite connections are kept open for reuse (0 disables pooling)."""
+
+    return _parse_bounded_int(
+        _current_settings().vet_records_db_pool_size,
+        default=DEFAULT_DB_POOL_SIZE,
+        min_value=0,
+        max_value=MAX_DB_POOL_SIZE,
+    )
+
+
+def db_statement_cache_size() -> int:
+    """Return the per-connection prepared statement cache size."""
+
+    return _parse_bounded_int(
+        _current_settings().vet_records_db_statement_cache_size,
+        default=DEFAULT_DB_STATEMENT_CACHE_SIZE,
+        min_value=0,
+        max_value=MAX_DB_STATEMENT_CACHE_SIZE,
+    )
+
+
+def extraction_cache_max_bytes() -> int:
+    """Return the disk budget of the raw-text extraction cache (0 disables it)."""
+
+    max_mb = _parse_bounded_int(
+        _current_settings().vet_records_extraction_cache_max_mb,
+        default=DEFAULT_EXTRACTION_CACHE_MAX_MB,
+        min_value=0,
+        max_value=MAX_EXTRACTION_CACHE_MAX_MB,
+    )
+    return max_mb * 1024 * 1024
+
+
 def extraction_observability_enabled() -> bool:
     """Return whether extraction observability debug endpoints are enabled."""
 
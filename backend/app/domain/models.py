@@ -49,6 +49,15 @@ class ReviewStatus(str, Enum):
     REVIEWED = "REVIEWED"
 
 
+class ReinterpretationJobState(str, Enum):
+    """Bulk re-interpretation job lifecycle states."""
+
+    QUEUED = "QUEUED"
+    RUNNING = "RUNNING"
+    COMPLETED = "COMPLETED"
+    INTERRUPTED = "INTERRUPTED"
+
+
 @dataclass(frozen=True, slots=True)
 class Document:
     """Immutable document metadata record stored by the system."""
@@ -64,6 +73,7 @@ class Document:
     reviewed_at: str | None = None
     reviewed_by: str | None = None
     reviewed_run_id: str | None = None
+    content_sha256: str | None = None
 
 
 @dataclass(frozen=True, slots=True)
@@ -83,6 +93,7 @@ class ProcessingRun:
     document_id: str
     state: ProcessingRunState
     created_at: str
+    source_run_id: str | None = None
 
 
 @dataclass(frozen=True, slots=True)
@@ -121,6 +132,7 @@ class StepArtifact:
     ended_at: str | None
     error_code: str | None
     created_at: str
+    details: dict[str, object] | None = None
 
 
 @dataclass(frozen=True, slots=True)
@@ -129,3 +141,49 @@ class DocumentWithLatestRun:
 
     document: Document
     latest_run: ProcessingRunSummary | None
+
+
+@dataclass(frozen=True, slots=True)
+class ReinterpretationJobFilters:
+    """Document selection for a bulk re-interpretation job.
+
+    ``created_before`` is pinned to the job creation time when omitted, so the
+    selected set does not grow while the job runs or is resumed.
+    Both bounds are UTC ISO timestamps in the format of ``documents.created_at``,
+    which they are compared to as text.
+    """
+
+    review_status: ReviewStatus | None = None
+    created_after: str | None = None
+    created_before: str | None = None
+    max_documents: int | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class ReinterpretationJob:
+    """Progress record of a bulk re-interpretation job.
+
+    Documents are processed in ``document_id`` order; ``checkpoint_document_id``
+    is the last document of the last fully processed batch.
+    """
+
+    job_id: str
+    state: ReinterpretationJobState
+    filters: ReinterpretationJobFilters
+    created_at: str
+    updated_at: str
+    started_at: str | None
+    completed_at: str | None
+    checkpoint_document_id: str | None
+    total_documents: int
+    processed_documents: int = 0
+    succeeded_documents: int = 0
+    failed_documents: int = 0
+    elapsed_seconds: float = 0.0
+    failures: tuple[dict[str, str], ...] = ()
+
+    @property
+    def docs_per_second(self) -> float | None:
+        if self.elapsed_seconds <= 0:
+            return None
+        return self.processed_documents / self.elapsed_seconds
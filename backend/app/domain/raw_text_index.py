@@ -0,0 +1,147 @@
+"""Page and line positions within a run's raw text."""
+
+from __future__ import annotations
+
+import re
+from array import array
+from bisect import bisect_right
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass, field
+from itertools import accumulate
+
+RAW_TEXT_INDEX_VERSION = 1
+
+# Same boundaries as `str.splitlines`, so line numbers agree with it.
+_LINE_BREAK_PATTERN = re.compile(r"\r\n|[\n\r\x0b\x0c\x1c\x1d\x1e\x85\u2028\u2029]")
+
+
+@dataclass(frozen=True, slots=True)
+class RawTextIndex:
+    """Where pages and lines start in a raw text, resolved by bisection.
+
+    Offsets are character offsets into the text, like evidence offsets.
+    ``page_byte_starts`` locate the same pages in the UTF-8 encoded text, so
+    single pages can be read from storage without decoding the rest. Pages and
+    lines are numbered from 1.
+    """
+
+    text_length: int
+    page_starts: tuple[int, ...]
+    page_byte_starts: tuple[int, ...]
+    byte_length: int
+    line_starts: array = field(repr=False)
+
+    @classmethod
+    def build(cls, text: str, page_starts: Sequence[int] = (0,)) -> RawTextIndex:
+        """Index ``text`` whose pages begin at ``page_starts`` (0 is always a page start)."""
+
+        starts = sorted({0, *(start for start in page_starts if 0 < start <= len(text))})
+        page_byte_lengths = (
+            len(text[start:end].encode("utf-8"))
+            for start, end in zip(starts, [*starts[1:], len(text)], strict=True)
+        )
+        byte_ends = list(accumulate(page_byte_lengths))
+        line_starts = array("I", [0])
+        line_starts.extend(match.end() for match in _LINE_BREAK_PATTERN.finditer(text))
+        return cls(
+            text_length=len(text),
+            page_starts=tuple(starts),
+            page_byte_starts=(0, *byte_ends[:-1]),
+            byte_length=byte_ends[-1],
+            line_starts=line_starts,
+        )
+
+    @property
+    def page_count(self) -> int:
+        return len(self.page_starts)
+
+    @property
+    def line_count(self) -> int:
+        return len(self.line_starts)
+
+    def page_for_offset(self, offset: int) -> int:
+        return max(1, bisect_right(self.page_starts, offset))
+
+    def line_for_offset(self, offset: int) -> int:
+        return max(1, bisect_right(self.line_starts, offset))
+
+    def page_span(self, page: int) -> tuple[int, int]:
+        """Return the ``[start, end)`` character offsets of ``page``.
+
+        Raises:
+            IndexError: If the text has no such page.
+        """
+
+        if not 1 <= page <= self.page_count:
+            raise IndexError(f"Page out of range: {page}")
+        end = self.page_starts[page] if page < self.page_count else self.text_length
+        return self.page_starts[page - 1], end
+
+    def page_byte_span(self, page: int) -> tuple[int, int]:
+        """Return the ``[start, end)`` byte offsets of ``page`` in the UTF-8 text.
+
+        Raises:
+            IndexError: If the text has no such page.
+        """
+
+        if not 1 <= page <= self.page_count:
+            raise IndexError(f"Page out of range: {page}")
+        end = self.page_byte_starts[page] if page < self.page_count else self.byte_length
+        return self.page_byte_starts[page - 1], end
+
+    def to_payload(self) -> dict[str, object]:
+        """Return a JSON-serializable form; line starts are stored as line lengths."""
+
+        line_starts = self.line_starts
+        return {
+            "version": RAW_TEXT_INDEX_VERSION,
+            "text_length": self.text_length,
+            "byte_length": self.byte_length,
+            "page_starts": list(self.page_starts),
+            "page_byte_starts": list(self.page_byte_starts),
+            "line_lengths": [
+                end - start for start, end in zip(line_starts, line_starts[1:], strict=False)
+            ],
+        }
+
+    @classmethod
+    def from_payload(cls, payload: Mapping[str, object]) -> RawTextIndex:
+        """Rebuild an index from `to_payload` output.
+
+        Raises:
+            ValueError: If the payload is malformed or from another index version.
+        """
+
+        if payload.get("version") != RAW_TEXT_INDEX_VERSION:
+            raise ValueError("Unsupported raw text index version")
+        try:
+            line_starts = array("I", [0])
+            line_starts.extend(accumulate(_int_list(payload["line_lengths"])))
+            index = cls(
+                text_length=_int(payload["text_length"]),
+                page_starts=tuple(_int_list(payload["page_starts"])),
+                page_byte_starts=tuple(_int_list(payload["page_byte_starts"])),
+                byte_length=_int(payload["byte_length"]),
+                line_starts=line_starts,
+            )
+        except (KeyError, TypeError, OverflowError) as exc:
+            raise ValueError("Malformed raw text index") from exc
+        if (
+            not index.page_starts
+            or index.page_starts[0] != 0
+            or len(index.page_byte_starts) != len(index.page_starts)
+        ):
+            raise ValueError("Malformed raw text index")
+        return index
+
+
+def _int(value: object) -> int:
+    if not isinstance(value, int) or isinstance(value, bool):
+        raise TypeError("Expected an integer")
+    return value
+
+
+def _int_list(value: object) -> list[int]:
+    if not isinstance(value, list):
+        raise TypeError("Expected a list of integers")
+    return [_int(item) for item in value]
@@ -0,0 +1,244 @@
+"""Thread-affine SQLite connection pool.
+
+Each thread keeps one configured connection open and reuses it across repository
+calls, so the per-call cost of ``sqlite3.connect`` and the WAL/busy-timeout
+PRAGMAs is paid once per thread instead of once per query. Reused connections
+also keep their prepared statement cache warm.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import sqlite3
+import threading
+import time
+import weakref
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+HEALTH_CHECK_IDLE_SECONDS = 30.0
+
+
+@dataclass(frozen=True, slots=True)
+class ConnectionPoolStats:
+    """Point-in-time pool metrics."""
+
+    max_size: int
+    open_connections: int
+    in_use: int
+    opened: int
+    reused: int
+    overflow: int
+    discarded: int
+    health_check_failures: int
+
+
+class _PooledConnection:
+    """Connection owned by one thread plus the identity of the file it points at."""
+
+    __slots__ = ("__weakref__", "conn", "file_id", "generation", "in_use", "last_used")
+
+    def __init__(
+        self, *, conn: sqlite3.Connection, file_id: tuple[str, int, int], generation: int
+    ) -> None:
+        self.conn = conn
+        self.file_id = file_id
+        self.generation = generation
+        self.in_use = False
+        self.last_used = time.monotonic()
+
+
+class SqliteConnectionPool:
+    """Hand out configured connections, reusing one per thread up to ``max_size``.
+
+    Threads beyond ``max_size`` (and nested checkouts on the same thread) get a
+    short-lived overflow connection that is closed on release. A pooled
+    connection is replaced when the database file changes, after ``reset``, or
+    when it fails a ``SELECT 1`` probe after being idle for a while.
+    """
+
+    def __init__(
+        self,
+        *,
+        connect: Callable[[Path], sqlite3.Connection],
+        resolve_path: Callable[[], Path],
+        max_size: int,
+        health_check_idle_seconds: float = HEALTH_CHECK_IDLE_SECONDS,
+    ) -> None:
+        self._connect = connect
+        self._resolve_path = resolve_path
+        self._max_size = max(0, max_size)
+        self._health_check_idle_seconds = health_check_idle_seconds
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._generation = 0
+        self._open_connections = 0
+        self._in_use = 0
+        self._opened = 0
+        self._reused = 0
+        self._overflow = 0
+        self._discarded = 0
+        self._health_check_failures = 0
+
+    @property
+    def max_size(self) -> int:
+        return self._max_size
+
+    @contextmanager
+    def connection(self) -> Iterator[sqlite3.Connection]:
+        """Yield a connection; any transaction left open is rolled back on release."""
+
+        path = self._resolve_path()
+        file_id = _file_id(path)
+        pooled = self._checkout(path=path, file_id=file_id)
+        if pooled is None:
+            conn = self._open(path)
+            with self._lock:
+                self._overflow += 1
+                self._in_use += 1
+            try:
+                yield conn
+            finally:
+                with self._lock:
+                    self._in_use -= 1
+                conn.close()
+            return
+
+        healthy = True
+        try:
+            yield pooled.conn
+        except sqlite3.IntegrityError:
+            # Constraint violations are expected (e.g. claim and dedup races) and leave
+            # the connection intact; release rolls the transaction back.
+            raise
+        except sqlite3.DatabaseError:
+            # The error may stem from the connection itself (e.g. a replaced file);
+            # never hand this connection out again.
+            healthy = False
+            raise
+        finally:
+            self._release(pooled, healthy=healthy)
+
+    def stats(self) -> ConnectionPoolStats:
+        with self._lock:
+            return ConnectionPoolStats(
+                max_size=self._max_size,
+                open_connections=self._open_connections,
+                in_use=self._in_use,
+                opened=self._opened,
+                reused=self._reused,
+                overflow=self._overflow,
+                discarded=self._discarded,
+                health_check_failures=self._health_check_failures,
+            )
+
+    def reset(self) -> None:
+        """Invalidate every pooled connection; each thread reopens on its next checkout."""
+
+        with self._lock:
+            self._generation += 1
+        self._discard_current_thread()
+
+    def _checkout(
+        self, *, path: Path, file_id: tuple[str, int, int] | None
+    ) -> _PooledConnection | None:
+        pooled: _PooledConnection | None = getattr(self._local, "pooled", None)
+        if pooled is not None:
+            if pooled.in_use:
+                return None
+            if not self._is_reusable(pooled, file_id=file_id):
+                self._discard_current_thread()
+                pooled = None
+        if pooled is None:
+            if file_id is None or not self._reserve_slot():
+                return None
+            try:
+                conn = self._open(path)
+            except BaseException:
+                self._free_slot()
+                raise
+            pooled = _PooledConnection(conn=conn, file_id=file_id, generation=self._generation)
+            # Threads exit without telling us; free the slot when their local dies.
+            weakref.finalize(pooled, self._free_slot)
+            self._local.pooled = pooled
+        else:
+            with self._lock:
+                self._reused += 1
+        pooled.in_use = True
+        with self._lock:
+            self._in_use += 1
+        return pooled
+
+    def _release(self, pooled: _PooledConnection, *, healthy: bool) -> None:
+        pooled.in_use = False
+        pooled.last_used = time.monotonic()
+        with self._lock:
+            self._in_use -= 1
+        if healthy:
+            try:
+                if pooled.conn.in_transaction:
+                    pooled.conn.rollback()
+                return
+            except sqlite3.Error:
+                pass
+        self._discard_current_thread()
+
+    def _is_reusable(
+        self, pooled: _PooledConnection, *, file_id: tuple[str, int, int] | None
+    ) -> bool:
+        if pooled.generation != self._generation or pooled.file_id != file_id:
+            return False
+        if time.monotonic() - pooled.last_used < self._health_check_idle_seconds:
+            return True
+        try:
+            pooled.conn.execute("SELECT 1").fetchone()
+        except sqlite3.Error:
+            with self._lock:
+                self._health_check_failures += 1
+            logger.warning("Discarding pooled SQLite connection that failed its health check")
+            return False
+        return True
+
+    def _discard_current_thread(self) -> None:
+        pooled: _PooledConnection | None = getattr(self._local, "pooled", None)
+        if pooled is None:
+            return
+        self._local.pooled = None
+        with self._lock:
+            self._discarded += 1
+        try:
+            pooled.conn.close()
+        except sqlite3.Error:  # pragma: no cover - defensive
+            pass
+
+    def _open(self, path: Path) -> sqlite3.Connection:
+        conn = self._connect(path)
+        with self._lock:
+            self._opened += 1
+        return conn
+
+    def _reserve_slot(self) -> bool:
+        with self._lock:
+            if self._open_connections >= self._max_size:
+                return False
+            self._open_connections += 1
+            return True
+
+    def _free_slot(self) -> None:
+        with self._lock:
+            self._open_connections -= 1
+
+
+def _file_id(path: Path) -> tuple[str, int, int] | None:
+    """Identify the database file so a deleted or replaced file is never reused."""
+
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return (str(path), stat.st_dev, stat.st_ino)
@@ -7,11 +7,14 @@ minimal schema used for the current release.
 from __future__ import annotations
 
 import sqlite3
+import threading
 from collections.abc import Iterator
 from contextlib import contextmanager
 from pathlib import Path
 from uuid import uuid4
 
+from backend.app.config import db_pool_size, db_statement_cache_size
+from backend.app.infra.connection_pool import ConnectionPoolStats, SqliteConnectionPool
 from backend.app.settings import get_settings
 
 BASE_DIR = Path(__file__).resolve().parents[2]
@@ -22,6 +25,7 @@ _SCHEMA_TABLE_INFO_SQL = {
     "processing_runs": "PRAGMA table_info(processing_runs)",
     "artifacts": "PRAGMA table_info(artifacts)",
     "calibration_aggregates": "PRAGMA table_info(calibration_aggregates)",
+    "reinterpretation_jobs": "PRAGMA table_info(reinterpretation_jobs)",
 }
 
 
@@ -43,25 +47,79 @@ def get_database_path() -> Path:
     return path
 
 
+def open_connection(
+    path: Path | None = None, *, cached_statements: int | None = None
+) -> sqlite3.Connection:
+    """Open a configured SQLite connection owned by the caller.
+
+    Used for longer-lived connections (e.g. a run unit of work) and by the
+    connection pool; the caller is responsible for closing it.
+    """
+
+    conn = sqlite3.connect(
+        path or get_database_path(),
+        detect_types=sqlite3.PARSE_DECLTYPES,
+        cached_statements=(
+            cached_statements if cached_statements is not None else db_statement_cache_size()
+        ),
+    )
+    conn.execute("PRAGMA journal_mode=WAL;")
+    conn.execute("PRAGMA busy_timeout=5000;")
+    conn.row_factory = sqlite3.Row
+    return conn
+
+
+_POOL: SqliteConnectionPool | None = None
+_POOL_LOCK = threading.Lock()
+
+
+def get_connection_pool() -> SqliteConnectionPool:
+    """Return the process-wide connection pool, creating it on first use."""
+
+    global _POOL
+    pool = _POOL
+    if pool is not None:
+        return pool
+    with _POOL_LOCK:
+        if _POOL is None:
+            cached_statements = db_statement_cache_size()
+            _POOL = SqliteConnectionPool(
+                connect=lambda path: open_connection(path, cached_statements=cached_statements),
+                resolve_path=get_database_path,
+                max_size=db_pool_size(),
+            )
+        return _POOL
+
+
+def reset_connection_pool() -> None:
+    """Drop the process-wide pool so pooled connections and pool settings are refreshed."""
+
+    global _POOL
+    with _POOL_LOCK:
+        pool, _POOL = _POOL, None
+    if pool is not None:
+        pool.reset()
+
+
+def connection_pool_stats() -> ConnectionPoolStats:
+    """Return metrics of the process-wide connection pool."""
+
+    return get_connection_pool().stats()
+
+
 @contextmanager
 def get_connection() -> Iterator[sqlite3.Connection]:
-    """Yield a configured SQLite connection.
+    """Yield a configured SQLite connection from the process-wide pool.
 
-    The connection uses `sqlite3.Row` for row mapping and is always closed after
-    the context exits.
+    The connection uses `sqlite3.Row` for row mapping. Connections are reused
+    per thread; any transaction left open is rolled back when the context exits.
 
     Yields:
         An open SQLite connection.
     """
 
-    conn = sqlite3.connect(get_database_path(), detect_types=sqlite3.PARSE_DECLTYPES)
-    conn.execute("PRAGMA journal_mode=WAL;")
-    conn.execute("PRAGMA busy_timeout=5000;")
-    conn.row_factory = sqlite3.Row
-    try:
+    with get_connection_pool().connection() as conn:
         yield conn
-    finally:
-        conn.close()
 
 
 def ensure_schema() -> None:
@@ -77,6 +135,7 @@ def ensure_schema() -> None:
         _ensure_processing_runs_schema(conn)
         _ensure_artifacts_schema(conn)
         _ensure_calibration_aggregates_schema(conn)
+        _ensure_reinterpretation_jobs_schema(conn)
         conn.commit()
 
 
@@ -104,10 +163,12 @@ def _ensure_documents_schema(conn: sqlite3.Connection) -> None:
                 review_status TEXT NOT NULL,
                 reviewed_at TEXT,
                 reviewed_by TEXT,
-                reviewed_run_id TEXT
+                reviewed_run_id TEXT,
+                content_sha256 TEXT
             );
             """
         )
+        _ensure_documents_content_hash_index(conn)
         return
 
     if "reviewed_at" not in columns:
@@ -116,8 +177,11 @@ def _ensure_documents_schema(conn: sqlite3.Connection) -> None:
         conn.execute("ALTER TABLE documents ADD COLUMN reviewed_by TEXT;")
     if "reviewed_run_id" not in columns:
         conn.execute("ALTER TABLE documents ADD COLUMN reviewed_run_id TEXT;")
+    if "content_sha256" not in columns:
+        conn.execute("ALTER TABLE documents ADD COLUMN content_sha256 TEXT;")
 
     if "original_filename" in columns and "storage_path" in columns:
+        _ensure_documents_content_hash_index(conn)
         return
 
     conn.executescript(
@@ -133,7 +197,8 @@ def _ensure_documents_schema(conn: sqlite3.Connection) -> None:
             review_status TEXT NOT NULL,
             reviewed_at TEXT,
             reviewed_by TEXT,
-            reviewed_run_id TEXT
+            reviewed_run_id TEXT,
+            content_sha256 TEXT
         );
         """
     )
@@ -169,6 +234,16 @@ def _ensure_documents_schema(conn: sqlite3.Connection) -> None:
     )
     conn.execute("DROP TABLE documents;")
     conn.execute("ALTER TABLE documents_new RENAME TO documents;")
+    _ensure_documents_content_hash_index(conn)
+
+
+def _ensure_documents_content_hash_index(conn: sqlite3.Connection) -> None:
+    conn.execute(
+        """
+        CREATE INDEX IF NOT EXISTS idx_documents_content_sha256
+        ON documents(content_sha256);
+        """
+    )
 
 
 def _ensure_status_history_schema(conn: sqlite3.Connection) -> None:
@@ -238,6 +313,11 @@ def _ensure_processing_runs_schema(conn: sqlite3.Connection) -> None:
                 started_at TEXT,
                 completed_at TEXT,
                 failure_type TEXT,
+                lease_owner TEXT,
+                lease_expires_at TEXT,
+                heartbeat_at TEXT,
+                claim_count INTEGER NOT NULL DEFAULT 0,
+                source_run_id TEXT,
                 FOREIGN KEY(document_id) REFERENCES documents(document_id)
             );
             """
@@ -291,12 +371,31 @@ def _ensure_processing_runs_schema(conn: sqlite3.Connection) -> None:
             )
             conn.execute("DROP TABLE processing_runs;")
             conn.execute("ALTER TABLE processing_runs_new RENAME TO processing_runs;")
+        columns = _table_columns(conn, "processing_runs")
+        if "lease_owner" not in columns:
+            conn.execute("ALTER TABLE processing_runs ADD COLUMN lease_owner TEXT;")
+        if "lease_expires_at" not in columns:
+            conn.execute("ALTER TABLE processing_runs ADD COLUMN lease_expires_at TEXT;")
+        if "heartbeat_at" not in columns:
+            conn.execute("ALTER TABLE processing_runs ADD COLUMN heartbeat_at TEXT;")
+        if "claim_count" not in columns:
+            conn.execute(
+                "ALTER TABLE processing_runs ADD COLUMN claim_count INTEGER NOT NULL DEFAULT 0;"
+            )
+        if "source_run_id" not in columns:
+            conn.execute("ALTER TABLE processing_runs ADD COLUMN source_run_id TEXT;")
     conn.execute(
         """
         CREATE INDEX IF NOT EXISTS idx_processing_runs_document_id
         ON processing_runs (document_id);
         """
     )
+    conn.execute(
+        """
+        CREATE INDEX IF NOT EXISTS idx_processing_runs_state_created_at
+        ON processing_runs (state, created_at);
+        """
+    )
 
 
 def _ensure_artifacts_schema(conn: sqlite3.Connection) -> None:
@@ -352,6 +451,36 @@ def _ensure_artifacts_schema(conn: sqlite3.Connection) -> None:
     )
 
 
+def _ensure_reinterpretation_jobs_schema(conn: sqlite3.Connection) -> None:
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS reinterpretation_jobs (
+            job_id TEXT PRIMARY KEY,
+            state TEXT NOT NULL,
+            filters TEXT NOT NULL,
+            created_at TEXT NOT NULL,
+            updated_at TEXT NOT NULL,
+            started_at TEXT,
+            completed_at TEXT,
+            checkpoint_document_id TEXT,
+            total_documents INTEGER NOT NULL,
+            processed_documents INTEGER NOT NULL DEFAULT 0,
+            succeeded_documents INTEGER NOT NULL DEFAULT 0,
+            failed_documents INTEGER NOT NULL DEFAULT 0,
+            elapsed_seconds REAL NOT NULL DEFAULT 0,
+            failures TEXT NOT NULL DEFAULT '[]',
+            lease_owner TEXT,
+            lease_expires_at TEXT
+        );
+        """
+    )
+    columns = _table_columns(conn, "reinterpretation_jobs")
+    if "lease_owner" not in columns:
+        conn.execute("ALTER TABLE reinterpretation_jobs ADD COLUMN lease_owner TEXT;")
+    if "lease_expires_at" not in columns:
+        conn.execute("ALTER TABLE reinterpretation_jobs ADD COLUMN lease_expires_at TEXT;")
+
+
 def _ensure_calibration_aggregates_schema(conn: sqlite3.Connection) -> None:
     columns = _table_columns(conn, "calibration_aggregates")
     if not columns:
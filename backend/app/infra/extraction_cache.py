@@ -0,0 +1,171 @@
+"""On-disk content-addressed cache of raw extracted text."""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from uuid import uuid4
+
+from backend.app.ports.file_storage import (
+    CachedExtraction,
+    ExtractionCacheKey,
+    ExtractionCacheStats,
+)
+
+ENTRY_SUFFIX = ".txt"
+# Page start offsets of multi-page entries and the pages re-extracted by the
+# fallback parser, written next to the text.
+PAGES_SUFFIX = ".pages.json"
+
+
+class LocalExtractionCache:
+    """Raw-text cache under ``root`` with a least-recently-used size budget.
+
+    Entries are files named by the key digest and written atomically. Reads bump
+    an entry's mtime, so the recency order survives restarts and is shared with
+    other processes using the same directory. Writes evict least recently used
+    entries until the directory fits ``max_bytes``.
+    """
+
+    def __init__(self, *, root: Path, max_bytes: int) -> None:
+        self._root = root
+        self._max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, int] | None = None
+        self._size_bytes = 0
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def max_bytes(self) -> int:
+        return self._max_bytes
+
+    def get(self, key: ExtractionCacheKey) -> str | None:
+        entry = self.get_entry(key)
+        return entry.text if entry is not None else None
+
+    def get_entry(self, key: ExtractionCacheKey) -> CachedExtraction | None:
+        digest = key.digest()
+        path = self._entry_path(digest)
+        try:
+            text = path.read_text(encoding="utf-8")
+            os.utime(path)
+        except OSError:
+            with self._lock:
+                self._misses += 1
+                if self._entries is not None and digest in self._entries:
+                    self._size_bytes -= self._entries.pop(digest)
+            return None
+        with self._lock:
+            self._hits += 1
+            if self._entries is not None and digest in self._entries:
+                self._entries.move_to_end(digest)
+        page_starts, fallback_pages = _read_pages(path)
+        return CachedExtraction(text=text, page_starts=page_starts, fallback_pages=fallback_pages)
+
+    def put(
+        self,
+        key: ExtractionCacheKey,
+        text: str,
+        *,
+        page_starts: tuple[int, ...] = (0,),
+        fallback_pages: tuple[int, ...] = (),
+    ) -> None:
+        payload = text.encode("utf-8")
+        if len(payload) > self._max_bytes:
+            return
+        digest = key.digest()
+        path = self._entry_path(digest)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        pages_path = path.with_name(f"{digest}{PAGES_SUFFIX}")
+        if page_starts == (0,) and not fallback_pages:
+            pages_path.unlink(missing_ok=True)
+        else:
+            pages = {"page_starts": list(page_starts), "fallback_pages": list(fallback_pages)}
+            _write_atomically(pages_path, json.dumps(pages).encode("utf-8"))
+        _write_atomically(path, payload)
+
+        evicted: list[str] = []
+        with self._lock:
+            entries = self._load_entries()
+            previous_size = entries.pop(digest, None)
+            if previous_size is not None:
+                self._size_bytes -= previous_size
+            entries[digest] = len(payload)
+            self._size_bytes += len(payload)
+            while self._size_bytes > self._max_bytes and entries:
+                evicted_digest, evicted_size = entries.popitem(last=False)
+                self._size_bytes -= evicted_size
+                evicted.append(evicted_digest)
+        for evicted_digest in evicted:
+            evicted_path = self._entry_path(evicted_digest)
+            evicted_path.unlink(missing_ok=True)
+            evicted_path.with_name(f"{evicted_digest}{PAGES_SUFFIX}").unlink(missing_ok=True)
+
+    def stats(self) -> ExtractionCacheStats:
+        with self._lock:
+            entries = self._load_entries()
+            return ExtractionCacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                entries=len(entries),
+                size_bytes=self._size_bytes,
+                max_bytes=self._max_bytes,
+            )
+
+    def _entry_path(self, digest: str) -> Path:
+        return self._root / digest[:2] / f"{digest}{ENTRY_SUFFIX}"
+
+    def _load_entries(self) -> OrderedDict[str, int]:
+        """Return the LRU index, scanning entries left by earlier processes on first use."""
+
+        if self._entries is None:
+            found: list[tuple[float, str, int]] = []
+            for path in self._root.glob(f"*/*{ENTRY_SUFFIX}"):
+                try:
+                    stat = path.stat()
+                except OSError:
+                    continue
+                found.append((stat.st_mtime, path.stem, stat.st_size))
+            found.sort()
+            self._entries = OrderedDict((digest, size) for _, digest, size in found)
+            self._size_bytes = sum(size for _, _, size in found)
+        return self._entries
+
+
+def _write_atomically(path: Path, payload: bytes) -> None:
+    temp_path = path.with_name(f"{path.name}.{uuid4().hex}.tmp")
+    try:
+        temp_path.write_bytes(payload)
+        os.replace(temp_path, path)
+    finally:
+        temp_path.unlink(missing_ok=True)
+
+
+def _read_pages(entry_path: Path) -> tuple[tuple[int, ...], tuple[int, ...]]:
+    """Return an entry's page starts and fallback pages.
+
+    Single-page entries without fallback pages have no pages file; entries from
+    before fallback pages were cached hold a bare list of page starts.
+    """
+
+    pages_path = entry_path.with_name(f"{entry_path.stem}{PAGES_SUFFIX}")
+    try:
+        pages = json.loads(pages_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return (0,), ()
+    if isinstance(pages, list):
+        pages = {"page_starts": pages}
+    if not isinstance(pages, dict):
+        return (0,), ()
+    page_starts = _int_tuple(pages.get("page_starts")) or (0,)
+    return page_starts, _int_tuple(pages.get("fallback_pages"))
+
+
+def _int_tuple(value: object) -> tuple[int, ...]:
+    if not isinstance(value, list) or not all(isinstance(item, int) for item in value):
+        return ()
+    return tuple(value)
@@ -2,14 +2,34 @@
 
 from __future__ import annotations
 
+import hashlib
+import json
 import os
+import shutil
+import threading
 from pathlib import Path
+from uuid import uuid4
 
-from backend.app.ports.file_storage import FileStorage, StoredFile
+from backend.app.config import extraction_cache_max_bytes
+from backend.app.domain.raw_text_index import RawTextIndex
+from backend.app.infra.extraction_cache import LocalExtractionCache
+from backend.app.ports.file_storage import (
+    CachedExtraction,
+    ExtractionCacheKey,
+    ExtractionCacheStats,
+    FileStorage,
+    StagedUpload,
+    StoredFile,
+    UploadTooLargeError,
+)
 from backend.app.settings import get_settings
 
 BASE_DIR = Path(__file__).resolve().parents[2]
 DEFAULT_STORAGE_ROOT = BASE_DIR / "storage"
+STAGING_DIR_NAME = ".staging"
+EXTRACTION_CACHE_DIR_NAME = ".extraction-cache"
+RAW_TEXT_STAGING_SUFFIX = ".part"
+RAW_TEXT_INDEX_FILE_NAME = "raw-text.index.json"
 
 
 def get_storage_root() -> Path:
@@ -25,29 +45,70 @@ def get_storage_root() -> Path:
     return root
 
 
+class LocalUploadWriter:
+    """Stream an upload into a staging file while hashing and size-checking it.
+
+    The staging directory lives under the storage root, so committing is a
+    same-filesystem rename. Writes block; async callers run them in a thread.
+    """
+
+    def __init__(self, *, storage_root: Path, max_size: int) -> None:
+        self._relative_path = Path(STAGING_DIR_NAME) / f"{uuid4().hex}.part"
+        self._path = storage_root / self._relative_path
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        self._handle = open(self._path, "wb")
+        self._digest = hashlib.sha256()
+        self._size = 0
+        self._max_size = max_size
+
+    def write(self, chunk: bytes) -> None:
+        self._size += len(chunk)
+        if self._size > self._max_size:
+            raise UploadTooLargeError(f"Upload exceeds {self._max_size} bytes.")
+        self._digest.update(chunk)
+        self._handle.write(chunk)
+
+    def finish(self) -> StagedUpload:
+        self._handle.flush()
+        os.fsync(self._handle.fileno())
+        self._handle.close()
+        return StagedUpload(
+            staging_path=str(self._relative_path),
+            file_size=self._size,
+            content_sha256=self._digest.hexdigest(),
+        )
+
+    def abort(self) -> None:
+        self._handle.close()
+        self._path.unlink(missing_ok=True)
+
+
 class LocalFileStorage(FileStorage):
     """Filesystem-backed storage adapter."""
 
-    def save(self, *, document_id: str, content: bytes) -> StoredFile:
-        """Persist a document file using an atomic write."""
+    def __init__(self) -> None:
+        self._extraction_caches: dict[tuple[Path, int], LocalExtractionCache] = {}
+        self._extraction_caches_lock = threading.Lock()
+
+    def open_upload(self, *, max_size: int) -> LocalUploadWriter:
+        """Open a staging file for a streamed upload."""
+
+        return LocalUploadWriter(storage_root=get_storage_root(), max_size=max_size)
+
+    def commit_upload(self, *, staged: StagedUpload, document_id: str) -> StoredFile:
+        """Rename a staged upload into place as the document's original file."""
 
         relative_path = Path(document_id) / "original.pdf"
         storage_root = get_storage_root()
         target_path = storage_root / relative_path
         target_path.parent.mkdir(parents=True, exist_ok=True)
+        os.replace(storage_root / staged.staging_path, target_path)
+        return StoredFile(storage_path=str(relative_path), file_size=staged.file_size)
 
-        temp_path = target_path.with_suffix(".tmp")
-        try:
-            with open(temp_path, "wb") as handle:
-                handle.write(content)
-                handle.flush()
-                os.fsync(handle.fileno())
-            os.replace(temp_path, target_path)
-        finally:
-            if temp_path.exists():
-                temp_path.unlink(missing_ok=True)
+    def discard_upload(self, *, staged: StagedUpload) -> None:
+        """Best-effort cleanup of a staged upload."""
 
-        return StoredFile(storage_path=str(relative_path), file_size=len(content))
+        (get_storage_root() / staged.staging_path).unlink(missing_ok=True)
 
     def delete(self, *, storage_path: str) -> None:
         """Best-effort cleanup of a stored file."""
@@ -66,13 +127,20 @@ class LocalFileStorage(FileStorage):
 
         return self.resolve(storage_path=storage_path).exists()
 
-    def save_raw_text(self, *, document_id: str, run_id: str, text: str) -> StoredFile:
-        """Persist extracted raw text for a processing run."""
+    def save_raw_text(
+        self, *, document_id: str, run_id: str, text: str, index: RawTextIndex | None = None
+    ) -> StoredFile:
+        """Persist extracted raw text for a processing run.
+
+        The index sidecar is written first, so a published raw text never has a
+        stale one next to it; without ``index`` a single-page index is built.
+        """
 
         relative_path = Path(document_id) / "runs" / run_id / "raw-text.txt"
         storage_root = get_storage_root()
         target_path = storage_root / relative_path
         target_path.parent.mkdir(parents=True, exist_ok=True)
+        _write_raw_text_index(target_path, index or RawTextIndex.build(text))
 
         payload = text.encode("utf-8")
         temp_path = target_path.with_suffix(".tmp")
@@ -88,6 +156,64 @@ class LocalFileStorage(FileStorage):
 
         return StoredFile(storage_path=str(relative_path), file_size=len(payload))
 
+    def link_raw_text(
+        self, *, source_document_id: str, source_run_id: str, document_id: str, run_id: str
+    ) -> StoredFile:
+        """Share a prior run's raw text with another run.
+
+        Raw text files are only ever replaced atomically, never rewritten in
+        place, so a hard link behaves as copy-on-write. Filesystems without hard
+        link support fall back to a plain copy.
+        """
+
+        source_path = self.resolve_raw_text(document_id=source_document_id, run_id=source_run_id)
+        relative_path = Path(document_id) / "runs" / run_id / "raw-text.txt"
+        target_path = get_storage_root() / relative_path
+        target_path.parent.mkdir(parents=True, exist_ok=True)
+
+        source_index_path = source_path.with_name(RAW_TEXT_INDEX_FILE_NAME)
+        if source_index_path.exists():
+            _link_or_copy(source_index_path, target_path.with_name(RAW_TEXT_INDEX_FILE_NAME))
+        else:
+            target_path.with_name(RAW_TEXT_INDEX_FILE_NAME).unlink(missing_ok=True)
+        _link_or_copy(source_path, target_path)
+
+        return StoredFile(storage_path=str(relative_path), file_size=target_path.stat().st_size)
+
+    def stage_raw_text(self, *, document_id: str, run_id: str) -> Path:
+        """Return the run's raw text staging file, next to its final location.
+
+        Writers stream pages into it and fsync it before handing it back for
+        commit, which then is a same-directory rename.
+        """
+
+        staged_path = self.resolve_raw_text(document_id=document_id, run_id=run_id).with_suffix(
+            RAW_TEXT_STAGING_SUFFIX
+        )
+        staged_path.parent.mkdir(parents=True, exist_ok=True)
+        return staged_path
+
+    def commit_raw_text(
+        self, *, document_id: str, run_id: str, index: RawTextIndex | None = None
+    ) -> StoredFile:
+        """Rename a run's staged raw text into place, after writing its index sidecar."""
+
+        relative_path = Path(document_id) / "runs" / run_id / "raw-text.txt"
+        target_path = get_storage_root() / relative_path
+        if index is not None:
+            _write_raw_text_index(target_path, index)
+        else:
+            target_path.with_name(RAW_TEXT_INDEX_FILE_NAME).unlink(missing_ok=True)
+        os.replace(target_path.with_suffix(RAW_TEXT_STAGING_SUFFIX), target_path)
+        return StoredFile(storage_path=str(relative_path), file_size=target_path.stat().st_size)
+
+    def discard_raw_text(self, *, document_id: str, run_id: str) -> None:
+        """Best-effort cleanup of a run's staged raw text."""
+
+        self.resolve_raw_text(document_id=document_id, run_id=run_id).with_suffix(
+            RAW_TEXT_STAGING_SUFFIX
+        ).unlink(missing_ok=True)
+
     def resolve_raw_text(self, *, document_id: str, run_id: str) -> Path:
         """Resolve a raw text artifact path to an absolute filesystem path."""
 
@@ -98,3 +224,108 @@ class LocalFileStorage(FileStorage):
         """Check whether the raw text artifact exists."""
 
         return self.resolve_raw_text(document_id=document_id, run_id=run_id).exists()
+
+    def read_raw_text_index(self, *, document_id: str, run_id: str) -> RawTextIndex | None:
+        """Load the index sidecar of a run's raw text.
+
+        Raw text written before sidecars existed, or with a damaged one, is
+        indexed on the fly as a single page.
+        """
+
+        raw_text_path = self.resolve_raw_text(document_id=document_id, run_id=run_id)
+        try:
+            payload = json.loads(
+                raw_text_path.with_name(RAW_TEXT_INDEX_FILE_NAME).read_text(encoding="utf-8")
+            )
+            if isinstance(payload, dict):
+                return RawTextIndex.from_payload(payload)
+        except (OSError, ValueError):
+            pass
+        try:
+            text = raw_text_path.read_text(encoding="utf-8")
+        except OSError:
+            return None
+        return RawTextIndex.build(text)
+
+    def read_raw_text_page(self, *, document_id: str, run_id: str, page: int) -> str | None:
+        """Read a single page of a run's raw text by seeking to its byte span."""
+
+        index = self.read_raw_text_index(document_id=document_id, run_id=run_id)
+        if index is None:
+            return None
+        try:
+            start, end = index.page_byte_span(page)
+        except IndexError:
+            return None
+        raw_text_path = self.resolve_raw_text(document_id=document_id, run_id=run_id)
+        try:
+            with open(raw_text_path, "rb") as handle:
+                handle.seek(start)
+                payload = handle.read(end - start)
+        except OSError:
+            return None
+        return payload.decode("utf-8", errors="replace")
+
+    def read_cached_extraction(self, *, key: ExtractionCacheKey) -> CachedExtraction | None:
+        """Look up raw text previously extracted from identical PDF bytes."""
+
+        cache = self._extraction_cache()
+        if cache is None:
+            return None
+        return cache.get_entry(key)
+
+    def write_cached_extraction(
+        self,
+        *,
+        key: ExtractionCacheKey,
+        text: str,
+        page_starts: tuple[int, ...] = (0,),
+        fallback_pages: tuple[int, ...] = (),
+    ) -> None:
+        """Cache extracted raw text under the storage root's extraction cache."""
+
+        cache = self._extraction_cache()
+        if cache is not None:
+            cache.put(key, text, page_starts=page_starts, fallback_pages=fallback_pages)
+
+    def extraction_cache_stats(self) -> ExtractionCacheStats:
+        """Return counters of this process and the occupancy of the cache directory."""
+
+        cache = self._extraction_cache()
+        if cache is None:
+            return ExtractionCacheStats(hits=0, misses=0, entries=0, size_bytes=0, max_bytes=0)
+        return cache.stats()
+
+    def _extraction_cache(self) -> LocalExtractionCache | None:
+        max_bytes = extraction_cache_max_bytes()
+        if max_bytes == 0:
+            return None
+        root = get_storage_root() / EXTRACTION_CACHE_DIR_NAME
+        with self._extraction_caches_lock:
+            cache = self._extraction_caches.get((root, max_bytes))
+            if cache is None:
+                cache = LocalExtractionCache(root=root, max_bytes=max_bytes)
+                self._extraction_caches[(root, max_bytes)] = cache
+            return cache
+
+
+def _write_raw_text_index(raw_text_path: Path, index: RawTextIndex) -> None:
+    index_path = raw_text_path.with_name(RAW_TEXT_INDEX_FILE_NAME)
+    temp_path = index_path.with_suffix(".tmp")
+    try:
+        temp_path.write_text(json.dumps(index.to_payload()), encoding="utf-8")
+        os.replace(temp_path, index_path)
+    finally:
+        temp_path.unlink(missing_ok=True)
+
+
+def _link_or_copy(source_path: Path, target_path: Path) -> None:
+    temp_path = target_path.with_suffix(".tmp")
+    try:
+        try:
+            os.link(source_path, temp_path)
+        except OSError:
+            shutil.copyfile(source_path, temp_path)
+        os.replace(temp_path, target_path)
+    finally:
+        temp_path.unlink(missing_ok=True)
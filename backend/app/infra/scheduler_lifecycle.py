@@ -39,6 +39,12 @@ class SchedulerLifecycle:
         )
 
     async def stop(self) -> None:
+        """Signal the scheduler to stop and let it drain in-flight runs.
+
+        Runs still executing after ``SCHEDULER_STOP_TIMEOUT_SECONDS`` are cancelled;
+        they stay RUNNING in storage and are recovered on the next startup.
+        """
+
         if self._task is None or self._stop_event is None:
             self._task = None
             self._stop_event = None
@@ -49,7 +55,7 @@ class SchedulerLifecycle:
             await asyncio.wait_for(self._task, timeout=SCHEDULER_STOP_TIMEOUT_SECONDS)
         except TimeoutError:
             logger.warning(
-                "Scheduler task did not stop within %.1fs, cancelling",
+                "Scheduler task did not drain within %.1fs, cancelling in-flight runs",
                 SCHEDULER_STOP_TIMEOUT_SECONDS,
             )
             self._task.cancel()
@@ -3,10 +3,60 @@
 from __future__ import annotations
 
 import json
+import threading
+import time
 from typing import Literal
 
 from backend.app.infra import database
 
+_NULL_MAPPING_SCOPE_KEY = "__null__"
+# Bounds staleness when another process (e.g. a standalone worker) applies deltas;
+# in-process writes invalidate the cache immediately.
+CALIBRATION_COUNTS_CACHE_TTL_SECONDS = 30.0
+
+CalibrationCounts = dict[tuple[str, str | None], tuple[int, int]]
+
+
+class _CalibrationCountsCache:
+    """Process-wide cache of per-context calibration counts."""
+
+    def __init__(self, *, ttl_seconds: float) -> None:
+        self._ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self._entries: dict[tuple[str, str, str], tuple[float, CalibrationCounts]] = {}
+
+    def get(self, key: tuple[str, str, str]) -> CalibrationCounts | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or time.monotonic() - entry[0] > self._ttl_seconds:
+                return None
+            return entry[1]
+
+    def put(self, key: tuple[str, str, str], counts: CalibrationCounts) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic(), counts)
+
+    def invalidate(self, key: tuple[str, str, str]) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+_COUNTS_CACHE = _CalibrationCountsCache(ttl_seconds=CALIBRATION_COUNTS_CACHE_TTL_SECONDS)
+
+
+def _counts_cache_key(*, context_key: str, policy_version: str) -> tuple[str, str, str]:
+    return (str(database.get_database_path()), context_key, policy_version)
+
+
+def clear_calibration_counts_cache() -> None:
+    """Drop every cached calibration count (e.g. after bulk changes outside the repo)."""
+
+    _COUNTS_CACHE.clear()
+
 
 class SqliteCalibrationRepo:
     """SQLite-backed repository for calibration counters and snapshots."""
@@ -44,7 +94,7 @@ class SqliteCalibrationRepo:
         edit_delta: int,
         updated_at: str,
     ) -> None:
-        mapping_scope_key = mapping_id if mapping_id is not None else "__null__"
+        mapping_scope_key = mapping_id if mapping_id is not None else _NULL_MAPPING_SCOPE_KEY
         with database.get_connection() as conn:
             conn.execute(
                 """
@@ -79,6 +129,9 @@ class SqliteCalibrationRepo:
                 ),
             )
             conn.commit()
+        _COUNTS_CACHE.invalidate(
+            _counts_cache_key(context_key=context_key, policy_version=policy_version)
+        )
 
     def get_calibration_counts(
         self,
@@ -88,7 +141,7 @@ class SqliteCalibrationRepo:
         mapping_id: str | None,
         policy_version: str,
     ) -> tuple[int, int] | None:
-        mapping_scope_key = mapping_id if mapping_id is not None else "__null__"
+        mapping_scope_key = mapping_id if mapping_id is not None else _NULL_MAPPING_SCOPE_KEY
         with database.get_connection() as conn:
             row = conn.execute(
                 """
@@ -106,6 +159,39 @@ class SqliteCalibrationRepo:
             return None
         return int(row["accept_count"]), int(row["edit_count"])
 
+    def get_calibration_counts_for_context(
+        self,
+        *,
+        context_key: str,
+        policy_version: str,
+    ) -> CalibrationCounts:
+        cache_key = _counts_cache_key(context_key=context_key, policy_version=policy_version)
+        cached = _COUNTS_CACHE.get(cache_key)
+        if cached is not None:
+            return dict(cached)
+
+        with database.get_connection() as conn:
+            rows = conn.execute(
+                """
+                SELECT field_key, mapping_id_scope_key, accept_count, edit_count
+                FROM calibration_aggregates
+                WHERE context_key = ?
+                  AND policy_version = ?
+                """,
+                (context_key, policy_version),
+            ).fetchall()
+
+        counts: CalibrationCounts = {}
+        for row in rows:
+            scope_key = row["mapping_id_scope_key"]
+            mapping_id = None if scope_key == _NULL_MAPPING_SCOPE_KEY else scope_key
+            counts[(row["field_key"], mapping_id)] = (
+                int(row["accept_count"]),
+                int(row["edit_count"]),
+            )
+        _COUNTS_CACHE.put(cache_key, counts)
+        return dict(counts)
+
     def get_latest_applied_calibration_snapshot(
         self,
         *,
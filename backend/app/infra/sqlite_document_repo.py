@@ -33,9 +33,10 @@ class SqliteDocumentRepo:
                     review_status,
                     reviewed_at,
                     reviewed_by,
-                    reviewed_run_id
+                    reviewed_run_id,
+                    content_sha256
                 )
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
                 """,
                 (
                     document.document_id,
@@ -49,6 +50,7 @@ class SqliteDocumentRepo:
                     document.reviewed_at,
                     document.reviewed_by,
                     document.reviewed_run_id,
+                    document.content_sha256,
                 ),
             )
             conn.execute(
@@ -75,7 +77,8 @@ class SqliteDocumentRepo:
                     review_status,
                     reviewed_at,
                     reviewed_by,
-                    reviewed_run_id
+                    reviewed_run_id,
+                    content_sha256
                 FROM documents
                 WHERE document_id = ?
                 """,
@@ -97,6 +100,7 @@ class SqliteDocumentRepo:
             reviewed_at=row["reviewed_at"],
             reviewed_by=row["reviewed_by"],
             reviewed_run_id=row["reviewed_run_id"],
+            content_sha256=row["content_sha256"],
         )
 
     def list_documents(self, *, limit: int, offset: int) -> list[DocumentWithLatestRun]:
@@ -115,6 +119,7 @@ class SqliteDocumentRepo:
                     d.reviewed_at,
                     d.reviewed_by,
                     d.reviewed_run_id,
+                    d.content_sha256,
                     r.run_id AS latest_run_id,
                     r.state AS latest_run_state,
                     r.failure_type AS latest_run_failure_type
@@ -147,6 +152,7 @@ class SqliteDocumentRepo:
                 reviewed_at=row["reviewed_at"],
                 reviewed_by=row["reviewed_by"],
                 reviewed_run_id=row["reviewed_run_id"],
+                content_sha256=row["content_sha256"],
             )
             latest_run = None
             if row["latest_run_id"] is not None:
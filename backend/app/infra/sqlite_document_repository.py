@@ -5,6 +5,7 @@ focused repositories:
 - documents: `SqliteDocumentRepo`
 - runs/artifacts: `SqliteRunRepo`
 - calibration: `SqliteCalibrationRepo`
+- bulk re-interpretation jobs: `SqliteReinterpretationJobRepo`
 """
 
 from __future__ import annotations
@@ -20,11 +21,14 @@ from backend.app.domain.models import (
     ProcessingRunState,
     ProcessingRunSummary,
     ProcessingStatus,
+    ReinterpretationJob,
+    ReinterpretationJobFilters,
     StepArtifact,
 )
 from backend.app.infra.sqlite_calibration_repo import SqliteCalibrationRepo
 from backend.app.infra.sqlite_document_repo import SqliteDocumentRepo
-from backend.app.infra.sqlite_run_repo import SqliteRunRepo
+from backend.app.infra.sqlite_reinterpretation_job_repo import SqliteReinterpretationJobRepo
+from backend.app.infra.sqlite_run_repo import SqliteRunRepo, SqliteRunUnitOfWork
 
 
 class SqliteDocumentRepository:
@@ -34,6 +38,7 @@ class SqliteDocumentRepository:
         self._documents = SqliteDocumentRepo()
         self._runs = SqliteRunRepo()
         self._calibration = SqliteCalibrationRepo()
+        self._reinterpretation_jobs = SqliteReinterpretationJobRepo()
 
     def create(self, document: Document, status: ProcessingStatus) -> None:
         self._documents.create(document, status)
@@ -75,6 +80,14 @@ class SqliteDocumentRepository:
     def get_latest_completed_run(self, document_id: str) -> ProcessingRunDetails | None:
         return self._runs.get_latest_completed_run(document_id)
 
+    def get_latest_completed_run_by_content_hash(
+        self, *, content_sha256: str, exclude_document_id: str | None = None
+    ) -> ProcessingRunDetails | None:
+        return self._runs.get_latest_completed_run_by_content_hash(
+            content_sha256=content_sha256,
+            exclude_document_id=exclude_document_id,
+        )
+
     def create_processing_run(
         self,
         *,
@@ -82,22 +95,75 @@ class SqliteDocumentRepository:
         document_id: str,
         state: ProcessingRunState,
         created_at: str,
+        started_at: str | None = None,
+        source_run_id: str | None = None,
     ) -> None:
         self._runs.create_processing_run(
             run_id=run_id,
             document_id=document_id,
             state=state,
             created_at=created_at,
+            started_at=started_at,
+            source_run_id=source_run_id,
+        )
+
+    def create_started_run(
+        self,
+        *,
+        run_id: str,
+        document_id: str,
+        created_at: str,
+        lease_owner: str,
+        lease_expires_at: str,
+        source_run_id: str | None = None,
+    ) -> bool:
+        return self._runs.create_started_run(
+            run_id=run_id,
+            document_id=document_id,
+            created_at=created_at,
+            lease_owner=lease_owner,
+            lease_expires_at=lease_expires_at,
+            source_run_id=source_run_id,
         )
 
     def list_queued_runs(self, *, limit: int) -> list[ProcessingRun]:
         return self._runs.list_queued_runs(limit=limit)
 
-    def try_start_run(self, *, run_id: str, document_id: str, started_at: str) -> bool:
+    def try_start_run(
+        self,
+        *,
+        run_id: str,
+        document_id: str,
+        started_at: str,
+        lease_owner: str | None = None,
+        lease_expires_at: str | None = None,
+    ) -> bool:
         return self._runs.try_start_run(
-            run_id=run_id, document_id=document_id, started_at=started_at
+            run_id=run_id,
+            document_id=document_id,
+            started_at=started_at,
+            lease_owner=lease_owner,
+            lease_expires_at=lease_expires_at,
         )
 
+    def renew_run_lease(
+        self,
+        *,
+        run_id: str,
+        lease_owner: str,
+        lease_expires_at: str,
+        heartbeat_at: str,
+    ) -> bool:
+        return self._runs.renew_run_lease(
+            run_id=run_id,
+            lease_owner=lease_owner,
+            lease_expires_at=lease_expires_at,
+            heartbeat_at=heartbeat_at,
+        )
+
+    def requeue_expired_runs(self, *, now: str, max_claims: int) -> int:
+        return self._runs.requeue_expired_runs(now=now, max_claims=max_claims)
+
     def complete_run(
         self,
         *,
@@ -105,12 +171,14 @@ class SqliteDocumentRepository:
         state: ProcessingRunState,
         completed_at: str,
         failure_type: str | None,
-    ) -> None:
-        self._runs.complete_run(
+        lease_owner: str | None = None,
+    ) -> bool:
+        return self._runs.complete_run(
             run_id=run_id,
             state=state,
             completed_at=completed_at,
             failure_type=failure_type,
+            lease_owner=lease_owner,
         )
 
     def recover_orphaned_runs(self, *, completed_at: str) -> int:
@@ -137,6 +205,9 @@ class SqliteDocumentRepository:
             created_at=created_at,
         )
 
+    def run_unit_of_work(self, *, lease_owner: str | None = None) -> SqliteRunUnitOfWork:
+        return self._runs.run_unit_of_work(lease_owner=lease_owner)
+
     def get_latest_artifact_payload(
         self, *, run_id: str, artifact_type: str
     ) -> dict[str, object] | None:
@@ -145,6 +216,14 @@ class SqliteDocumentRepository:
             artifact_type=artifact_type,
         )
 
+    def get_first_artifact_payload(
+        self, *, run_id: str, artifact_type: str
+    ) -> dict[str, object] | None:
+        return self._runs.get_first_artifact_payload(
+            run_id=run_id,
+            artifact_type=artifact_type,
+        )
+
     def get_latest_applied_calibration_snapshot(
         self,
         *,
@@ -208,3 +287,57 @@ class SqliteDocumentRepository:
             mapping_id=mapping_id,
             policy_version=policy_version,
         )
+
+    def get_calibration_counts_for_context(
+        self,
+        *,
+        context_key: str,
+        policy_version: str,
+    ) -> dict[tuple[str, str | None], tuple[int, int]]:
+        return self._calibration.get_calibration_counts_for_context(
+            context_key=context_key,
+            policy_version=policy_version,
+        )
+
+    def create_reinterpretation_job(self, job: ReinterpretationJob) -> None:
+        self._reinterpretation_jobs.create_reinterpretation_job(job)
+
+    def get_reinterpretation_job(self, job_id: str) -> ReinterpretationJob | None:
+        return self._reinterpretation_jobs.get_reinterpretation_job(job_id)
+
+    def claim_reinterpretation_job(
+        self, *, job_id: str, lease_owner: str, lease_expires_at: str, now: str
+    ) -> bool:
+        return self._reinterpretation_jobs.claim_reinterpretation_job(
+            job_id=job_id, lease_owner=lease_owner, lease_expires_at=lease_expires_at, now=now
+        )
+
+    def renew_reinterpretation_job_lease(
+        self, *, job_id: str, lease_owner: str, lease_expires_at: str
+    ) -> bool:
+        return self._reinterpretation_jobs.renew_reinterpretation_job_lease(
+            job_id=job_id, lease_owner=lease_owner, lease_expires_at=lease_expires_at
+        )
+
+    def update_reinterpretation_job(
+        self, job: ReinterpretationJob, *, lease_owner: str, lease_expires_at: str
+    ) -> bool:
+        return self._reinterpretation_jobs.update_reinterpretation_job(
+            job, lease_owner=lease_owner, lease_expires_at=lease_expires_at
+        )
+
+    def count_reinterpretation_candidates(self, *, filters: ReinterpretationJobFilters) -> int:
+        return self._reinterpretation_jobs.count_reinterpretation_candidates(filters=filters)
+
+    def list_reinterpretation_candidates(
+        self,
+        *,
+        filters: ReinterpretationJobFilters,
+        after_document_id: str | None,
+        limit: int,
+    ) -> list[str]:
+        return self._reinterpretation_jobs.list_reinterpretation_candidates(
+            filters=filters,
+            after_document_id=after_document_id,
+            limit=limit,
+        )
@@ -0,0 +1,285 @@
+"""SQLite repository for bulk re-interpretation jobs."""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+
+from backend.app.domain.models import (
+    ReinterpretationJob,
+    ReinterpretationJobFilters,
+    ReinterpretationJobState,
+    ReviewStatus,
+)
+from backend.app.infra import database
+
+_INSERT_JOB_SQL = """
+    INSERT INTO reinterpretation_jobs (
+        job_id,
+        state,
+        filters,
+        created_at,
+        updated_at,
+        started_at,
+        completed_at,
+        checkpoint_document_id,
+        total_documents,
+        processed_documents,
+        succeeded_documents,
+        failed_documents,
+        elapsed_seconds,
+        failures
+    )
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+_SELECT_JOB_SQL = """
+    SELECT
+        job_id,
+        state,
+        filters,
+        created_at,
+        updated_at,
+        started_at,
+        completed_at,
+        checkpoint_document_id,
+        total_documents,
+        processed_documents,
+        succeeded_documents,
+        failed_documents,
+        elapsed_seconds,
+        failures
+    FROM reinterpretation_jobs
+    WHERE job_id = ?
+"""
+# A job is taken over unless it is finished or still RUNNING under an unexpired
+# lease; lease timestamps share a fixed precision so they compare as text.
+_CLAIM_JOB_SQL = """
+    UPDATE reinterpretation_jobs
+    SET state = ?,
+        lease_owner = ?,
+        lease_expires_at = ?,
+        started_at = COALESCE(started_at, ?),
+        updated_at = ?
+    WHERE job_id = ?
+      AND state != ?
+      AND (state != ? OR lease_expires_at IS NULL OR lease_expires_at < ?)
+"""
+# Progress is only written by the lease holder; the lease is released with the
+# job's last update (any state but RUNNING).
+_UPDATE_JOB_SQL = """
+    UPDATE reinterpretation_jobs
+    SET state = ?,
+        updated_at = ?,
+        started_at = ?,
+        completed_at = ?,
+        checkpoint_document_id = ?,
+        processed_documents = ?,
+        succeeded_documents = ?,
+        failed_documents = ?,
+        elapsed_seconds = ?,
+        failures = ?,
+        lease_owner = ?,
+        lease_expires_at = ?
+    WHERE job_id = ?
+      AND lease_owner = ?
+"""
+_RENEW_JOB_LEASE_SQL = """
+    UPDATE reinterpretation_jobs
+    SET lease_expires_at = ?
+    WHERE job_id = ?
+      AND state = ?
+      AND lease_owner = ?
+"""
+# Every filter is optional; a NULL parameter disables its condition.
+_COUNT_CANDIDATES_SQL = """
+    SELECT COUNT(*) AS total
+    FROM documents
+    WHERE (? IS NULL OR review_status = ?)
+      AND (? IS NULL OR created_at >= ?)
+      AND (? IS NULL OR created_at < ?)
+"""
+_LIST_CANDIDATES_SQL = """
+    SELECT document_id
+    FROM documents
+    WHERE (? IS NULL OR review_status = ?)
+      AND (? IS NULL OR created_at >= ?)
+      AND (? IS NULL OR created_at < ?)
+      AND (? IS NULL OR document_id > ?)
+    ORDER BY document_id
+    LIMIT ?
+"""
+
+
+def _filters_to_json(filters: ReinterpretationJobFilters) -> str:
+    return json.dumps(
+        {
+            "review_status": filters.review_status.value if filters.review_status else None,
+            "created_after": filters.created_after,
+            "created_before": filters.created_before,
+            "max_documents": filters.max_documents,
+        },
+        separators=(",", ":"),
+    )
+
+
+def _filters_from_json(raw: str) -> ReinterpretationJobFilters:
+    payload = json.loads(raw)
+    review_status = payload.get("review_status")
+    return ReinterpretationJobFilters(
+        review_status=ReviewStatus(review_status) if review_status else None,
+        created_after=payload.get("created_after"),
+        created_before=payload.get("created_before"),
+        max_documents=payload.get("max_documents"),
+    )
+
+
+def _filter_params(filters: ReinterpretationJobFilters) -> tuple[str | None, ...]:
+    review_status = filters.review_status.value if filters.review_status else None
+    return (
+        review_status,
+        review_status,
+        filters.created_after,
+        filters.created_after,
+        filters.created_before,
+        filters.created_before,
+    )
+
+
+def _job_from_row(row: sqlite3.Row) -> ReinterpretationJob:
+    return ReinterpretationJob(
+        job_id=row["job_id"],
+        state=ReinterpretationJobState(row["state"]),
+        filters=_filters_from_json(row["filters"]),
+        created_at=row["created_at"],
+        updated_at=row["updated_at"],
+        started_at=row["started_at"],
+        completed_at=row["completed_at"],
+        checkpoint_document_id=row["checkpoint_document_id"],
+        total_documents=row["total_documents"],
+        processed_documents=row["processed_documents"],
+        succeeded_documents=row["succeeded_documents"],
+        failed_documents=row["failed_documents"],
+        elapsed_seconds=row["elapsed_seconds"],
+        failures=tuple(json.loads(row["failures"])),
+    )
+
+
+class SqliteReinterpretationJobRepo:
+    """SQLite-backed repository for bulk re-interpretation job progress."""
+
+    def create_reinterpretation_job(self, job: ReinterpretationJob) -> None:
+        with database.get_connection() as conn:
+            conn.execute(
+                _INSERT_JOB_SQL,
+                (
+                    job.job_id,
+                    job.state.value,
+                    _filters_to_json(job.filters),
+                    job.created_at,
+                    job.updated_at,
+                    job.started_at,
+                    job.completed_at,
+                    job.checkpoint_document_id,
+                    job.total_documents,
+                    job.processed_documents,
+                    job.succeeded_documents,
+                    job.failed_documents,
+                    job.elapsed_seconds,
+                    json.dumps(list(job.failures), separators=(",", ":")),
+                ),
+            )
+            conn.commit()
+
+    def get_reinterpretation_job(self, job_id: str) -> ReinterpretationJob | None:
+        with database.get_connection() as conn:
+            row = conn.execute(_SELECT_JOB_SQL, (job_id,)).fetchone()
+        if row is None:
+            return None
+        return _job_from_row(row)
+
+    def claim_reinterpretation_job(
+        self, *, job_id: str, lease_owner: str, lease_expires_at: str, now: str
+    ) -> bool:
+        running = ReinterpretationJobState.RUNNING.value
+        with database.get_connection() as conn:
+            cursor = conn.execute(
+                _CLAIM_JOB_SQL,
+                (
+                    running,
+                    lease_owner,
+                    lease_expires_at,
+                    now,
+                    now,
+                    job_id,
+                    ReinterpretationJobState.COMPLETED.value,
+                    running,
+                    now,
+                ),
+            )
+            conn.commit()
+        return cursor.rowcount == 1
+
+    def renew_reinterpretation_job_lease(
+        self, *, job_id: str, lease_owner: str, lease_expires_at: str
+    ) -> bool:
+        with database.get_connection() as conn:
+            cursor = conn.execute(
+                _RENEW_JOB_LEASE_SQL,
+                (
+                    lease_expires_at,
+                    job_id,
+                    ReinterpretationJobState.RUNNING.value,
+                    lease_owner,
+                ),
+            )
+            conn.commit()
+        return cursor.rowcount == 1
+
+    def update_reinterpretation_job(
+        self, job: ReinterpretationJob, *, lease_owner: str, lease_expires_at: str
+    ) -> bool:
+        held = job.state == ReinterpretationJobState.RUNNING
+        with database.get_connection() as conn:
+            cursor = conn.execute(
+                _UPDATE_JOB_SQL,
+                (
+                    job.state.value,
+                    job.updated_at,
+                    job.started_at,
+                    job.completed_at,
+                    job.checkpoint_document_id,
+                    job.processed_documents,
+                    job.succeeded_documents,
+                    job.failed_documents,
+                    job.elapsed_seconds,
+                    json.dumps(list(job.failures), separators=(",", ":")),
+                    lease_owner if held else None,
+                    lease_expires_at if held else None,
+                    job.job_id,
+                    lease_owner,
+                ),
+            )
+            conn.commit()
+        return cursor.rowcount == 1
+
+    def count_reinterpretation_candidates(self, *, filters: ReinterpretationJobFilters) -> int:
+        with database.get_connection() as conn:
+            row = conn.execute(_COUNT_CANDIDATES_SQL, _filter_params(filters)).fetchone()
+        total = int(row["total"])
+        if filters.max_documents is not None:
+            return min(total, filters.max_documents)
+        return total
+
+    def list_reinterpretation_candidates(
+        self,
+        *,
+        filters: ReinterpretationJobFilters,
+        after_document_id: str | None,
+        limit: int,
+    ) -> list[str]:
+        with database.get_connection() as conn:
+            rows = conn.execute(
+                _LIST_CANDIDATES_SQL,
+                (*_filter_params(filters), after_document_id, after_document_id, limit),
+            ).fetchall()
+        return [row["document_id"] for row in rows]
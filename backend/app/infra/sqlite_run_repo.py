@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import json
+import logging
+import sqlite3
 from uuid import uuid4
 
 from backend.app.domain.models import (
@@ -17,6 +19,180 @@ from backend.app.domain.models import (
 )
 from backend.app.infra import database
 
+logger = logging.getLogger(__name__)
+
+_INSERT_ARTIFACT_SQL = """
+    INSERT INTO artifacts (artifact_id, run_id, artifact_type, payload, created_at)
+    VALUES (?, ?, ?, ?, ?)
+"""
+_INSERT_LEASED_ARTIFACT_SQL = """
+    INSERT INTO artifacts (artifact_id, run_id, artifact_type, payload, created_at)
+    SELECT ?, ?, ?, ?, ?
+    WHERE EXISTS (
+        SELECT 1
+        FROM processing_runs
+        WHERE run_id = ?
+          AND lease_owner IS ?
+    )
+"""
+_COMPLETE_RUN_SQL = """
+    UPDATE processing_runs
+    SET state = ?,
+        completed_at = ?,
+        failure_type = ?,
+        lease_owner = NULL,
+        lease_expires_at = NULL
+    WHERE run_id = ?
+      AND lease_owner IS ?
+"""
+_SELECT_LATEST_ARTIFACT_SQL = """
+    SELECT payload
+    FROM artifacts
+    WHERE run_id = ? AND artifact_type = ?
+    ORDER BY created_at DESC
+    LIMIT 1
+"""
+_SELECT_FIRST_ARTIFACT_SQL = """
+    SELECT payload
+    FROM artifacts
+    WHERE run_id = ? AND artifact_type = ?
+    ORDER BY created_at ASC
+    LIMIT 1
+"""
+
+
+def _artifact_row(
+    *, run_id: str, artifact_type: str, payload: dict[str, object], created_at: str
+) -> tuple[str, str, str, str, str]:
+    return (
+        str(uuid4()),
+        run_id,
+        artifact_type,
+        json.dumps(payload, separators=(",", ":")),
+        created_at,
+    )
+
+
+def _fetch_artifact_payload(
+    sql: str, *, run_id: str, artifact_type: str
+) -> dict[str, object] | None:
+    with database.get_connection() as conn:
+        row = conn.execute(sql, (run_id, artifact_type)).fetchone()
+
+    if row is None:
+        return None
+
+    payload = json.loads(row["payload"])
+    if not isinstance(payload, dict):
+        return None
+    return payload
+
+
+class _RunLeaseLostError(Exception):
+    """Rolls back a unit-of-work commit whose runs are no longer held by its owner."""
+
+
+class SqliteRunUnitOfWork:
+    """Buffer run-scoped writes and flush them in one transaction per step boundary.
+
+    A single connection is opened lazily on the first commit and reused for the
+    whole run. Buffered writes are committed on clean exit and discarded when the
+    context exits with an exception (e.g. the run was cancelled or lost its lease).
+    Each commit only applies while the runs are held by ``lease_owner`` (None for
+    runs executed without a lease). Otherwise the whole commit is rolled back and
+    its writes are dropped, so an owner that lost the lease never appends to a run
+    that was claimed again.
+    """
+
+    def __init__(self, *, lease_owner: str | None = None) -> None:
+        self._conn: sqlite3.Connection | None = None
+        self._lease_owner = lease_owner
+        self._artifact_rows: list[tuple[str, str, str, str, str]] = []
+        self._run_completions: list[tuple[str, str, str | None, str, str | None]] = []
+
+    def __enter__(self) -> SqliteRunUnitOfWork:
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        try:
+            if exc_type is None:
+                self.commit()
+        finally:
+            self.close()
+
+    @property
+    def pending_writes(self) -> int:
+        return len(self._artifact_rows) + len(self._run_completions)
+
+    def append_artifact(
+        self,
+        *,
+        run_id: str,
+        artifact_type: str,
+        payload: dict[str, object],
+        created_at: str,
+    ) -> None:
+        self._artifact_rows.append(
+            _artifact_row(
+                run_id=run_id,
+                artifact_type=artifact_type,
+                payload=payload,
+                created_at=created_at,
+            )
+        )
+
+    def complete_run(
+        self,
+        *,
+        run_id: str,
+        state: ProcessingRunState,
+        completed_at: str,
+        failure_type: str | None,
+    ) -> None:
+        self._run_completions.append(
+            (state.value, completed_at, failure_type, run_id, self._lease_owner)
+        )
+
+    def commit(self) -> None:
+        if not self.pending_writes:
+            return
+        if self._conn is None:
+            self._conn = database.open_connection()
+        try:
+            with self._conn:
+                # Every statement is guarded on the lease; the first write takes the
+                # database write lock, so the lease cannot change mid-commit.
+                if self._artifact_rows:
+                    cursor = self._conn.executemany(
+                        _INSERT_LEASED_ARTIFACT_SQL,
+                        [(*row, row[1], self._lease_owner) for row in self._artifact_rows],
+                    )
+                    if cursor.rowcount < len(self._artifact_rows):
+                        raise _RunLeaseLostError
+                if self._run_completions:
+                    cursor = self._conn.executemany(_COMPLETE_RUN_SQL, self._run_completions)
+                    if cursor.rowcount < len(self._run_completions):
+                        raise _RunLeaseLostError
+        except _RunLeaseLostError:
+            logger.warning(
+                "Dropped writes for runs no longer leased by owner=%s run_ids=%s",
+                self._lease_owner,
+                sorted(
+                    {row[1] for row in self._artifact_rows}
+                    | {completion[3] for completion in self._run_completions}
+                ),
+            )
+        finally:
+            self._artifact_rows.clear()
+            self._run_completions.clear()
+
+    def close(self) -> None:
+        self._artifact_rows.clear()
+        self._run_completions.clear()
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
 
 class SqliteRunRepo:
     """SQLite-backed repository for processing runs and artifacts."""
@@ -110,6 +286,54 @@ class SqliteRunRepo:
             failure_type=row["failure_type"],
         )
 
+    def get_latest_completed_run_by_content_hash(
+        self, *, content_sha256: str, exclude_document_id: str | None = None
+    ) -> ProcessingRunDetails | None:
+        with database.get_connection() as conn:
+            row = conn.execute(
+                """
+                SELECT
+                    r.run_id,
+                    r.document_id,
+                    r.state,
+                    r.created_at,
+                    r.started_at,
+                    r.completed_at,
+                    r.failure_type
+                FROM documents d
+                JOIN processing_runs r ON r.document_id = d.document_id
+                WHERE d.content_sha256 = ?
+                    AND d.document_id != ?
+                    AND r.state = ?
+                    AND EXISTS (
+                        SELECT 1
+                        FROM artifacts a
+                        WHERE a.run_id = r.run_id AND a.artifact_type = ?
+                    )
+                ORDER BY r.completed_at DESC, r.created_at DESC
+                LIMIT 1
+                """,
+                (
+                    content_sha256,
+                    exclude_document_id or "",
+                    ProcessingRunState.COMPLETED.value,
+                    "STRUCTURED_INTERPRETATION",
+                ),
+            ).fetchone()
+
+        if row is None:
+            return None
+
+        return ProcessingRunDetails(
+            run_id=row["run_id"],
+            document_id=row["document_id"],
+            state=ProcessingRunState(row["state"]),
+            created_at=row["created_at"],
+            started_at=row["started_at"],
+            completed_at=row["completed_at"],
+            failure_type=row["failure_type"],
+        )
+
     def create_processing_run(
         self,
         *,
@@ -117,6 +341,8 @@ class SqliteRunRepo:
         document_id: str,
         state: ProcessingRunState,
         created_at: str,
+        started_at: str | None = None,
+        source_run_id: str | None = None,
     ) -> None:
         with database.get_connection() as conn:
             conn.execute(
@@ -125,13 +351,66 @@ class SqliteRunRepo:
                     run_id,
                     document_id,
                     state,
-                    created_at
+                    created_at,
+                    started_at,
+                    source_run_id
+                )
+                VALUES (?, ?, ?, ?, ?, ?)
+                """,
+                (run_id, document_id, state.value, created_at, started_at, source_run_id),
+            )
+            conn.commit()
+
+    def create_started_run(
+        self,
+        *,
+        run_id: str,
+        document_id: str,
+        created_at: str,
+        lease_owner: str,
+        lease_expires_at: str,
+        source_run_id: str | None = None,
+    ) -> bool:
+        # Never QUEUED, so no scheduler or worker can claim the run before its creator.
+        with database.get_connection() as conn:
+            cursor = conn.execute(
+                """
+                INSERT INTO processing_runs (
+                    run_id,
+                    document_id,
+                    state,
+                    created_at,
+                    started_at,
+                    source_run_id,
+                    lease_owner,
+                    lease_expires_at,
+                    heartbeat_at,
+                    claim_count
+                )
+                SELECT ?, ?, ?, ?, ?, ?, ?, ?, ?, 1
+                WHERE NOT EXISTS (
+                    SELECT 1
+                    FROM processing_runs
+                    WHERE document_id = ?
+                      AND state = ?
                 )
-                VALUES (?, ?, ?, ?)
                 """,
-                (run_id, document_id, state.value, created_at),
+                (
+                    run_id,
+                    document_id,
+                    ProcessingRunState.RUNNING.value,
+                    created_at,
+                    created_at,
+                    source_run_id,
+                    lease_owner,
+                    lease_expires_at,
+                    created_at,
+                    document_id,
+                    ProcessingRunState.RUNNING.value,
+                ),
             )
             conn.commit()
+        return cursor.rowcount == 1
 
     def list_queued_runs(self, *, limit: int) -> list[ProcessingRun]:
         with database.get_connection() as conn:
@@ -141,7 +420,8 @@ class SqliteRunRepo:
                     run_id,
                     document_id,
                     state,
-                    created_at
+                    created_at,
+                    source_run_id
                 FROM processing_runs
                 WHERE state = ?
                 ORDER BY created_at ASC
@@ -156,16 +436,30 @@ class SqliteRunRepo:
                 document_id=row["document_id"],
                 state=ProcessingRunState(row["state"]),
                 created_at=row["created_at"],
+                source_run_id=row["source_run_id"],
             )
             for row in rows
         ]
 
-    def try_start_run(self, *, run_id: str, document_id: str, started_at: str) -> bool:
+    def try_start_run(
+        self,
+        *,
+        run_id: str,
+        document_id: str,
+        started_at: str,
+        lease_owner: str | None = None,
+        lease_expires_at: str | None = None,
+    ) -> bool:
         with database.get_connection() as conn:
             cursor = conn.execute(
                 """
                 UPDATE processing_runs
-                SET state = ?, started_at = ?
+                SET state = ?,
+                    started_at = ?,
+                    lease_owner = ?,
+                    lease_expires_at = ?,
+                    heartbeat_at = ?,
+                    claim_count = claim_count + 1
                 WHERE run_id = ?
                   AND state = ?
                   AND NOT EXISTS (
@@ -178,6 +472,9 @@ class SqliteRunRepo:
                 (
                     ProcessingRunState.RUNNING.value,
                     started_at,
+                    lease_owner,
+                    lease_expires_at,
+                    started_at if lease_owner is not None else None,
                     run_id,
                     ProcessingRunState.QUEUED.value,
                     document_id,
@@ -187,24 +484,94 @@ class SqliteRunRepo:
             conn.commit()
         return cursor.rowcount == 1
 
-    def complete_run(
+    def renew_run_lease(
         self,
         *,
         run_id: str,
-        state: ProcessingRunState,
-        completed_at: str,
-        failure_type: str | None,
-    ) -> None:
+        lease_owner: str,
+        lease_expires_at: str,
+        heartbeat_at: str,
+    ) -> bool:
         with database.get_connection() as conn:
-            conn.execute(
+            cursor = conn.execute(
                 """
                 UPDATE processing_runs
-                SET state = ?, completed_at = ?, failure_type = ?
+                SET lease_expires_at = ?, heartbeat_at = ?
                 WHERE run_id = ?
+                  AND state = ?
+                  AND lease_owner = ?
                 """,
-                (state.value, completed_at, failure_type, run_id),
+                (
+                    lease_expires_at,
+                    heartbeat_at,
+                    run_id,
+                    ProcessingRunState.RUNNING.value,
+                    lease_owner,
+                ),
             )
             conn.commit()
+        return cursor.rowcount == 1
+
+    def requeue_expired_runs(self, *, now: str, max_claims: int) -> int:
+        with database.get_connection() as conn:
+            conn.execute(
+                """
+                UPDATE processing_runs
+                SET state = ?,
+                    completed_at = ?,
+                    failure_type = ?,
+                    lease_owner = NULL,
+                    lease_expires_at = NULL
+                WHERE state = ?
+                  AND lease_expires_at IS NOT NULL
+                  AND lease_expires_at < ?
+                  AND claim_count >= ?
+                """,
+                (
+                    ProcessingRunState.FAILED.value,
+                    now,
+                    "PROCESS_TERMINATED",
+                    ProcessingRunState.RUNNING.value,
+                    now,
+                    max_claims,
+                ),
+            )
+            cursor = conn.execute(
+                """
+                UPDATE processing_runs
+                SET state = ?,
+                    started_at = NULL,
+                    lease_owner = NULL,
+                    lease_expires_at = NULL,
+                    heartbeat_at = NULL
+                WHERE state = ?
+                  AND lease_expires_at IS NOT NULL
+                  AND lease_expires_at < ?
+                """,
+                (
+                    ProcessingRunState.QUEUED.value,
+                    ProcessingRunState.RUNNING.value,
+                    now,
+                ),
+            )
+            conn.commit()
+        return cursor.rowcount
+
+    def complete_run(
+        self,
+        *,
+        run_id: str,
+        state: ProcessingRunState,
+        completed_at: str,
+        failure_type: str | None,
+        lease_owner: str | None = None,
+    ) -> bool:
+        with database.get_connection() as conn:
+            cursor = conn.execute(
+                _COMPLETE_RUN_SQL, (state.value, completed_at, failure_type, run_id, lease_owner)
+            )
+            conn.commit()
+        return cursor.rowcount == 1
 
     def recover_orphaned_runs(self, *, completed_at: str) -> int:
         with database.get_connection() as conn:
@@ -213,6 +580,7 @@ class SqliteRunRepo:
                 UPDATE processing_runs
                 SET state = ?, completed_at = ?, failure_type = ?
                 WHERE state = ?
+                  AND lease_owner IS NULL
                 """,
                 (
                     ProcessingRunState.FAILED.value,
@@ -278,6 +646,7 @@ class SqliteRunRepo:
                     ended_at=payload.get("ended_at"),
                     error_code=payload.get("error_code"),
                     created_at=row["created_at"],
+                    details=payload.get("details"),
                 )
             )
         return artifacts
@@ -292,39 +661,29 @@ class SqliteRunRepo:
     ) -> None:
         with database.get_connection() as conn:
             conn.execute(
-                """
-                INSERT INTO artifacts (artifact_id, run_id, artifact_type, payload, created_at)
-                VALUES (?, ?, ?, ?, ?)
-                """,
-                (
-                    str(uuid4()),
-                    run_id,
-                    artifact_type,
-                    json.dumps(payload, separators=(",", ":")),
-                    created_at,
+                _INSERT_ARTIFACT_SQL,
+                _artifact_row(
+                    run_id=run_id,
+                    artifact_type=artifact_type,
+                    payload=payload,
+                    created_at=created_at,
                 ),
             )
             conn.commit()
 
+    def run_unit_of_work(self, *, lease_owner: str | None = None) -> SqliteRunUnitOfWork:
+        return SqliteRunUnitOfWork(lease_owner=lease_owner)
+
     def get_latest_artifact_payload(
         self, *, run_id: str, artifact_type: str
     ) -> dict[str, object] | None:
-        with database.get_connection() as conn:
-            row = conn.execute(
-                """
-                SELECT payload
-                FROM artifacts
-                WHERE run_id = ? AND artifact_type = ?
-                ORDER BY created_at DESC
-                LIMIT 1
-                """,
-                (run_id, artifact_type),
-            ).fetchone()
-
-        if row is None:
-            return None
+        return _fetch_artifact_payload(
+            _SELECT_LATEST_ARTIFACT_SQL, run_id=run_id, artifact_type=artifact_type
+        )
 
-        payload = json.loads(row["payload"])
-        if not isinstance(payload, dict):
-            return None
-        return payload
+    def get_first_artifact_payload(
+        self, *, run_id: str, artifact_type: str
+    ) -> dict[str, object] | None:
+        return _fetch_artifact_payload(
+            _SELECT_FIRST_ARTIFACT_SQL, run_id=run_id, artifact_type=artifact_type
+        )
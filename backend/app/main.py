@@ -7,6 +7,7 @@ business logic lives in the application/domain layers.
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import sys
 from collections.abc import AsyncIterator
@@ -27,10 +28,15 @@ from starlette.exceptions import HTTPException as StarletteHTTPException
 
 from backend.app.api.routes import MAX_UPLOAD_SIZE as ROUTE_MAX_UPLOAD_SIZE
 from backend.app.api.routes import router as api_router
-from backend.app.application.processing import processing_scheduler
+from backend.app.application.processing import (
+    ReinterpretationJobRunner,
+    processing_scheduler,
+    shutdown_fitz_page_pool,
+)
 from backend.app.config import (
     auth_token,
     confidence_policy_explicit_config_diagnostics,
+    embedded_scheduler_enabled,
     processing_enabled,
 )
 from backend.app.infra import database
@@ -133,10 +139,12 @@ def create_app() -> FastAPI:
         if recovered:
             logger.info("Recovered %s orphaned runs", recovered)
         app.state.scheduler = SchedulerLifecycle(scheduler_fn=processing_scheduler)
-        if processing_enabled():
+        if processing_enabled() and embedded_scheduler_enabled():
             await app.state.scheduler.start(repository=repository, storage=storage)
         yield
+        await app.state.reinterpretation_jobs.stop()
         await app.state.scheduler.stop()
+        await asyncio.to_thread(shutdown_fitz_page_pool)
 
     settings = get_settings()
 
@@ -186,6 +194,7 @@ def create_app() -> FastAPI:
         )
     app.state.document_repository = SqliteDocumentRepository()
     app.state.file_storage = LocalFileStorage()
+    app.state.reinterpretation_jobs = ReinterpretationJobRunner()
     app.state.settings = settings
     app.state.auth_token = auth_token()
 
@@ -47,3 +47,11 @@ class CalibrationRepository(Protocol):
         policy_version: str,
     ) -> tuple[int, int] | None:
         """Return (accept_count, edit_count) for a calibration scope."""
+
+    def get_calibration_counts_for_context(
+        self,
+        *,
+        context_key: str,
+        policy_version: str,
+    ) -> dict[tuple[str, str | None], tuple[int, int]]:
+        """Return (accept_count, edit_count) keyed by (field_key, mapping_id) for a context."""
@@ -14,6 +14,7 @@ from backend.app.domain.models import (
     ProcessingStatus,
 )
 from backend.app.ports.calibration_repository import CalibrationRepository
+from backend.app.ports.reinterpretation_job_repository import ReinterpretationJobRepository
 from backend.app.ports.run_repository import RunRepository
 
 
@@ -49,6 +50,7 @@ class DocumentRepository(
     DocumentCrudRepository,
     RunRepository,
     CalibrationRepository,
+    ReinterpretationJobRepository,
     Protocol,
 ):
     """Backward-compatible aggregate repository contract."""
@@ -2,10 +2,13 @@
 
 from __future__ import annotations
 
+import hashlib
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Protocol
 
+from backend.app.domain.raw_text_index import RawTextIndex
+
 
 @dataclass(frozen=True, slots=True)
 class StoredFile:
@@ -15,11 +18,89 @@ class StoredFile:
     file_size: int
 
 
+@dataclass(frozen=True, slots=True)
+class StagedUpload:
+    """Upload fully written to storage but not yet bound to a document."""
+
+    staging_path: str
+    file_size: int
+    content_sha256: str
+
+
+@dataclass(frozen=True, slots=True)
+class ExtractionCacheKey:
+    """Identity of one raw-text extraction: PDF bytes plus extractor build and limits."""
+
+    content_sha256: str
+    extractor: str
+    extractor_version: str
+    limits: str
+
+    def digest(self) -> str:
+        identity = "\0".join(
+            (self.content_sha256, self.extractor, self.extractor_version, self.limits)
+        )
+        return hashlib.sha256(identity.encode("utf-8")).hexdigest()
+
+
+@dataclass(frozen=True, slots=True)
+class CachedExtraction:
+    """Raw text found in the extraction cache, with the offsets its pages start at.
+
+    ``fallback_pages`` lists the 1-based pages the fallback parser re-extracted.
+    """
+
+    text: str
+    page_starts: tuple[int, ...] = (0,)
+    fallback_pages: tuple[int, ...] = ()
+
+
+@dataclass(frozen=True, slots=True)
+class ExtractionCacheStats:
+    """Counters and occupancy of the raw-text extraction cache."""
+
+    hits: int
+    misses: int
+    entries: int
+    size_bytes: int
+    max_bytes: int
+
+    @property
+    def hit_rate(self) -> float | None:
+        lookups = self.hits + self.misses
+        if lookups == 0:
+            return None
+        return self.hits / lookups
+
+
+class UploadTooLargeError(Exception):
+    """Raised when a streamed upload grows past its size limit."""
+
+
+class UploadWriter(Protocol):
+    """Incremental writer for one streamed upload."""
+
+    def write(self, chunk: bytes) -> None:
+        """Append a chunk; raise `UploadTooLargeError` once the size limit is exceeded."""
+
+    def finish(self) -> StagedUpload:
+        """Flush the upload to durable storage and return its staged handle."""
+
+    def abort(self) -> None:
+        """Close the writer and remove the partial upload."""
+
+
 class FileStorage(Protocol):
     """Storage contract for saving uploaded files."""
 
-    def save(self, *, document_id: str, content: bytes) -> StoredFile:
-        """Persist the uploaded file and return its storage metadata."""
+    def open_upload(self, *, max_size: int) -> UploadWriter:
+        """Start streaming an upload into a staging area of the storage."""
+
+    def commit_upload(self, *, staged: StagedUpload, document_id: str) -> StoredFile:
+        """Atomically move a staged upload to the document's original file."""
+
+    def discard_upload(self, *, staged: StagedUpload) -> None:
+        """Remove a staged upload that will not be committed."""
 
     def delete(self, *, storage_path: str) -> None:
         """Remove a stored file if it exists."""
@@ -30,11 +111,51 @@ class FileStorage(Protocol):
     def exists(self, *, storage_path: str) -> bool:
         """Return True when the stored file exists."""
 
-    def save_raw_text(self, *, document_id: str, run_id: str, text: str) -> StoredFile:
-        """Persist raw extracted text for a processing run."""
+    def save_raw_text(
+        self, *, document_id: str, run_id: str, text: str, index: RawTextIndex | None = None
+    ) -> StoredFile:
+        """Persist raw extracted text for a processing run, with its page and line index."""
+
+    def link_raw_text(
+        self, *, source_document_id: str, source_run_id: str, document_id: str, run_id: str
+    ) -> StoredFile:
+        """Expose another run's raw text under a new run without duplicating it."""
+
+    def stage_raw_text(self, *, document_id: str, run_id: str) -> Path:
+        """Return the scratch file a run's raw text is streamed into before commit."""
+
+    def commit_raw_text(
+        self, *, document_id: str, run_id: str, index: RawTextIndex | None = None
+    ) -> StoredFile:
+        """Atomically publish the staged raw text (and its index) as the run's artifact."""
+
+    def discard_raw_text(self, *, document_id: str, run_id: str) -> None:
+        """Remove staged raw text that will not be committed."""
 
     def resolve_raw_text(self, *, document_id: str, run_id: str) -> Path:
         """Return the absolute filesystem path for a raw text artifact."""
 
     def exists_raw_text(self, *, document_id: str, run_id: str) -> bool:
         """Return True when the raw text artifact exists."""
+
+    def read_raw_text_index(self, *, document_id: str, run_id: str) -> RawTextIndex | None:
+        """Return the page and line index of a run's raw text, or None without raw text."""
+
+    def read_raw_text_page(self, *, document_id: str, run_id: str, page: int) -> str | None:
+        """Return one page of a run's raw text, or None without raw text or such a page."""
+
+    def read_cached_extraction(self, *, key: ExtractionCacheKey) -> CachedExtraction | None:
+        """Return cached raw text for ``key``, counting the lookup as a hit or miss."""
+
+    def write_cached_extraction(
+        self,
+        *,
+        key: ExtractionCacheKey,
+        text: str,
+        page_starts: tuple[int, ...] = (0,),
+        fallback_pages: tuple[int, ...] = (),
+    ) -> None:
+        """Cache raw text for ``key``, evicting least recently used entries over budget."""
+
+    def extraction_cache_stats(self) -> ExtractionCacheStats:
+        """Return hit/miss counters and occupancy of the extraction cache."""
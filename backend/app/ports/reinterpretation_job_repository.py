@@ -0,0 +1,51 @@
+"""Port for bulk re-interpretation job persistence."""
+
+from __future__ import annotations
+
+from typing import Protocol
+
+from backend.app.domain.models import ReinterpretationJob, ReinterpretationJobFilters
+
+
+class ReinterpretationJobRepository(Protocol):
+    """Persistence contract for bulk re-interpretation jobs and their checkpoints."""
+
+    def create_reinterpretation_job(self, job: ReinterpretationJob) -> None:
+        """Persist a new bulk re-interpretation job."""
+
+    def get_reinterpretation_job(self, job_id: str) -> ReinterpretationJob | None:
+        """Return a bulk re-interpretation job by id, if it exists."""
+
+    def claim_reinterpretation_job(
+        self, *, job_id: str, lease_owner: str, lease_expires_at: str, now: str
+    ) -> bool:
+        """Mark a job RUNNING under ``lease_owner`` unless it is COMPLETED or leased.
+
+        A RUNNING job whose lease expired before ``now`` is taken over.
+        """
+
+    def renew_reinterpretation_job_lease(
+        self, *, job_id: str, lease_owner: str, lease_expires_at: str
+    ) -> bool:
+        """Extend the lease of a RUNNING job; False if ``lease_owner`` lost it."""
+
+    def update_reinterpretation_job(
+        self, job: ReinterpretationJob, *, lease_owner: str, lease_expires_at: str
+    ) -> bool:
+        """Persist the state, checkpoint, counters and failures of a job.
+
+        Only the lease holder may write; the lease is renewed while the job stays
+        RUNNING and released otherwise. Returns False if ``lease_owner`` lost it.
+        """
+
+    def count_reinterpretation_candidates(self, *, filters: ReinterpretationJobFilters) -> int:
+        """Return how many documents match ``filters`` (capped by ``max_documents``)."""
+
+    def list_reinterpretation_candidates(
+        self,
+        *,
+        filters: ReinterpretationJobFilters,
+        after_document_id: str | None,
+        limit: int,
+    ) -> list[str]:
+        """Return matching document ids after ``after_document_id`` in id order."""
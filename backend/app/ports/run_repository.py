@@ -14,6 +14,39 @@ from backend.app.domain.models import (
 )
 
 
+class RunUnitOfWork(Protocol):
+    """Buffered run-scoped writes committed together at step boundaries."""
+
+    def __enter__(self) -> RunUnitOfWork:
+        """Enter the unit of work."""
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        """Commit pending writes on success, discard them on error, and release resources."""
+
+    def append_artifact(
+        self,
+        *,
+        run_id: str,
+        artifact_type: str,
+        payload: dict[str, object],
+        created_at: str,
+    ) -> None:
+        """Buffer a run-scoped artifact record."""
+
+    def complete_run(
+        self,
+        *,
+        run_id: str,
+        state: ProcessingRunState,
+        completed_at: str,
+        failure_type: str | None,
+    ) -> None:
+        """Buffer finalizing a run with a terminal state."""
+
+    def commit(self) -> None:
+        """Persist all buffered writes in a single transaction."""
+
+
 class RunRepository(Protocol):
     """Persistence contract for processing runs and run-scoped artifacts."""
 
@@ -26,6 +59,11 @@ class RunRepository(Protocol):
     def get_latest_completed_run(self, document_id: str) -> ProcessingRunDetails | None:
         """Return the latest completed run for a document, if any."""
 
+    def get_latest_completed_run_by_content_hash(
+        self, *, content_sha256: str, exclude_document_id: str | None = None
+    ) -> ProcessingRunDetails | None:
+        """Return the latest completed, interpreted run of any document with this content hash."""
+
     def create_processing_run(
         self,
         *,
@@ -33,14 +71,49 @@ class RunRepository(Protocol):
         document_id: str,
         state: ProcessingRunState,
         created_at: str,
+        started_at: str | None = None,
+        source_run_id: str | None = None,
     ) -> None:
         """Persist a new processing run."""
 
+    def create_started_run(
+        self,
+        *,
+        run_id: str,
+        document_id: str,
+        created_at: str,
+        lease_owner: str,
+        lease_expires_at: str,
+        source_run_id: str | None = None,
+    ) -> bool:
+        """Insert a run already RUNNING under a lease; False if the document has a running run."""
+
     def list_queued_runs(self, *, limit: int) -> list[ProcessingRun]:
         """Return queued processing runs in FIFO order."""
 
-    def try_start_run(self, *, run_id: str, document_id: str, started_at: str) -> bool:
-        """Attempt to transition a queued run to running."""
+    def try_start_run(
+        self,
+        *,
+        run_id: str,
+        document_id: str,
+        started_at: str,
+        lease_owner: str | None = None,
+        lease_expires_at: str | None = None,
+    ) -> bool:
+        """Attempt to transition a queued run to running, optionally under a lease."""
+
+    def renew_run_lease(
+        self,
+        *,
+        run_id: str,
+        lease_owner: str,
+        lease_expires_at: str,
+        heartbeat_at: str,
+    ) -> bool:
+        """Extend a RUNNING run's lease; return False when the owner lost the lease."""
+
+    def requeue_expired_runs(self, *, now: str, max_claims: int) -> int:
+        """Re-queue RUNNING runs whose lease expired; fail runs claimed max_claims times."""
 
     def complete_run(
         self,
@@ -49,11 +122,12 @@ class RunRepository(Protocol):
         state: ProcessingRunState,
         completed_at: str,
         failure_type: str | None,
-    ) -> None:
-        """Finalize a run with a terminal state."""
+        lease_owner: str | None = None,
+    ) -> bool:
+        """Finalize a run held by ``lease_owner``; return False (a no-op) once it lost the lease."""
 
     def recover_orphaned_runs(self, *, completed_at: str) -> int:
-        """Mark any RUNNING runs as FAILED with PROCESS_TERMINATED."""
+        """Mark RUNNING runs without a lease as FAILED with PROCESS_TERMINATED."""
 
     def list_processing_runs(self, *, document_id: str) -> list[ProcessingRunDetail]:
         """Return processing runs for a document ordered by creation time."""
@@ -71,7 +145,15 @@ class RunRepository(Protocol):
     ) -> None:
         """Persist a run-scoped artifact record."""
 
+    def run_unit_of_work(self, *, lease_owner: str | None = None) -> RunUnitOfWork:
+        """Return a unit of work that batches one run's writes while ``lease_owner`` holds it."""
+
     def get_latest_artifact_payload(
         self, *, run_id: str, artifact_type: str
     ) -> dict[str, object] | None:
         """Return latest artifact payload for a run and artifact type."""
+
+    def get_first_artifact_payload(
+        self, *, run_id: str, artifact_type: str
+    ) -> dict[str, object] | None:
+        """Return the earliest artifact payload for a run and artifact type."""
@@ -27,8 +27,19 @@ class Settings:
     uvicorn_reload: str | None
     vet_records_cors_origins: str | None
     vet_records_db_path: str
+    vet_records_db_pool_size: str | None
+    vet_records_db_statement_cache_size: str | None
     vet_records_storage_path: str
+    vet_records_extraction_cache_max_mb: str | None
     vet_records_disable_processing: str | None
+    vet_records_disable_upload_dedup: str | None
+    vet_records_disable_embedded_scheduler: str | None
+    vet_records_processing_concurrency: str | None
+    vet_records_processing_executor: str | None
+    vet_records_processing_workers: str | None
+    vet_records_fitz_page_workers: str | None
+    vet_records_fitz_parallel_min_pages: str | None
+    vet_records_extraction_early_abort_pages: str | None
     vet_records_extraction_obs: str | None
     vet_records_confidence_policy_version: str | None
     vet_records_confidence_low_max: str | None
@@ -72,8 +83,21 @@ def get_settings() -> Settings:
         uvicorn_reload=_getenv("UVICORN_RELOAD"),
         vet_records_cors_origins=_getenv("VET_RECORDS_CORS_ORIGINS"),
         vet_records_db_path=_getenv("VET_RECORDS_DB_PATH") or str(DEFAULT_DB_PATH),
+        vet_records_db_pool_size=_getenv("VET_RECORDS_DB_POOL_SIZE"),
+        vet_records_db_statement_cache_size=_getenv("VET_RECORDS_DB_STATEMENT_CACHE_SIZE"),
         vet_records_storage_path=_getenv("VET_RECORDS_STORAGE_PATH") or str(DEFAULT_STORAGE_PATH),
+        vet_records_extraction_cache_max_mb=_getenv("VET_RECORDS_EXTRACTION_CACHE_MAX_MB"),
         vet_records_disable_processing=_getenv("VET_RECORDS_DISABLE_PROCESSING"),
+        vet_records_disable_upload_dedup=_getenv("VET_RECORDS_DISABLE_UPLOAD_DEDUP"),
+        vet_records_disable_embedded_scheduler=_getenv("VET_RECORDS_DISABLE_EMBEDDED_SCHEDULER"),
+        vet_records_processing_concurrency=_getenv("VET_RECORDS_PROCESSING_CONCURRENCY"),
+        vet_records_processing_executor=_getenv("VET_RECORDS_PROCESSING_EXECUTOR"),
+        vet_records_processing_workers=_getenv("VET_RECORDS_PROCESSING_WORKERS"),
+        vet_records_fitz_page_workers=_getenv("VET_RECORDS_FITZ_PAGE_WORKERS"),
+        vet_records_fitz_parallel_min_pages=_getenv("VET_RECORDS_FITZ_PARALLEL_MIN_PAGES"),
+        vet_records_extraction_early_abort_pages=_getenv(
+            "VET_RECORDS_EXTRACTION_EARLY_ABORT_PAGES"
+        ),
         vet_records_extraction_obs=_getenv("VET_RECORDS_EXTRACTION_OBS"),
         vet_records_confidence_policy_version=_getenv("VET_RECORDS_CONFIDENCE_POLICY_VERSION"),
         vet_records_confidence_low_max=_getenv("VET_RECORDS_CONFIDENCE_LOW_MAX"),
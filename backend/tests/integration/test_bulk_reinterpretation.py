@@ -0,0 +1,336 @@
+"""Integration tests for bulk re-interpretation jobs."""
+
+import asyncio
+import io
+import time
+
+import pytest
+from fastapi.testclient import TestClient
+
+from backend.app.application.processing import (
+    claim_reinterpretation_job,
+    create_reinterpretation_job,
+    execute_reinterpretation_job,
+    orchestrator,
+    run_reinterpretation_job,
+)
+from backend.app.application.processing.interpretation import _build_interpretation_artifact
+from backend.app.application.processing.orchestrator import InterpretationBuildError
+from backend.app.domain import models as app_models
+from backend.app.infra import database
+from backend.app.infra.file_storage import LocalFileStorage, get_storage_root
+from backend.app.infra.sqlite_document_repository import SqliteDocumentRepository
+
+
+@pytest.fixture
+def test_db(tmp_path, monkeypatch):
+    db_path = tmp_path / "documents.db"
+    monkeypatch.setenv("VET_RECORDS_DB_PATH", str(db_path))
+    monkeypatch.setenv("VET_RECORDS_STORAGE_PATH", str(tmp_path / "storage"))
+    monkeypatch.setenv("VET_RECORDS_DISABLE_PROCESSING", "true")
+    database.ensure_schema()
+    return db_path
+
+
+@pytest.fixture
+def test_client(test_db):
+    from backend.app.main import app
+
+    with TestClient(app) as client:
+        yield client
+
+
+def _upload_document(test_client: TestClient, *, content: bytes, raw_text: str | None) -> str:
+    files = {"file": ("record.pdf", io.BytesIO(content), "application/pdf")}
+    response = test_client.post("/documents/upload", files=files)
+    assert response.status_code == 201
+    document_id = response.json()["document_id"]
+    if raw_text is None:
+        return document_id
+    run_id = f"run-{document_id}"
+    with database.get_connection() as conn:
+        conn.execute(
+            """
+            INSERT INTO processing_runs (
+                run_id, document_id, state, created_at, started_at, completed_at, failure_type
+            )
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+            """,
+            (
+                run_id,
+                document_id,
+                app_models.ProcessingRunState.COMPLETED.value,
+                "2026-02-06T10:00:00+00:00",
+                "2026-02-06T10:00:01+00:00",
+                "2026-02-06T10:00:05+00:00",
+                None,
+            ),
+        )
+        conn.commit()
+    raw_text_path = get_storage_root() / document_id / "runs" / run_id / "raw-text.txt"
+    raw_text_path.parent.mkdir(parents=True, exist_ok=True)
+    raw_text_path.write_text(raw_text, encoding="utf-8")
+    return document_id
+
+
+def _build_rejecting_invalid_records(*, raw_text: str, **kwargs) -> dict[str, object]:
+    # Module-level so process-pool workers can import it by name.
+    if "INVALID" in raw_text:
+        raise InterpretationBuildError(
+            error_code="INTERPRETATION_VALIDATION_FAILED", details={"errors": ["pet_name"]}
+        )
+    return _build_interpretation_artifact(raw_text=raw_text, **kwargs)
+
+
+def _reinterpretation_runs(document_id: str) -> list[tuple[str, str]]:
+    with database.get_connection() as conn:
+        rows = conn.execute(
+            """
+            SELECT state, source_run_id
+            FROM processing_runs
+            WHERE document_id = ? AND source_run_id IS NOT NULL
+            """,
+            (document_id,),
+        ).fetchall()
+    return [(row["state"], row["source_run_id"]) for row in rows]
+
+
+class _StopAfterFirstCheckpointRepository(SqliteDocumentRepository):
+    def __init__(self, stop_event: asyncio.Event) -> None:
+        super().__init__()
+        self._stop_event = stop_event
+
+    def update_reinterpretation_job(
+        self, job: app_models.ReinterpretationJob, *, lease_owner: str, lease_expires_at: str
+    ) -> bool:
+        updated = super().update_reinterpretation_job(
+            job, lease_owner=lease_owner, lease_expires_at=lease_expires_at
+        )
+        if job.processed_documents >= 1:
+            self._stop_event.set()
+        return updated
+
+
+def test_bulk_reinterpretation_job_checkpoints_and_resumes(test_client, monkeypatch):
+    document_ids = [
+        _upload_document(test_client, content=b"%PDF-1.5 luna", raw_text="Paciente: Luna"),
+        _upload_document(test_client, content=b"%PDF-1.5 kira", raw_text="Paciente: Kira"),
+        _upload_document(test_client, content=b"%PDF-1.5 none", raw_text=None),
+    ]
+    repository = SqliteDocumentRepository()
+    storage = LocalFileStorage()
+    job = create_reinterpretation_job(
+        filters=app_models.ReinterpretationJobFilters(), repository=repository
+    )
+    assert job.total_documents == 3
+    assert job.filters.created_before == job.created_at
+
+    async def _run_until_first_checkpoint() -> app_models.ReinterpretationJob:
+        stop_event = asyncio.Event()
+        return await run_reinterpretation_job(
+            job_id=job.job_id,
+            repository=_StopAfterFirstCheckpointRepository(stop_event),
+            storage=storage,
+            executor=None,
+            max_in_flight=2,
+            stop_event=stop_event,
+            batch_size=1,
+        )
+
+    interrupted = asyncio.run(_run_until_first_checkpoint())
+    assert interrupted.state == app_models.ReinterpretationJobState.INTERRUPTED
+    assert interrupted.processed_documents == 1
+    assert interrupted.checkpoint_document_id == min(document_ids)
+
+    completed = asyncio.run(
+        run_reinterpretation_job(
+            job_id=job.job_id,
+            repository=repository,
+            storage=storage,
+            executor=None,
+            max_in_flight=2,
+        )
+    )
+    assert completed.state == app_models.ReinterpretationJobState.COMPLETED
+    assert completed.processed_documents == 3
+    assert completed.succeeded_documents == 2
+    assert completed.failed_documents == 1
+    assert completed.failures == (
+        {"document_id": document_ids[2], "reason": "SOURCE_RAW_TEXT_NOT_AVAILABLE"},
+    )
+    assert completed.docs_per_second is not None
+    assert repository.get_reinterpretation_job(job.job_id) == completed
+    # The checkpointed document is not reinterpreted again on resume.
+    for document_id in document_ids[:2]:
+        assert _reinterpretation_runs(document_id) == [
+            (app_models.ProcessingRunState.COMPLETED.value, f"run-{document_id}")
+        ]
+
+
+def test_reinterpretation_job_api_starts_and_reports_progress(test_client, monkeypatch):
+    document_id = _upload_document(test_client, content=b"%PDF-1.5 luna", raw_text="Paciente: Luna")
+
+    response = test_client.post("/reinterpretation-jobs", json={"workers": 1})
+    assert response.status_code == 409
+
+    monkeypatch.setenv("VET_RECORDS_DISABLE_PROCESSING", "false")
+    response = test_client.post(
+        "/reinterpretation-jobs", json={"review_status": "REVIEWED", "workers": 1}
+    )
+    assert response.status_code == 202
+    assert response.json()["total_documents"] == 0
+
+    response = test_client.post(
+        "/reinterpretation-jobs", json={"review_status": "IN_REVIEW", "workers": 1}
+    )
+    assert response.status_code == 202
+    job_id = response.json()["job_id"]
+    assert response.json()["total_documents"] == 1
+
+    deadline = time.monotonic() + 60
+    while True:
+        response = test_client.get(f"/reinterpretation-jobs/{job_id}")
+        assert response.status_code == 200
+        payload = response.json()
+        if payload["state"] == app_models.ReinterpretationJobState.COMPLETED.value:
+            break
+        assert time.monotonic() < deadline
+        time.sleep(0.1)
+
+    assert payload["processed_documents"] == 1
+    assert payload["succeeded_documents"] == 1
+    assert payload["failures"] == []
+    assert payload["docs_per_second"] > 0
+    assert _reinterpretation_runs(document_id) == [
+        (app_models.ProcessingRunState.COMPLETED.value, f"run-{document_id}")
+    ]
+
+    response = test_client.post(f"/reinterpretation-jobs/{job_id}/resume")
+    assert response.status_code == 409
+    assert response.json()["details"]["reason"] == "JOB_COMPLETED"
+    assert test_client.get("/reinterpretation-jobs/unknown").status_code == 404
+
+
+def test_reinterpretation_job_api_normalizes_created_at_bounds(test_client, monkeypatch):
+    document_id = _upload_document(test_client, content=b"%PDF-1.5 luna", raw_text=None)
+    with database.get_connection() as conn:
+        conn.execute(
+            "UPDATE documents SET created_at = ? WHERE document_id = ?",
+            ("2026-01-01T00:00:00+00:00", document_id),
+        )
+        conn.commit()
+    monkeypatch.setenv("VET_RECORDS_DISABLE_PROCESSING", "false")
+
+    response = test_client.post(
+        "/reinterpretation-jobs", json={"created_after": "yesterday", "workers": 1}
+    )
+    assert response.status_code == 422
+    response = test_client.post(
+        "/reinterpretation-jobs",
+        json={"created_before": "2026-01-01T01:00:00+01:00", "workers": 1},
+    )
+    assert response.status_code == 202
+    assert response.json()["total_documents"] == 0
+    response = test_client.post(
+        "/reinterpretation-jobs", json={"created_after": "2026-01-01T00:00:00Z", "workers": 1}
+    )
+    assert response.status_code == 202
+    assert response.json()["total_documents"] == 1
+    assert response.json()["filters"]["created_after"] == "2026-01-01T00:00:00+00:00"
+
+
+def test_reinterpretation_job_is_refused_to_a_second_runner_until_its_lease_expires(
+    test_client, monkeypatch
+):
+    document_id = _upload_document(test_client, content=b"%PDF-1.5 luna", raw_text="Paciente: Luna")
+    monkeypatch.setenv("VET_RECORDS_DISABLE_PROCESSING", "false")
+    repository = SqliteDocumentRepository()
+    storage = LocalFileStorage()
+    job = create_reinterpretation_job(
+        filters=app_models.ReinterpretationJobFilters(), repository=repository
+    )
+    first_lease = claim_reinterpretation_job(job_id=job.job_id, repository=repository)
+    assert first_lease is not None
+
+    # The job is held by a live runner: neither the API nor another runner takes it.
+    assert claim_reinterpretation_job(job_id=job.job_id, repository=repository) is None
+    response = test_client.post(f"/reinterpretation-jobs/{job.job_id}/resume")
+    assert response.status_code == 409
+    assert response.json()["details"]["reason"] == "JOB_RUNNING"
+    refused = asyncio.run(
+        run_reinterpretation_job(
+            job_id=job.job_id,
+            repository=repository,
+            storage=storage,
+            executor=None,
+            max_in_flight=1,
+        )
+    )
+    assert (refused.state, refused.processed_documents) == (
+        app_models.ReinterpretationJobState.RUNNING,
+        0,
+    )
+    assert _reinterpretation_runs(document_id) == []
+
+    # The first runner died without releasing the job: once its lease expires the
+    # job resumes, and the dead runner can no longer write progress.
+    with database.get_connection() as conn:
+        conn.execute(
+            "UPDATE reinterpretation_jobs SET lease_expires_at = ? WHERE job_id = ?",
+            ("2000-01-01T00:00:00.000000+00:00", job.job_id),
+        )
+        conn.commit()
+    second_lease = claim_reinterpretation_job(job_id=job.job_id, repository=repository)
+    assert second_lease is not None
+    completed = asyncio.run(
+        run_reinterpretation_job(
+            job_id=job.job_id,
+            repository=repository,
+            storage=storage,
+            executor=None,
+            max_in_flight=1,
+            lease=second_lease,
+        )
+    )
+    assert completed.state == app_models.ReinterpretationJobState.COMPLETED
+    assert completed.succeeded_documents == 1
+    assert not repository.update_reinterpretation_job(
+        job, lease_owner=first_lease.owner, lease_expires_at="2100-01-01T00:00:00.000000+00:00"
+    )
+    assert repository.get_reinterpretation_job(job.job_id) == completed
+
+
+def test_bulk_reinterpretation_job_survives_a_document_failing_in_a_worker(
+    test_client, monkeypatch
+):
+    document_ids = [
+        _upload_document(test_client, content=b"%PDF-1.5 luna", raw_text="Paciente: Luna"),
+        _upload_document(test_client, content=b"%PDF-1.5 bad", raw_text="Paciente: INVALID"),
+        _upload_document(test_client, content=b"%PDF-1.5 kira", raw_text="Paciente: Kira"),
+    ]
+    monkeypatch.setattr(
+        orchestrator, "_build_interpretation_artifact", _build_rejecting_invalid_records
+    )
+    repository = SqliteDocumentRepository()
+    job = create_reinterpretation_job(
+        filters=app_models.ReinterpretationJobFilters(), repository=repository
+    )
+
+    completed = asyncio.run(
+        execute_reinterpretation_job(
+            job_id=job.job_id,
+            repository=repository,
+            storage=LocalFileStorage(),
+            workers=1,
+        )
+    )
+
+    assert completed.state == app_models.ReinterpretationJobState.COMPLETED
+    assert (completed.succeeded_documents, completed.failed_documents) == (2, 1)
+    assert [(failure["document_id"], failure["reason"]) for failure in completed.failures] == [
+        (document_ids[1], "INTERPRETATION_FAILED")
+    ]
+    for document_id in (document_ids[0], document_ids[2]):
+        assert _reinterpretation_runs(document_id) == [
+            (app_models.ProcessingRunState.COMPLETED.value, f"run-{document_id}")
+        ]
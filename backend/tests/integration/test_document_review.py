@@ -333,6 +333,54 @@ def test_document_review_returns_latest_completed_run_context(test_client):
     assert payload["reviewed_at"] is None
 
 
+def test_document_review_and_metadata_support_conditional_get(test_client):
+    document_id = _upload_sample_document(test_client)
+    run_id = str(uuid4())
+    _insert_run(
+        document_id=document_id,
+        run_id=run_id,
+        state=app_models.ProcessingRunState.COMPLETED,
+        failure_type=None,
+    )
+    _insert_structured_interpretation(run_id=run_id)
+
+    review = test_client.get(f"/documents/{document_id}/review")
+    assert review.status_code == 200
+    review_etag = review.headers["etag"]
+    assert review.headers["cache-control"] == "private, no-cache"
+
+    not_modified = test_client.get(
+        f"/documents/{document_id}/review", headers={"If-None-Match": f"W/{review_etag}"}
+    )
+    assert not_modified.status_code == 304
+    assert not_modified.content == b""
+    assert not_modified.headers["etag"] == review_etag
+
+    metadata = test_client.get(f"/documents/{document_id}")
+    assert metadata.status_code == 200
+    metadata_etag = metadata.headers["etag"]
+    assert (
+        test_client.get(
+            f"/documents/{document_id}", headers={"If-None-Match": f'"other", {metadata_etag}'}
+        ).status_code
+        == 304
+    )
+
+    assert test_client.post(f"/documents/{document_id}/reviewed").status_code == 200
+
+    changed_review = test_client.get(
+        f"/documents/{document_id}/review", headers={"If-None-Match": review_etag}
+    )
+    assert changed_review.status_code == 200
+    assert changed_review.headers["etag"] != review_etag
+    assert changed_review.json()["review_status"] == "REVIEWED"
+    changed_metadata = test_client.get(
+        f"/documents/{document_id}", headers={"If-None-Match": metadata_etag}
+    )
+    assert changed_metadata.status_code == 200
+    assert changed_metadata.headers["etag"] != metadata_etag
+
+
 def test_document_review_payload_uses_canonical_global_schema_key_only(test_client):
     document_id = _upload_sample_document(test_client)
     run_id = str(uuid4())
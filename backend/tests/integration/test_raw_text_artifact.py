@@ -6,8 +6,9 @@ import pytest
 from fastapi.testclient import TestClient
 
 from backend.app.domain import models as app_models
+from backend.app.domain.raw_text_index import RawTextIndex
 from backend.app.infra import database
-from backend.app.infra.file_storage import get_storage_root
+from backend.app.infra.file_storage import LocalFileStorage, get_storage_root
 
 
 @pytest.fixture
@@ -89,6 +90,46 @@ def test_get_raw_text_returns_payload_for_completed_run(test_client):
     assert payload["artifact_type"] == "RAW_TEXT"
     assert payload["content_type"] == "text/plain"
     assert "Historia clinica" in payload["text"]
+    # Raw text stored without an index sidecar reads as a single page.
+    assert (payload["page"], payload["page_count"]) == (None, 1)
+
+
+def test_get_raw_text_returns_single_pages_from_the_index(test_client):
+    document_id = _upload_sample_document(test_client)
+    storage = LocalFileStorage()
+    text = "Paciente: Luna\nDiagnóstico: otitis"
+    for run_id in ("run-raw-text-pages", "run-raw-text-linked"):
+        _insert_run(
+            document_id=document_id,
+            run_id=run_id,
+            state=app_models.ProcessingRunState.COMPLETED,
+            failure_type=None,
+        )
+    storage.save_raw_text(
+        document_id=document_id,
+        run_id="run-raw-text-pages",
+        text=text,
+        index=RawTextIndex.build(text, page_starts=(0, 15)),
+    )
+    storage.link_raw_text(
+        source_document_id=document_id,
+        source_run_id="run-raw-text-pages",
+        document_id=document_id,
+        run_id="run-raw-text-linked",
+    )
+
+    response = test_client.get("/runs/run-raw-text-linked/artifacts/raw-text", params={"page": 2})
+    assert response.status_code == 200
+    payload = response.json()
+    assert (payload["text"], payload["page"], payload["page_count"]) == (
+        "Diagnóstico: otitis",
+        2,
+        2,
+    )
+
+    response = test_client.get("/runs/run-raw-text-pages/artifacts/raw-text", params={"page": 3})
+    assert response.status_code == 404
+    assert response.json()["details"] == {"page": 3, "page_count": 2}
 
 
 def test_get_raw_text_returns_409_when_run_not_ready(test_client):
@@ -146,3 +187,44 @@ def test_get_raw_text_returns_404_when_run_missing(test_client):
     assert response.status_code == 404
     payload = response.json()
     assert payload["error_code"] == "NOT_FOUND"
+
+
+def test_reprocess_interpretation_only_queues_run_reusing_stored_raw_text(test_client, monkeypatch):
+    document_id = _upload_sample_document(test_client)
+    _insert_run(
+        document_id=document_id,
+        run_id="run-with-text",
+        state=app_models.ProcessingRunState.FAILED,
+        failure_type="INTERPRETATION_FAILED",
+    )
+    raw_text_path = get_storage_root() / document_id / "runs" / "run-with-text" / "raw-text.txt"
+    raw_text_path.parent.mkdir(parents=True, exist_ok=True)
+    raw_text_path.write_text("Paciente: Luna", encoding="utf-8")
+    monkeypatch.setenv("VET_RECORDS_DISABLE_PROCESSING", "false")
+
+    response = test_client.post(
+        f"/documents/{document_id}/reprocess", params={"source_run_id": "run-with-text"}
+    )
+    assert response.status_code == 400
+
+    response = test_client.post(
+        f"/documents/{document_id}/reprocess", params={"interpretation_only": "true"}
+    )
+    assert response.status_code == 201
+    payload = response.json()
+    assert payload["state"] == app_models.ProcessingRunState.QUEUED.value
+    assert payload["source_run_id"] == "run-with-text"
+    with database.get_connection() as conn:
+        row = conn.execute(
+            "SELECT source_run_id FROM processing_runs WHERE run_id = ?",
+            (payload["run_id"],),
+        ).fetchone()
+    assert row["source_run_id"] == "run-with-text"
+
+    # The queued run has no raw text yet, so it cannot be a source itself.
+    response = test_client.post(
+        f"/documents/{document_id}/reprocess",
+        params={"interpretation_only": "true", "source_run_id": payload["run_id"]},
+    )
+    assert response.status_code == 409
+    assert response.json()["details"]["reason"] == "SOURCE_RAW_TEXT_NOT_AVAILABLE"
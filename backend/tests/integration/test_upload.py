@@ -1,6 +1,7 @@
 """Integration tests covering the document HTTP endpoints."""
 
 import io
+import json
 
 import pytest
 from fastapi.testclient import TestClient
@@ -8,6 +9,7 @@ from fastapi.testclient import TestClient
 from backend.app.domain import models as app_models
 from backend.app.infra import database
 from backend.app.infra.file_storage import get_storage_root
+from backend.app.infra.sqlite_document_repository import SqliteDocumentRepository
 
 
 @pytest.fixture
@@ -107,6 +109,28 @@ def test_upload_rejects_oversized_via_streaming(test_client, monkeypatch):
     assert response.json()["error_code"] == "FILE_TOO_LARGE"
 
 
+def test_upload_streams_through_staging_without_leaving_partial_files(test_client, monkeypatch):
+    from backend.app.api import routes_documents
+
+    monkeypatch.setattr(routes_documents, "MAX_UPLOAD_SIZE", 200 * 1024)
+    staging_dir = get_storage_root() / ".staging"
+
+    content = b"%PDF-1.5 " + b"x" * (150 * 1024)
+    files = {"file": ("record.pdf", io.BytesIO(content), "application/pdf")}
+    response = test_client.post("/documents/upload", files=files)
+    assert response.status_code == 201
+    document_id = response.json()["document_id"]
+    assert (get_storage_root() / document_id / "original.pdf").read_bytes() == content
+
+    monkeypatch.setattr(routes_documents, "_request_content_length", lambda _request: None)
+    files = {"file": ("record.pdf", io.BytesIO(content * 2), "application/pdf")}
+    assert test_client.post("/documents/upload", files=files).status_code == 413
+    files = {"file": ("record.pdf", io.BytesIO(b""), "application/pdf")}
+    assert test_client.post("/documents/upload", files=files).status_code == 400
+
+    assert list(staging_dir.iterdir()) == []
+
+
 def test_upload_normal_file_still_works(test_client, monkeypatch):
     from backend.app.api import routes_documents
 
@@ -154,3 +178,167 @@ def test_get_document_returns_404_when_missing(test_client):
     payload = response.json()
     assert payload["error_code"] == "NOT_FOUND"
     assert payload["message"] == "Document not found."
+
+
+def _insert_completed_source_run(
+    source_id: str, *, policy_version: str, extractor_identity: tuple[str, str, str]
+) -> None:
+    from backend.app.application.processing.orchestrator import _extractor_identity_details
+
+    interpretation = {
+        "interpretation_id": "interp-1",
+        "version_number": 1,
+        "data": {
+            "document_id": source_id,
+            "processing_run_id": "run-source",
+            "fields": [],
+            "confidence_policy": {"policy_version": policy_version},
+        },
+    }
+    extraction_step = {
+        "step_name": "EXTRACTION",
+        "step_status": "SUCCEEDED",
+        "attempt": 1,
+        "started_at": "2026-02-06T10:00:01+00:00",
+        "ended_at": "2026-02-06T10:00:02+00:00",
+        "error_code": None,
+        "details": {"extractor_identity": _extractor_identity_details(extractor_identity)},
+    }
+    with database.get_connection() as conn:
+        conn.execute(
+            """
+            INSERT INTO processing_runs (run_id, document_id, state, created_at, completed_at)
+            VALUES ('run-source', ?, 'COMPLETED', '2026-02-06T10:00:00+00:00',
+                    '2026-02-06T10:00:05+00:00')
+            """,
+            (source_id,),
+        )
+        conn.executemany(
+            """
+            INSERT INTO artifacts (artifact_id, run_id, artifact_type, payload, created_at)
+            VALUES (?, 'run-source', ?, ?, ?)
+            """,
+            [
+                (
+                    "artifact-1",
+                    "STEP_STATUS",
+                    json.dumps(extraction_step),
+                    "2026-02-06T10:00:02+00:00",
+                ),
+                (
+                    "artifact-2",
+                    "STRUCTURED_INTERPRETATION",
+                    json.dumps(interpretation),
+                    "2026-02-06T10:00:04+00:00",
+                ),
+            ],
+        )
+        conn.commit()
+    source_raw_text = get_storage_root() / source_id / "runs" / "run-source" / "raw-text.txt"
+    source_raw_text.parent.mkdir(parents=True)
+    source_raw_text.write_text("Paciente: Luna", encoding="utf-8")
+
+
+def test_duplicate_upload_reuses_completed_run_of_identical_content(test_client, monkeypatch):
+    import hashlib
+    import os
+
+    from backend.app.application.processing import pdf_extraction
+
+    monkeypatch.setenv("VET_RECORDS_CONFIDENCE_POLICY_VERSION", "v1")
+    content = b"%PDF-1.5 duplicate sample"
+    files = {"file": ("record.pdf", io.BytesIO(content), "application/pdf")}
+    source_id = test_client.post("/documents/upload", files=files).json()["document_id"]
+    identity = pdf_extraction._pdf_extractor_identity()
+    assert identity is not None
+    _insert_completed_source_run(source_id, policy_version="v1", extractor_identity=identity)
+    source_raw_text = get_storage_root() / source_id / "runs" / "run-source" / "raw-text.txt"
+
+    monkeypatch.setenv("VET_RECORDS_DISABLE_PROCESSING", "false")
+    files = {"file": ("copy.pdf", io.BytesIO(content), "application/pdf")}
+    response = test_client.post("/documents/upload", files=files)
+    assert response.status_code == 201
+    assert response.json()["status"] == app_models.ProcessingStatus.COMPLETED.value
+    document_id = response.json()["document_id"]
+
+    with database.get_connection() as conn:
+        hashes = {
+            row["document_id"]: row["content_sha256"]
+            for row in conn.execute("SELECT document_id, content_sha256 FROM documents")
+        }
+        runs = conn.execute(
+            "SELECT run_id, state, started_at FROM processing_runs WHERE document_id = ?",
+            (document_id,),
+        ).fetchall()
+    assert hashes == {
+        source_id: hashlib.sha256(content).hexdigest(),
+        document_id: hashlib.sha256(content).hexdigest(),
+    }
+    assert len(runs) == 1
+    assert runs[0]["state"] == "COMPLETED"
+    assert runs[0]["started_at"]
+    run_id = runs[0]["run_id"]
+
+    raw_text = get_storage_root() / document_id / "runs" / run_id / "raw-text.txt"
+    assert raw_text.read_text(encoding="utf-8") == "Paciente: Luna"
+    assert os.path.samefile(raw_text, source_raw_text)
+
+    review = test_client.get(f"/documents/{document_id}/review").json()
+    assert review["latest_completed_run"]["run_id"] == run_id
+    assert review["active_interpretation"]["version_number"] == 1
+    assert review["active_interpretation"]["interpretation_id"] != "interp-1"
+
+    steps = test_client.get(f"/documents/{document_id}/processing-history").json()["runs"][0][
+        "steps"
+    ]
+    assert [step["step_status"] for step in steps] == ["SUCCEEDED", "SUCCEEDED"]
+    # The reused run carries the extractor identity, so it can be reused in turn.
+    extraction = SqliteDocumentRepository().list_step_artifacts(run_id=run_id)[0]
+    assert extraction.details is not None
+    assert extraction.details["extractor_identity"] == {
+        "extractor": identity[0],
+        "extractor_version": identity[1],
+        "limits": identity[2],
+    }
+
+
+@pytest.mark.parametrize(
+    ("policy_version", "extractor_version"),
+    [("v0", None), ("v1", "0.0-stale")],
+    ids=["confidence_policy_changed", "extractor_changed"],
+)
+def test_duplicate_upload_is_reprocessed_after_a_policy_or_extractor_change(
+    test_client, monkeypatch, policy_version, extractor_version
+):
+    from backend.app.application.processing import pdf_extraction
+
+    monkeypatch.setenv("VET_RECORDS_CONFIDENCE_POLICY_VERSION", "v1")
+    content = b"%PDF-1.5 duplicate sample"
+    files = {"file": ("record.pdf", io.BytesIO(content), "application/pdf")}
+    source_id = test_client.post("/documents/upload", files=files).json()["document_id"]
+    identity = pdf_extraction._pdf_extractor_identity()
+    assert identity is not None
+    if extractor_version is not None:
+        identity = (identity[0], extractor_version, identity[2])
+    _insert_completed_source_run(
+        source_id, policy_version=policy_version, extractor_identity=identity
+    )
+
+    monkeypatch.setenv("VET_RECORDS_DISABLE_PROCESSING", "false")
+    files = {"file": ("copy.pdf", io.BytesIO(content), "application/pdf")}
+    response = test_client.post("/documents/upload", files=files)
+
+    assert response.status_code == 201
+    assert response.json()["status"] == app_models.ProcessingStatus.PROCESSING.value
+
+
+def test_duplicate_upload_is_reprocessed_when_dedup_disabled(test_client, monkeypatch):
+    content = b"%PDF-1.5 sample"
+    files = {"file": ("record.pdf", io.BytesIO(content), "application/pdf")}
+    test_client.post("/documents/upload", files=files)
+
+    monkeypatch.setenv("VET_RECORDS_DISABLE_PROCESSING", "false")
+    monkeypatch.setenv("VET_RECORDS_DISABLE_UPLOAD_DEDUP", "true")
+    files = {"file": ("record.pdf", io.BytesIO(content), "application/pdf")}
+    response = test_client.post("/documents/upload", files=files)
+    assert response.json()["status"] == app_models.ProcessingStatus.PROCESSING.value
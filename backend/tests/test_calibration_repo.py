@@ -5,7 +5,10 @@ from pathlib import Path
 import pytest
 
 from backend.app.infra import database
-from backend.app.infra.sqlite_calibration_repo import SqliteCalibrationRepo
+from backend.app.infra.sqlite_calibration_repo import (
+    SqliteCalibrationRepo,
+    clear_calibration_counts_cache,
+)
 
 
 def test_sqlite_calibration_repo_constructs_and_tracks_counts(
@@ -32,3 +35,60 @@ def test_sqlite_calibration_repo_constructs_and_tracks_counts(
         policy_version="v1",
     )
     assert counts == (1, 0)
+
+
+def test_sqlite_calibration_repo_bulk_counts_are_cached_until_deltas_apply(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    monkeypatch.setenv("VET_RECORDS_DB_PATH", str(tmp_path / "calibration-bulk.db"))
+    database.ensure_schema()
+    clear_calibration_counts_cache()
+
+    repo = SqliteCalibrationRepo()
+    for field_key, mapping_id in (("pet_name", None), ("pet_name", "anchor::paciente")):
+        repo.increment_calibration_signal(
+            context_key="dog:cbc",
+            field_key=field_key,
+            mapping_id=mapping_id,
+            policy_version="v1",
+            signal_type="edited",
+            updated_at="2026-01-01T00:00:00+00:00",
+        )
+    repo.increment_calibration_signal(
+        context_key="cat:cbc",
+        field_key="pet_name",
+        mapping_id=None,
+        policy_version="v1",
+        signal_type="accepted_unchanged",
+        updated_at="2026-01-01T00:00:00+00:00",
+    )
+
+    counts = repo.get_calibration_counts_for_context(context_key="dog:cbc", policy_version="v1")
+    assert counts == {("pet_name", None): (0, 1), ("pet_name", "anchor::paciente"): (0, 1)}
+
+    query_count = 0
+    original_get_connection = database.get_connection
+
+    def _counting_get_connection():
+        nonlocal query_count
+        query_count += 1
+        return original_get_connection()
+
+    monkeypatch.setattr(database, "get_connection", _counting_get_connection)
+    assert repo.get_calibration_counts_for_context(context_key="dog:cbc", policy_version="v1") == (
+        counts
+    )
+    assert query_count == 0
+
+    repo.apply_calibration_deltas(
+        context_key="dog:cbc",
+        field_key="pet_name",
+        mapping_id=None,
+        policy_version="v1",
+        accept_delta=2,
+        edit_delta=0,
+        updated_at="2026-01-01T00:00:01+00:00",
+    )
+    refreshed = repo.get_calibration_counts_for_context(context_key="dog:cbc", policy_version="v1")
+    assert refreshed[("pet_name", None)] == (2, 1)
+    assert query_count == 2
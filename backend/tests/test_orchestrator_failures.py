@@ -11,6 +11,12 @@ from backend.app.application.processing import orchestrator
 from backend.app.domain.models import ProcessingRun, ProcessingRunState
 
 
+def _streamed_text(text: str):
+    return lambda *_args: orchestrator.pdf_extraction.StreamedPdfText(
+        text=text, extractor="fitz", pages=1, aborted=False
+    )
+
+
 def _build_run() -> ProcessingRun:
     return ProcessingRun(
         run_id="run-failure-1",
@@ -69,14 +75,17 @@ def test_process_document_preserves_extraction_artifact_when_interpretation_fail
     repository = Mock()
     storage = Mock()
     sample_pdf = Path(__file__)
-    repository.get.return_value = SimpleNamespace(storage_path="doc/original.pdf")
+    repository.get.return_value = SimpleNamespace(
+        storage_path="doc/original.pdf", content_sha256=None
+    )
     storage.exists.return_value = True
     storage.resolve.return_value = sample_pdf
+    storage.read_cached_extraction.return_value = None
 
     monkeypatch.setattr(
         orchestrator.pdf_extraction,
-        "_extract_pdf_text_with_extractor",
-        lambda _path: ("texto clinico suficiente para pasar calidad", "fitz"),
+        "_stream_pdf_text_with_extractor",
+        _streamed_text("texto clinico suficiente para pasar calidad"),
     )
     monkeypatch.setattr(
         orchestrator,
@@ -125,12 +134,15 @@ def test_process_document_empty_extraction_records_low_quality_failure(
     repository = Mock()
     storage = Mock()
     sample_pdf = Path(__file__)
-    repository.get.return_value = SimpleNamespace(storage_path="doc/original.pdf")
+    repository.get.return_value = SimpleNamespace(
+        storage_path="doc/original.pdf", content_sha256=None
+    )
     storage.exists.return_value = True
     storage.resolve.return_value = sample_pdf
+    storage.read_cached_extraction.return_value = None
 
     monkeypatch.setattr(
-        orchestrator.pdf_extraction, "_extract_pdf_text_with_extractor", lambda _path: ("", "fitz")
+        orchestrator.pdf_extraction, "_stream_pdf_text_with_extractor", _streamed_text("")
     )
 
     with pytest.raises(orchestrator.ProcessingError, match="EXTRACTION_LOW_QUALITY"):
@@ -152,3 +164,57 @@ def test_process_document_empty_extraction_records_low_quality_failure(
     ]
     assert failed_extraction
     assert failed_extraction[0]["error_code"] == "EXTRACTION_LOW_QUALITY"
+
+
+def test_execute_run_batches_writes_in_unit_of_work_commits(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    repository = Mock()
+    storage = Mock()
+    unit_of_work = Mock()
+    events: list[str] = []
+    unit_of_work.append_artifact.side_effect = lambda **kwargs: events.append(
+        f"{kwargs['payload'].get('step_name', kwargs['artifact_type'])}:"
+        f"{kwargs['payload'].get('step_status', '')}"
+    )
+    unit_of_work.complete_run.side_effect = lambda **kwargs: events.append(
+        f"complete:{kwargs['state'].value}"
+    )
+    unit_of_work.commit.side_effect = lambda: events.append("commit")
+    repository.get.return_value = SimpleNamespace(
+        storage_path="doc/original.pdf", content_sha256=None
+    )
+    storage.exists.return_value = True
+    storage.resolve.return_value = Path(__file__)
+    storage.read_cached_extraction.return_value = None
+    monkeypatch.setattr(orchestrator, "extraction_observability_enabled", lambda: False)
+    monkeypatch.setattr(
+        orchestrator.pdf_extraction,
+        "_stream_pdf_text_with_extractor",
+        _streamed_text("texto clinico suficiente para pasar calidad"),
+    )
+    monkeypatch.setattr(
+        orchestrator, "evaluate_extracted_text_quality", lambda _text: (0.9, True, [])
+    )
+    monkeypatch.setattr(orchestrator, "_build_interpretation_artifact", lambda **_kwargs: {})
+
+    asyncio.run(
+        orchestrator._execute_run(
+            run=_build_run(), repository=repository, storage=storage, unit_of_work=unit_of_work
+        )
+    )
+
+    assert events == [
+        "EXTRACTION:RUNNING",
+        "commit",
+        "EXTRACTION:SUCCEEDED",
+        "INTERPRETATION:RUNNING",
+        "commit",
+        "STRUCTURED_INTERPRETATION:",
+        "REVIEW_PROJECTION:",
+        "INTERPRETATION:SUCCEEDED",
+        "complete:COMPLETED",
+        "commit",
+    ]
+    repository.append_artifact.assert_not_called()
+    repository.complete_run.assert_not_called()
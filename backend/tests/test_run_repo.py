@@ -10,20 +10,26 @@ from backend.app.infra.sqlite_document_repo import SqliteDocumentRepo
 from backend.app.infra.sqlite_run_repo import SqliteRunRepo
 
 
-def _seed_document(doc_repo: SqliteDocumentRepo) -> None:
+def _seed_document(
+    doc_repo: SqliteDocumentRepo,
+    *,
+    document_id: str = "doc-1",
+    content_sha256: str | None = None,
+) -> None:
     doc_repo.create(
         Document(
-            document_id="doc-1",
+            document_id=document_id,
             original_filename="record.pdf",
             content_type="application/pdf",
             file_size=100,
-            storage_path="storage/doc-1/original.pdf",
+            storage_path=f"storage/{document_id}/original.pdf",
             created_at="2026-01-01T00:00:00+00:00",
             updated_at="2026-01-01T00:00:00+00:00",
             review_status=ReviewStatus.IN_REVIEW,
             reviewed_at=None,
             reviewed_by=None,
             reviewed_run_id=None,
+            content_sha256=content_sha256,
         ),
         ProcessingStatus.UPLOADED,
     )
@@ -49,3 +55,327 @@ def test_sqlite_run_repo_constructs_and_handles_basic_run_flow(
     queued = run_repo.list_queued_runs(limit=10)
     assert len(queued) == 1
     assert queued[0].run_id == "run-1"
+
+
+def test_sqlite_run_repo_leases_are_renewed_and_expired_leases_requeued(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    monkeypatch.setenv("VET_RECORDS_DB_PATH", str(tmp_path / "lease.db"))
+    database.ensure_schema()
+    doc_repo = SqliteDocumentRepo()
+    run_repo = SqliteRunRepo()
+    _seed_document(doc_repo)
+    run_repo.create_processing_run(
+        run_id="run-1",
+        document_id="doc-1",
+        state=ProcessingRunState.QUEUED,
+        created_at="2026-01-01T00:00:01+00:00",
+    )
+
+    assert run_repo.try_start_run(
+        run_id="run-1",
+        document_id="doc-1",
+        started_at="2026-01-01T00:00:02+00:00",
+        lease_owner="worker-a",
+        lease_expires_at="2026-01-01T00:01:02.000000+00:00",
+    )
+    assert run_repo.renew_run_lease(
+        run_id="run-1",
+        lease_owner="worker-a",
+        lease_expires_at="2026-01-01T00:02:00.000000+00:00",
+        heartbeat_at="2026-01-01T00:01:00.000000+00:00",
+    )
+    assert not run_repo.renew_run_lease(
+        run_id="run-1",
+        lease_owner="worker-b",
+        lease_expires_at="2026-01-01T00:03:00.000000+00:00",
+        heartbeat_at="2026-01-01T00:01:00.000000+00:00",
+    )
+    # Leased runs belong to a live owner: startup recovery must leave them alone.
+    assert run_repo.recover_orphaned_runs(completed_at="2026-01-01T00:01:30+00:00") == 0
+    assert run_repo.requeue_expired_runs(now="2026-01-01T00:01:59.000000+00:00", max_claims=3) == 0
+
+    assert run_repo.requeue_expired_runs(now="2026-01-01T00:02:01.000000+00:00", max_claims=3) == 1
+    run = run_repo.get_run("run-1")
+    assert run is not None
+    assert run.state is ProcessingRunState.QUEUED
+    assert run.started_at is None
+    assert not run_repo.renew_run_lease(
+        run_id="run-1",
+        lease_owner="worker-a",
+        lease_expires_at="2026-01-01T00:04:00.000000+00:00",
+        heartbeat_at="2026-01-01T00:02:02.000000+00:00",
+    )
+
+
+def test_sqlite_run_repo_ignores_completion_by_an_owner_that_lost_the_lease(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    monkeypatch.setenv("VET_RECORDS_DB_PATH", str(tmp_path / "stale.db"))
+    database.ensure_schema()
+    doc_repo = SqliteDocumentRepo()
+    run_repo = SqliteRunRepo()
+    _seed_document(doc_repo)
+    run_repo.create_processing_run(
+        run_id="run-1",
+        document_id="doc-1",
+        state=ProcessingRunState.QUEUED,
+        created_at="2026-01-01T00:00:01+00:00",
+    )
+    # worker-a's lease expires, the run is re-queued and worker-b claims it.
+    for owner, started_at, lease_expires_at in (
+        ("worker-a", "2026-01-01T00:00:02.000000+00:00", "2026-01-01T00:01:02.000000+00:00"),
+        ("worker-b", "2026-01-01T00:02:02.000000+00:00", "2026-01-01T00:03:02.000000+00:00"),
+    ):
+        run_repo.requeue_expired_runs(now=started_at, max_claims=3)
+        assert run_repo.try_start_run(
+            run_id="run-1",
+            document_id="doc-1",
+            started_at=started_at,
+            lease_owner=owner,
+            lease_expires_at=lease_expires_at,
+        )
+
+    assert not run_repo.complete_run(
+        run_id="run-1",
+        state=ProcessingRunState.FAILED,
+        completed_at="2026-01-01T00:02:03+00:00",
+        failure_type="INTERPRETATION_FAILED",
+        lease_owner="worker-a",
+    )
+    run = run_repo.get_run("run-1")
+    assert run is not None
+    assert run.state is ProcessingRunState.RUNNING
+    assert run.completed_at is None
+
+    # A stale unit of work drops its whole commit, artifacts included.
+    for owner, created_at in (
+        ("worker-a", "2026-01-01T00:02:03+00:00"),
+        ("worker-b", "2026-01-01T00:02:04+00:00"),
+    ):
+        with run_repo.run_unit_of_work(lease_owner=owner) as unit_of_work:
+            unit_of_work.append_artifact(
+                run_id="run-1",
+                artifact_type="STEP_STATUS",
+                payload=_step_payload("RUNNING"),
+                created_at=created_at,
+            )
+            if owner == "worker-a":
+                unit_of_work.complete_run(
+                    run_id="run-1",
+                    state=ProcessingRunState.FAILED,
+                    completed_at="2026-01-01T00:02:03+00:00",
+                    failure_type="INTERPRETATION_FAILED",
+                )
+    artifacts = run_repo.list_step_artifacts(run_id="run-1")
+    assert [artifact.created_at for artifact in artifacts] == ["2026-01-01T00:02:04+00:00"]
+    run = run_repo.get_run("run-1")
+    assert run is not None
+    assert run.state is ProcessingRunState.RUNNING
+
+    assert run_repo.complete_run(
+        run_id="run-1",
+        state=ProcessingRunState.COMPLETED,
+        completed_at="2026-01-01T00:02:05+00:00",
+        failure_type=None,
+        lease_owner="worker-b",
+    )
+    run = run_repo.get_run("run-1")
+    assert run is not None
+    assert run.state is ProcessingRunState.COMPLETED
+
+
+def test_sqlite_run_repo_creates_runs_already_started_under_a_lease(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    monkeypatch.setenv("VET_RECORDS_DB_PATH", str(tmp_path / "started.db"))
+    database.ensure_schema()
+    doc_repo = SqliteDocumentRepo()
+    run_repo = SqliteRunRepo()
+    _seed_document(doc_repo)
+
+    assert run_repo.create_started_run(
+        run_id="run-1",
+        document_id="doc-1",
+        created_at="2026-01-01T00:00:01+00:00",
+        lease_owner="job-a",
+        lease_expires_at="2026-01-01T00:01:01.000000+00:00",
+        source_run_id="run-0",
+    )
+    assert run_repo.list_queued_runs(limit=10) == []
+    run = run_repo.get_run("run-1")
+    assert run is not None
+    assert run.state is ProcessingRunState.RUNNING
+    assert run_repo.renew_run_lease(
+        run_id="run-1",
+        lease_owner="job-a",
+        lease_expires_at="2026-01-01T00:02:00.000000+00:00",
+        heartbeat_at="2026-01-01T00:01:00.000000+00:00",
+    )
+    # A document runs one run at a time.
+    assert not run_repo.create_started_run(
+        run_id="run-2",
+        document_id="doc-1",
+        created_at="2026-01-01T00:00:02+00:00",
+        lease_owner="job-b",
+        lease_expires_at="2026-01-01T00:01:02.000000+00:00",
+    )
+    assert run_repo.get_run("run-2") is None
+
+
+def test_sqlite_run_repo_fails_expired_runs_after_max_claims(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    monkeypatch.setenv("VET_RECORDS_DB_PATH", str(tmp_path / "lease-max.db"))
+    database.ensure_schema()
+    doc_repo = SqliteDocumentRepo()
+    run_repo = SqliteRunRepo()
+    _seed_document(doc_repo)
+    run_repo.create_processing_run(
+        run_id="run-1",
+        document_id="doc-1",
+        state=ProcessingRunState.QUEUED,
+        created_at="2026-01-01T00:00:01+00:00",
+    )
+
+    for attempt in range(2):
+        assert run_repo.try_start_run(
+            run_id="run-1",
+            document_id="doc-1",
+            started_at="2026-01-01T00:00:02+00:00",
+            lease_owner=f"worker-{attempt}",
+            lease_expires_at="2026-01-01T00:01:00.000000+00:00",
+        )
+        requeued = run_repo.requeue_expired_runs(
+            now="2026-01-01T00:05:00.000000+00:00", max_claims=2
+        )
+        assert requeued == (1 if attempt == 0 else 0)
+
+    run = run_repo.get_run("run-1")
+    assert run is not None
+    assert run.state is ProcessingRunState.FAILED
+    assert run.failure_type == "PROCESS_TERMINATED"
+
+
+def _step_payload(step_status: str) -> dict[str, object]:
+    return {
+        "step_name": "EXTRACTION",
+        "step_status": step_status,
+        "attempt": 1,
+        "started_at": "2026-01-01T00:00:02+00:00",
+        "ended_at": None,
+        "error_code": None,
+        "details": None,
+    }
+
+
+def test_sqlite_run_unit_of_work_commits_buffered_writes_and_discards_on_error(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    monkeypatch.setenv("VET_RECORDS_DB_PATH", str(tmp_path / "uow.db"))
+    database.ensure_schema()
+    doc_repo = SqliteDocumentRepo()
+    run_repo = SqliteRunRepo()
+    _seed_document(doc_repo)
+    for run_id in ("run-1", "run-2"):
+        run_repo.create_processing_run(
+            run_id=run_id,
+            document_id="doc-1",
+            state=ProcessingRunState.QUEUED,
+            created_at="2026-01-01T00:00:01+00:00",
+        )
+
+    with run_repo.run_unit_of_work() as unit_of_work:
+        unit_of_work.append_artifact(
+            run_id="run-1",
+            artifact_type="STEP_STATUS",
+            payload=_step_payload("RUNNING"),
+            created_at="2026-01-01T00:00:02+00:00",
+        )
+        unit_of_work.commit()
+        assert unit_of_work.pending_writes == 0
+        assert len(run_repo.list_step_artifacts(run_id="run-1")) == 1
+
+        unit_of_work.append_artifact(
+            run_id="run-1",
+            artifact_type="STEP_STATUS",
+            payload=_step_payload("SUCCEEDED"),
+            created_at="2026-01-01T00:00:03+00:00",
+        )
+        unit_of_work.complete_run(
+            run_id="run-1",
+            state=ProcessingRunState.COMPLETED,
+            completed_at="2026-01-01T00:00:04+00:00",
+            failure_type=None,
+        )
+        # Buffered writes are invisible until the next step boundary.
+        assert len(run_repo.list_step_artifacts(run_id="run-1")) == 1
+        assert unit_of_work.pending_writes == 2
+
+    assert len(run_repo.list_step_artifacts(run_id="run-1")) == 2
+    completed = run_repo.get_run("run-1")
+    assert completed is not None
+    assert completed.state is ProcessingRunState.COMPLETED
+
+    with pytest.raises(RuntimeError):
+        with run_repo.run_unit_of_work() as unit_of_work:
+            unit_of_work.append_artifact(
+                run_id="run-2",
+                artifact_type="STEP_STATUS",
+                payload=_step_payload("RUNNING"),
+                created_at="2026-01-01T00:00:05+00:00",
+            )
+            raise RuntimeError("cancelled")
+
+    assert run_repo.list_step_artifacts(run_id="run-2") == []
+
+
+def test_sqlite_run_repo_finds_interpreted_runs_by_content_hash(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    monkeypatch.setenv("VET_RECORDS_DB_PATH", str(tmp_path / "dedup.db"))
+    database.ensure_schema()
+    doc_repo = SqliteDocumentRepo()
+    run_repo = SqliteRunRepo()
+    for document_id in ("doc-1", "doc-2"):
+        _seed_document(doc_repo, document_id=document_id, content_sha256="abc123")
+    for run_id, document_id in (("run-1", "doc-1"), ("run-2", "doc-1")):
+        run_repo.create_processing_run(
+            run_id=run_id,
+            document_id=document_id,
+            state=ProcessingRunState.RUNNING,
+            created_at="2026-01-01T00:00:01+00:00",
+            started_at="2026-01-01T00:00:01+00:00",
+        )
+        run_repo.complete_run(
+            run_id=run_id,
+            state=ProcessingRunState.COMPLETED,
+            completed_at=f"2026-01-01T00:00:0{run_id[-1]}+00:00",
+            failure_type=None,
+        )
+    for version in (1, 2):
+        run_repo.append_artifact(
+            run_id="run-1",
+            artifact_type="STRUCTURED_INTERPRETATION",
+            payload={"version_number": version},
+            created_at=f"2026-01-01T00:00:1{version}+00:00",
+        )
+
+    # run-2 is newer but never produced an interpretation, so it cannot be reused.
+    match = run_repo.get_latest_completed_run_by_content_hash(
+        content_sha256="abc123", exclude_document_id="doc-2"
+    )
+    assert match is not None
+    assert (match.document_id, match.run_id) == ("doc-1", "run-1")
+    assert match.started_at == "2026-01-01T00:00:01+00:00"
+    assert (
+        run_repo.get_latest_completed_run_by_content_hash(
+            content_sha256="abc123", exclude_document_id="doc-1"
+        )
+        is None
+    )
+    assert run_repo.get_latest_completed_run_by_content_hash(content_sha256="other") is None
+    first = run_repo.get_first_artifact_payload(
+        run_id="run-1", artifact_type="STRUCTURED_INTERPRETATION"
+    )
+    assert first == {"version_number": 1}
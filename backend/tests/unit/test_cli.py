@@ -1,8 +1,16 @@
 from __future__ import annotations
 
+import json
 from pathlib import Path
 
 from backend.app import cli
+from backend.app.application.processing.scheduler import RunLease
+from backend.app.domain.models import (
+    ReinterpretationJob,
+    ReinterpretationJobFilters,
+    ReinterpretationJobState,
+    ReviewStatus,
+)
 
 
 def test_db_schema_command_ensures_schema_and_prints_status(monkeypatch, capsys) -> None:
@@ -64,3 +72,93 @@ def test_config_check_command_prints_resolved_config(monkeypatch, capsys) -> Non
     assert result == 0
     assert '"ENV": "test"' in output
     assert '"API_TOKEN": "ab***45"' in output
+
+
+def test_worker_command_runs_leased_scheduler(monkeypatch) -> None:
+    captured: dict[str, object] = {}
+
+    async def fake_scheduler(**kwargs) -> None:
+        captured.update(kwargs)
+
+    monkeypatch.setattr(cli.database, "ensure_schema", lambda: None)
+    monkeypatch.setattr(cli, "configure_logging", lambda _level: None)
+    monkeypatch.setattr(cli, "processing_scheduler", fake_scheduler)
+    monkeypatch.setattr(
+        "sys.argv",
+        ["cli", "worker", "--concurrency", "3", "--lease-seconds", "30", "--worker-id", "w-1"],
+    )
+
+    result = cli.main()
+
+    assert result == 0
+    assert captured["max_concurrent_runs"] == 3
+    assert captured["lease_seconds"] == 30.0
+    assert captured["lease_owner"] == "w-1"
+    assert captured["idle_poll_max_seconds"] == cli.WORKER_IDLE_POLL_MAX_SECONDS
+
+
+def test_reinterpret_command_creates_job_and_reports_summary(monkeypatch, capsys) -> None:
+    captured: dict[str, object] = {}
+    job = ReinterpretationJob(
+        job_id="job-1",
+        state=ReinterpretationJobState.COMPLETED,
+        filters=ReinterpretationJobFilters(),
+        created_at="2026-01-01T00:00:00+00:00",
+        updated_at="2026-01-01T00:00:10+00:00",
+        started_at="2026-01-01T00:00:00+00:00",
+        completed_at="2026-01-01T00:00:10+00:00",
+        checkpoint_document_id="doc-4",
+        total_documents=4,
+        processed_documents=4,
+        succeeded_documents=3,
+        failed_documents=1,
+        elapsed_seconds=2.0,
+        failures=({"document_id": "doc-2", "reason": "SOURCE_RAW_TEXT_NOT_AVAILABLE"},),
+    )
+
+    def fake_create_job(*, filters, repository) -> ReinterpretationJob:
+        captured["filters"] = filters
+        return job
+
+    async def fake_execute_job(**kwargs) -> ReinterpretationJob:
+        captured.update(kwargs)
+        return job
+
+    monkeypatch.setattr(cli.database, "ensure_schema", lambda: None)
+    monkeypatch.setattr(cli, "configure_logging", lambda _level: None)
+    monkeypatch.setattr(cli, "create_reinterpretation_job", fake_create_job)
+    monkeypatch.setattr(cli, "execute_reinterpretation_job", fake_execute_job)
+    monkeypatch.setattr(
+        cli,
+        "claim_reinterpretation_job",
+        lambda *, job_id, repository: RunLease(owner=f"reinterpretation:{job_id}:test"),
+    )
+    monkeypatch.setattr(
+        "sys.argv",
+        [
+            "cli",
+            "reinterpret",
+            "--review-status",
+            "IN_REVIEW",
+            "--created-after",
+            "2026-01-01T01:00:00+01:00",
+            "--workers",
+            "3",
+        ],
+    )
+
+    result = cli.main()
+    summary = json.loads(capsys.readouterr().out)
+
+    assert result == 0
+    # Bounds are normalized to the UTC format documents.created_at is stored in.
+    assert captured["filters"] == ReinterpretationJobFilters(
+        review_status=ReviewStatus.IN_REVIEW, created_after="2026-01-01T00:00:00+00:00"
+    )
+    assert captured["job_id"] == "job-1"
+    assert captured["workers"] == 3
+    assert captured["lease"] == RunLease(owner="reinterpretation:job-1:test")
+    assert summary["docs_per_second"] == 2.0
+    assert summary["failures"] == [
+        {"document_id": "doc-2", "reason": "SOURCE_RAW_TEXT_NOT_AVAILABLE"}
+    ]
@@ -187,3 +187,50 @@ def test_confidence_policy_explicit_config_diagnostics_reads_env(monkeypatch) ->
         [],
         [],
     )
+
+
+@pytest.mark.parametrize(
+    ("raw", "expected"),
+    [(None, 4), ("8", 8), (" 1 ", 1), ("0", 4), ("100", 4), ("many", 4)],
+)
+def test_processing_concurrency_bounds(monkeypatch, raw: str | None, expected: int) -> None:
+    if raw is None:
+        monkeypatch.delenv("VET_RECORDS_PROCESSING_CONCURRENCY", raising=False)
+    else:
+        monkeypatch.setenv("VET_RECORDS_PROCESSING_CONCURRENCY", raw)
+    assert app_config.processing_concurrency() == expected
+
+
+def test_processing_executor_mode_and_workers(monkeypatch) -> None:
+    monkeypatch.delenv("VET_RECORDS_PROCESSING_EXECUTOR", raising=False)
+    assert app_config.processing_executor_mode() == "thread"
+    monkeypatch.setenv("VET_RECORDS_PROCESSING_EXECUTOR", "Process")
+    assert app_config.processing_executor_mode() == "process"
+    monkeypatch.setenv("VET_RECORDS_PROCESSING_EXECUTOR", "fork")
+    assert app_config.processing_executor_mode() == "thread"
+
+    monkeypatch.setenv("VET_RECORDS_PROCESSING_WORKERS", "2")
+    assert app_config.processing_process_workers() == 2
+    monkeypatch.setenv("VET_RECORDS_PROCESSING_WORKERS", "0")
+    assert app_config.processing_process_workers() >= 1
+
+
+def test_embedded_scheduler_enabled_flag(monkeypatch) -> None:
+    monkeypatch.delenv("VET_RECORDS_DISABLE_EMBEDDED_SCHEDULER", raising=False)
+    assert app_config.embedded_scheduler_enabled() is True
+    monkeypatch.setenv("VET_RECORDS_DISABLE_EMBEDDED_SCHEDULER", "true")
+    assert app_config.embedded_scheduler_enabled() is False
+
+
+def test_db_pool_settings_bounds(monkeypatch) -> None:
+    monkeypatch.delenv("VET_RECORDS_DB_POOL_SIZE", raising=False)
+    monkeypatch.delenv("VET_RECORDS_DB_STATEMENT_CACHE_SIZE", raising=False)
+    assert app_config.db_pool_size() == app_config.DEFAULT_DB_POOL_SIZE
+    assert app_config.db_statement_cache_size() == app_config.DEFAULT_DB_STATEMENT_CACHE_SIZE
+
+    monkeypatch.setenv("VET_RECORDS_DB_POOL_SIZE", "0")
+    assert app_config.db_pool_size() == 0
+    monkeypatch.setenv("VET_RECORDS_DB_POOL_SIZE", "1000")
+    assert app_config.db_pool_size() == app_config.DEFAULT_DB_POOL_SIZE
+    monkeypatch.setenv("VET_RECORDS_DB_STATEMENT_CACHE_SIZE", "512")
+    assert app_config.db_statement_cache_size() == 512
@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+import sqlite3
+import threading
+from pathlib import Path
+
+import pytest
+
+from backend.app.infra import database
+from backend.app.infra.connection_pool import SqliteConnectionPool
+
+
+def _pool(db_path: Path, *, max_size: int = 2, idle: float = 30.0) -> SqliteConnectionPool:
+    return SqliteConnectionPool(
+        connect=lambda path: database.open_connection(path, cached_statements=16),
+        resolve_path=lambda: db_path,
+        max_size=max_size,
+        health_check_idle_seconds=idle,
+    )
+
+
+def _touch_db(path: Path) -> None:
+    sqlite3.connect(path).close()
+
+
+def test_pool_reuses_connection_per_thread_and_overflows_beyond_size(tmp_path: Path) -> None:
+    db_path = tmp_path / "pool.db"
+    _touch_db(db_path)
+    pool = _pool(db_path, max_size=1)
+
+    with pool.connection() as first:
+        with pool.connection() as nested:
+            assert nested is not first
+    with pool.connection() as again:
+        assert again is first
+
+    other_thread: list[sqlite3.Connection] = []
+
+    def _worker() -> None:
+        with pool.connection() as conn:
+            other_thread.append(conn)
+
+    thread = threading.Thread(target=_worker)
+    thread.start()
+    thread.join()
+
+    assert other_thread[0] is not first
+    stats = pool.stats()
+    assert stats.open_connections == 1
+    assert stats.in_use == 0
+    assert stats.reused == 1
+    assert stats.overflow == 2
+    assert stats.opened == 3
+
+
+def test_pool_rolls_back_open_transactions_on_release(tmp_path: Path) -> None:
+    db_path = tmp_path / "pool.db"
+    _touch_db(db_path)
+    pool = _pool(db_path)
+
+    with pool.connection() as conn:
+        conn.execute("CREATE TABLE items (id INTEGER)")
+        conn.commit()
+        conn.execute("INSERT INTO items VALUES (1)")
+
+    with pool.connection() as conn:
+        assert not conn.in_transaction
+        assert conn.execute("SELECT COUNT(*) FROM items").fetchone()[0] == 0
+
+
+def test_pool_keeps_connection_after_integrity_errors_only(tmp_path: Path) -> None:
+    db_path = tmp_path / "pool.db"
+    _touch_db(db_path)
+    pool = _pool(db_path)
+
+    with pool.connection() as first:
+        first.execute("CREATE TABLE items (id INTEGER PRIMARY KEY)")
+        first.execute("INSERT INTO items VALUES (1)")
+        first.commit()
+    with pytest.raises(sqlite3.IntegrityError):
+        with pool.connection() as conn:
+            conn.execute("INSERT INTO items VALUES (2)")
+            conn.execute("INSERT INTO items VALUES (1)")
+
+    with pool.connection() as conn:
+        assert conn is first
+        assert not conn.in_transaction
+        assert conn.execute("SELECT COUNT(*) FROM items").fetchone()[0] == 1
+    assert pool.stats().discarded == 0
+
+    with pytest.raises(sqlite3.OperationalError):
+        with pool.connection() as conn:
+            conn.execute("SELECT * FROM missing_table")
+    with pool.connection() as conn:
+        assert conn is not first
+    assert pool.stats().discarded == 1
+
+
+def test_pool_replaces_connection_after_reset_file_change_or_failed_health_check(
+    tmp_path: Path,
+) -> None:
+    db_path = tmp_path / "pool.db"
+    _touch_db(db_path)
+    pool = _pool(db_path, idle=0.0)
+
+    with pool.connection() as first:
+        pass
+    pool.reset()
+    with pool.connection() as after_reset:
+        assert after_reset is not first
+
+    db_path.unlink()
+    _touch_db(db_path)
+    with pool.connection() as after_replace:
+        assert after_replace is not after_reset
+
+    after_replace.close()
+    with pool.connection() as after_health_check:
+        after_health_check.execute("SELECT 1")
+
+    assert pool.stats().health_check_failures == 1
+    assert pool.stats().open_connections == 1
+
+
+def test_get_connection_uses_process_pool(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    monkeypatch.setenv("VET_RECORDS_DB_PATH", str(tmp_path / "documents.db"))
+    monkeypatch.setenv("VET_RECORDS_DB_POOL_SIZE", "3")
+    database.reset_connection_pool()
+    try:
+        database.ensure_schema()
+        with database.get_connection() as first:
+            pass
+        with database.get_connection() as second:
+            assert second is first
+        assert database.connection_pool_stats().max_size == 3
+    finally:
+        database.reset_connection_pool()
@@ -1,17 +1,22 @@
 from __future__ import annotations
 
+import hashlib
 from pathlib import Path
 
+import pytest
+
 from backend.app.application import document_service, documents
 from backend.app.application.document_service import (
     _normalize_visit_date_candidate,
     _project_review_payload_to_canonical,
     get_document_original_location,
+    get_document_review,
     get_document_status_details,
     mark_document_reviewed,
     register_document_upload,
     reopen_document_review,
 )
+from backend.app.application.documents import review_payload_projector
 from backend.app.domain.models import (
     Document,
     ProcessingRunDetails,
@@ -20,7 +25,7 @@ from backend.app.domain.models import (
     ProcessingStatus,
     ReviewStatus,
 )
-from backend.app.ports.file_storage import StoredFile
+from backend.app.ports.file_storage import StagedUpload, StoredFile
 
 
 def test_document_service_re_exports_stay_in_sync_with_documents_package() -> None:
@@ -92,8 +97,14 @@ class FakeDocumentRepository:
 
 
 class FakeFileStorage:
-    def save(self, *, document_id: str, content: bytes) -> StoredFile:
-        return StoredFile(storage_path=f"{document_id}/original.pdf", file_size=len(content))
+    def __init__(self) -> None:
+        self.discarded: list[StagedUpload] = []
+
+    def commit_upload(self, *, staged: StagedUpload, document_id: str) -> StoredFile:
+        return StoredFile(storage_path=f"{document_id}/original.pdf", file_size=staged.file_size)
+
+    def discard_upload(self, *, staged: StagedUpload) -> None:
+        self.discarded.append(staged)
 
     def delete(self, *, storage_path: str) -> None:
         return None
@@ -117,6 +128,14 @@ class FakeFileStorage:
         return False
 
 
+def _staged_upload(content: bytes) -> StagedUpload:
+    return StagedUpload(
+        staging_path=".staging/upload.part",
+        file_size=len(content),
+        content_sha256=hashlib.sha256(content).hexdigest(),
+    )
+
+
 def test_register_document_upload_persists_document_and_returns_response_fields() -> None:
     repository = FakeDocumentRepository()
     storage = FakeFileStorage()
@@ -124,7 +143,7 @@ def test_register_document_upload_persists_document_and_returns_response_fields(
     result = register_document_upload(
         filename="record.pdf",
         content_type="application/pdf",
-        content=b"%PDF-1.5 sample",
+        upload=_staged_upload(b"%PDF-1.5 sample"),
         repository=repository,
         storage=storage,
         id_provider=lambda: "doc-123",
@@ -145,6 +164,8 @@ def test_register_document_upload_persists_document_and_returns_response_fields(
     assert created.created_at == "2026-02-02T09:00:00+00:00"
     assert created.updated_at == "2026-02-02T09:00:00+00:00"
     assert created.review_status == ReviewStatus.IN_REVIEW
+    assert created.content_sha256 == hashlib.sha256(b"%PDF-1.5 sample").hexdigest()
+    assert result.content_sha256 == created.content_sha256
     assert status == ProcessingStatus.UPLOADED
 
 
@@ -155,7 +176,7 @@ def test_register_document_upload_uses_provided_id_and_time_sources() -> None:
     result = register_document_upload(
         filename="x.pdf",
         content_type="application/pdf",
-        content=b"data",
+        upload=_staged_upload(b"data"),
         repository=repository,
         storage=storage,
         id_provider=lambda: "fixed-id",
@@ -613,3 +634,90 @@ def test_project_review_payload_derives_latest_weight_from_raw_text() -> None:
     assert derived["field_id"] == "derived-weight-current"
     assert derived["value"] == "7.8 kg"
     assert derived["origin"] == "derived"
+
+
+def test_get_document_review_serves_materialized_projection_and_recomputes_stale_ones(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    document = Document(
+        document_id="doc-projection",
+        original_filename="record.pdf",
+        content_type="application/pdf",
+        file_size=10,
+        storage_path="doc-projection/original.pdf",
+        created_at="2026-02-02T09:00:00+00:00",
+        updated_at="2026-02-02T09:00:00+00:00",
+        review_status=ReviewStatus.IN_REVIEW,
+    )
+    interpretation = {
+        "interpretation_id": "interp-1",
+        "version_number": 2,
+        "data": {"fields": [], "visits": [], "other_fields": []},
+    }
+
+    class StubRepository(FakeDocumentRepository):
+        def __init__(self) -> None:
+            super().__init__()
+            self.artifacts: dict[str, dict[str, object]] = {
+                "STRUCTURED_INTERPRETATION": interpretation
+            }
+
+        def get(self, document_id: str) -> Document | None:
+            return document
+
+        def get_latest_completed_run(self, document_id: str) -> ProcessingRunDetails | None:
+            return ProcessingRunDetails(
+                run_id="run-projection",
+                document_id=document_id,
+                state=ProcessingRunState.COMPLETED,
+                created_at="2026-02-02T09:00:00+00:00",
+                started_at="2026-02-02T09:00:01+00:00",
+                completed_at="2026-02-02T09:00:02+00:00",
+                failure_type=None,
+            )
+
+        def get_latest_artifact_payload(
+            self, *, run_id: str, artifact_type: str
+        ) -> dict[str, object] | None:
+            return self.artifacts.get(artifact_type)
+
+        def append_artifact(
+            self,
+            *,
+            run_id: str,
+            artifact_type: str,
+            payload: dict[str, object],
+            created_at: str,
+        ) -> None:
+            self.artifacts[artifact_type] = payload
+
+    repository = StubRepository()
+    first = get_document_review(
+        document_id="doc-projection", repository=repository, storage=FakeFileStorage()
+    )
+    stored = repository.artifacts["REVIEW_PROJECTION"]
+    assert stored["projector_version"] == review_payload_projector.REVIEW_PROJECTOR_VERSION
+    assert (stored["interpretation_id"], stored["version_number"]) == ("interp-1", 2)
+
+    def _fail_projection(*_args: object, **_kwargs: object) -> dict[str, object]:
+        raise AssertionError("projection should be served from the stored artifact")
+
+    monkeypatch.setattr(
+        review_payload_projector, "_normalize_review_interpretation_data", _fail_projection
+    )
+    second = get_document_review(
+        document_id="doc-projection", repository=repository, storage=FakeFileStorage()
+    )
+    assert first is not None and second is not None
+    assert first.review is not None and second.review is not None
+    assert second.review.active_interpretation.data == first.review.active_interpretation.data
+
+    monkeypatch.undo()
+    repository.artifacts["REVIEW_PROJECTION"] = {**stored, "projector_version": "0"}
+    get_document_review(
+        document_id="doc-projection", repository=repository, storage=FakeFileStorage()
+    )
+    assert (
+        repository.artifacts["REVIEW_PROJECTION"]["projector_version"]
+        == review_payload_projector.REVIEW_PROJECTOR_VERSION
+    )
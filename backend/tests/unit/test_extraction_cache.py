@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+from backend.app.infra.extraction_cache import LocalExtractionCache
+from backend.app.ports.file_storage import ExtractionCacheKey
+
+
+def _key(content_sha256: str, *, extractor_version: str = "1") -> ExtractionCacheKey:
+    return ExtractionCacheKey(
+        content_sha256=content_sha256,
+        extractor="fallback",
+        extractor_version=extractor_version,
+        limits="seconds=20.0",
+    )
+
+
+def test_extraction_cache_counts_hits_and_misses_per_key(tmp_path: Path) -> None:
+    cache = LocalExtractionCache(root=tmp_path, max_bytes=1024)
+    cache.put(_key("a"), "Paciente: Luna")
+
+    assert cache.get(_key("a")) == "Paciente: Luna"
+    assert cache.get(_key("a", extractor_version="2")) is None
+    assert cache.get(_key("b")) is None
+
+    stats = cache.stats()
+    assert (stats.hits, stats.misses, stats.entries, stats.size_bytes) == (1, 2, 1, 14)
+    assert stats.hit_rate == 1 / 3
+
+
+def test_extraction_cache_keeps_page_starts_of_multi_page_entries(tmp_path: Path) -> None:
+    cache = LocalExtractionCache(root=tmp_path, max_bytes=50)
+    cache.put(_key("a"), "Paciente: Luna\nEspecie: canino", page_starts=(0, 15))
+    cache.put(_key("b"), "Paciente: Kira")
+
+    entry = cache.get_entry(_key("a"))
+    assert entry is not None and entry.page_starts == (0, 15)
+    entry = cache.get_entry(_key("b"))
+    assert entry is not None and entry.page_starts == (0,)
+    assert len(list(tmp_path.glob("*/*.pages.json"))) == 1
+
+    # Evicting the text evicts its page starts with it.
+    cache.put(_key("c"), "c" * 16)
+    assert cache.get_entry(_key("a")) is None
+    assert list(tmp_path.glob("*/*.pages.json")) == []
+
+
+def test_extraction_cache_keeps_fallback_pages_and_reads_legacy_page_files(
+    tmp_path: Path,
+) -> None:
+    cache = LocalExtractionCache(root=tmp_path, max_bytes=1024)
+    cache.put(_key("a"), "Paciente: Luna", fallback_pages=(1,))
+    cache.put(_key("b"), "Paciente: Luna\nEspecie: canino", page_starts=(0, 15))
+
+    entry = cache.get_entry(_key("a"))
+    assert entry is not None
+    assert (entry.page_starts, entry.fallback_pages) == ((0,), (1,))
+
+    # Entries cached before fallback pages were recorded hold bare page starts.
+    digest = _key("b").digest()
+    (tmp_path / digest[:2] / f"{digest}.pages.json").write_text("[0, 15]", encoding="utf-8")
+    entry = cache.get_entry(_key("b"))
+    assert entry is not None
+    assert (entry.page_starts, entry.fallback_pages) == ((0, 15), ())
+
+
+def test_extraction_cache_evicts_least_recently_used_entries_over_budget(
+    tmp_path: Path,
+) -> None:
+    cache = LocalExtractionCache(root=tmp_path, max_bytes=20)
+    cache.put(_key("a"), "a" * 8)
+    cache.put(_key("b"), "b" * 8)
+    assert cache.get(_key("a")) == "a" * 8
+
+    cache.put(_key("c"), "c" * 8)
+
+    assert cache.get(_key("b")) is None
+    assert cache.get(_key("a")) == "a" * 8
+    assert cache.get(_key("c")) == "c" * 8
+    assert cache.stats().size_bytes == 16
+    cache.put(_key("huge"), "x" * 21)
+    assert cache.get(_key("huge")) is None
+
+
+def test_extraction_cache_restores_recency_order_from_disk(tmp_path: Path) -> None:
+    first = LocalExtractionCache(root=tmp_path, max_bytes=20)
+    first.put(_key("a"), "a" * 8)
+    first.put(_key("b"), "b" * 8)
+    for offset, content_sha256 in enumerate(("b", "a")):
+        entry = next(tmp_path.glob(f"*/{_key(content_sha256).digest()}.txt"))
+        os.utime(entry, (1_000_000 + offset, 1_000_000 + offset))
+
+    restarted = LocalExtractionCache(root=tmp_path, max_bytes=20)
+    restarted.put(_key("c"), "c" * 8)
+
+    assert restarted.get(_key("b")) is None
+    assert restarted.get(_key("a")) == "a" * 8
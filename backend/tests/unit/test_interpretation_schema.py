@@ -12,6 +12,7 @@ from backend.app.application.processing_runner import (
     _build_interpretation_artifact,
     _mine_interpretation_candidates,
 )
+from backend.app.domain.raw_text_index import RawTextIndex
 
 _SHARED_CONTRACT_PATH = (
     Path(__file__).resolve().parents[3] / "shared" / "global_schema_contract.json"
@@ -63,22 +64,18 @@ def test_interpretation_artifact_contains_full_global_schema_shape() -> None:
 
 
 def test_interpretation_artifact_does_not_use_context_key_fallback_for_calibration() -> None:
-    pet_name_lookup_count = 0
+    context_lookups: list[str] = []
 
     class FakeRepository:
-        def get_calibration_counts(
+        def get_calibration_counts_for_context(
             self,
             *,
             context_key: str,
-            field_key: str,
-            mapping_id: str | None,
             policy_version: str,
-        ) -> tuple[int, int] | None:
-            nonlocal pet_name_lookup_count
-            if field_key != "pet_name":
-                return None
-            pet_name_lookup_count += 1
-            return None
+        ) -> dict[tuple[str, str | None], tuple[int, int]]:
+            _ = policy_version
+            context_lookups.append(context_key)
+            return {}
 
     payload = _build_interpretation_artifact(
         document_id="doc-fallback-calibration",
@@ -92,7 +89,7 @@ def test_interpretation_artifact_does_not_use_context_key_fallback_for_calibrati
         for field in payload["data"]["fields"]
         if isinstance(field, dict) and field.get("key") == "pet_name"
     )
-    assert pet_name_lookup_count == 1
+    assert len(context_lookups) == 1
     assert pet_name_field["field_review_history_adjustment"] == 0
 
 
@@ -148,7 +145,7 @@ def test_candidate_bundle_is_persisted_when_debug_flag_enabled(monkeypatch) -> N
 def test_candidate_suggestions_are_ordered_and_capped_to_top_five(monkeypatch) -> None:
     monkeypatch.setattr(
         "backend.app.application.processing.interpretation._mine_interpretation_candidates",
-        lambda _raw_text: {
+        lambda _raw_text, _raw_text_index: {
             "pet_name": [
                 {"value": "Milo", "confidence": 0.72, "evidence": {"page": 1, "snippet": "Milo"}},
                 {"value": "Luna", "confidence": 0.91, "evidence": {"page": 1, "snippet": "Luna"}},
@@ -180,7 +177,7 @@ def test_candidate_suggestions_are_ordered_and_capped_to_top_five(monkeypatch) -
 def test_candidate_suggestions_are_omitted_when_field_has_no_candidates(monkeypatch) -> None:
     monkeypatch.setattr(
         "backend.app.application.processing.interpretation._mine_interpretation_candidates",
-        lambda _raw_text: {},
+        lambda _raw_text, _raw_text_index: {},
     )
     monkeypatch.setattr(
         "backend.app.application.processing.interpretation._map_candidates_to_global_schema",
@@ -209,6 +206,17 @@ def test_microchip_heuristic_extracts_digits_from_keyworded_line() -> None:
     assert microchip_candidates[0]["value"] == "00023035139"
 
 
+def test_candidate_evidence_page_is_resolved_from_the_raw_text_index() -> None:
+    raw_text = "Paciente: Luna\nMicrochip: 00023035139 NHC"
+    index = RawTextIndex.build(raw_text, page_starts=(0, 15))
+
+    candidates = _mine_interpretation_candidates(raw_text, index)
+
+    assert candidates["microchip_id"][0]["evidence"]["page"] == 2
+    assert candidates["pet_name"][0]["evidence"]["page"] == 1
+    assert _mine_interpretation_candidates(raw_text)["microchip_id"][0]["evidence"]["page"] == 1
+
+
 def test_microchip_heuristic_skips_owner_address_without_chip_digits() -> None:
     candidates = _mine_interpretation_candidates("BEATRIZ ABARCA C/ ORTEGA")
 
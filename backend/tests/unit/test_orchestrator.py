@@ -1,14 +1,22 @@
 from __future__ import annotations
 
 import asyncio
+from collections.abc import Iterator
 from pathlib import Path
 from types import SimpleNamespace
-from unittest.mock import Mock
+from unittest.mock import AsyncMock, Mock
 
 import pytest
 
 from backend.app.application.processing import orchestrator
 from backend.app.domain.models import ProcessingRun, ProcessingRunState
+from backend.app.infra.file_storage import LocalFileStorage
+
+
+def _streamed_text(text: str):
+    return lambda *_args: orchestrator.pdf_extraction.StreamedPdfText(
+        text=text, extractor="fitz", pages=1, aborted=False
+    )
 
 
 def _build_run() -> ProcessingRun:
@@ -138,14 +146,17 @@ def test_process_document_fails_for_low_quality_extraction(monkeypatch: pytest.M
     repository = Mock()
     storage = Mock()
     sample_pdf = Path(__file__)
-    repository.get.return_value = SimpleNamespace(storage_path="doc/original.pdf")
+    repository.get.return_value = SimpleNamespace(
+        storage_path="doc/original.pdf", content_sha256=None
+    )
     storage.exists.return_value = True
     storage.resolve.return_value = sample_pdf
+    storage.read_cached_extraction.return_value = None
 
     monkeypatch.setattr(
         orchestrator.pdf_extraction,
-        "_extract_pdf_text_with_extractor",
-        lambda _path: ("texto ilegible", "fitz"),
+        "_stream_pdf_text_with_extractor",
+        _streamed_text("texto ilegible"),
     )
     monkeypatch.setattr(
         orchestrator,
@@ -170,14 +181,17 @@ def test_process_document_marks_interpretation_failed_for_builder_errors(
     repository = Mock()
     storage = Mock()
     sample_pdf = Path(__file__)
-    repository.get.return_value = SimpleNamespace(storage_path="doc/original.pdf")
+    repository.get.return_value = SimpleNamespace(
+        storage_path="doc/original.pdf", content_sha256=None
+    )
     storage.exists.return_value = True
     storage.resolve.return_value = sample_pdf
+    storage.read_cached_extraction.return_value = None
 
     monkeypatch.setattr(
         orchestrator.pdf_extraction,
-        "_extract_pdf_text_with_extractor",
-        lambda _path: ("texto valido", "fitz"),
+        "_stream_pdf_text_with_extractor",
+        _streamed_text("texto valido"),
     )
     monkeypatch.setattr(
         orchestrator,
@@ -235,3 +249,230 @@ def test_persist_observability_snapshot_skips_or_handles_invalid_payload(
     )
 
     persist_spy.assert_not_called()
+
+
+def test_process_document_reinterprets_stored_raw_text_without_extraction(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    repository = Mock()
+    storage = Mock()
+    raw_text_path = tmp_path / "raw-text.txt"
+    raw_text_path.write_text("Paciente: Luna", encoding="utf-8")
+    storage.resolve_raw_text.return_value = raw_text_path
+    built_from: list[str] = []
+
+    def _fail_extraction(*_args):
+        pytest.fail("interpretation-only runs must not extract the PDF")
+
+    def _build(*, raw_text: str, **_kwargs):
+        built_from.append(raw_text)
+        return {"interpretation_id": "interp-1", "version_number": 1, "data": {}}
+
+    monkeypatch.setattr(
+        orchestrator.pdf_extraction, "_stream_pdf_text_with_extractor", _fail_extraction
+    )
+    monkeypatch.setattr(orchestrator, "_build_interpretation_artifact", _build)
+    monkeypatch.setattr(orchestrator, "_materialize_review_projection", AsyncMock())
+
+    asyncio.run(
+        orchestrator._process_document(
+            run_id="run-2",
+            document_id="doc-1",
+            repository=repository,
+            storage=storage,
+            source_run_id="run-1",
+        )
+    )
+
+    assert built_from == ["Paciente: Luna"]
+    storage.link_raw_text.assert_called_once_with(
+        source_document_id="doc-1", source_run_id="run-1", document_id="doc-1", run_id="run-2"
+    )
+    steps = [
+        call.kwargs["payload"]
+        for call in repository.append_artifact.call_args_list
+        if call.kwargs["artifact_type"] == "STEP_STATUS"
+    ]
+    assert [(step["step_name"], step["step_status"]) for step in steps] == [
+        ("EXTRACTION", "SUCCEEDED"),
+        ("INTERPRETATION", "RUNNING"),
+        ("INTERPRETATION", "SUCCEEDED"),
+    ]
+    for step in steps:
+        assert step["details"] == {"reused_from": {"document_id": "doc-1", "run_id": "run-1"}}
+
+
+def test_process_document_reuses_cached_extraction_of_identical_pdf(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    monkeypatch.setenv("VET_RECORDS_STORAGE_PATH", str(tmp_path / "storage"))
+    monkeypatch.setenv("PDF_EXTRACTOR_FORCE", "fallback")
+    storage = LocalFileStorage()
+    pdf_path = storage.resolve(storage_path="doc-1/original.pdf")
+    pdf_path.parent.mkdir(parents=True)
+    pdf_path.write_bytes(b"%PDF-1.5 sample")
+    repository = Mock()
+    repository.get.return_value = SimpleNamespace(
+        storage_path="doc-1/original.pdf", content_sha256="a" * 64
+    )
+    extracted: list[Path] = []
+
+    def _extract(path: Path) -> tuple[Iterator[str], str]:
+        extracted.append(path)
+        return (page for page in ["Paciente: Luna", "Especie: canino"]), "fallback"
+
+    built_page_starts: list[tuple[int, ...]] = []
+
+    def _build(*, raw_text_index, **_kwargs):
+        built_page_starts.append(raw_text_index.page_starts)
+        return {"interpretation_id": "interp-1", "version_number": 1, "data": {}}
+
+    monkeypatch.setattr(
+        orchestrator.pdf_extraction, "_iter_pdf_page_texts_with_extractor", _extract
+    )
+    monkeypatch.setattr(
+        orchestrator, "evaluate_extracted_text_quality", lambda _text: (1.0, True, [])
+    )
+    monkeypatch.setattr(orchestrator, "_build_interpretation_artifact", _build)
+    monkeypatch.setattr(orchestrator, "_materialize_review_projection", AsyncMock())
+
+    for run_id in ("run-1", "run-2"):
+        asyncio.run(
+            orchestrator._process_document(
+                run_id=run_id,
+                document_id="doc-1",
+                repository=repository,
+                storage=storage,
+            )
+        )
+
+    assert extracted == [pdf_path]
+    raw_text_path = storage.resolve_raw_text(document_id="doc-1", run_id="run-2")
+    assert raw_text_path.read_text(encoding="utf-8") == "Paciente: Luna\nEspecie: canino"
+    # Page boundaries survive the cache round trip into the second run's index.
+    assert built_page_starts == [(0, 15), (0, 15)]
+    index = storage.read_raw_text_index(document_id="doc-1", run_id="run-2")
+    assert index is not None and index.page_starts == (0, 15)
+    assert storage.read_raw_text_page(document_id="doc-1", run_id="run-2", page=2) == (
+        "Especie: canino"
+    )
+    stats = storage.extraction_cache_stats()
+    assert (stats.hits, stats.misses, stats.entries) == (1, 1, 1)
+
+
+def test_process_document_reports_fallback_pages_of_cached_extractions(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    monkeypatch.setenv("VET_RECORDS_STORAGE_PATH", str(tmp_path / "storage"))
+    monkeypatch.delenv("PDF_EXTRACTOR_FORCE", raising=False)
+    storage = LocalFileStorage()
+    pdf_path = storage.resolve(storage_path="doc-1/original.pdf")
+    pdf_path.parent.mkdir(parents=True)
+    pdf_path.write_bytes(b"%PDF-1.5 sample")
+    repository = Mock()
+    repository.get.return_value = SimpleNamespace(
+        storage_path="doc-1/original.pdf", content_sha256="a" * 64
+    )
+
+    def _recover_second_page(_path, page_texts, fallback_pages):
+        fallback_pages.append(2)
+        return page_texts
+
+    monkeypatch.setattr(
+        orchestrator.pdf_extraction,
+        "_pdf_extractor_identity",
+        lambda: ("fitz", "1.24.0", "page_fallback=3"),
+    )
+    monkeypatch.setattr(
+        orchestrator.pdf_extraction,
+        "_iter_pdf_page_texts_with_extractor",
+        lambda _path: ((page for page in ["Paciente: Luna", "Especie: canino"]), "fitz"),
+    )
+    monkeypatch.setattr(
+        orchestrator.pdf_extraction, "_iter_pages_with_fallback", _recover_second_page
+    )
+    monkeypatch.setattr(
+        orchestrator, "evaluate_extracted_text_quality", lambda _text: (1.0, True, [])
+    )
+    monkeypatch.setattr(
+        orchestrator,
+        "_build_interpretation_artifact",
+        lambda **_kwargs: {"interpretation_id": "interp-1", "version_number": 1, "data": {}},
+    )
+    monkeypatch.setattr(orchestrator, "_materialize_review_projection", AsyncMock())
+
+    for run_id in ("run-1", "run-2"):
+        asyncio.run(
+            orchestrator._process_document(
+                run_id=run_id,
+                document_id="doc-1",
+                repository=repository,
+                storage=storage,
+            )
+        )
+
+    extraction_details = [
+        call.kwargs["payload"]["details"]
+        for call in repository.append_artifact.call_args_list
+        if call.kwargs["artifact_type"] == "STEP_STATUS"
+        and call.kwargs["payload"]["step_name"] == "EXTRACTION"
+        and call.kwargs["payload"]["step_status"] == "SUCCEEDED"
+    ]
+    # The cache hit of run-2 reports the same provenance as the extraction of run-1.
+    assert (
+        extraction_details
+        == [
+            {
+                "extractor": "fitz",
+                "fallback_pages": [2],
+                "extractor_identity": {
+                    "extractor": "fitz",
+                    "extractor_version": "1.24.0",
+                    "limits": "page_fallback=3",
+                },
+            }
+        ]
+        * 2
+    )
+    assert storage.extraction_cache_stats().hits == 1
+
+
+def test_process_document_aborts_unreadable_pdf_early_and_discards_staged_text(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    monkeypatch.setenv("VET_RECORDS_STORAGE_PATH", str(tmp_path / "storage"))
+    monkeypatch.setenv("VET_RECORDS_EXTRACTION_EARLY_ABORT_PAGES", "2")
+    storage = LocalFileStorage()
+    pdf_path = storage.resolve(storage_path="doc-1/original.pdf")
+    pdf_path.parent.mkdir(parents=True)
+    pdf_path.write_bytes(b"%PDF-1.5 scanned")
+    repository = Mock()
+    repository.get.return_value = SimpleNamespace(
+        storage_path="doc-1/original.pdf", content_sha256=None
+    )
+    consumed: list[int] = []
+
+    def _scanned_pages(_path):
+        for index in range(10):
+            consumed.append(index)
+            yield ""
+
+    monkeypatch.setattr(
+        orchestrator.pdf_extraction,
+        "_iter_pdf_page_texts_with_extractor",
+        lambda path: (_scanned_pages(path), "fitz"),
+    )
+
+    with pytest.raises(orchestrator.ProcessingError, match="EXTRACTION_LOW_QUALITY"):
+        asyncio.run(
+            orchestrator._process_document(
+                run_id="run-1",
+                document_id="doc-1",
+                repository=repository,
+                storage=storage,
+            )
+        )
+
+    assert consumed == [0, 1]
+    raw_text_path = storage.resolve_raw_text(document_id="doc-1", run_id="run-1")
+    assert list(raw_text_path.parent.iterdir()) == []
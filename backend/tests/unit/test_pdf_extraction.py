@@ -1,12 +1,36 @@
 from __future__ import annotations
 
+import mmap
+import os
 import sys
+import tracemalloc
+import zlib
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
 from types import SimpleNamespace
 
 import pytest
 
-from backend.app.application.processing import pdf_extraction
+from backend.app.application.processing import (
+    execution,
+    pdf_cmap_parsing,
+    pdf_extraction,
+    pdf_extraction_nodeps,
+    pdf_fallback_shared,
+    pdf_page_structure,
+    pdf_text_decoder,
+    pdf_text_quality,
+)
+from backend.app.application.processing.pdf_object_index import (
+    PdfObjectIndex,
+    _undo_png_predictor,
+)
+
+FIXTURES_DIR = Path(__file__).resolve().parents[1] / "fixtures" / "pdfs"
+
+
+def _crash_page_worker(*_args: object) -> None:
+    os._exit(1)
 
 
 def test_extract_pdf_text_returns_text_from_pair(
@@ -95,6 +119,195 @@ def test_extract_pdf_text_with_fitz_wraps_runtime_failures(
         pdf_extraction._extract_pdf_text_with_fitz(sample)
 
 
+def test_pdf_extractor_identity_tracks_fallback_limits_of_page_fallback(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    pytest.importorskip("fitz")
+    monkeypatch.delenv(pdf_extraction.PDF_EXTRACTOR_FORCE_ENV, raising=False)
+    identity = pdf_extraction._pdf_extractor_identity()
+
+    monkeypatch.setattr(pdf_fallback_shared, "MAX_TEXT_CHUNKS", 7)
+    changed = pdf_extraction._pdf_extractor_identity()
+
+    assert identity is not None and changed is not None
+    assert identity[0] == changed[0] == "fitz"
+    assert identity[2] != changed[2]
+    assert "chunks=7;" in changed[2]
+    monkeypatch.setenv(pdf_extraction.PDF_EXTRACTOR_FORCE_ENV, "fitz")
+    assert pdf_extraction._pdf_extractor_identity() == ("fitz", changed[1], "")
+
+
+def test_extract_pdf_text_with_fitz_shards_large_documents_across_page_workers(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    fitz = pytest.importorskip("fitz")
+    sample = tmp_path / "large.pdf"
+    with fitz.open() as document:
+        for index in range(20):
+            document.new_page().insert_text((72, 72), f"Pagina {index} de la historia clinica")
+        document.save(sample)
+    monkeypatch.setenv("VET_RECORDS_FITZ_PAGE_WORKERS", "1")
+    sequential = pdf_extraction._extract_pdf_text_with_fitz(sample)
+
+    monkeypatch.setenv("VET_RECORDS_FITZ_PAGE_WORKERS", "2")
+    monkeypatch.setenv("VET_RECORDS_FITZ_PARALLEL_MIN_PAGES", "16")
+    assert pdf_extraction._fitz_page_shards(15) is None
+    assert pdf_extraction._fitz_page_shards(20) == [(0, 10), (10, 20)]
+    with monkeypatch.context() as worker:
+        worker.setattr(execution, "_in_processing_worker", True)
+        assert pdf_extraction._fitz_page_shards(20) is None
+    try:
+        sharded = pdf_extraction._extract_pdf_text_with_fitz(sample)
+    finally:
+        pdf_extraction.shutdown_fitz_page_pool()
+
+    assert sharded == sequential
+    assert "Pagina 0 " in sharded and "Pagina 19 " in sharded
+
+
+def test_extract_fitz_pages_in_parallel_falls_back_to_sequential_on_pool_failure(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    fitz = pytest.importorskip("fitz")
+    sample = tmp_path / "sample.pdf"
+    with fitz.open() as document:
+        document.new_page().insert_text((72, 72), "Paciente: Luna")
+        document.save(sample)
+
+    def _broken_pool():
+        raise RuntimeError("pool unavailable")
+
+    monkeypatch.setattr(pdf_extraction, "_get_fitz_page_pool", _broken_pool)
+
+    assert list(pdf_extraction._iter_fitz_pages_in_parallel(sample, [(0, 1)])) == [
+        "Paciente: Luna\n"
+    ]
+
+
+def test_fitz_page_pool_is_replaced_after_a_worker_crash(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    fitz = pytest.importorskip("fitz")
+    sample = tmp_path / "sample.pdf"
+    with fitz.open() as document:
+        document.new_page().insert_text((72, 72), "Paciente: Luna")
+        document.save(sample)
+    monkeypatch.setenv("VET_RECORDS_FITZ_PAGE_WORKERS", "2")
+    extract_range = pdf_extraction._extract_fitz_page_range
+    extract_fallback_page = pdf_extraction._extract_fallback_page_text
+    try:
+        monkeypatch.setattr(pdf_extraction, "_extract_fitz_page_range", _crash_page_worker)
+        assert list(pdf_extraction._iter_fitz_pages_in_parallel(sample, [(0, 1)])) == [
+            "Paciente: Luna\n"
+        ]
+        assert pdf_extraction._fitz_page_pool is None
+
+        monkeypatch.setattr(pdf_extraction, "_extract_fitz_page_range", extract_range)
+        assert list(pdf_extraction._iter_fitz_pages_in_parallel(sample, [(0, 1)])) == [
+            "Paciente: Luna\n"
+        ]
+        broken_pool = pdf_extraction._fitz_page_pool
+        assert broken_pool is not None
+
+        monkeypatch.setattr(pdf_extraction, "_extract_fallback_page_text", _crash_page_worker)
+        with pytest.raises(BrokenProcessPool):
+            pdf_extraction._submit_fallback_page(sample, 0, 1).result()
+
+        monkeypatch.setattr(pdf_extraction, "_extract_fallback_page_text", extract_fallback_page)
+        assert pdf_extraction._submit_fallback_page(sample, 0, 1).result() == (
+            extract_fallback_page(sample, 0, 1)
+        )
+        assert pdf_extraction._fitz_page_pool not in (None, broken_pool)
+    finally:
+        pdf_extraction.shutdown_fitz_page_pool()
+
+
+def test_stream_pdf_text_writes_pages_incrementally(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    destination = tmp_path / "raw-text.part"
+    written_before_page: list[str] = []
+
+    def _pages(_path):
+        for text in ("Paciente: Luna, canino", "Diagnostico: otitis externa"):
+            written_before_page.append(destination.read_text(encoding="utf-8"))
+            yield text
+
+    monkeypatch.setattr(
+        pdf_extraction,
+        "_iter_pdf_page_texts_with_extractor",
+        lambda path: (_pages(path), "fitz"),
+    )
+
+    streamed = pdf_extraction._stream_pdf_text_with_extractor(tmp_path / "x.pdf", destination, 1)
+
+    expected = "Paciente: Luna, canino\nDiagnostico: otitis externa"
+    assert streamed == pdf_extraction.StreamedPdfText(
+        text=expected, extractor="fitz", pages=2, aborted=False, page_starts=(0, 23)
+    )
+    assert expected[23:].startswith("Diagnostico")
+    assert written_before_page == ["", "Paciente: Luna, canino"]
+    assert destination.read_text(encoding="utf-8") == expected
+
+
+def test_stream_pdf_text_stops_after_leading_unreadable_pages(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    consumed: list[int] = []
+
+    def _scanned_pages(_path):
+        for index in range(50):
+            consumed.append(index)
+            yield "" if index % 2 else "@@ ## %% 0101 ~~"
+
+    monkeypatch.setattr(
+        pdf_extraction,
+        "_iter_pdf_page_texts_with_extractor",
+        lambda path: (_scanned_pages(path), "fitz"),
+    )
+
+    streamed = pdf_extraction._stream_pdf_text_with_extractor(
+        tmp_path / "scan.pdf", tmp_path / "raw-text.part", 3
+    )
+
+    assert streamed.aborted is True
+    assert streamed.pages == 3
+    assert consumed == [0, 1, 2]
+
+
+def test_stream_pdf_text_re_extracts_garbled_fitz_pages_with_fallback(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    fitz = pytest.importorskip("fitz")
+    sample = FIXTURES_DIR / "clinical_history_1.pdf"
+    with fitz.open(sample) as document:
+        pages = [page.get_text("text") for page in document]
+    garbled = "\ufffd\x03\ufffd " * 40
+    monkeypatch.setenv("VET_RECORDS_FITZ_PAGE_WORKERS", "1")
+    monkeypatch.delenv(pdf_extraction.PDF_EXTRACTOR_FORCE_ENV, raising=False)
+    monkeypatch.setattr(
+        pdf_extraction,
+        "_iter_pdf_page_texts_with_extractor",
+        lambda _path: ((text for text in [pages[0], garbled, *pages[2:]]), "fitz"),
+    )
+
+    streamed = pdf_extraction._stream_pdf_text_with_extractor(sample, tmp_path / "raw-text.part", 8)
+
+    recovered = pdf_extraction_nodeps._extract_pdf_page_text_without_external_dependencies(
+        sample, page_index=1, page_count=len(pages)
+    )
+    assert "hidratado" in recovered
+    assert streamed.fallback_pages == (2,)
+    assert streamed.text == "\n".join([pages[0], recovered, *pages[2:]])
+    unrecoverable: list[int] = []
+    assert list(
+        pdf_extraction._iter_pages_with_fallback(
+            tmp_path / "missing.pdf", (text for text in [garbled]), unrecoverable
+        )
+    ) == [garbled]
+    assert unrecoverable == []
+
+
 def test_parse_tounicode_cmap_parses_bfchar_and_bfrange() -> None:
     cmap_payload = b"""
     begincmap
@@ -114,10 +327,38 @@ def test_parse_tounicode_cmap_parses_bfchar_and_bfrange() -> None:
     cmap = pdf_extraction.parse_tounicode_cmap(cmap_payload)
 
     assert cmap is not None
-    assert cmap.codepoints[0x41] == "A"
-    assert cmap.codepoints[0x42] == "B"
-    assert cmap.codepoints[0x43] == "C"
-    assert cmap.codepoints[0x44] == "D"
+    assert cmap.codepoints == {0x41: "A", 0x42: "B"}
+    assert cmap.get(0x43) == "C"
+    assert cmap.get(0x44) == "D"
+    assert cmap.get(0x45) is None
+
+
+def test_extract_cmaps_by_object_parses_identical_streams_once_per_process(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    cmap_stream = b"begincmap 1 beginbfchar <41> <0042> endbfchar endcmap"
+    other_stream = b"begincmap 1 beginbfchar <41> <0043> endbfchar endcmap"
+
+    def _stream_object(stream: bytes) -> bytes:
+        return b"<< /Filter /FlateDecode >>\nstream\n%s\nendstream\n" % zlib.compress(stream)
+
+    monkeypatch.setattr(
+        pdf_cmap_parsing, "_PARSED_CMAPS", pdf_cmap_parsing._ParsedCMapCache(max_entries=1)
+    )
+    first_document = {7: _stream_object(cmap_stream)}
+    second_document = {3: _stream_object(cmap_stream), 4: _stream_object(other_stream)}
+
+    first = pdf_extraction.extract_cmaps_by_object(first_document)[7]
+    second = pdf_extraction.extract_cmaps_by_object(second_document)[3]
+
+    assert second is first
+    assert second.codepoints == {0x41: "B"}
+    assert pdf_extraction.cmap_cache_stats() == pdf_cmap_parsing.CMapCacheStats(
+        hits=1, misses=1, entries=1, max_entries=1
+    )
+    assert pdf_extraction.cmap_cache_stats().hit_rate == 0.5
+    assert pdf_extraction.extract_cmaps_by_object(second_document)[4].codepoints == {0x41: "C"}
+    assert pdf_extraction.extract_cmaps_by_object(first_document)[7] is not first
 
 
 def test_parse_tounicode_cmap_supports_bfrange_array_destination() -> None:
@@ -135,8 +376,40 @@ def test_parse_tounicode_cmap_supports_bfrange_array_destination() -> None:
     cmap = pdf_extraction.parse_tounicode_cmap(cmap_payload)
 
     assert cmap is not None
-    assert cmap.codepoints[0x30] == "A"
-    assert cmap.codepoints[0x31] == "B"
+    assert cmap.get(0x30) == "A"
+    assert cmap.get(0x31) == "B"
+
+
+def test_parse_tounicode_cmap_stores_bfranges_as_compact_segments() -> None:
+    cmap_payload = b"""
+    begincmap
+    1 begincodespacerange
+    <0000> <FFFF>
+    endcodespacerange
+    1 beginbfchar
+    <A000> <0058>
+    endbfchar
+    3 beginbfrange
+    <4E00> <9FFF> <4E00>
+    <0100> <0103> <D7FE>
+    <4E20> <4E21> [<0061> <0062>]
+    endbfrange
+    endcmap
+    """
+
+    cmap = pdf_extraction.parse_tounicode_cmap(cmap_payload)
+
+    assert cmap is not None
+    assert list(cmap.range_starts) == [0x0100, 0x0102, 0x4E00, 0x4E20, 0x4E22]
+    assert list(cmap.range_ends) == [0x0101, 0x0103, 0x4E1F, 0x4E21, 0x9FFF]
+    assert cmap.get(0xA000) == "X"
+    assert cmap.get(0x4E11) == "\u4e11"
+    assert cmap.get(0x4E21) == "b"
+    assert cmap.get(0x9FFF) == "\u9fff"
+    assert cmap.get(0x0101) == "\ud7ff"
+    assert cmap.get(0x0102) == pdf_cmap_parsing._decode_unicode_hex(b"D800")
+    assert cmap.get(0x0103) == pdf_cmap_parsing._decode_unicode_hex(b"D801")
+    assert cmap.get(0xA001) is None
 
 
 def test_extract_pdf_text_tokens_collects_hex_and_literal_tokens() -> None:
@@ -161,6 +434,30 @@ def test_tokenize_pdf_content_parses_arrays_names_numbers_and_strings() -> None:
     assert any(isinstance(token, list) for token in tokens)
 
 
+def test_tokenize_pdf_content_handles_comments_escapes_and_token_limits(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    content = b"% header (x)\nBT /F1 12 Tf [(a\\(b\\)) -3.5 [<41 42>] 1%2] TJ (q) Tj <4>"
+
+    tokens = pdf_extraction.tokenize_pdf_content(content)
+
+    assert tokens == [
+        "BT",
+        "/F1",
+        12,
+        "Tf",
+        [b"a(b)", -3.5, [b"AB"], "1%2"],
+        "TJ",
+        b"q",
+        "Tj",
+        b"\x04",
+    ]
+    monkeypatch.setattr(pdf_fallback_shared, "MAX_TOKENS_PER_STREAM", 3)
+    monkeypatch.setattr(pdf_fallback_shared, "MAX_ARRAY_ITEMS", 2)
+    assert pdf_extraction.tokenize_pdf_content(content) == ["BT", "/F1", 12]
+    assert pdf_extraction.parse_pdf_array(b"1 2 3] 4", 0) == ([1, 2], 8)
+
+
 def test_parse_pdf_array_supports_nested_arrays_names_numbers_and_hex() -> None:
     parsed, next_index = pdf_extraction.parse_pdf_array(
         b"(Uno) [<446f73> 3.5] /Tag 7 ] trailing", 0
@@ -183,6 +480,57 @@ def test_decode_bytes_with_cmap_supports_multi_length_codes() -> None:
     assert decoded == "ÇA"
 
 
+def test_decode_bytes_with_cmap_uses_compiled_single_and_double_byte_tables() -> None:
+    single = pdf_extraction.PdfCMap(codepoints={0x41: "Á", 0x42: ""}, code_lengths=(1,))
+    double = pdf_extraction.PdfCMap(codepoints={0x41: "A", 0x0102: "Ç"}, code_lengths=(2,))
+
+    assert single.byte_table is not None and double.byte_table is None
+    assert pdf_extraction.decode_bytes_with_cmap(b"ABC\xe9", single) == "ÁCé"
+    assert pdf_extraction.decode_bytes_with_cmap(b"\x00\x41\x01\x02!", double) == "AÇ!"
+    # An unmapped code unit falls back to latin-1 one byte at a time.
+    assert pdf_extraction.decode_bytes_with_cmap(b"\x00\x41\x09\x09", double) == "A\t\t"
+
+
+def test_decode_token_for_font_memoizes_decodings_per_cmap() -> None:
+    cmap = pdf_extraction.PdfCMap(codepoints={0x41: "A", 0x42: "B"}, code_lengths=(1,))
+    before = pdf_text_decoder._decode_token_with_cmap.cache_info()
+
+    for _ in range(3):
+        decoded, selected = pdf_extraction.decode_token_for_font(
+            token_bytes=b"ABBA",
+            active_cmap=cmap,
+            active_font="F1",
+            font_to_cmap={},
+            fallback_cmaps=[],
+        )
+        assert (decoded, selected) == ("ABBA", cmap)
+
+    after = pdf_text_decoder._decode_token_with_cmap.cache_info()
+    assert after.hits - before.hits == 2
+    assert after.misses - before.misses == 1
+
+
+def test_decoded_text_score_counts_character_classes() -> None:
+    letters, vowels, spaces, punctuation, length = 9, 4, 2, 1, 13
+
+    assert pdf_text_quality._decoded_text_score("Hola, mundo 1") == pytest.approx(
+        letters / length + vowels / letters + spaces / length * 0.5 - punctuation / length * 1.5
+    )
+    assert pdf_text_quality._decoded_text_score("12 ,.") == -100.0
+
+
+def test_decoded_text_score_memo_of_character_classes_stays_bounded() -> None:
+    limit = pdf_text_quality.MAX_MEMOIZED_CHARACTER_CLASSES
+    # Letters far outside the BMP, as a hostile CMap could produce.
+    text = "".join(chr(0x20000 + offset) for offset in range(limit * 3)) + " a"
+
+    score = pdf_text_quality._decoded_text_score(text)
+
+    assert len(pdf_text_quality._CHARACTER_CLASSES) <= limit
+    assert score == pytest.approx(pdf_text_quality._decoded_text_score(text))
+    assert pdf_text_quality._decoded_text_score("Hola, mundo 1") > 1.0
+
+
 def test_decode_tj_array_for_font_uses_spacing_and_best_cmap() -> None:
     cmap = pdf_extraction.PdfCMap(codepoints={0x41: "A", 0x42: "B"}, code_lengths=(1,))
     text, selected_cmap = pdf_extraction.decode_tj_array_for_font(
@@ -249,6 +597,39 @@ def test_parse_pdf_literal_string_bytes_and_looks_textual_bytes() -> None:
     assert not pdf_extraction.looks_textual_bytes(b"\x00\x01\x02\x03")
 
 
+def test_inflate_pdf_stream_bounded_stops_at_the_size_limit() -> None:
+    bomb = zlib.compress(b"\x00" * (64 * 1024 * 1024), 9)
+    failures_before = pdf_extraction.inflate_failure_counts()
+
+    tracemalloc.start()
+    try:
+        too_large = pdf_fallback_shared.inflate_pdf_stream_bounded(bomb, max_bytes=1024 * 1024)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    assert too_large == pdf_fallback_shared.InflatedStream(
+        None, pdf_fallback_shared.INFLATE_TOO_LARGE
+    )
+    assert peak < 4 * 1024 * 1024
+    payload = zlib.compress(b"BT (Hola) Tj ET")
+    assert pdf_fallback_shared.inflate_pdf_stream_bounded(
+        payload, max_bytes=15
+    ) == pdf_fallback_shared.InflatedStream(b"BT (Hola) Tj ET")
+    assert pdf_extraction.inflate_pdf_stream(payload, max_bytes=14) is None
+    assert pdf_extraction.inflate_pdf_stream(payload[:-4]) is None
+    assert pdf_extraction.inflate_pdf_stream(b"BT (Hola) Tj ET") is None
+    failures = pdf_extraction.inflate_failure_counts()
+    for reason, added in (
+        (pdf_fallback_shared.INFLATE_TOO_LARGE, 2),
+        (pdf_fallback_shared.INFLATE_TRUNCATED, 1),
+        (pdf_fallback_shared.INFLATE_NOT_DEFLATE, 1),
+    ):
+        assert failures[reason] == failures_before.get(reason, 0) + added
+    oversized_object = b"<< /Length 9 >>\nstream\n%s\nendstream" % zlib.compress(b"x" * 2048)
+    assert pdf_page_structure._extract_object_stream(oversized_object, max_bytes=1024) is None
+
+
 def test_extract_without_external_dependencies_uses_stream_fallback(
     monkeypatch: pytest.MonkeyPatch, tmp_path: Path
 ) -> None:
@@ -268,3 +649,103 @@ def test_extract_without_external_dependencies_uses_stream_fallback(
     extracted = pdf_extraction._extract_pdf_text_without_external_dependencies(sample)
 
     assert "Hola" in extracted
+
+
+def test_extract_without_external_dependencies_reads_a_closed_memory_map(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    sample = FIXTURES_DIR / "clinical_history_1.pdf"
+    mappings: list[mmap.mmap] = []
+    buffers: list[object] = []
+
+    class _RecordingMmap(mmap.mmap):
+        def __new__(cls, *args, **kwargs):
+            mapping = super().__new__(cls, *args, **kwargs)
+            mappings.append(mapping)
+            return mapping
+
+    def _parse(pdf_buffer):
+        buffers.append(type(pdf_buffer))
+        return PdfObjectIndex(pdf_buffer)
+
+    monkeypatch.setattr(pdf_extraction_nodeps.mmap, "mmap", _RecordingMmap)
+
+    extracted = pdf_extraction_nodeps._extract_pdf_text_without_external_dependencies(
+        sample, parse_pdf_objects=_parse
+    )
+
+    assert "Datos de la Mascota" in extracted
+    assert buffers == [memoryview]
+    assert len(mappings) == 1 and mappings[0].closed
+    empty = tmp_path / "empty.pdf"
+    empty.write_bytes(b"")
+    assert pdf_extraction_nodeps._extract_pdf_text_without_external_dependencies(empty) == ""
+
+
+def test_pdf_object_index_reads_xref_streams_and_object_streams_lazily() -> None:
+    fitz = pytest.importorskip("fitz")
+    with fitz.open() as document:
+        for index in range(3):
+            document.new_page().insert_text((72, 72), f"Pagina {index}")
+        pdf_bytes = document.tobytes(use_objstms=1, garbage=1, deflate=True)
+
+    read_ids: set[int] = set()
+
+    class _RecordingIndex(PdfObjectIndex):
+        def __getitem__(self, object_id: int):
+            read_ids.add(object_id)
+            return super().__getitem__(object_id)
+
+    objects = _RecordingIndex(pdf_bytes)
+
+    assert objects.from_xref is True
+    assert objects.scanned is False
+    assert objects.root_object_id is not None
+    page_streams = pdf_extraction.collect_page_content_streams(
+        objects=objects, cmap_by_object=pdf_extraction.extract_cmaps_by_object(objects)
+    )
+    assert len(page_streams) == 3
+    # Only the catalog, the page tree, pages and their contents/resources were read.
+    assert len(read_ids) < len(objects)
+
+
+def test_pdf_object_index_drops_bogus_xref_entries_and_scans_on_demand() -> None:
+    header = b"%PDF-1.4\n"
+    catalog = b"1 0 obj\n<< /Type /Catalog /Pages 2 0 R >>\nendobj\n"
+    pages = b"2 0 obj\n<< /Type /Pages /Kids [] /Count 0 >>\nendobj\n"
+    orphan = b"3 0 obj\n<< /Orphan true >>\nendobj\n"
+    xref_offset = len(header + catalog + pages + orphan)
+    pdf_bytes = (
+        header
+        + catalog
+        + pages
+        + orphan
+        + b"xref\n0 4\n0000000000 65535 f \n"
+        + f"{len(header):010d} 00000 n \n".encode()
+        + f"{len(header + catalog):010d} 00000 n \n".encode()
+        + b"0000000000 00000 n \n"
+        + b"trailer\n<< /Size 4 /Root 1 0 R >>\nstartxref\n"
+        + str(xref_offset).encode()
+        + b"\n%%EOF\n"
+    )
+
+    objects = PdfObjectIndex(pdf_bytes)
+
+    assert objects.from_xref is True
+    assert objects[2] == b"\n<< /Type /Pages /Kids [] /Count 0 >>\n"
+    assert objects.scanned is False
+    assert objects[3] == b"\n<< /Orphan true >>\n"
+    assert objects.scanned is True
+
+
+def test_pdf_object_index_falls_back_to_regex_scan_without_xref() -> None:
+    objects = PdfObjectIndex(b"%PDF-1.4\n7 0 obj\n<< /Type /Page >>\nendobj\n%%EOF")
+
+    assert objects.from_xref is False
+    assert dict(objects) == {7: b"\n<< /Type /Page >>\n"}
+
+
+def test_undo_png_predictor_reverses_sub_and_up_rows() -> None:
+    encoded = bytes([2, 1, 2, 3, 2, 1, 1, 1, 1, 5, 5, 5])
+
+    assert _undo_png_predictor(encoded, 3) == bytes([1, 2, 3, 2, 3, 4, 5, 10, 15])
@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+import asyncio
+import os
+import threading
+from concurrent.futures.process import BrokenProcessPool
+
+import pytest
+
+from backend.app.application.extraction_quality import evaluate_extracted_text_quality
+from backend.app.application.processing import execution
+from backend.app.application.processing.orchestrator import InterpretationBuildError
+
+
+def _fail_interpretation() -> None:
+    raise InterpretationBuildError(
+        error_code="INTERPRETATION_VALIDATION_FAILED", details={"errors": ["pet_name"]}
+    )
+
+
+def _crash_worker() -> None:
+    os._exit(1)
+
+
+def test_thread_executor_runs_work_off_the_event_loop_thread() -> None:
+    loop_thread: list[int] = []
+
+    def _work(value: int, *, offset: int) -> tuple[int, int]:
+        return value + offset, threading.get_ident()
+
+    async def _exercise() -> tuple[int, int]:
+        loop_thread.append(threading.get_ident())
+        return await execution.ThreadProcessingExecutor().run(_work, 2, offset=3)
+
+    result, worker_thread = asyncio.run(_exercise())
+
+    assert result == 5
+    assert worker_thread != loop_thread[0]
+
+
+def test_process_pool_executor_runs_picklable_work_and_shuts_down() -> None:
+    executor = execution.ProcessPoolProcessingExecutor(max_workers=1)
+    text = "Historia clinica: perro macho de 7 anos con fiebre y vomitos."
+
+    async def _exercise() -> tuple[float, bool, list[str]]:
+        return await executor.run(evaluate_extracted_text_quality, text)
+
+    try:
+        result = asyncio.run(_exercise())
+    finally:
+        executor.shutdown()
+
+    assert tuple(result) == evaluate_extracted_text_quality(text)
+    assert executor._pool is None
+
+
+def test_process_pool_executor_marks_its_workers() -> None:
+    executor = execution.ProcessPoolProcessingExecutor(max_workers=1)
+
+    async def _exercise() -> bool:
+        return await executor.run(execution.in_processing_worker)
+
+    try:
+        assert asyncio.run(_exercise()) is True
+    finally:
+        executor.shutdown()
+
+    assert execution.in_processing_worker() is False
+
+
+def test_process_pool_executor_survives_failed_and_crashed_work() -> None:
+    executor = execution.ProcessPoolProcessingExecutor(max_workers=1)
+    text = "Historia clinica: perro macho de 7 anos con fiebre y vomitos."
+
+    async def _exercise() -> None:
+        with pytest.raises(InterpretationBuildError) as raised:
+            await executor.run(_fail_interpretation)
+        assert raised.value.error_code == "INTERPRETATION_VALIDATION_FAILED"
+        assert raised.value.details == {"errors": ["pet_name"]}
+        assert tuple(await executor.run(evaluate_extracted_text_quality, text)) == (
+            evaluate_extracted_text_quality(text)
+        )
+
+        with pytest.raises(BrokenProcessPool):
+            await executor.run(_crash_worker)
+        # The broken pool is replaced rather than failing every later run.
+        assert tuple(await executor.run(evaluate_extracted_text_quality, text)) == (
+            evaluate_extracted_text_quality(text)
+        )
+
+    try:
+        asyncio.run(_exercise())
+    finally:
+        executor.shutdown()
+
+
+@pytest.mark.parametrize(
+    ("raw", "expected_type"),
+    [
+        (None, execution.ThreadProcessingExecutor),
+        ("thread", execution.ThreadProcessingExecutor),
+        (" PROCESS ", execution.ProcessPoolProcessingExecutor),
+    ],
+)
+def test_build_processing_executor_follows_configuration(
+    monkeypatch: pytest.MonkeyPatch, raw: str | None, expected_type: type
+) -> None:
+    if raw is None:
+        monkeypatch.delenv("VET_RECORDS_PROCESSING_EXECUTOR", raising=False)
+    else:
+        monkeypatch.setenv("VET_RECORDS_PROCESSING_EXECUTOR", raw)
+    monkeypatch.setenv("VET_RECORDS_PROCESSING_WORKERS", "3")
+
+    executor = execution.build_processing_executor()
+
+    assert isinstance(executor, expected_type)
+    if isinstance(executor, execution.ProcessPoolProcessingExecutor):
+        assert executor.max_workers == 3
@@ -127,13 +127,21 @@ def test_process_document_converts_keyerror_during_interpretation_to_processing_
     repository = Mock()
     storage = Mock()
     sample_pdf = Path(__file__)
-    repository.get.return_value = SimpleNamespace(storage_path="doc/original.pdf")
+    repository.get.return_value = SimpleNamespace(
+        storage_path="doc/original.pdf", content_sha256=None
+    )
     storage.exists.return_value = True
     storage.resolve.return_value = sample_pdf
+    storage.read_cached_extraction.return_value = None
 
     monkeypatch.setattr(
-        "backend.app.application.processing.orchestrator.pdf_extraction._extract_pdf_text_with_extractor",
-        lambda _path: ("historia clinica suficiente para procesamiento", "fitz"),
+        "backend.app.application.processing.orchestrator.pdf_extraction._stream_pdf_text_with_extractor",
+        lambda *_args: orchestrator.pdf_extraction.StreamedPdfText(
+            text="historia clinica suficiente para procesamiento",
+            extractor="fitz",
+            pages=1,
+            aborted=False,
+        ),
     )
     monkeypatch.setattr(
         "backend.app.application.processing.orchestrator.evaluate_extracted_text_quality",
@@ -163,13 +171,18 @@ def test_process_document_with_empty_extraction_creates_low_quality_failure_arti
     repository = Mock()
     storage = Mock()
     sample_pdf = Path(__file__)
-    repository.get.return_value = SimpleNamespace(storage_path="doc/original.pdf")
+    repository.get.return_value = SimpleNamespace(
+        storage_path="doc/original.pdf", content_sha256=None
+    )
     storage.exists.return_value = True
     storage.resolve.return_value = sample_pdf
+    storage.read_cached_extraction.return_value = None
 
     monkeypatch.setattr(
-        "backend.app.application.processing.orchestrator.pdf_extraction._extract_pdf_text_with_extractor",
-        lambda _path: ("", "fitz"),
+        "backend.app.application.processing.orchestrator.pdf_extraction._stream_pdf_text_with_extractor",
+        lambda *_args: orchestrator.pdf_extraction.StreamedPdfText(
+            text="", extractor="fitz", pages=1, aborted=False
+        ),
     )
 
     with pytest.raises(orchestrator.ProcessingError, match="EXTRACTION_LOW_QUALITY"):
@@ -0,0 +1,263 @@
+from __future__ import annotations
+
+import asyncio
+from contextlib import nullcontext
+from unittest.mock import Mock
+
+import pytest
+
+from backend.app.application.processing import scheduler
+from backend.app.domain.models import ProcessingRun, ProcessingRunState
+
+
+def _run(run_id: str, document_id: str) -> ProcessingRun:
+    return ProcessingRun(
+        run_id=run_id,
+        document_id=document_id,
+        state=ProcessingRunState.QUEUED,
+        created_at="2026-01-01T00:00:00+00:00",
+    )
+
+
+class _FakeQueueRepository:
+    """In-memory queue honouring the per-document exclusivity of try_start_run."""
+
+    def __init__(self, runs: list[ProcessingRun]) -> None:
+        self._queued = list(runs)
+        self.running_documents: set[str] = set()
+        self.started: list[str] = []
+        self.lease_owners: dict[str, str | None] = {}
+        self.renewals: list[str] = []
+        self.renew_result = True
+
+    def run_unit_of_work(self, *, lease_owner: str | None = None) -> nullcontext[None]:
+        _ = lease_owner
+        return nullcontext()
+
+    def requeue_expired_runs(self, *, now: str, max_claims: int) -> int:
+        _ = (now, max_claims)
+        return 0
+
+    def renew_run_lease(self, *, run_id, lease_owner, lease_expires_at, heartbeat_at) -> bool:
+        _ = (lease_owner, lease_expires_at, heartbeat_at)
+        self.renewals.append(run_id)
+        return self.renew_result
+
+    def list_queued_runs(self, *, limit: int) -> list[ProcessingRun]:
+        return self._queued[:limit]
+
+    def try_start_run(
+        self,
+        *,
+        run_id: str,
+        document_id: str,
+        started_at: str,
+        lease_owner: str | None = None,
+        lease_expires_at: str | None = None,
+    ) -> bool:
+        _ = (started_at, lease_expires_at)
+        if document_id in self.running_documents:
+            return False
+        self.lease_owners[run_id] = lease_owner
+        self._queued = [run for run in self._queued if run.run_id != run_id]
+        self.running_documents.add(document_id)
+        self.started.append(run_id)
+        return True
+
+
+def test_slow_run_does_not_block_other_queued_runs(monkeypatch: pytest.MonkeyPatch) -> None:
+    repository = _FakeQueueRepository([_run("slow", "doc-a"), _run("fast", "doc-b")])
+    slow_release = asyncio.Event()
+    completed: list[str] = []
+
+    async def _fake_execute_run(*, run, repository, storage, executor, unit_of_work) -> None:
+        _ = (storage, executor, unit_of_work)
+        if run.run_id == "slow":
+            await slow_release.wait()
+        completed.append(run.run_id)
+        repository.running_documents.discard(run.document_id)
+
+    monkeypatch.setattr(scheduler, "_execute_run", _fake_execute_run)
+
+    async def _exercise() -> None:
+        stop_event = asyncio.Event()
+        task = asyncio.create_task(
+            scheduler.processing_scheduler(
+                repository=repository,
+                storage=Mock(),
+                stop_event=stop_event,
+                tick_seconds=0.01,
+                max_concurrent_runs=2,
+            )
+        )
+        for _ in range(100):
+            if "fast" in completed:
+                break
+            await asyncio.sleep(0.01)
+        assert completed == ["fast"]
+        slow_release.set()
+        stop_event.set()
+        await asyncio.wait_for(task, timeout=1.0)
+
+    asyncio.run(_exercise())
+
+    assert completed == ["fast", "slow"]
+
+
+def test_process_queued_runs_respects_pool_size_and_document_exclusivity(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    repository = _FakeQueueRepository(
+        [_run("a-1", "doc-a"), _run("a-2", "doc-a"), _run("b-1", "doc-b"), _run("c-1", "doc-c")]
+    )
+
+    async def _never_finishes(*, run, repository, storage, executor, unit_of_work) -> None:
+        _ = (run, repository, storage, executor, unit_of_work)
+        await asyncio.Event().wait()
+
+    monkeypatch.setattr(scheduler, "_execute_run", _never_finishes)
+
+    async def _exercise() -> None:
+        pool = scheduler.RunWorkerPool(max_concurrent_runs=2)
+        scheduler._process_queued_runs(repository=repository, storage=Mock(), worker_pool=pool)
+        assert pool.in_flight == 2
+        assert pool.available_slots == 0
+
+    asyncio.run(_exercise())
+
+    assert repository.started == ["a-1", "b-1"]
+
+
+def test_scheduler_drains_in_flight_runs_on_stop(monkeypatch: pytest.MonkeyPatch) -> None:
+    repository = _FakeQueueRepository([_run("run-1", "doc-1")])
+    started = asyncio.Event()
+    finished: list[str] = []
+
+    async def _fake_execute_run(*, run, repository, storage, executor, unit_of_work) -> None:
+        _ = (repository, storage, executor, unit_of_work)
+        started.set()
+        await asyncio.sleep(0.05)
+        finished.append(run.run_id)
+
+    monkeypatch.setattr(scheduler, "_execute_run", _fake_execute_run)
+
+    async def _exercise() -> None:
+        stop_event = asyncio.Event()
+        task = asyncio.create_task(
+            scheduler.processing_scheduler(
+                repository=repository,
+                storage=Mock(),
+                stop_event=stop_event,
+                tick_seconds=0.01,
+                max_concurrent_runs=1,
+            )
+        )
+        await asyncio.wait_for(started.wait(), timeout=1.0)
+        stop_event.set()
+        await asyncio.wait_for(task, timeout=1.0)
+
+    asyncio.run(_exercise())
+
+    assert finished == ["run-1"]
+
+
+def test_enqueue_wakes_idle_scheduler_without_waiting_for_poll(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    repository = _FakeQueueRepository([])
+    executed = asyncio.Event()
+    list_calls: list[int] = []
+    original_list = repository.list_queued_runs
+
+    def _counting_list(*, limit: int) -> list[ProcessingRun]:
+        list_calls.append(limit)
+        return original_list(limit=limit)
+
+    def _create_processing_run(*, run_id, document_id, state, created_at, source_run_id) -> None:
+        _ = (state, created_at, source_run_id)
+        repository._queued.append(_run(run_id, document_id))
+
+    repository.list_queued_runs = _counting_list  # type: ignore[method-assign]
+    repository.create_processing_run = _create_processing_run  # type: ignore[attr-defined]
+
+    async def _fake_execute_run(*, run, repository, storage, executor, unit_of_work) -> None:
+        _ = (run, repository, storage, executor, unit_of_work)
+        executed.set()
+
+    monkeypatch.setattr(scheduler, "_execute_run", _fake_execute_run)
+
+    async def _exercise() -> None:
+        stop_event = asyncio.Event()
+        task = asyncio.create_task(
+            scheduler.processing_scheduler(
+                repository=repository,
+                storage=Mock(),
+                stop_event=stop_event,
+                tick_seconds=30.0,
+                max_concurrent_runs=1,
+            )
+        )
+        await asyncio.sleep(0.01)
+        # Reprocess routes are sync and enqueue from the threadpool.
+        await asyncio.to_thread(
+            scheduler.enqueue_processing_run,
+            document_id="doc-1",
+            repository=repository,
+            id_provider=lambda: "run-1",
+        )
+        await asyncio.wait_for(executed.wait(), timeout=1.0)
+        stop_event.set()
+        await asyncio.wait_for(task, timeout=1.0)
+
+    asyncio.run(_exercise())
+
+    assert repository.started == ["run-1"]
+    assert len(list_calls) >= 2
+
+
+def test_idle_poll_backs_off_and_resets_after_activity() -> None:
+    interval = 0.5
+    observed = []
+    for _ in range(6):
+        interval = scheduler._next_poll_seconds(
+            current=interval, started=0, tick_seconds=0.5, max_seconds=10.0
+        )
+        observed.append(interval)
+
+    assert observed == [1.0, 2.0, 4.0, 8.0, 10.0, 10.0]
+    assert (
+        scheduler._next_poll_seconds(current=10.0, started=1, tick_seconds=0.5, max_seconds=10.0)
+        == 0.5
+    )
+
+
+def test_leased_run_is_abandoned_when_heartbeat_loses_the_lease(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    repository = _FakeQueueRepository([_run("run-1", "doc-1")])
+    repository.renew_result = False
+    cancelled = asyncio.Event()
+
+    async def _slow_execute_run(*, run, repository, storage, executor, unit_of_work) -> None:
+        _ = (run, repository, storage, executor, unit_of_work)
+        try:
+            await asyncio.sleep(5)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    monkeypatch.setattr(scheduler, "_execute_run", _slow_execute_run)
+
+    async def _exercise() -> None:
+        pool = scheduler.RunWorkerPool(max_concurrent_runs=1)
+        lease = scheduler.RunLease(owner="worker-a", seconds=0.03)
+        scheduler._process_queued_runs(
+            repository=repository, storage=Mock(), worker_pool=pool, lease=lease
+        )
+        await asyncio.wait_for(pool.drain(), timeout=1.0)
+
+    asyncio.run(_exercise())
+
+    assert cancelled.is_set()
+    assert repository.renewals == ["run-1"]
+    assert repository.lease_owners == {"run-1": "worker-a"}
@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from backend.app.domain.raw_text_index import RawTextIndex
+
+_TEXT = "Paciente: Luna\r\nEspecie: canino\nPeso: 12 kg Diagnóstico: otitis"
+
+
+def test_raw_text_index_resolves_pages_and_lines_by_offset() -> None:
+    second_page = _TEXT.index("Peso")
+    index = RawTextIndex.build(_TEXT, page_starts=(second_page, 0))
+
+    assert index.page_count == 2
+    assert index.line_count == len(_TEXT.splitlines())
+    assert [index.page_for_offset(offset) for offset in (0, second_page - 1, second_page)] == [
+        1,
+        1,
+        2,
+    ]
+    for line_number, line in enumerate(_TEXT.splitlines(), start=1):
+        assert index.line_for_offset(_TEXT.index(line)) == line_number
+
+    start, end = index.page_span(2)
+    assert _TEXT[start:end] == "Peso: 12 kg Diagnóstico: otitis"
+    byte_start, byte_end = index.page_byte_span(2)
+    assert _TEXT.encode("utf-8")[byte_start:byte_end].decode("utf-8") == _TEXT[start:end]
+    with pytest.raises(IndexError):
+        index.page_span(3)
+
+
+def test_raw_text_index_round_trips_through_its_json_payload() -> None:
+    index = RawTextIndex.build(_TEXT, page_starts=(0, _TEXT.index("Peso")))
+
+    restored = RawTextIndex.from_payload(json.loads(json.dumps(index.to_payload())))
+
+    assert restored == index
+    assert restored.line_starts == index.line_starts
+    with pytest.raises(ValueError):
+        RawTextIndex.from_payload({**index.to_payload(), "version": 0})
+    with pytest.raises(ValueError):
+        RawTextIndex.from_payload({**index.to_payload(), "line_lengths": "12"})
@@ -72,6 +72,8 @@ export type RawTextArtifactResponse = {
   artifact_type: string;
   content_type: string;
   text: string;
+  page?: number | null;
+  page_count?: number;
 };
 
 export type ReviewEvidence = {